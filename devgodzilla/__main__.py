@@ -0,0 +1,24 @@
+"""
+``python -m devgodzilla`` entry point.
+
+``--version`` is answered before the CLI (and Click) is imported, so version
+checks in scripts and health probes stay fast.
+"""
+
+import sys
+
+
+def main() -> None:
+    if sys.argv[1:] in (["--version"], ["version"]):
+        from devgodzilla import __version__
+
+        print(f"DevGodzilla v{__version__}")
+        return
+
+    from devgodzilla.cli.main import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
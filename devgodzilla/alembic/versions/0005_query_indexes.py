@@ -0,0 +1,62 @@
+"""Add indexes for protocol/step lookups found by the query plan harness
+
+Revision ID: 0005_query_indexes
+Revises: 0004_add_priority
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "0005_query_indexes"
+down_revision = "0004_add_priority"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Steps that can still make progress; kept in sync with db/schema.py.
+ACTIVE_STEP_STATUSES = ("pending", "running", "needs_qa")
+
+# (index name, table, columns, partial WHERE clause)
+INDEXES = [
+    ("idx_protocol_runs_project_status", "protocol_runs", ["project_id", "status"], None),
+    ("idx_protocol_runs_created", "protocol_runs", ["created_at"], None),
+    ("idx_step_runs_protocol", "step_runs", ["protocol_run_id", "step_index"], None),
+    (
+        "idx_step_runs_active",
+        "step_runs",
+        ["protocol_run_id", "status"],
+        "status IN (" + ", ".join(f"'{s}'" for s in ACTIVE_STEP_STATUSES) + ")",
+    ),
+    ("idx_sprints_project", "sprints", ["project_id", "status"], None),
+]
+
+
+def upgrade() -> None:
+    """Create missing indexes (skipping tables created outside Alembic)."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    for name, table, columns, where in INDEXES:
+        if table not in tables:
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table)}
+        if name in existing:
+            continue
+        kwargs = {}
+        if where:
+            kwargs["sqlite_where"] = sa.text(where)
+            kwargs["postgresql_where"] = sa.text(where)
+        op.create_index(name, table, columns, **kwargs)
+
+
+def downgrade() -> None:
+    """Drop the indexes added by this revision."""
+    for name, table, _columns, _where in reversed(INDEXES):
+        try:
+            op.drop_index(name, table_name=table)
+        except Exception:
+            pass
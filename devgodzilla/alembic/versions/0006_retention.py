@@ -0,0 +1,118 @@
+"""Retention support: created_at indexes and monthly partitioning of events
+
+Revision ID: 0006_retention
+Revises: 0005_query_indexes
+Create Date: 2026-10-18 00:00:01.000000
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "0006_retention"
+down_revision = "0005_query_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Retention scans each table by created_at.
+CREATED_AT_INDEXES = [
+    ("idx_events_created", "events"),
+    ("idx_job_runs_created", "job_runs"),
+    ("idx_run_artifacts_created", "run_artifacts"),
+    ("idx_feedback_events_created", "feedback_events"),
+    ("idx_qa_results_created", "qa_results"),
+]
+
+# Months of partitions created ahead of the current one.
+MONTHS_AHEAD = 2
+
+
+def _month(value: datetime, offset: int = 0) -> datetime:
+    index = value.year * 12 + (value.month - 1) + offset
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _is_partitioned(bind) -> bool:
+    return bind.execute(
+        sa.text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = 'events'"
+        )
+    ).first() is not None
+
+
+def _partition_events(bind) -> None:
+    """Rebuild events as a table range-partitioned by month on created_at."""
+    columns = [col["name"] for col in inspect(bind).get_columns("events")]
+    column_list = ", ".join(columns)
+    seq = bind.execute(sa.text("SELECT pg_get_serial_sequence('events', 'id')")).scalar()
+
+    op.execute("ALTER TABLE events RENAME TO events_unpartitioned")
+    op.execute("DROP INDEX IF EXISTS idx_events_project")
+    op.execute("DROP INDEX IF EXISTS idx_events_protocol")
+    op.execute("UPDATE events_unpartitioned SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    op.execute(
+        "CREATE TABLE events (LIKE events_unpartitioned INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute("ALTER TABLE events ALTER COLUMN created_at SET NOT NULL")
+    op.execute("ALTER TABLE events ADD PRIMARY KEY (id, created_at)")
+    for column, target in (
+        ("protocol_run_id", "protocol_runs"),
+        ("project_id", "projects"),
+        ("step_run_id", "step_runs"),
+    ):
+        if column in columns:
+            op.execute(f"ALTER TABLE events ADD FOREIGN KEY ({column}) REFERENCES {target}(id)")
+    if seq:
+        # Keep the id sequence alive when the old table is dropped.
+        op.execute(f"ALTER SEQUENCE {seq} OWNED BY events.id")
+
+    # One partition per month from the oldest row through MONTHS_AHEAD.
+    oldest = bind.execute(sa.text("SELECT MIN(created_at) FROM events_unpartitioned")).scalar()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    start = _month(oldest or now)
+    last = _month(now, MONTHS_AHEAD)
+    while start <= last:
+        end = _month(start, 1)
+        op.execute(
+            f"CREATE TABLE events_p{start:%Y%m} PARTITION OF events "
+            f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+        )
+        start = end
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+    op.execute(f"INSERT INTO events ({column_list}) SELECT {column_list} FROM events_unpartitioned")
+    op.execute("DROP TABLE events_unpartitioned")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_events_project ON events(project_id, created_at)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_events_protocol ON events(protocol_run_id, created_at)")
+
+
+def upgrade() -> None:
+    """Add created_at indexes; on PostgreSQL, partition events by month."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if bind.dialect.name == "postgresql" and "events" in tables and not _is_partitioned(bind):
+        _partition_events(bind)
+        inspector = inspect(bind)
+
+    for name, table in CREATED_AT_INDEXES:
+        if table not in tables:
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop the created_at indexes. Partitioned events are left in place."""
+    for name, table in reversed(CREATED_AT_INDEXES):
+        try:
+            op.drop_index(name, table_name=table)
+        except Exception:
+            pass
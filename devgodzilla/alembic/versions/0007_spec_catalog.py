@@ -0,0 +1,116 @@
+"""Add the materialized specification catalog
+
+Revision ID: 0007_spec_catalog
+Revises: 0006_retention
+Create Date: 2026-10-18 00:00:02.000000
+"""
+import sqlite3
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "0007_spec_catalog"
+down_revision = "0006_retention"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with db/schema.py.
+INDEXES = [
+    ("idx_spec_catalog_project", ["project_id", "spec_run_id"]),
+    ("idx_spec_catalog_run", ["spec_run_id"]),
+    ("idx_spec_catalog_status", ["status", "has_plan", "has_tasks"]),
+    ("idx_spec_catalog_created", ["spec_created_at"]),
+]
+
+
+def _create_search_index(bind) -> None:
+    """FTS5 trigram table (SQLite) or pg_trgm indexes (PostgreSQL), if available."""
+    from devgodzilla.db.schema import SPEC_CATALOG_SEARCH_POSTGRES, SPEC_CATALOG_SEARCH_SQLITE
+
+    if bind.dialect.name == "sqlite":
+        statements, buffer = [], ""
+        for line in SPEC_CATALOG_SEARCH_SQLITE.splitlines(keepends=True):
+            buffer += line
+            if sqlite3.complete_statement(buffer):
+                statements.append(buffer.strip())
+                buffer = ""
+        try:
+            with bind.begin_nested():
+                for statement in statements:
+                    bind.exec_driver_sql(statement)
+        except Exception:
+            pass  # FTS5 unavailable; search falls back to a scan
+        return
+    try:
+        with bind.begin_nested():
+            for statement in SPEC_CATALOG_SEARCH_POSTGRES.strip().split(";"):
+                if statement.strip():
+                    bind.execute(sa.text(statement))
+    except Exception:
+        pass  # pg_trgm unavailable; search uses an unindexed ILIKE
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_sqlite = bind.dialect.name == "sqlite"
+    if "spec_catalog" in set(inspect(bind).get_table_names()):
+        return
+
+    timestamp_type = sa.DateTime() if is_sqlite else sa.TIMESTAMP()
+    false = sa.text("0") if is_sqlite else sa.false()
+
+    op.create_table(
+        "spec_catalog",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=False),
+        sa.Column("spec_key", sa.Text(), nullable=False),
+        sa.Column("spec_run_id", sa.Integer(), nullable=True),
+        sa.Column("slug", sa.Text(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("path", sa.Text(), nullable=False),
+        sa.Column("spec_path", sa.Text(), nullable=True),
+        sa.Column("plan_path", sa.Text(), nullable=True),
+        sa.Column("tasks_path", sa.Text(), nullable=True),
+        sa.Column("checklist_path", sa.Text(), nullable=True),
+        sa.Column("analysis_path", sa.Text(), nullable=True),
+        sa.Column("implement_path", sa.Text(), nullable=True),
+        sa.Column("status", sa.Text(), nullable=True),
+        sa.Column("has_spec", sa.Boolean(), server_default=false),
+        sa.Column("has_plan", sa.Boolean(), server_default=false),
+        sa.Column("has_tasks", sa.Boolean(), server_default=false),
+        sa.Column("worktree_path", sa.Text(), nullable=True),
+        sa.Column("branch_name", sa.Text(), nullable=True),
+        sa.Column("base_branch", sa.Text(), nullable=True),
+        sa.Column("feature_name", sa.Text(), nullable=True),
+        sa.Column("spec_number", sa.Integer(), nullable=True),
+        sa.Column("spec_created_at", sa.Text(), nullable=True),
+        sa.Column("linked_tasks", sa.Integer(), server_default=sa.text("0")),
+        sa.Column("completed_tasks", sa.Integer(), server_default=sa.text("0")),
+        sa.Column("story_points", sa.Integer(), server_default=sa.text("0")),
+        sa.Column("task_sprint_id", sa.Integer(), nullable=True),
+        sa.Column("task_sprint_count", sa.Integer(), server_default=sa.text("0")),
+        sa.Column("updated_at", timestamp_type, server_default=sa.func.now()),
+        sa.UniqueConstraint("project_id", "spec_key"),
+    )
+    for name, columns in INDEXES:
+        op.create_index(name, "spec_catalog", columns)
+    _create_search_index(bind)
+    # Rows are filled by spec run writes and the API's catalog reconciler.
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        for trigger in ("spec_catalog_fts_ai", "spec_catalog_fts_ad", "spec_catalog_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS spec_catalog_fts")
+    for name, _columns in reversed(INDEXES):
+        try:
+            op.drop_index(name, table_name="spec_catalog")
+        except Exception:
+            pass
+    op.drop_table("spec_catalog")
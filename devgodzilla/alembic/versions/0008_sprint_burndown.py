@@ -0,0 +1,57 @@
+"""Add daily sprint burndown snapshots
+
+Revision ID: 0008_sprint_burndown
+Revises: 0007_spec_catalog
+Create Date: 2026-10-18 00:00:03.000000
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "0008_sprint_burndown"
+down_revision = "0007_spec_catalog"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "sprint_burndown" in set(inspect(bind).get_table_names()):
+        return
+
+    timestamp_type = sa.DateTime() if bind.dialect.name == "sqlite" else sa.TIMESTAMP()
+    op.create_table(
+        "sprint_burndown",
+        sa.Column("sprint_id", sa.Integer(), sa.ForeignKey("sprints.id"), nullable=False),
+        sa.Column("day", sa.Text(), nullable=False),
+        sa.Column("total_tasks", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("completed_tasks", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("total_points", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("completed_points", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("updated_at", timestamp_type, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("sprint_id", "day"),
+    )
+    # Seed today's row for every sprint so existing sprints start their series.
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO sprint_burndown (
+                sprint_id, day, total_tasks, completed_tasks, total_points, completed_points
+            )
+            SELECT s.id, :day, COUNT(t.id),
+                   COALESCE(SUM(CASE WHEN t.board_status = 'done' THEN 1 ELSE 0 END), 0),
+                   COALESCE(SUM(t.story_points), 0),
+                   COALESCE(SUM(CASE WHEN t.board_status = 'done' THEN t.story_points ELSE 0 END), 0)
+            FROM sprints s LEFT JOIN tasks t ON t.sprint_id = s.id
+            GROUP BY s.id
+            """
+        ).bindparams(day=datetime.now(timezone.utc).date().isoformat())
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sprint_burndown")
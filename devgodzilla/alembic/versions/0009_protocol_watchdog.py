@@ -0,0 +1,54 @@
+"""Add worker leases and the running-protocol index for the recovery watchdog
+
+Revision ID: 0009_protocol_watchdog
+Revises: 0008_sprint_burndown
+Create Date: 2026-10-18 00:00:04.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "0009_protocol_watchdog"
+down_revision = "0008_sprint_burndown"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with db/schema.py.
+RUNNING_INDEX = "idx_protocol_runs_running"
+RUNNING_WHERE = "status = 'running'"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if "worker_leases" not in tables:
+        op.create_table(
+            "worker_leases",
+            sa.Column("name", sa.Text(), primary_key=True),
+            sa.Column("holder", sa.Text(), nullable=False),
+            sa.Column("expires_at", sa.Float(), nullable=False),
+        )
+
+    if "protocol_runs" in tables:
+        existing = {ix["name"] for ix in inspector.get_indexes("protocol_runs")}
+        if RUNNING_INDEX not in existing:
+            op.create_index(
+                RUNNING_INDEX,
+                "protocol_runs",
+                ["id"],
+                sqlite_where=sa.text(RUNNING_WHERE),
+                postgresql_where=sa.text(RUNNING_WHERE),
+            )
+
+
+def downgrade() -> None:
+    try:
+        op.drop_index(RUNNING_INDEX, table_name="protocol_runs")
+    except Exception:
+        pass
+    op.drop_table("worker_leases")
@@ -0,0 +1,46 @@
+"""Add trigger-maintained change counters for versioned API responses
+
+Revision ID: 0010_resource_versions
+Revises: 0009_protocol_watchdog
+Create Date: 2026-10-18 00:00:05.000000
+"""
+import sqlite3
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0010_resource_versions"
+down_revision = "0009_protocol_watchdog"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    from devgodzilla.db.schema import RESOURCE_VERSIONS_POSTGRES, RESOURCE_VERSIONS_SQLITE
+
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        # Function bodies contain semicolons; the driver runs the script whole.
+        bind.exec_driver_sql(RESOURCE_VERSIONS_POSTGRES)
+        return
+    buffer = ""
+    for line in RESOURCE_VERSIONS_SQLITE.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            bind.exec_driver_sql(buffer.strip())
+            buffer = ""
+
+
+def downgrade() -> None:
+    from devgodzilla.db.schema import VERSIONED_TABLES
+
+    bind = op.get_bind()
+    for table, _scope in VERSIONED_TABLES:
+        if bind.dialect.name == "sqlite":
+            for suffix in ("ai", "au", "ad"):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_version_{suffix}")
+        else:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_version ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS {table}_version_bump()")
+    op.execute("DROP TABLE IF EXISTS resource_versions")
@@ -1,3 +1,8 @@
+import importlib
+import inspect
+import threading
+from typing import Any, List, Optional, Sequence, Tuple
+
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -10,35 +15,92 @@ except ImportError:
     SLOWAPI_AVAILABLE = False
 
 from devgodzilla.api import schemas
-from devgodzilla.services.telemetry import (
-    TelemetryConfig,
-    get_telemetry,
-    init_telemetry,
-    shutdown_telemetry,
-)
-from devgodzilla.services.health import HealthChecker, health_status_to_dict
-from devgodzilla.api.routes import projects, protocols, steps, agents, clarifications, speckit, sprints, tasks, policy_packs, specifications, quality, profile, templates
-from devgodzilla.api.routes import metrics, webhooks, events, logs
-from devgodzilla.api.routes import windmill as windmill_routes
-from devgodzilla.api.routes import runs as runs_routes
-from devgodzilla.api.routes import project_speckit as project_speckit_routes
-from devgodzilla.api.routes import cli_executions
-from devgodzilla.api.routes import queues
-from devgodzilla.api.routes import reconciliation as reconciliation_routes
 from devgodzilla.api.dependencies import get_db, get_service_context, require_api_token, require_webhook_token
 from devgodzilla.config import get_config
-from devgodzilla.engines.bootstrap import bootstrap_default_engines
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger, get_log_buffer
-from devgodzilla.services.orchestrator import OrchestratorMode, OrchestratorService
-from devgodzilla.services.path_contract import validate_path_contract
-from devgodzilla.windmill.client import WindmillClient, WindmillConfig
 
 logger = get_logger(__name__)
 
 get_log_buffer()
 
-app = FastAPI(
+# Routers, in inclusion order: (module, tags, auth). auth is "api" for the API
+# token, "webhook" for the webhook token and None for unauthenticated routes.
+# Importing the route modules and building their routes is most of the cost of
+# importing this module, so DevGodzillaAPI defers it to the first ASGI event.
+_ROUTERS: Sequence[Tuple[str, Optional[List[str]], Optional[str]]] = (
+    ("devgodzilla.api.routes.projects", ["Projects"], "api"),
+    ("devgodzilla.api.routes.protocols", ["Protocols"], "api"),
+    ("devgodzilla.api.routes.steps", ["Steps"], "api"),
+    ("devgodzilla.api.routes.agents", ["Agents"], "api"),
+    ("devgodzilla.api.routes.clarifications", ["Clarifications"], "api"),
+    ("devgodzilla.api.routes.speckit", ["SpecKit"], "api"),
+    ("devgodzilla.api.routes.metrics", None, None),  # /metrics (optionally unauthenticated)
+    ("devgodzilla.api.routes.webhooks", None, "webhook"),  # /webhooks/*
+    ("devgodzilla.api.routes.events", None, "api"),  # /events
+    ("devgodzilla.api.routes.logs", None, "api"),  # /logs
+    ("devgodzilla.api.routes.windmill", None, "api"),  # /flows, /jobs (Windmill)
+    ("devgodzilla.api.routes.runs", None, "api"),  # /runs (Job runs)
+    ("devgodzilla.api.routes.project_speckit", None, "api"),  # /projects/{id}/speckit/*
+    ("devgodzilla.api.routes.sprints", ["Sprints"], "api"),
+    ("devgodzilla.api.routes.tasks", ["Tasks"], "api"),
+    ("devgodzilla.api.routes.queues", None, "api"),  # /queues
+    ("devgodzilla.api.routes.reconciliation", None, "api"),  # /reconciliation
+    ("devgodzilla.api.routes.policy_packs", None, "api"),  # /policy_packs
+    ("devgodzilla.api.routes.specifications", None, "api"),  # /specifications
+    ("devgodzilla.api.routes.quality", None, "api"),  # /quality
+    ("devgodzilla.api.routes.profile", None, "api"),  # /profile
+    ("devgodzilla.api.routes.templates", None, "api"),  # /templates
+    ("devgodzilla.api.routes.cli_executions", ["CLI Executions"], "api"),  # /cli-executions
+)
+
+_AUTH_DEPENDENCIES = {
+    "api": [Depends(require_api_token)],
+    "webhook": [Depends(require_webhook_token)],
+    None: [],
+}
+
+
+class DevGodzillaAPI(FastAPI):
+    """
+    FastAPI app that mounts the route modules on first use.
+
+    Routers are included on the first ASGI event (the lifespan startup under
+    uvicorn, or the first request), or when the route table or OpenAPI schema
+    is read, whichever comes first.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._routers_mounted = False
+        self._mount_lock = threading.Lock()
+
+    def mount_routers(self) -> None:
+        if self._routers_mounted:
+            return
+        with self._mount_lock:
+            if self._routers_mounted:
+                return
+            for module_name, tags, auth in _ROUTERS:
+                module = importlib.import_module(module_name)
+                self.include_router(module.router, tags=tags, dependencies=_AUTH_DEPENDENCIES[auth])
+            self._routers_mounted = True
+
+    @property
+    def routes(self):  # type: ignore[override]
+        self.mount_routers()
+        return super().routes
+
+    def openapi(self):  # type: ignore[override]
+        self.mount_routers()
+        return super().openapi()
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.mount_routers()
+        await super().__call__(scope, receive, send)
+
+
+app = DevGodzillaAPI(
     title="DevGodzilla API",
     description="REST API for DevGodzilla AI Development Pipeline",
     version="0.1.0",
@@ -64,32 +126,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Routes
-auth_deps = [Depends(require_api_token)]
-app.include_router(projects.router, tags=["Projects"], dependencies=auth_deps)
-app.include_router(protocols.router, tags=["Protocols"], dependencies=auth_deps)
-app.include_router(steps.router, tags=["Steps"], dependencies=auth_deps)
-app.include_router(agents.router, tags=["Agents"], dependencies=auth_deps)
-app.include_router(clarifications.router, tags=["Clarifications"], dependencies=auth_deps)
-app.include_router(speckit.router, tags=["SpecKit"], dependencies=auth_deps)
-app.include_router(metrics.router)  # /metrics (optionally unauthenticated)
-app.include_router(webhooks.router, dependencies=[Depends(require_webhook_token)])  # /webhooks/*
-app.include_router(events.router, dependencies=auth_deps)  # /events
-app.include_router(logs.router, dependencies=auth_deps)  # /logs
-app.include_router(windmill_routes.router, dependencies=auth_deps)  # /flows, /jobs (Windmill)
-app.include_router(runs_routes.router, dependencies=auth_deps)  # /runs (Job runs)
-app.include_router(project_speckit_routes.router, dependencies=auth_deps)  # /projects/{id}/speckit/*
-app.include_router(sprints.router, tags=["Sprints"], dependencies=auth_deps)
-app.include_router(tasks.router, tags=["Tasks"], dependencies=auth_deps)
-app.include_router(queues.router, dependencies=auth_deps)  # /queues
-app.include_router(reconciliation_routes.router, dependencies=auth_deps)  # /reconciliation
-app.include_router(policy_packs.router, dependencies=auth_deps)  # /policy_packs
-app.include_router(specifications.router, dependencies=auth_deps)  # /specifications
-app.include_router(quality.router, dependencies=auth_deps)  # /quality
-app.include_router(profile.router, dependencies=auth_deps)  # /profile
-app.include_router(templates.router, dependencies=auth_deps)  # /templates
-app.include_router(cli_executions.router, tags=["CLI Executions"], dependencies=auth_deps)  # /cli-executions
-
 
 @app.on_event("startup")
 def bootstrap_engines() -> None:
@@ -100,6 +136,8 @@ def bootstrap_engines() -> None:
     We always register a DummyEngine as the default so UI/flow integration can
     be tested end-to-end.
     """
+    from devgodzilla.engines.bootstrap import bootstrap_default_engines
+
     bootstrap_default_engines()
 
 
@@ -134,39 +172,66 @@ def bootstrap_database() -> None:
         )
 
 
+def _build_recovery_orchestrator():
+    from devgodzilla.cli.main import get_db as cli_get_db
+    from devgodzilla.cli.main import get_service_context as cli_get_service_context
+    from devgodzilla.services.orchestrator import OrchestratorMode, OrchestratorService
+    from devgodzilla.windmill.client import WindmillClient, WindmillConfig
+
+    ctx = cli_get_service_context()
+    db = cli_get_db()
+    windmill_client = None
+    mode = OrchestratorMode.LOCAL
+    if getattr(ctx.config, "windmill_enabled", False):
+        windmill_client = WindmillClient(
+            WindmillConfig(
+                base_url=ctx.config.windmill_url or "http://localhost:8000",
+                token=ctx.config.windmill_token or "",
+                workspace=getattr(ctx.config, "windmill_workspace", "devgodzilla"),
+            )
+        )
+        mode = OrchestratorMode.WINDMILL
+
+    return OrchestratorService(
+        context=ctx,
+        db=db,
+        windmill_client=windmill_client,
+        mode=mode,
+    )
+
+
+_protocol_watchdog = None
+
+
 @app.on_event("startup")
 def recover_protocol_runs() -> None:
-    """Recover protocols stuck in RUNNING without active steps."""
-    try:
-        from devgodzilla.cli.main import get_db as cli_get_db
-        from devgodzilla.cli.main import get_service_context as cli_get_service_context
+    """Recover protocols stuck in RUNNING without active steps.
 
-        ctx = cli_get_service_context()
-        db = cli_get_db()
-        windmill_client = None
-        mode = OrchestratorMode.LOCAL
-        if getattr(ctx.config, "windmill_enabled", False):
-            windmill_client = WindmillClient(
-                WindmillConfig(
-                    base_url=ctx.config.windmill_url or "http://localhost:8000",
-                    token=ctx.config.windmill_token or "",
-                    workspace=getattr(ctx.config, "windmill_workspace", "devgodzilla"),
-                )
-            )
-            mode = OrchestratorMode.WINDMILL
+    Runs as a periodic watchdog (one replica at a time, via a database
+    lease), or as a single pass when the watchdog interval is 0.
+    """
+    global _protocol_watchdog
+    from devgodzilla.services.protocol_watchdog import (
+        ProtocolWatchdog,
+        lease_holder_id,
+        run_protocol_recovery,
+    )
 
-        orchestrator = OrchestratorService(
-            context=ctx,
-            db=db,
-            windmill_client=windmill_client,
-            mode=mode,
+    interval = int(getattr(config, "protocol_watchdog_interval_seconds", 0) or 0)
+    if interval > 0:
+        _protocol_watchdog = ProtocolWatchdog(
+            _build_recovery_orchestrator,
+            interval_seconds=interval,
+            stale_after_seconds=getattr(config, "protocol_watchdog_stale_seconds", None),
+        )
+        _protocol_watchdog.start()
+        return
+    try:
+        run_protocol_recovery(
+            _build_recovery_orchestrator(),
+            holder=lease_holder_id(),
+            lease_seconds=60,
         )
-        recovered = orchestrator.recover_stuck_protocols()
-        if recovered:
-            logger.warning(
-                "protocol_recovery_actions",
-                extra={"recovered_count": len(recovered)},
-            )
     except Exception as exc:
         logger.error(
             "protocol_recovery_failed",
@@ -174,6 +239,12 @@ def recover_protocol_runs() -> None:
         )
 
 
+@app.on_event("shutdown")
+def stop_protocol_watchdog() -> None:
+    if _protocol_watchdog is not None:
+        _protocol_watchdog.stop()
+
+
 @app.on_event("startup")
 def bootstrap_sprint_integration() -> None:
     """Register sprint event handlers."""
@@ -184,9 +255,89 @@ def bootstrap_sprint_integration() -> None:
         logger.error("sprint_event_handlers_registration_failed", extra={"error": str(e)})
 
 
+_retention_worker = None
+
+
+@app.on_event("startup")
+def start_retention_worker() -> None:
+    """Prune history tables in the background when retention is enabled."""
+    global _retention_worker
+    if not getattr(config, "retention_enabled", False):
+        return
+    from devgodzilla.cli.main import get_db as cli_get_db
+    from devgodzilla.cli.main import get_service_context as cli_get_service_context
+    from devgodzilla.services.retention import RetentionService, RetentionWorker
+
+    _retention_worker = RetentionWorker(
+        lambda: RetentionService(cli_get_service_context(), cli_get_db()),
+        interval_seconds=config.retention_interval_seconds,
+    )
+    _retention_worker.start()
+
+
+@app.on_event("shutdown")
+def stop_retention_worker() -> None:
+    if _retention_worker is not None:
+        _retention_worker.stop()
+
+
+_spec_catalog_worker = None
+
+
+@app.on_event("startup")
+def start_spec_catalog_worker() -> None:
+    """Reconcile the specification catalog with spec folders in the background."""
+    global _spec_catalog_worker
+    interval = int(getattr(config, "spec_catalog_interval_seconds", 0) or 0)
+    if interval <= 0:
+        return
+    from devgodzilla.cli.main import get_db as cli_get_db
+    from devgodzilla.cli.main import get_service_context as cli_get_service_context
+    from devgodzilla.services.spec_catalog import SpecCatalogService, SpecCatalogWorker
+
+    _spec_catalog_worker = SpecCatalogWorker(
+        lambda: SpecCatalogService(cli_get_service_context(), cli_get_db()),
+        interval_seconds=interval,
+    )
+    _spec_catalog_worker.start()
+
+
+@app.on_event("shutdown")
+def stop_spec_catalog_worker() -> None:
+    if _spec_catalog_worker is not None:
+        _spec_catalog_worker.stop()
+
+
+@app.on_event("startup")
+async def start_loop_lag_monitor() -> None:
+    """Sample event loop lag so blocking calls on the loop show up in logs."""
+    from devgodzilla.db.async_database import get_loop_lag_monitor
+
+    get_loop_lag_monitor().start()
+
+
+@app.on_event("shutdown")
+async def stop_loop_lag_monitor() -> None:
+    from devgodzilla.api import dependencies
+    from devgodzilla.db.async_database import get_loop_lag_monitor
+
+    await get_loop_lag_monitor().stop()
+    await dependencies.close_async_db()
+
+
+@app.on_event("startup")
+def install_config_reload_handler() -> None:
+    """Rebuild the cached config snapshot on SIGHUP (e.g. after rotating tokens)."""
+    from devgodzilla.config import install_reload_signal_handler
+
+    install_reload_signal_handler()
+
+
 @app.on_event("startup")
 def validate_path_contract_startup() -> None:
     """Fail fast when core folder/file path contracts are invalid."""
+    from devgodzilla.services.path_contract import validate_path_contract
+
     report = validate_path_contract(config)
     for warning in report.warnings:
         logger.warning("path_contract_warning", extra={"warning": warning})
@@ -203,6 +354,8 @@ def initialize_telemetry() -> None:
     """Initialize OpenTelemetry distributed tracing."""
     import os
 
+    from devgodzilla.services.telemetry import TelemetryConfig, get_telemetry, init_telemetry
+
     otlp_endpoint = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
     sample_rate = float(os.environ.get("OTEL_SAMPLE_RATE", "1.0"))
     enable_console = os.environ.get("OTEL_CONSOLE_EXPORT", "").lower() in ("1", "true", "yes")
@@ -233,32 +386,17 @@ def initialize_telemetry() -> None:
 @app.on_event("shutdown")
 def shutdown_telemetry_on_exit() -> None:
     """Shutdown OpenTelemetry on application exit."""
-    shutdown_telemetry()
+    from devgodzilla.services.telemetry import shutdown_telemetry
 
-
-@app.get("/health", response_model=schemas.Health)
-def health_check():
-    """Health check endpoint."""
-    return schemas.Health()
-
-
-@app.get("/health/live")
-def health_live():
-    """Liveness probe (process is running)."""
-    return {"status": "ok"}
+    shutdown_telemetry()
 
 
-@app.get("/health/ready")
-def health_ready(
-    db: Database = Depends(get_db),
-    ctx=Depends(get_service_context),
-):
-    """Readiness probe (dependencies reachable) with comprehensive health checking."""
+def _build_health_checker(db, config, *, db_provider=None):
     from devgodzilla.engines.registry import get_registry
-    
-    # Build windmill client if enabled
+    from devgodzilla.services.health import HealthChecker
+    from devgodzilla.windmill.client import WindmillClient, WindmillConfig
+
     windmill_client = None
-    config = ctx.config
     if getattr(config, "windmill_enabled", False):
         try:
             windmill_client = WindmillClient(
@@ -270,21 +408,111 @@ def health_ready(
             )
         except Exception:
             pass
-    
-    # Get agent registry
+
     try:
         agent_registry = get_registry()
     except Exception:
         agent_registry = None
-    
-    # Create health checker and run checks
-    checker = HealthChecker(
-        db=db,
-        windmill=windmill_client,
-        agent_registry=agent_registry,
+
+    return HealthChecker(db=db, windmill=windmill_client, agent_registry=agent_registry, db_provider=db_provider)
+
+
+_health_prober = None
+
+
+def _probe_db():
+    """The database a request would get right now, honouring get_db overrides."""
+    provider = app.dependency_overrides.get(get_db, get_db)
+    db = provider()
+    return next(db) if inspect.isgenerator(db) else db
+
+
+@app.on_event("startup")
+def start_health_prober() -> None:
+    """
+    Set up the background prober behind /health.
+
+    Its threads start with the first health request, so an app that is never
+    probed (a TestClient, a one-off script) runs none.
+    """
+    global _health_prober
+    interval = float(getattr(config, "health_probe_interval_seconds", 0) or 0)
+    if interval <= 0:
+        return
+    from devgodzilla.services.health import HealthProber
+
+    _health_prober = HealthProber(
+        _build_health_checker(None, config, db_provider=_probe_db),
+        intervals={
+            "database": interval,
+            "windmill": config.health_windmill_ttl_seconds,
+            "agents": config.health_agents_ttl_seconds,
+        },
     )
-    status = checker.check_all_sync()
-    
+
+
+def _running_prober():
+    if _health_prober is not None:
+        _health_prober.start()
+    return _health_prober
+
+
+@app.on_event("shutdown")
+def stop_health_prober() -> None:
+    global _health_prober
+    if _health_prober is not None:
+        _health_prober.stop()
+        _health_prober = None
+
+
+@app.get("/health", response_model=schemas.Health)
+def health_check():
+    """Health check endpoint, served from the background prober's snapshot."""
+    prober = _running_prober()
+    if prober is None:
+        return schemas.Health()
+    snapshot = prober.snapshot()
+    return schemas.Health(
+        status="down" if snapshot.status == "error" else snapshot.status,
+        stale=any(c.details.get("stale") for c in snapshot.components.values()),
+        checked_at=snapshot.timestamp.isoformat(),
+    )
+
+
+@app.get("/health/live")
+def health_live():
+    """Liveness probe (process is running)."""
+    return {"status": "ok"}
+
+
+@app.get("/health/loop")
+def health_loop():
+    """Event loop lag statistics from the background monitor."""
+    from devgodzilla.db.async_database import get_loop_lag_monitor
+
+    return get_loop_lag_monitor().stats()
+
+
+@app.get("/health/latency")
+def health_latency():
+    """Probe latency histograms per component from the background prober."""
+    if _health_prober is None:
+        return {}
+    return _health_prober.latency()
+
+
+@app.get("/health/ready")
+def health_ready(
+    db: Database = Depends(get_db),
+    ctx=Depends(get_service_context),
+):
+    """Readiness probe (dependencies reachable) with comprehensive health checking."""
+    from devgodzilla.services.health import health_status_to_dict
+
+    prober = _running_prober()
+    if prober is not None:
+        return health_status_to_dict(prober.snapshot())
+    status = _build_health_checker(db, ctx.config).check_all_sync()
     return health_status_to_dict(status)
 
 
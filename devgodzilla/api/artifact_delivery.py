@@ -0,0 +1,232 @@
+"""
+DevGodzilla Artifact Delivery
+
+Serves artifact and log content without loading whole files. JSON previews
+read one bounded window (from an offset, or the tail) so the console can page
+through large logs; downloads stream with HTTP Range support. Both carry a
+strong ETag (the blob digest for stored artifacts, size and mtime for plain
+files) plus Last-Modified, and answer conditional requests with 304.
+
+Full downloads of text artifacts are gzip-encoded for clients that accept
+it; blobs the store already keeps gzip-compressed are sent as stored.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import zlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+from devgodzilla.api import schemas
+from devgodzilla.api.serialization import FastJSONResponse
+from devgodzilla.engines.artifact_store import StoredArtifact
+
+MAX_PREVIEW_BYTES = 2_000_000
+_CHUNK_BYTES = 64 * 1024
+
+_TEXT_SUFFIXES = (".log", ".txt", ".md", ".diff", ".patch", ".json", ".jsonl", ".yaml", ".yml", ".csv")
+
+
+def _is_text(artifact: StoredArtifact) -> bool:
+    return artifact.encoding != "identity" or artifact.name.lower().endswith(_TEXT_SUFFIXES)
+
+
+def _media_type(artifact: StoredArtifact) -> str:
+    if artifact.name.lower().endswith(".json"):
+        return "application/json"
+    if _is_text(artifact):
+        return "text/plain; charset=utf-8"
+    return mimetypes.guess_type(artifact.name)[0] or "application/octet-stream"
+
+
+def _validators(artifact: StoredArtifact) -> Dict[str, str]:
+    return {
+        "ETag": f'"{artifact.etag}"',
+        "Last-Modified": formatdate(artifact.modified, usegmt=True),
+        # Clients may keep a copy but must revalidate; logs keep growing.
+        "Cache-Control": "no-cache",
+    }
+
+
+def _not_modified(request: Request, artifact: StoredArtifact, headers: Dict[str, str]) -> Optional[Response]:
+    """A 304 response if the client's cached copy is current."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        current = {f'"{artifact.etag}"', f'"{artifact.etag}-gzip"'}
+        if "*" in tags or tags & current:
+            return Response(status_code=304, headers=headers)
+        return None
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return None
+        if int(artifact.modified) <= since:
+            return Response(status_code=304, headers=headers)
+    return None
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def parse_byte_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``bytes=`` range into an inclusive (start, end) span.
+
+    Returns None for ranges that cannot be satisfied. Raises ValueError for
+    headers this module does not serve (malformed or multiple ranges), which
+    callers answer with the full content.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        raise ValueError(header)
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        suffix = int(last)
+        if suffix <= 0 or size == 0:
+            return None
+        return max(0, size - suffix), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and start > end:
+        raise ValueError(header)
+    if start >= size:
+        return None
+    return start, min(end, size - 1)
+
+
+def read_window(
+    artifact: StoredArtifact,
+    *,
+    max_bytes: int,
+    offset: Optional[int] = None,
+    tail: bool = False,
+) -> Tuple[bytes, int]:
+    """
+    Read at most ``max_bytes`` from ``offset`` (or the last ``max_bytes``).
+
+    Returns the bytes and the offset they start at. Compressed blobs are
+    decompressed up to the window, never held whole, so a window at offset N
+    costs O(N) CPU; logs, the kind that gets tailed, are stored uncompressed
+    (see ``TEXT_KINDS``) and seek directly.
+    """
+    if tail:
+        start = max(0, artifact.size - max_bytes)
+    else:
+        start = min(max(0, int(offset or 0)), artifact.size)
+    with artifact.open() as fh:
+        if start:
+            fh.seek(start)
+        return fh.read(max_bytes), start
+
+
+def _iter_span(artifact: StoredArtifact, start: int, end: int) -> Iterator[bytes]:
+    remaining = end - start + 1
+    with artifact.open() as fh:
+        if start:
+            fh.seek(start)
+        while remaining > 0:
+            chunk = fh.read(min(_CHUNK_BYTES, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def content_response(
+    request: Request,
+    artifact: StoredArtifact,
+    *,
+    artifact_id: str,
+    artifact_type: str,
+    max_bytes: int = 200_000,
+    offset: Optional[int] = None,
+    tail: bool = False,
+) -> Response:
+    """JSON preview of one window of ``artifact`` (an ``ArtifactContentOut``)."""
+    headers = _validators(artifact)
+    cached = _not_modified(request, artifact, headers)
+    if cached is not None:
+        return cached
+
+    max_bytes = max(1, min(int(max_bytes), MAX_PREVIEW_BYTES))
+    raw, start = read_window(artifact, max_bytes=max_bytes, offset=offset, tail=tail)
+    body = schemas.ArtifactContentOut(
+        id=artifact_id,
+        name=artifact.name,
+        type=artifact_type,
+        content=raw.decode("utf-8", errors="replace"),
+        truncated=start > 0 or start + len(raw) < artifact.size,
+        offset=start,
+        size=artifact.size,
+    )
+    return FastJSONResponse(body.model_dump(), headers=headers)
+
+
+def download_response(request: Request, artifact: StoredArtifact) -> Response:
+    """Raw download of ``artifact`` with Range, conditional GET and gzip support."""
+    headers = _validators(artifact)
+    cached = _not_modified(request, artifact, headers)
+    if cached is not None:
+        return cached
+
+    media_type = _media_type(artifact)
+    headers["Accept-Ranges"] = "bytes"
+    headers["Content-Disposition"] = f'attachment; filename="{artifact.name}"'
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and if_range is not None and if_range.strip() != headers["ETag"]:
+        range_header = None
+
+    if range_header:
+        if artifact.path is not None:
+            # FileResponse serves (multi-)ranges itself, validated by our ETag.
+            return FileResponse(artifact.path, headers=headers, media_type=media_type)
+        try:
+            span = parse_byte_range(range_header, artifact.size)
+        except ValueError:
+            span = ()  # not a range we serve; send the whole artifact
+        if span is None:
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{artifact.size}"})
+        if span:
+            start, end = span
+            headers["Content-Range"] = f"bytes {start}-{end}/{artifact.size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _iter_span(artifact, start, end), status_code=206, headers=headers, media_type=media_type
+            )
+
+    if _is_text(artifact) and _accepts_gzip(request):
+        headers["ETag"] = f'"{artifact.etag}-gzip"'
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+        stored = artifact.stored_path()
+        # FileResponse would apply a (declined) Range to the compressed bytes.
+        if artifact.encoding == "gzip" and stored is not None and "range" not in request.headers:
+            return FileResponse(stored, headers=headers, media_type=media_type)
+        return StreamingResponse(_gzip_chunks(artifact.iter_chunks()), headers=headers, media_type=media_type)
+
+    if artifact.path is not None:
+        return FileResponse(artifact.path, headers=headers, media_type=media_type)
+    headers["Content-Length"] = str(artifact.size)
+    return StreamingResponse(artifact.iter_chunks(), headers=headers, media_type=media_type)
@@ -1,13 +1,15 @@
-from typing import Optional
+import asyncio
+from typing import Optional, Set
 
 from fastapi import Depends, Header, HTTPException, Request, Query
 
 from devgodzilla.cli.main import get_db as cli_get_db, get_service_context as cli_get_service_context
 from devgodzilla.services.base import ServiceContext
 
+from devgodzilla.db.async_database import AsyncDatabase, get_async_database
 from devgodzilla.db.database import Database
 from devgodzilla.windmill.client import WindmillClient, WindmillConfig
-from devgodzilla.config import load_config
+from devgodzilla.config import get_config_snapshot, token_matches
 
 def get_db():
     """Get database instance."""
@@ -18,6 +20,40 @@ def get_db():
         pass
 
 
+_ASYNC_DB: Optional[AsyncDatabase] = None
+# close() of facades replaced by a database swap, kept referenced until done.
+_RETIRED_ASYNC_DBS: Set["asyncio.Task[None]"] = set()
+
+
+async def get_async_db(db: Database = Depends(get_db)) -> AsyncDatabase:
+    """Async facade over the process database, for handlers on the event loop."""
+    global _ASYNC_DB
+    if _ASYNC_DB is None or _ASYNC_DB.sync is not db:
+        if _ASYNC_DB is not None:
+            # Closed in the background: a pool close waits for connections
+            # still checked out by other requests.
+            task = asyncio.get_running_loop().create_task(_ASYNC_DB.close())
+            _RETIRED_ASYNC_DBS.add(task)
+            task.add_done_callback(_RETIRED_ASYNC_DBS.discard)
+        config = get_config_snapshot().config
+        _ASYNC_DB = get_async_database(
+            db,
+            max_workers=getattr(config, "db_async_workers", 4),
+            pool_size=getattr(config, "db_pool_size", 20),
+        )
+    return _ASYNC_DB
+
+
+async def close_async_db() -> None:
+    """Close the current async facade and any still closing after a swap."""
+    global _ASYNC_DB
+    if _ASYNC_DB is not None:
+        await _ASYNC_DB.close()
+        _ASYNC_DB = None
+    if _RETIRED_ASYNC_DBS:
+        await asyncio.gather(*list(_RETIRED_ASYNC_DBS), return_exceptions=True)
+
+
 def require_api_token(
     authorization: Optional[str] = Header(None, alias="Authorization"),
     x_devgodzilla_token: Optional[str] = Header(None, alias="X-DevGodzilla-Token"),
@@ -30,21 +66,23 @@ def require_api_token(
     - Header `Authorization: Bearer <token>`
     - Header `X-DevGodzilla-Token: <token>`
     - Query parameter `token=<token>` (for SSE/WebSockets)
+
+    Tokens are compared in constant time against a digest precomputed
+    when the config snapshot was loaded.
     """
-    config = load_config()
-    expected = config.api_token
-    if not expected:
+    expected = get_config_snapshot().api_token_digest
+    if expected is None:
         return
 
-    if x_devgodzilla_token and x_devgodzilla_token == expected:
+    if token_matches(x_devgodzilla_token, expected):
         return
         
-    if token and token == expected:
+    if token_matches(token, expected):
         return
 
     if authorization:
         parts = authorization.strip().split(None, 1)
-        if len(parts) == 2 and parts[0].lower() == "bearer" and parts[1] == expected:
+        if len(parts) == 2 and parts[0].lower() == "bearer" and token_matches(parts[1], expected):
             return
 
     raise HTTPException(status_code=401, detail="Unauthorized")
@@ -64,18 +102,16 @@ def require_webhook_token(
     - expose inbound webhooks to Windmill/CI, while
     - still securing the public API surface.
     """
-    config = load_config()
-    expected = config.webhook_token
-    if not expected:
+    expected = get_config_snapshot().webhook_token_digest
+    if expected is None:
         return
-    if x_devgodzilla_webhook_token == expected:
+    if token_matches(x_devgodzilla_webhook_token, expected):
         return
     path = request.url.path or ""
     if path.endswith("/webhooks/github") or path.endswith("/webhooks/gitlab"):
         if x_hub_signature_256 or x_hub_signature or x_gitlab_token:
             return
-    if x_devgodzilla_webhook_token != expected:
-        raise HTTPException(status_code=401, detail="Unauthorized")
+    raise HTTPException(status_code=401, detail="Unauthorized")
 
 def get_service_context(
     _db: Database = Depends(get_db),
@@ -5,17 +5,17 @@ DB-backed Server-Sent Events (SSE) and WebSocket endpoints for real-time updates
 """
 
 import asyncio
-import json
 from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 
 from fastapi import APIRouter, Depends, Header, Query, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 
-from devgodzilla.api import schemas
-from devgodzilla.api.dependencies import get_db
-from devgodzilla.db.database import Database
+from devgodzilla.api.dependencies import get_async_db
+from devgodzilla.api.serialization import FastJSONResponse, dumps_str, event_json, event_payload
+from devgodzilla.db.async_database import AsyncDatabase
 from devgodzilla.events_catalog import normalize_event_type
 from devgodzilla.logging import get_logger
+from devgodzilla.models.domain import Event
 
 logger = get_logger(__name__)
 
@@ -56,27 +56,25 @@ class ConnectionManager:
 ws_manager = ConnectionManager()
 
 
-def _event_to_sse(event: schemas.EventOut) -> str:
-    payload = event.model_dump()
+def _event_to_sse(event: Event) -> str:
     return (
         f"id: {event.id}\n"
         f"event: {event.event_type}\n"
-        f"data: {json.dumps(payload, default=str)}\n\n"
+        f"data: {event_json(event)}\n\n"
     )
 
-def _event_to_sse_message(event: schemas.EventOut) -> str:
-    payload = event.model_dump()
+def _event_to_sse_message(event: Event) -> str:
     # Omit `event:` so browsers dispatch this as the default "message" event.
     return (
         f"id: {event.id}\n"
-        f"data: {json.dumps(payload, default=str)}\n\n"
+        f"data: {event_json(event)}\n\n"
     )
 
 
 # ==================== SSE Endpoint ====================
 
 async def event_generator(
-    db: Database,
+    db: AsyncDatabase,
     protocol_id: Optional[int] = None,
     project_id: Optional[int] = None,
     event_types: Optional[List[str]] = None,
@@ -95,7 +93,7 @@ async def event_generator(
     category_set = {normalize_event_type(c) for c in categories or [] if c}
     idle_ticks = 0
     while True:
-        batch = db.list_events_since_id(
+        batch = await db.list_events_since_id(
             since_id=last_id,
             limit=200,
             protocol_run_id=protocol_id,
@@ -105,11 +103,10 @@ async def event_generator(
         if batch:
             idle_ticks = 0
             for e in batch:
-                out = schemas.EventOut.model_validate(e)
-                last_id = max(last_id, out.id)
-                if category_set and (out.event_category or "other") not in category_set:
+                last_id = max(last_id, e.id)
+                if category_set and (e.event_category or "other") not in category_set:
                     continue
-                yield _event_to_sse(out) if named_events else _event_to_sse_message(out)
+                yield _event_to_sse(e) if named_events else _event_to_sse_message(e)
         else:
             idle_ticks += 1
             if idle_ticks >= int(30 / max(poll_interval_seconds, 0.1)):
@@ -128,7 +125,7 @@ async def events_stream(
     category: Optional[List[str]] = Query(None, description="Filter by event category"),
     since_id: int = Query(0, ge=0, description="Only stream events with id > since_id"),
     last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Server-Sent Events stream for real-time updates.
@@ -168,7 +165,7 @@ async def events_stream_message(
     category: Optional[List[str]] = Query(None, description="Filter by event category"),
     since_id: int = Query(0, ge=0, description="Only stream events with id > since_id"),
     last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     SSE stream using default browser "message" events.
@@ -208,7 +205,7 @@ async def recent_events(
     event_type: Optional[str] = Query(None, description="Filter by event type"),
     kind: Optional[str] = Query(None, description="Deprecated: use event_type"),
     category: Optional[List[str]] = Query(None, description="Filter by event category"),
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Get recent events (non-streaming).
@@ -216,23 +213,21 @@ async def recent_events(
     Returns the last N events from the DB-backed event store.
     """
     effective_event_types = [event_type or kind] if (event_type or kind) else None
-    items = db.list_recent_events(
+    items = await db.list_recent_events(
         limit=limit,
         protocol_run_id=protocol_id,
         project_id=project_id,
         event_types=effective_event_types,
         categories=category,
     )
-    return {
-        "events": [schemas.EventOut.model_validate(e).model_dump() for e in items],
-    }
+    return FastJSONResponse({"events": [event_payload(e) for e in items]})
 
 
 # ==================== WebSocket Endpoint ====================
 
 async def _ws_event_pusher(
     websocket: WebSocket,
-    db: Database,
+    db: AsyncDatabase,
     poll_interval: float = 0.5,
 ):
     """Background task to push events to WebSocket client based on subscriptions."""
@@ -260,7 +255,7 @@ async def _ws_event_pusher(
                     except (ValueError, IndexError):
                         pass
 
-            batch = db.list_events_since_id(
+            batch = await db.list_events_since_id(
                 since_id=last_id,
                 limit=200,
                 protocol_run_id=protocol_id,
@@ -270,21 +265,20 @@ async def _ws_event_pusher(
             if batch:
                 idle_ticks = 0
                 for e in batch:
-                    out = schemas.EventOut.model_validate(e)
-                    last_id = max(last_id, out.id)
+                    last_id = max(last_id, e.id)
 
                     channel = "events"
-                    if out.protocol_run_id:
-                        channel = f"protocol:{out.protocol_run_id}"
+                    if e.protocol_run_id:
+                        channel = f"protocol:{e.protocol_run_id}"
 
                     message = {
                         "type": "event",
                         "channel": channel,
-                        "payload": out.model_dump(),
-                        "id": str(out.id),
-                        "ts": out.created_at.isoformat() if out.created_at else None,
+                        "payload": event_payload(e),
+                        "id": str(e.id),
+                        "ts": e.created_at or None,
                     }
-                    await websocket.send_json(message)
+                    await websocket.send_text(dumps_str(message))
             else:
                 idle_ticks += 1
                 if idle_ticks >= int(30 / max(poll_interval, 0.1)):
@@ -302,7 +296,7 @@ async def _ws_event_pusher(
 @router.websocket("/ws/events")
 async def websocket_events(
     websocket: WebSocket,
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     WebSocket endpoint for real-time event updates.
@@ -314,6 +314,14 @@ async def metrics():
     )
 
 
+@router.get("/metrics/sandbox")
+def sandbox_metrics():
+    """Sandbox session startup latency per backend and idle container count."""
+    from devgodzilla.engines.sandbox import get_sandbox_pool
+
+    return get_sandbox_pool().stats()
+
+
 # ==================== Helper Functions ====================
 
 def record_protocol_started():
@@ -5,12 +5,16 @@ import subprocess
 import time
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
 
 from devgodzilla.api import schemas
+from devgodzilla.api.artifact_delivery import content_response
 from devgodzilla.api.dependencies import get_db, get_service_context
+from devgodzilla.api.serialization import dump_trusted_many
+from devgodzilla.api.versioning import versioned_response
 from devgodzilla.db.database import Database, _UNSET
+from devgodzilla.engines.artifact_store import StoredArtifact
 from devgodzilla.events_catalog import normalize_event_type
 from devgodzilla.logging import get_logger, log_extra
 from devgodzilla.services.base import ServiceContext
@@ -192,14 +196,18 @@ def create_project(
 
 @router.get("/projects", response_model=List[schemas.ProjectOut])
 def list_projects(
+    request: Request,
     status: Optional[str] = None,
     db: Database = Depends(get_db)
 ):
     """List all projects, optionally filtered by status."""
-    projects = db.list_projects()
-    if status:
-        projects = [p for p in projects if p.status == status]
-    return projects
+    def build():
+        projects = db.list_projects()
+        if status:
+            projects = [p for p in projects if p.status == status]
+        return dump_trusted_many(schemas.ProjectOut, projects)
+
+    return versioned_response(request, db, scopes=["projects"], build=build)
 
 @router.get("/projects/{project_id}", response_model=schemas.ProjectOut)
 def get_project(
@@ -595,11 +603,13 @@ def onboard_project(
             discovery_error = disc.error
             discovery_warning = disc.warning
             fallback_engine_id = disc.fallback_engine_id
+            discovery_stages = disc.stage_timings()
         except Exception as e:
             discovery_success = False
             discovery_error = str(e)
             discovery_warning = None
             fallback_engine_id = None
+            discovery_stages = []
         discovery_duration_ms = int((time.perf_counter() - discovery_start) * 1000)
         logger.info(
             "discovery_completed",
@@ -626,6 +636,7 @@ def onboard_project(
                 "error": discovery_error,
                 "warning": discovery_warning,
                 "fallback_engine_id": fallback_engine_id,
+                "stages": discovery_stages,
             },
         )
     else:
@@ -700,6 +711,7 @@ def retry_project_discovery(
     discovery_error: Optional[str] = None
     discovery_warning: Optional[str] = None
     fallback_engine_id: Optional[str] = None
+    discovery_stages: List[dict] = []
     try:
         from devgodzilla.services.discovery_agent import DiscoveryAgentService
 
@@ -720,6 +732,7 @@ def retry_project_discovery(
         discovery_error = disc.error
         discovery_warning = disc.warning
         fallback_engine_id = disc.fallback_engine_id
+        discovery_stages = disc.stage_timings()
     except Exception as e:
         discovery_success = False
         discovery_error = str(e)
@@ -740,6 +753,7 @@ def retry_project_discovery(
             "model": request.discovery_model,
             "pipeline": pipeline,
             "retry": True,
+            "stages": discovery_stages,
         },
     )
 
@@ -758,8 +772,11 @@ def retry_project_discovery(
 
 @router.get("/projects/{project_id}/discovery/logs", response_model=schemas.ArtifactContentOut)
 def get_project_discovery_logs(
+    request: Request,
     project_id: int,
     max_bytes: int = 200_000,
+    offset: Optional[int] = Query(None, ge=0, description="Byte offset of the window"),
+    tail: bool = Query(False, description="Return the last max_bytes instead"),
     db: Database = Depends(get_db),
 ):
     try:
@@ -772,7 +789,8 @@ def get_project_discovery_logs(
 
     repo_root = Path(project.local_path).expanduser().resolve()
     log_path = repo_root / "specs" / "discovery" / "_runtime" / "opencode-discovery.log"
-    if not log_path.exists() or not log_path.is_file():
+    log = StoredArtifact.from_file(log_path)
+    if log is None:
         return schemas.ArtifactContentOut(
             id="discovery-log",
             name=log_path.name,
@@ -780,23 +798,8 @@ def get_project_discovery_logs(
             content="",
             truncated=False,
         )
-
-    max_bytes = max(1, min(int(max_bytes), 2_000_000))
-    raw = log_path.read_bytes()
-    truncated = len(raw) > max_bytes
-    if truncated:
-        raw = raw[:max_bytes]
-    try:
-        content = raw.decode("utf-8")
-    except Exception:
-        content = raw.decode("utf-8", errors="replace")
-
-    return schemas.ArtifactContentOut(
-        id="discovery-log",
-        name=log_path.name,
-        type="log",
-        content=content,
-        truncated=truncated,
+    return content_response(
+        request, log, artifact_id="discovery-log", artifact_type="log", max_bytes=max_bytes, offset=offset, tail=tail
     )
 
 @router.get("/projects/{project_id}/sprints", response_model=List[schemas.SprintOut])
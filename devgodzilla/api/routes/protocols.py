@@ -1,13 +1,16 @@
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Request
 from pydantic import BaseModel, Field
 
 from devgodzilla.api import schemas
 from devgodzilla.api.dependencies import get_db, get_service_context, get_windmill_client
+from devgodzilla.api.serialization import FastJSONResponse, dump_trusted, dump_trusted_many
+from devgodzilla.api.versioning import versioned_response
 from devgodzilla.services.base import ServiceContext
 from devgodzilla.db.database import Database
+from devgodzilla.engines.artifact_store import list_stored_artifacts
 from devgodzilla.services.orchestrator import OrchestratorMode, OrchestratorService
 from devgodzilla.services.planning import PlanningService
 from devgodzilla.services.policy import PolicyService
@@ -230,31 +233,39 @@ def list_protocols(
 
     if status:
         runs = [r for r in runs if r.status == status]
-    return runs[:limit]
+    return FastJSONResponse(dump_trusted_many(schemas.ProtocolOut, runs[:limit]))
 
 @router.get("/protocols/{protocol_id}", response_model=schemas.ProtocolOut)
 def get_protocol(
+    request: Request,
     protocol_id: int,
     db: Database = Depends(get_db)
 ):
     """Get a protocol run by ID."""
-    try:
-        return db.get_protocol_run(protocol_id)
-    except KeyError:
-        raise HTTPException(status_code=404, detail=f"Protocol {protocol_id} not found")
+    def build():
+        try:
+            return dump_trusted(schemas.ProtocolOut, db.get_protocol_run(protocol_id))
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Protocol {protocol_id} not found")
+
+    return versioned_response(request, db, scopes=[f"protocol:{protocol_id}"], build=build)
 
 
 @router.get("/protocols/{protocol_id}/steps", response_model=List[schemas.StepOut])
 def list_protocol_steps(
+    request: Request,
     protocol_id: int,
     db: Database = Depends(get_db),
 ):
     """List steps for a protocol run."""
-    try:
-        db.get_protocol_run(protocol_id)
-    except KeyError:
-        raise HTTPException(status_code=404, detail="Protocol not found")
-    return db.list_step_runs(protocol_id)
+    def build():
+        try:
+            db.get_protocol_run(protocol_id)
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Protocol not found")
+        return dump_trusted_many(schemas.StepOut, db.list_step_runs(protocol_id))
+
+    return versioned_response(request, db, scopes=[f"protocol:{protocol_id}"], build=build)
 
 
 # Response models for new endpoints
@@ -318,7 +329,7 @@ def list_protocol_runs(
         job_type=job_type,
         limit=limit,
     )
-    return [schemas.JobRunOut.model_validate(r) for r in runs]
+    return FastJSONResponse(dump_trusted_many(schemas.JobRunOut, runs))
 
 
 @router.post("/protocols/{protocol_id}/actions/open_pr", response_model=OpenPRResponse)
@@ -402,6 +413,8 @@ def list_protocol_events(
     protocol_id: int,
     event_type: Optional[str] = Query(None, description="Filter by event type"),
     category: Optional[List[str]] = Query(None, description="Filter by event category"),
+    include_archived: bool = Query(False, description="Also return events moved to the retention archive"),
+    ctx: ServiceContext = Depends(get_service_context),
     db: Database = Depends(get_db),
 ):
     try:
@@ -409,10 +422,20 @@ def list_protocol_events(
     except KeyError:
         raise HTTPException(status_code=404, detail="Protocol not found")
     event_types = [event_type] if event_type else None
-    return [
-        schemas.EventOut.model_validate(e)
-        for e in db.list_events(protocol_id, event_types=event_types, categories=category)
-    ]
+    events = db.list_events(protocol_id, event_types=event_types, categories=category)
+    if include_archived:
+        from devgodzilla.events_catalog import normalize_event_type
+        from devgodzilla.services.retention import RetentionService
+
+        archived = RetentionService(ctx, db).list_archived_events(protocol_id)
+        if event_types:
+            wanted = {normalize_event_type(t) for t in event_types}
+            archived = [e for e in archived if e.event_type in wanted]
+        if category:
+            archived = [e for e in archived if e.event_category in category]
+        live_ids = {e.id for e in events}
+        events = [e for e in archived if e.id not in live_ids] + events
+    return FastJSONResponse(dump_trusted_many(schemas.EventOut, events))
 
 
 @router.get("/protocols/{protocol_id}/flow")
@@ -641,42 +664,31 @@ def list_protocol_artifacts(
     project = db.get_project(run.project_id)
     root = _protocol_root(run, _workspace_root(run, project))
 
-    items: List[schemas.ProtocolArtifactOut] = []
+    found = []
     for step in db.list_step_runs(protocol_id):
         artifacts_dir = root / ".devgodzilla" / "steps" / str(step.id) / "artifacts"
-        if not artifacts_dir.exists():
-            continue
-        for p in artifacts_dir.iterdir():
-            if not p.is_file():
-                continue
-            stat = p.stat()
-            items.append(
-                schemas.ProtocolArtifactOut(
-                    id=f"{step.id}:{p.name}",
-                    type=_artifact_type_from_name(p.name),
-                    name=p.name,
-                    size=stat.st_size,
-                    created_at=None,
-                    step_run_id=step.id,
-                    step_name=step.step_name,
-                )
-            )
-
-    # Sort by file mtime desc (best-effort)
-    def _mtime(item: schemas.ProtocolArtifactOut) -> float:
-        try:
-            step_id_str, filename = item.id.split(":", 1)
-            p = root / ".devgodzilla" / "steps" / step_id_str / "artifacts" / filename
-            return p.stat().st_mtime
-        except Exception:
-            return 0.0
+        for artifact in list_stored_artifacts(artifacts_dir):
+            found.append((artifact.modified, step, artifact))
 
-    items.sort(key=_mtime, reverse=True)
-    return items[:limit]
+    # Newest first
+    found.sort(key=lambda item: item[0], reverse=True)
+    return [
+        schemas.ProtocolArtifactOut(
+            id=f"{step.id}:{artifact.name}",
+            type=_artifact_type_from_name(artifact.name),
+            name=artifact.name,
+            size=artifact.size,
+            created_at=None,
+            step_run_id=step.id,
+            step_name=step.step_name,
+        )
+        for _, step, artifact in found[:limit]
+    ]
 
 
 @router.get("/protocols/{protocol_id}/quality", response_model=schemas.QualitySummaryOut)
 def get_protocol_quality(
+    request: Request,
     protocol_id: int,
     db: Database = Depends(get_db),
 ):
@@ -685,6 +697,15 @@ def get_protocol_quality(
 
     Aggregates per-step QA verdicts from qa_results.
     """
+    return versioned_response(
+        request,
+        db,
+        scopes=[f"protocol:{protocol_id}"],
+        build=lambda: _protocol_quality(db, protocol_id).model_dump(mode="json"),
+    )
+
+
+def _protocol_quality(db: Database, protocol_id: int) -> schemas.QualitySummaryOut:
     try:
         db.get_protocol_run(protocol_id)
     except KeyError:
@@ -795,7 +816,7 @@ def get_protocol_quality_gates(
     protocol_id: int,
     db: Database = Depends(get_db),
 ):
-    summary = get_protocol_quality(protocol_id, db)
+    summary = _protocol_quality(db, protocol_id)
     return {"gates": summary.gates}
 
 
@@ -8,34 +8,38 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 from devgodzilla.api import schemas
 from devgodzilla.api.dependencies import get_db
+from devgodzilla.api.versioning import versioned_response
 from devgodzilla.db.database import Database
 
 router = APIRouter(tags=["Queues"])
 
 
+def _queue_stats(db: Database) -> list:
+    return [schemas.QueueStatsOut.model_validate(s).model_dump(mode="json") for s in db.get_queue_stats()]
+
+
 @router.get("/queues", response_model=List[schemas.QueueStatsOut])
-def get_queue_stats(db: Database = Depends(get_db)):
+def get_queue_stats(request: Request, db: Database = Depends(get_db)):
     """
     Return queue statistics for monitoring.
     
     Groups job runs by queue name and provides counts by status.
     """
-    stats = db.get_queue_stats()
-    return [schemas.QueueStatsOut.model_validate(s) for s in stats]
+    return versioned_response(request, db, scopes=["queue:*"], build=lambda: _queue_stats(db))
 
 @router.get("/queues/stats", response_model=List[schemas.QueueStatsOut])
-def get_queue_stats_alias(db: Database = Depends(get_db)):
+def get_queue_stats_alias(request: Request, db: Database = Depends(get_db)):
     """Alias for `/queues` (kept for frontend/backwards compatibility)."""
-    stats = db.get_queue_stats()
-    return [schemas.QueueStatsOut.model_validate(s) for s in stats]
+    return versioned_response(request, db, scopes=["queue:*"], build=lambda: _queue_stats(db))
 
 
 @router.get("/queues/jobs", response_model=List[schemas.QueueJobOut])
 def list_queue_jobs(
+    request: Request,
     status: Optional[str] = None,
     limit: int = 100,
     db: Database = Depends(get_db)
@@ -47,5 +51,8 @@ def list_queue_jobs(
         status: Filter by job status (queued, running, completed, failed)
         limit: Maximum number of jobs to return
     """
-    jobs = db.list_queue_jobs(status=status, limit=limit)
-    return [schemas.QueueJobOut.model_validate(j) for j in jobs]
+    def build():
+        jobs = db.list_queue_jobs(status=status, limit=limit)
+        return [schemas.QueueJobOut.model_validate(j).model_dump(mode="json") for j in jobs]
+
+    return versioned_response(request, db, scopes=["queue:*"], build=build)
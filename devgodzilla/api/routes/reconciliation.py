@@ -10,9 +10,9 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
 from pydantic import BaseModel, Field
 
-from devgodzilla.api.dependencies import get_db, get_service_context, get_windmill_client
+from devgodzilla.api.dependencies import get_async_db, get_service_context, get_windmill_client
 from devgodzilla.services.base import ServiceContext
-from devgodzilla.db.database import Database
+from devgodzilla.db.async_database import AsyncDatabase
 from devgodzilla.services.reconciliation import (
     ReconciliationService,
     ReconciliationReport,
@@ -96,7 +96,7 @@ class ReconciliationRunRequest(BaseModel):
 # Dependency injection
 def get_reconciliation_service(
     ctx: ServiceContext = Depends(get_service_context),
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
     windmill: WindmillClient = Depends(get_windmill_client),
 ) -> ReconciliationService:
     """Create ReconciliationService with dependencies."""
@@ -237,7 +237,7 @@ async def reconcile_protocol(
     protocol_run_id: int,
     dry_run: bool = Query(False, description="Report mismatches without applying fixes"),
     service: ReconciliationService = Depends(get_reconciliation_service),
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Reconcile all steps for a specific protocol.
@@ -247,7 +247,7 @@ async def reconcile_protocol(
         dry_run: If true, report what would change without applying fixes
     """
     try:
-        db.get_protocol_run(protocol_run_id)
+        await db.get_protocol_run(protocol_run_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Protocol not found")
 
@@ -263,7 +263,7 @@ async def reconcile_step(
     step_run_id: int,
     dry_run: bool = Query(False, description="Report mismatches without applying fixes"),
     service: ReconciliationService = Depends(get_reconciliation_service),
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Reconcile a single step run with its Windmill job.
@@ -273,7 +273,7 @@ async def reconcile_step(
         dry_run: If true, report what would change without applying fixes
     """
     try:
-        db.get_step_run(step_run_id)
+        await db.get_step_run(step_run_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Step not found")
 
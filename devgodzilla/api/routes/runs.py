@@ -5,13 +5,16 @@ import json
 from pathlib import Path
 from typing import AsyncGenerator, List, Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 
 from devgodzilla.api import schemas
+from devgodzilla.api.artifact_delivery import content_response, download_response
 from devgodzilla.api.dependencies import get_db
-from devgodzilla.config import load_config
+from devgodzilla.api.serialization import FastJSONResponse, dump_trusted_many
+from devgodzilla.config import get_cached_config
 from devgodzilla.db.database import Database
+from devgodzilla.engines.artifact_store import StoredArtifact
 from devgodzilla.logging import get_logger
 from devgodzilla.windmill.client import JobStatus, WindmillClient, WindmillConfig
 
@@ -20,7 +23,7 @@ logger = get_logger(__name__)
 
 
 def _build_windmill_client() -> WindmillClient | None:
-    config = load_config()
+    config = get_cached_config()
     if not getattr(config, "windmill_enabled", False):
         return None
     try:
@@ -178,7 +181,7 @@ def list_runs(
                 runs = synced
         finally:
             windmill.close()
-    return [schemas.JobRunOut.model_validate(r) for r in runs]
+    return FastJSONResponse(dump_trusted_many(schemas.JobRunOut, runs))
 
 
 @router.get("/runs/{run_id}", response_model=schemas.JobRunOut)
@@ -199,18 +202,38 @@ def get_run(
     return schemas.JobRunOut.model_validate(run)
 
 
+def _resolve_path(raw: str) -> Path:
+    path = Path(raw).expanduser()
+    if not path.is_absolute():
+        path = (Path.cwd() / path).resolve()
+    return path
+
+
+def _run_log(db: Database, run_id: str) -> Optional[StoredArtifact]:
+    """The run's log file, or None if the run has no log path."""
+    try:
+        run = db.get_job_run(run_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Run not found")
+    if not run.log_path:
+        return None
+    log = StoredArtifact.from_file(_resolve_path(run.log_path))
+    if log is None:
+        raise HTTPException(status_code=404, detail="Run logs not found")
+    return log
+
+
 @router.get("/runs/{run_id}/logs", response_model=schemas.ArtifactContentOut)
 def get_run_logs(
+    request: Request,
     run_id: str,
     max_bytes: int = 200_000,
+    offset: Optional[int] = Query(None, ge=0, description="Byte offset of the window"),
+    tail: bool = Query(False, description="Return the last max_bytes instead"),
     db: Database = Depends(get_db),
 ):
-    try:
-        run = db.get_job_run(run_id)
-    except KeyError:
-        raise HTTPException(status_code=404, detail="Run not found")
-
-    if not run.log_path:
+    log = _run_log(db, run_id)
+    if log is None:
         return schemas.ArtifactContentOut(
             id="logs",
             name="logs",
@@ -218,31 +241,21 @@ def get_run_logs(
             content="",
             truncated=False,
         )
+    return content_response(
+        request, log, artifact_id="logs", artifact_type="log", max_bytes=max_bytes, offset=offset, tail=tail
+    )
 
-    path = Path(run.log_path).expanduser()
-    if not path.is_absolute():
-        path = (Path.cwd() / path).resolve()
-    if not path.exists() or not path.is_file():
-        raise HTTPException(status_code=404, detail="Run logs not found")
-
-    max_bytes = max(1, min(int(max_bytes), 2_000_000))
-    raw = path.read_bytes()
-    truncated = len(raw) > max_bytes
-    if truncated:
-        raw = raw[:max_bytes]
 
-    try:
-        content = raw.decode("utf-8")
-    except Exception:
-        content = raw.decode("utf-8", errors="replace")
-
-    return schemas.ArtifactContentOut(
-        id="logs",
-        name=path.name,
-        type="log",
-        content=content,
-        truncated=truncated,
-    )
+@router.get("/runs/{run_id}/logs/download")
+def download_run_logs(
+    request: Request,
+    run_id: str,
+    db: Database = Depends(get_db),
+):
+    log = _run_log(db, run_id)
+    if log is None:
+        raise HTTPException(status_code=404, detail="Run logs not found")
+    return download_response(request, log)
 
 
 @router.get("/runs/{run_id}/logs/stream")
@@ -315,39 +328,43 @@ def list_run_artifacts(
     return items
 
 
+def _run_artifact(db: Database, run_id: str, artifact_id: str) -> StoredArtifact:
+    try:
+        record = db.get_run_artifact(run_id, artifact_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+    artifact = StoredArtifact.from_file(_resolve_path(record.path), name=artifact_id)
+    if artifact is None:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+    return artifact
+
+
 @router.get("/runs/{run_id}/artifacts/{artifact_id}/content", response_model=schemas.ArtifactContentOut)
 def get_run_artifact_content(
+    request: Request,
     run_id: str,
     artifact_id: str,
     max_bytes: int = 200_000,
+    offset: Optional[int] = Query(None, ge=0, description="Byte offset of the window"),
+    tail: bool = Query(False, description="Return the last max_bytes instead"),
     db: Database = Depends(get_db),
 ):
-    try:
-        artifact = db.get_run_artifact(run_id, artifact_id)
-    except KeyError:
-        raise HTTPException(status_code=404, detail="Artifact not found")
-
-    path = Path(artifact.path).expanduser()
-    if not path.is_absolute():
-        path = (Path.cwd() / path).resolve()
-    if not path.exists() or not path.is_file():
-        raise HTTPException(status_code=404, detail="Artifact not found")
+    return content_response(
+        request,
+        _run_artifact(db, run_id, artifact_id),
+        artifact_id=artifact_id,
+        artifact_type=_artifact_type_from_name(artifact_id),
+        max_bytes=max_bytes,
+        offset=offset,
+        tail=tail,
+    )
 
-    max_bytes = max(1, min(int(max_bytes), 2_000_000))
-    raw = path.read_bytes()
-    truncated = len(raw) > max_bytes
-    if truncated:
-        raw = raw[:max_bytes]
 
-    try:
-        content = raw.decode("utf-8")
-    except Exception:
-        content = raw.decode("utf-8", errors="replace")
-
-    return schemas.ArtifactContentOut(
-        id=artifact_id,
-        name=artifact_id,
-        type=_artifact_type_from_name(artifact_id),
-        content=content,
-        truncated=truncated,
-    )
+@router.get("/runs/{run_id}/artifacts/{artifact_id}/download")
+def download_run_artifact(
+    request: Request,
+    run_id: str,
+    artifact_id: str,
+    db: Database = Depends(get_db),
+):
+    return download_response(request, _run_artifact(db, run_id, artifact_id))
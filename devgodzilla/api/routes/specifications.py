@@ -5,33 +5,16 @@ Endpoints for listing and managing feature specifications across projects.
 Enhanced with comprehensive filtering support.
 """
 from typing import List, Optional, Any, Dict
-from datetime import datetime, timedelta
 from pathlib import Path
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from devgodzilla.api.dependencies import get_db, get_service_context, Database
-from devgodzilla.services.base import ServiceContext
-from devgodzilla.services.specification import SpecificationService
+from devgodzilla.api.dependencies import get_db, Database
+from devgodzilla.models.domain import SpecCatalogEntry
 
 router = APIRouter(tags=["specifications"])
 
 
-def _spec_value(item: Any, key: str, default: Any = None) -> Any:
-    if isinstance(item, dict):
-        return item.get(key, default)
-    return getattr(item, key, default)
-
-
-def _spec_key(item: Any, resolved_spec_id: int) -> str:
-    spec_run_id = _spec_value(item, "spec_run_id", None) or _spec_value(item, "id", None)
-    if spec_run_id is not None:
-        return f"run:{spec_run_id}"
-    spec_path_value = str(_spec_value(item, "path", "") or "")
-    spec_slug = Path(spec_path_value).name if spec_path_value else str(resolved_spec_id)
-    return f"slug:{spec_slug}"
-
-
 class SpecificationOut(BaseModel):
     id: int
     spec_run_id: Optional[int] = None
@@ -98,11 +81,36 @@ class SpecificationsListOut(BaseModel):
     filters_applied: Dict[str, Any]
 
 
-def get_specification_service(
-    ctx: ServiceContext = Depends(get_service_context),
-    db: Database = Depends(get_db),
-) -> SpecificationService:
-    return SpecificationService(ctx, db)
+def _entry_to_out(entry: SpecCatalogEntry) -> SpecificationOut:
+    return SpecificationOut(
+        id=entry.spec_run_id or entry.id,
+        spec_run_id=entry.spec_run_id,
+        path=entry.path,
+        spec_path=entry.spec_path,
+        plan_path=entry.plan_path,
+        tasks_path=entry.tasks_path,
+        checklist_path=entry.checklist_path,
+        analysis_path=entry.analysis_path,
+        implement_path=entry.implement_path,
+        title=entry.title,
+        project_id=entry.project_id,
+        project_name=entry.project_name or "",
+        status=entry.status or "draft",
+        created_at=entry.spec_created_at,
+        worktree_path=entry.worktree_path,
+        branch_name=entry.branch_name,
+        base_branch=entry.base_branch,
+        feature_name=entry.feature_name,
+        spec_number=entry.spec_number,
+        tasks_generated=entry.has_tasks,
+        linked_tasks=entry.linked_tasks,
+        completed_tasks=entry.completed_tasks,
+        story_points=entry.story_points,
+        has_plan=entry.has_plan,
+        has_tasks=entry.has_tasks,
+        sprint_id=entry.sprint_id,
+        sprint_name=entry.sprint_name,
+    )
 
 
 @router.get("/specifications", response_model=SpecificationsListOut)
@@ -115,14 +123,20 @@ def list_specifications(
     has_plan: Optional[bool] = Query(None, description="Filter by has implementation plan"),
     has_tasks: Optional[bool] = Query(None, description="Filter by has tasks generated"),
     search: Optional[str] = Query(None, description="Search in title and path"),
+    sort: Optional[str] = Query(
+        None,
+        description="Sort by title, status, created_at or updated_at (prefix '-' for descending)",
+    ),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
     db: Database = Depends(get_db),
-    service: SpecificationService = Depends(get_specification_service),
 ):
     """
     List all feature specifications across projects with comprehensive filtering.
     
+    Served from the materialized spec catalog: filters, search, sort and
+    pagination all run in SQL.
+
     Filters:
     - project_id: Filter to a specific project
     - sprint_id: Filter specs linked to a specific sprint
@@ -150,249 +164,71 @@ def list_specifications(
         filters_applied["has_tasks"] = has_tasks
     if search:
         filters_applied["search"] = search
-    
-    # Get projects to iterate
+    if sort:
+        filters_applied["sort"] = sort
+
     if project_id:
         try:
-            project = db.get_project(project_id)
-            projects = [project] if project else []
+            db.get_project(project_id)
         except (KeyError, Exception):
             raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
-    else:
-        projects = db.list_projects()[:100]
-    
-    # If filtering by sprint, get sprint details
-    sprint_project_filter = None
+
+    sprint = None
     if sprint_id:
         try:
             sprint = db.get_sprint(sprint_id)
-            sprint_project_filter = sprint.project_id
         except (KeyError, Exception):
             raise HTTPException(status_code=404, detail=f"Sprint {sprint_id} not found")
-    
-    all_specifications = []
-    spec_id = 0
-    
-    for project in projects:
-        if not project or not project.local_path:
-            continue
-        
-        # Skip if sprint filter and project doesn't match
-        if sprint_project_filter is not None and project.id != sprint_project_filter:
-            continue
-            
-        try:
-            specs = service.list_specs(project.local_path, project_id=project.id)
-            project_tasks = db.list_tasks(project_id=project.id, limit=500)
-            project_sprints = {sprint.id: sprint for sprint in db.list_sprints(project_id=project.id)}
-            try:
-                project_spec_links = db.list_spec_sprint_links(project.id)
-            except Exception:
-                project_spec_links = {}
-            spec_task_map: Dict[str, List[Any]] = {}
-            for task in project_tasks:
-                spec_label = next((label for label in task.labels if label.startswith("spec:")), None)
-                if not spec_label:
-                    continue
-                spec_slug = spec_label.split(":", 1)[1]
-                spec_task_map.setdefault(spec_slug, []).append(task)
-            for spec in specs:
-                spec_id += 1
-                resolved_spec_id = _spec_value(spec, "spec_run_id", None) or _spec_value(spec, "id", None) or spec_id
-                spec_ref_key = _spec_key(spec, resolved_spec_id)
-                
-                # Determine status based on what exists
-                has_tasks_value = bool(_spec_value(spec, "has_tasks", False))
-                has_plan_value = bool(_spec_value(spec, "has_plan", False))
-                has_spec_value = bool(_spec_value(spec, "has_spec", False))
-
-                status_override = _spec_value(spec, "status", None)
-                if status_override in ("cleaned", "failed"):
-                    spec_status = status_override
-                else:
-                    if has_tasks_value:
-                        spec_status = "completed"
-                    elif has_plan_value:
-                        spec_status = "in-progress"
-                    elif has_spec_value:
-                        spec_status = "draft"
-                    else:
-                        continue  # Skip if no spec file
-                
-                # Apply status filter
-                if status and spec_status != status:
-                    continue
-                
-                # Apply has_plan filter
-                if has_plan is not None and has_plan_value != has_plan:
-                    continue
-                
-                # Apply has_tasks filter
-                if has_tasks is not None and has_tasks_value != has_tasks:
-                    continue
-                
-                # Try to extract title from spec name
-                spec_name = _spec_value(spec, "name", "spec")
-                title = spec_name.replace("-", " ").replace("_", " ").title()
-                if title.startswith("Feature "):
-                    title = title[8:]
-                
-                # Apply search filter
-                if search:
-                    search_lower = search.lower()
-                    spec_path_value = str(_spec_value(spec, "path", ""))
-                    if search_lower not in title.lower() and search_lower not in spec_path_value.lower():
-                        continue
-                
-                # Get spec file modification time for date filtering
-                spec_created_at = None
-                try:
-                    spec_dir = Path(_spec_value(spec, "path", ""))
-                    if not spec_dir.is_absolute():
-                        spec_dir = Path(project.local_path) / spec_dir
-                    spec_file = spec_dir / "spec.md"
-                    if spec_file.exists():
-                        stat = spec_file.stat()
-                        spec_created_at = datetime.fromtimestamp(stat.st_mtime).isoformat()
-                except Exception:
-                    pass
-                
-                # Apply date filters
-                if date_from and spec_created_at:
-                    try:
-                        from_date = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
-                        spec_date = datetime.fromisoformat(spec_created_at.replace('Z', '+00:00'))
-                        if spec_date < from_date:
-                            continue
-                    except ValueError:
-                        pass
-                
-                if date_to and spec_created_at:
-                    try:
-                        to_date = datetime.fromisoformat(date_to.replace('Z', '+00:00'))
-                        spec_date = datetime.fromisoformat(spec_created_at.replace('Z', '+00:00'))
-                        if spec_date > to_date:
-                            continue
-                    except ValueError:
-                        pass
-                
-                spec_slug = Path(_spec_value(spec, "path", "")).name
-                spec_tasks = spec_task_map.get(spec_slug, [])
-                linked_tasks = len(spec_tasks)
-                completed_tasks = sum(1 for t in spec_tasks if t.board_status == "done")
-                story_points = sum(t.story_points or 0 for t in spec_tasks)
-                spec_sprint_ids = {t.sprint_id for t in spec_tasks if t.sprint_id}
-                linked_sprint_id = project_spec_links.get(spec_ref_key)
-                if linked_sprint_id is not None:
-                    spec_sprint_ids.add(linked_sprint_id)
-                spec_sprint_id = None
-                spec_sprint_name = None
-
-                if linked_sprint_id is not None:
-                    spec_sprint_id = linked_sprint_id
-                    sprint = project_sprints.get(spec_sprint_id)
-                    spec_sprint_name = sprint.name if sprint else None
-                elif len(spec_sprint_ids) == 1:
-                    spec_sprint_id = next(iter(spec_sprint_ids))
-                    sprint = project_sprints.get(spec_sprint_id)
-                    spec_sprint_name = sprint.name if sprint else None
-                elif len(spec_sprint_ids) > 1:
-                    spec_sprint_name = "Multiple"
-
-                if sprint_id is not None:
-                    if sprint_id not in spec_sprint_ids:
-                        continue
-                    spec_sprint_id = sprint_id
-                    sprint = project_sprints.get(spec_sprint_id)
-                    spec_sprint_name = sprint.name if sprint else spec_sprint_name
-                
-                all_specifications.append(SpecificationOut(
-                    id=resolved_spec_id,
-                    spec_run_id=_spec_value(spec, "spec_run_id", None) or _spec_value(spec, "id", None),
-                    path=_spec_value(spec, "path", ""),
-                    spec_path=_spec_value(spec, "spec_path"),
-                    plan_path=_spec_value(spec, "plan_path"),
-                    tasks_path=_spec_value(spec, "tasks_path"),
-                    checklist_path=_spec_value(spec, "checklist_path"),
-                    analysis_path=_spec_value(spec, "analysis_path"),
-                    implement_path=_spec_value(spec, "implement_path"),
-                    title=title,
-                    project_id=project.id,
-                    project_name=project.name,
-                    status=spec_status,
-                    created_at=spec_created_at,
-                    worktree_path=_spec_value(spec, "worktree_path"),
-                    branch_name=_spec_value(spec, "branch_name"),
-                    base_branch=_spec_value(spec, "base_branch"),
-                    feature_name=_spec_value(spec, "feature_name"),
-                    spec_number=_spec_value(spec, "spec_number"),
-                    tasks_generated=has_tasks_value,
-                    linked_tasks=linked_tasks,
-                    completed_tasks=completed_tasks,
-                    story_points=story_points,
-                    has_plan=has_plan_value,
-                    has_tasks=has_tasks_value,
-                    sprint_id=spec_sprint_id,
-                    sprint_name=spec_sprint_name,
-                ))
-        except Exception:
-            # Skip projects with errors
-            continue
-    
-    # Apply pagination
-    total = len(all_specifications)
-    paginated = all_specifications[offset:offset + limit]
-    
+
+    entries, total = db.list_spec_catalog(
+        project_id=project_id,
+        sprint_id=sprint_id,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+        has_plan=has_plan,
+        has_tasks=has_tasks,
+        search=search,
+        sort=sort,
+        limit=limit,
+        offset=offset,
+    )
+    items = [_entry_to_out(entry) for entry in entries]
+    if sprint is not None:
+        for item in items:
+            item.sprint_id = sprint.id
+            item.sprint_name = sprint.name
+
     return SpecificationsListOut(
-        items=paginated,
+        items=items,
         total=total,
         filters_applied=filters_applied,
     )
 
 
-def _get_specification_by_id(
-    spec_id: int,
-    db: Database,
-    service: SpecificationService,
-) -> SpecificationOut:
-    result = list_specifications(
-        project_id=None,
-        sprint_id=None,
-        status=None,
-        date_from=None,
-        date_to=None,
-        has_plan=None,
-        has_tasks=None,
-        search=None,
-        limit=500,
-        offset=0,
-        db=db,
-        service=service,
-    )
-    for spec in result.items:
-        if spec.id == spec_id:
-            return spec
-    raise HTTPException(status_code=404, detail=f"Specification {spec_id} not found")
+def _get_catalog_entry(spec_id: int, db: Database) -> SpecCatalogEntry:
+    try:
+        return db.get_spec_catalog_entry(spec_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Specification {spec_id} not found")
 
 
 @router.get("/specifications/{spec_id}", response_model=SpecificationOut)
 def get_specification(
     spec_id: int,
     db: Database = Depends(get_db),
-    service: SpecificationService = Depends(get_specification_service),
 ):
     """Get a single specification by ID."""
-    return _get_specification_by_id(spec_id=spec_id, db=db, service=service)
+    return _entry_to_out(_get_catalog_entry(spec_id, db))
 
 
 @router.get("/specifications/{spec_id}/content", response_model=SpecificationContentOut)
 def get_specification_content(
     spec_id: int,
     db: Database = Depends(get_db),
-    service: SpecificationService = Depends(get_specification_service),
 ):
     """Get specification content including spec, plan, and tasks markdown."""
-    spec = _get_specification_by_id(spec_id=spec_id, db=db, service=service)
+    spec = _get_catalog_entry(spec_id, db)
     
     # Get project to find local path
     try:
@@ -460,10 +296,9 @@ def link_specification_to_sprint(
     spec_id: int,
     request: SpecificationLinkSprintRequest,
     db: Database = Depends(get_db),
-    service: SpecificationService = Depends(get_specification_service),
 ):
     """Link or unlink a specification to/from a sprint."""
-    spec = _get_specification_by_id(spec_id=spec_id, db=db, service=service)
+    spec = _get_catalog_entry(spec_id, db)
     
     # Verify sprint exists if linking
     if request.sprint_id is not None:
@@ -482,9 +317,8 @@ def link_specification_to_sprint(
         except Exception as exc:
             raise HTTPException(status_code=500, detail=f"Failed to load sprint {request.sprint_id}: {exc}")
     
-    spec_ref_key = _spec_key(spec, spec.id)
     try:
-        db.set_spec_sprint_link(spec.project_id, spec_ref_key, request.sprint_id)
+        db.set_spec_sprint_link(spec.project_id, spec.spec_key, request.sprint_id)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     except Exception as exc:
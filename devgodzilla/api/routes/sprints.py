@@ -1,11 +1,11 @@
 from typing import List, Optional
-from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException
 from devgodzilla.api import schemas
 from devgodzilla.db.database import Database
 from devgodzilla.api.dependencies import get_db
+from devgodzilla.services.sprint_analytics import SprintAnalyticsService, SprintStats
 from devgodzilla.services.sprint_integration import SprintIntegrationService
-from devgodzilla.models.domain import Sprint, AgileTask
+from devgodzilla.models.domain import Sprint
 
 router = APIRouter(prefix="/sprints", tags=["sprints"])
 
@@ -76,26 +76,64 @@ def get_sprint_metrics(
     except KeyError:
         raise HTTPException(status_code=404, detail="Sprint not found")
 
-    tasks = db.list_tasks(sprint_id=sprint_id)
-    total_tasks = len(tasks)
-    completed_tasks = sum(1 for t in tasks if t.board_status == "done")
-    total_points = sum(t.story_points or 0 for t in tasks)
-    completed_points = sum(t.story_points or 0 for t in tasks if t.board_status == "done")
-
-    # Generate burndown data points
-    burndown = _calculate_burndown_data(sprint, tasks)
-    
-    # Calculate velocity trend (simplified - using historical sprints from same project)
-    velocity_trend = _calculate_velocity_trend(db, sprint.project_id, sprint_id)
+    analytics = SprintAnalyticsService(db)
+    stats = analytics.stats(sprint_id)
 
     return schemas.SprintMetricsOut(
         sprint_id=sprint_id,
-        total_tasks=total_tasks,
-        completed_tasks=completed_tasks,
-        total_points=total_points,
-        completed_points=completed_points,
-        burndown=burndown,
-        velocity_trend=velocity_trend
+        total_tasks=stats.total_tasks,
+        completed_tasks=stats.completed_tasks,
+        total_points=stats.total_points,
+        completed_points=stats.completed_points,
+        burndown=_calculate_burndown_data(db, sprint, stats),
+        velocity_trend=_calculate_velocity_trend(db, sprint.project_id, sprint_id),
+    )
+
+@router.get("/{sprint_id}/burndown", response_model=schemas.SprintBurndownOut)
+def get_sprint_burndown(
+    sprint_id: int,
+    db: Database = Depends(get_db)
+):
+    """Daily burndown (remaining) and burnup (completed vs scope) series."""
+    try:
+        sprint = db.get_sprint(sprint_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+
+    analytics = SprintAnalyticsService(db)
+    stats = analytics.stats(sprint_id)
+    return schemas.SprintBurndownOut(
+        sprint_id=sprint_id,
+        total_points=stats.total_points,
+        completed_points=stats.completed_points,
+        points=[
+            schemas.SprintBurndownPointOut(**point.__dict__)
+            for point in analytics.burndown(sprint, stats)
+        ],
+    )
+
+@router.get("/{sprint_id}/dependencies", response_model=schemas.SprintDependenciesOut)
+def get_sprint_dependencies(
+    sprint_id: int,
+    db: Database = Depends(get_db)
+):
+    """Blocked and ready tasks plus the critical chain, from one graph load."""
+    try:
+        sprint = db.get_sprint(sprint_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+
+    graph = db.load_task_graph(sprint.project_id)
+    task_ids = graph.sprint_task_ids(sprint_id)
+    blocked = graph.blocked_ids(task_ids)
+    chain = graph.critical_chain(task_ids)
+    return schemas.SprintDependenciesOut(
+        sprint_id=sprint_id,
+        blocked=blocked,
+        unblocked=graph.unblocked_ids(task_ids),
+        blockers={task_id: graph.open_blockers(task_id) for task_id in blocked},
+        critical_chain=chain,
+        critical_chain_points=graph.chain_points(chain),
     )
 
 @router.delete("/{sprint_id}")
@@ -173,16 +211,14 @@ async def get_sprint_velocity(
         raise HTTPException(status_code=404, detail="Sprint not found")
 
     velocity = await service.calculate_sprint_velocity(sprint_id)
-    tasks = db.list_tasks(sprint_id=sprint_id)
-    total_points = sum(t.story_points or 0 for t in tasks)
-    completed_points = sum(t.story_points or 0 for t in tasks if t.board_status == "done")
+    stats = SprintAnalyticsService(db).stats(sprint_id)
 
     return schemas.SprintVelocityOut(
         sprint_id=sprint_id,
         velocity_actual=velocity,
-        total_points=total_points,
-        completed_points=completed_points,
-        completion_rate=completed_points / total_points if total_points > 0 else 0.0,
+        total_points=stats.total_points,
+        completed_points=stats.completed_points,
+        completion_rate=stats.completion_rate,
     )
 
 
@@ -234,74 +270,17 @@ async def import_tasks_to_sprint(
     )
 
 
-def _calculate_burndown_data(sprint: Sprint, tasks: List[AgileTask]) -> List[schemas.BurndownPointOut]:
-    """Calculate burndown chart data points for a sprint."""
+def _calculate_burndown_data(db: Database, sprint: Sprint, stats: SprintStats) -> List[schemas.BurndownPointOut]:
+    """Burndown points for the metrics view; future days repeat the latest remaining."""
     burndown_points = []
-    
-    # If no start/end dates, return empty burndown
-    if not sprint.start_date or not sprint.end_date:
-        return burndown_points
-    
-    try:
-        start_date = datetime.fromisoformat(sprint.start_date.replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(sprint.end_date.replace('Z', '+00:00'))
-    except (ValueError, AttributeError):
-        # If date parsing fails, return empty burndown
-        return burndown_points
-    
-    total_points = sum(t.story_points or 0 for t in tasks)
-    if total_points == 0:
-        return burndown_points
-    
-    # Calculate ideal burndown (linear)
-    sprint_days = (end_date - start_date).days
-    if sprint_days <= 0:
-        return burndown_points
-    
-    current_date = start_date
-    daily_ideal_burn = total_points / sprint_days
-    
-    for day in range(sprint_days + 1):
-        date_str = current_date.strftime("%Y-%m-%d")
-        ideal_remaining = max(0, total_points - (day * daily_ideal_burn))
-        
-        # For actual, we'd need task completion timestamps
-        # For now, use a simplified calculation based on current completion
-        completed_points = sum(t.story_points or 0 for t in tasks if t.board_status == "done")
-        actual_remaining = total_points - completed_points
-        
-        burndown_points.append(schemas.BurndownPointOut(
-            date=date_str,
-            ideal=ideal_remaining,
-            actual=actual_remaining
-        ))
-        
-        current_date += timedelta(days=1)
-    
+    actual = float(stats.remaining_points)
+    for point in SprintAnalyticsService(db).burndown(sprint, stats):
+        if point.remaining is not None:
+            actual = point.remaining
+        burndown_points.append(schemas.BurndownPointOut(date=point.date, ideal=point.ideal, actual=actual))
     return burndown_points
 
 
 def _calculate_velocity_trend(db: Database, project_id: int, current_sprint_id: int) -> List[int]:
-    """Calculate velocity trend from historical sprints in the same project."""
-    # Get completed sprints from the same project (excluding current sprint)
-    all_sprints = db.list_sprints(project_id=project_id)
-    completed_sprints = [
-        s for s in all_sprints
-        if s.id != current_sprint_id and s.status == "completed"
-    ]
-
-    # Sort oldest to newest with deterministic tie-breaking.
-    completed_sprints.sort(key=lambda s: (s.created_at or "", s.id))
-
-    # Calculate velocity for up to the first 5 completed sprints.
-    velocity_trend = []
-    for sprint in completed_sprints[:5]:
-        tasks = db.list_tasks(sprint_id=sprint.id)
-        completed_points = sum(t.story_points or 0 for t in tasks if t.board_status == "done")
-        velocity_trend.append(completed_points)
-
-    # If we have fewer than 5 sprints, pad with zeros on the left.
-    while len(velocity_trend) < 5:
-        velocity_trend.insert(0, 0)
-
-    return velocity_trend
+    """Velocity of the first five completed sprints in the project, oldest first, zero-padded."""
+    return SprintAnalyticsService(db).velocity_trend(project_id, current_sprint_id)
@@ -2,8 +2,7 @@ from typing import List, Optional
 from pathlib import Path
 import subprocess
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 
 from devgodzilla.api.dependencies import get_service_context
@@ -15,8 +14,11 @@ from devgodzilla.services.quality import QualityService
 from devgodzilla.qa.gates import LintGate, TypeGate, TestGate
 
 from devgodzilla.api import schemas
+from devgodzilla.api.artifact_delivery import content_response, download_response
 from devgodzilla.api.dependencies import get_db
 from devgodzilla.db.database import Database
+from devgodzilla.engines.artifact_store import get_artifact_store, list_stored_artifacts, open_stored_artifact
+from devgodzilla.engines.artifacts import ArtifactWriter
 
 router = APIRouter()
 
@@ -277,28 +279,29 @@ def execute_step(
 
     # Persist basic artifacts (logs + metadata + best-effort git diff) for UI
     try:
-        import json
-
-        artifacts_dir = _step_artifacts_dir(db, step_id)
-        (artifacts_dir / "execution.log").write_text(result.stdout or "", encoding="utf-8")
-        (artifacts_dir / "execution.stderr.log").write_text(result.stderr or "", encoding="utf-8")
-        (artifacts_dir / "execution.meta.json").write_text(
-            json.dumps(
-                {
-                    "engine_id": result.engine_id,
-                    "model": result.model,
-                    "success": result.success,
-                    "tokens_used": result.tokens_used,
-                    "cost_cents": result.cost_cents,
-                    "duration_seconds": result.duration_seconds,
-                    "error": result.error,
-                },
-                indent=2,
-            ),
-            encoding="utf-8",
+        run = db.get_protocol_run(step.protocol_run_id)
+        writer = ArtifactWriter(
+            _step_artifacts_dir(db, step_id),
+            run_id=str(run.id),
+            step_run_id=step_id,
+            store=get_artifact_store(ctx.config),
+        )
+        writer.write_text("execution", result.stdout or "", kind="log", extension=".log")
+        writer.write_text("execution.stderr", result.stderr or "", kind="log", extension=".log")
+        writer.write_json(
+            "execution.meta",
+            {
+                "engine_id": result.engine_id,
+                "model": result.model,
+                "success": result.success,
+                "tokens_used": result.tokens_used,
+                "cost_cents": result.cost_cents,
+                "duration_seconds": result.duration_seconds,
+                "error": result.error,
+            },
+            kind="meta",
         )
 
-        run = db.get_protocol_run(step.protocol_run_id)
         project = db.get_project(run.project_id)
         cwd = _workspace_root(run, project)
         try:
@@ -310,7 +313,7 @@ def execute_step(
                 timeout=10,
             )
             if proc.returncode == 0 and proc.stdout.strip():
-                (artifacts_dir / "changes.diff").write_text(proc.stdout, encoding="utf-8")
+                writer.write_text("changes", proc.stdout, kind="diff", extension=".diff")
         except Exception:
             pass
     except Exception:
@@ -426,76 +429,68 @@ def list_step_artifacts(
     if not artifacts_dir.exists():
         return []
 
-    items: List[schemas.ArtifactOut] = []
-    for p in sorted(artifacts_dir.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-        if not p.is_file():
-            continue
-        stat = p.stat()
-        items.append(
-            schemas.ArtifactOut(
-                id=p.name,
-                type=_artifact_type_from_name(p.name),
-                name=p.name,
-                size=stat.st_size,
-                created_at=None,
-            )
+    return [
+        schemas.ArtifactOut(
+            id=artifact.name,
+            type=_artifact_type_from_name(artifact.name),
+            name=artifact.name,
+            size=artifact.size,
+            created_at=None,
         )
-    return items
+        for artifact in list_stored_artifacts(artifacts_dir)
+    ]
 
 
 @router.get("/steps/{step_id}/artifacts/{artifact_id}/content", response_model=schemas.ArtifactContentOut)
 def get_step_artifact_content(
+    request: Request,
     step_id: int,
     artifact_id: str,
     max_bytes: int = 200_000,
+    offset: Optional[int] = Query(None, ge=0, description="Byte offset of the preview window"),
+    tail: bool = Query(False, description="Preview the last max_bytes instead"),
     db: Database = Depends(get_db),
 ):
-    """Fetch artifact content for preview (truncates large files)."""
+    """Fetch one window of artifact content for preview (the head by default)."""
     try:
         db.get_step_run(step_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Step not found")
 
     artifacts_dir = _step_artifacts_dir(db, step_id)
-    path = _safe_child(artifacts_dir, artifact_id)
-    if not path.exists() or not path.is_file():
+    _safe_child(artifacts_dir, artifact_id)
+    artifact = open_stored_artifact(artifacts_dir, artifact_id)
+    if artifact is None:
         raise HTTPException(status_code=404, detail="Artifact not found")
 
-    max_bytes = max(1, min(int(max_bytes), 2_000_000))
-    raw = path.read_bytes()
-    truncated = len(raw) > max_bytes
-    if truncated:
-        raw = raw[:max_bytes]
-
-    try:
-        content = raw.decode("utf-8")
-    except Exception:
-        content = raw.decode("utf-8", errors="replace")
-
-    return schemas.ArtifactContentOut(
-        id=artifact_id,
-        name=artifact_id,
-        type=_artifact_type_from_name(artifact_id),
-        content=content,
-        truncated=truncated,
+    return content_response(
+        request,
+        artifact,
+        artifact_id=artifact_id,
+        artifact_type=_artifact_type_from_name(artifact_id),
+        max_bytes=max_bytes,
+        offset=offset,
+        tail=tail,
     )
 
 
 @router.get("/steps/{step_id}/artifacts/{artifact_id}/download")
 def download_step_artifact(
+    request: Request,
     step_id: int,
     artifact_id: str,
     db: Database = Depends(get_db),
 ):
-    """Download artifact as a file."""
+    """Download artifact as a file (supports Range and conditional requests)."""
     try:
         db.get_step_run(step_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Step not found")
 
     artifacts_dir = _step_artifacts_dir(db, step_id)
-    path = _safe_child(artifacts_dir, artifact_id)
-    if not path.exists() or not path.is_file():
+    _safe_child(artifacts_dir, artifact_id)
+    artifact = open_stored_artifact(artifacts_dir, artifact_id)
+    if artifact is None:
         raise HTTPException(status_code=404, detail="Artifact not found")
 
-    return FileResponse(path=str(path), filename=path.name)
+    return download_response(request, artifact)
@@ -66,6 +66,8 @@ def update_task(
         return db.update_task(task_id, **updates)
     except KeyError:
         raise HTTPException(status_code=404, detail="Task not found")
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 @router.patch("/{task_id}", response_model=schemas.AgileTaskOut)
 def patch_task(
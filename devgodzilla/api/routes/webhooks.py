@@ -13,8 +13,9 @@ from typing import Any, Dict, Optional
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
 from pydantic import BaseModel
 
-from devgodzilla.api.dependencies import get_db
-from devgodzilla.config import load_config
+from devgodzilla.api.dependencies import get_async_db
+from devgodzilla.config import get_cached_config
+from devgodzilla.db.async_database import AsyncDatabase
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import ProtocolStatus, StepStatus
@@ -76,20 +77,20 @@ def _normalize_repo_url(value: Optional[str]) -> Optional[str]:
     return text.strip("/")
 
 
-def _resolve_project_id(db: Database, candidates: list[str]) -> Optional[int]:
+async def _resolve_project_id(db: AsyncDatabase, candidates: list[str]) -> Optional[int]:
     normalized = {_normalize_repo_url(value) for value in candidates if value}
     normalized.discard(None)
     if not normalized:
         return None
-    for project in db.list_projects():
+    for project in await db.list_projects():
         project_url = _normalize_repo_url(project.git_url)
         if project_url and project_url in normalized:
             return project.id
     return None
 
 
-def _emit_ci_event(
-    db: Database,
+async def _emit_ci_event(
+    db: AsyncDatabase,
     *,
     event_type: str,
     message: str,
@@ -100,7 +101,7 @@ def _emit_ci_event(
     if project_id is None and protocol_run_id is None:
         return
     try:
-        db.append_event(
+        await db.append_event(
             protocol_run_id=protocol_run_id,
             project_id=project_id,
             event_type=event_type,
@@ -115,7 +116,7 @@ def _emit_ci_event(
 
 
 def _build_orchestrator(db: Database) -> OrchestratorService:
-    config = load_config()
+    config = get_cached_config()
     ctx = ServiceContext(config=config)
     windmill_client = None
     mode = OrchestratorMode.LOCAL
@@ -243,7 +244,7 @@ def _maybe_advance_protocol_on_ci(
 async def windmill_job_webhook(
     payload: WindmillJobUpdate,
     request: Request,
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Handle Windmill job status updates.
@@ -271,7 +272,7 @@ async def windmill_job_webhook(
     }
 
     try:
-        db.update_job_run_by_windmill_id(
+        await db.update_job_run_by_windmill_id(
             payload.job_id,
             status=status_map.get(payload.status.lower(), payload.status.lower()),
             result=payload.result,
@@ -295,7 +296,7 @@ async def windmill_job_webhook(
 @router.post("/windmill/flow")
 async def windmill_flow_webhook(
     request: Request,
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Handle Windmill flow completion webhook.
@@ -314,17 +315,18 @@ async def windmill_flow_webhook(
     flow_path = _extract_flow_path(payload)
 
     if protocol_run_id is None and flow_path:
-        for run in db.list_all_protocol_runs(limit=200):
+        for run in await db.list_all_protocol_runs(limit=200):
             if run.windmill_flow_id == flow_path:
                 protocol_run_id = run.id
                 break
 
     if protocol_run_id is not None:
         if _is_success_status(status):
-            orchestrator = _build_orchestrator(db)
-            orchestrator.check_and_complete_protocol(protocol_run_id)
+            # Orchestration is synchronous end to end; keep it off the loop.
+            orchestrator = _build_orchestrator(db.sync)
+            await db.run(orchestrator.check_and_complete_protocol, protocol_run_id)
         elif _is_failure_status(status):
-            db.update_protocol_status(protocol_run_id, ProtocolStatus.BLOCKED)
+            await db.update_protocol_status(protocol_run_id, ProtocolStatus.BLOCKED)
 
     return {"status": "received"}
 
@@ -339,7 +341,7 @@ async def github_webhook(
     x_hub_signature: str = Header(None),
     project_id: Optional[int] = Query(None, description="Override project ID for logging"),
     protocol_run_id: Optional[int] = Query(None, description="Override protocol run ID for logging"),
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Handle GitHub webhooks.
@@ -355,7 +357,7 @@ async def github_webhook(
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
-    config = load_config()
+    config = get_cached_config()
     if config.webhook_token:
         signature = x_hub_signature_256 or x_hub_signature
         if not _verify_github_signature(config.webhook_token, body, signature):
@@ -378,10 +380,10 @@ async def github_webhook(
     ]
     if repo.get("full_name"):
         candidate_urls.append(f"github.com/{repo['full_name']}")
-    resolved_project_id = project_id or _resolve_project_id(db, candidate_urls)
+    resolved_project_id = project_id or await _resolve_project_id(db, candidate_urls)
 
     event_type = f"ci_webhook_github_{x_github_event}" if x_github_event else "ci_webhook_github"
-    _emit_ci_event(
+    await _emit_ci_event(
         db,
         event_type=event_type,
         message=f"GitHub webhook {x_github_event or 'event'} received",
@@ -425,7 +427,7 @@ async def github_webhook(
 async def _handle_workflow_run(
     payload: dict,
     *,
-    db: Database,
+    db: AsyncDatabase,
     project_id: Optional[int],
     protocol_run_id: Optional[int],
 ):
@@ -434,7 +436,7 @@ async def _handle_workflow_run(
     conclusion = workflow_run.get("conclusion")
     
     if conclusion == "success":
-        _emit_ci_event(
+        await _emit_ci_event(
             db,
             event_type="ci_workflow_success",
             message="GitHub workflow succeeded",
@@ -442,10 +444,10 @@ async def _handle_workflow_run(
             protocol_run_id=protocol_run_id,
             metadata={"workflow": workflow_run.get("name"), "id": workflow_run.get("id")},
         )
-        if load_config().auto_qa_on_ci:
-            _maybe_advance_protocol_on_ci(db, protocol_run_id=protocol_run_id)
+        if get_cached_config().auto_qa_on_ci:
+            await db.run(_maybe_advance_protocol_on_ci, db.sync, protocol_run_id=protocol_run_id)
     elif conclusion in ("failure", "cancelled"):
-        _emit_ci_event(
+        await _emit_ci_event(
             db,
             event_type="ci_workflow_failed",
             message="GitHub workflow failed",
@@ -454,7 +456,7 @@ async def _handle_workflow_run(
             metadata={"workflow": workflow_run.get("name"), "id": workflow_run.get("id")},
         )
         if protocol_run_id is not None:
-            db.update_protocol_status(protocol_run_id, ProtocolStatus.BLOCKED)
+            await db.update_protocol_status(protocol_run_id, ProtocolStatus.BLOCKED)
     
     return {
         "status": "processed",
@@ -466,7 +468,7 @@ async def _handle_workflow_run(
 async def _handle_check_run(
     payload: dict,
     *,
-    db: Database,
+    db: AsyncDatabase,
     project_id: Optional[int],
     protocol_run_id: Optional[int],
 ):
@@ -474,7 +476,7 @@ async def _handle_check_run(
     check_run = payload.get("check_run", {})
     conclusion = check_run.get("conclusion")
     if conclusion == "success":
-        _emit_ci_event(
+        await _emit_ci_event(
             db,
             event_type="ci_check_success",
             message="GitHub check run succeeded",
@@ -483,7 +485,7 @@ async def _handle_check_run(
             metadata={"check": check_run.get("name"), "id": check_run.get("id")},
         )
     elif conclusion in ("failure", "cancelled"):
-        _emit_ci_event(
+        await _emit_ci_event(
             db,
             event_type="ci_check_failed",
             message="GitHub check run failed",
@@ -501,7 +503,7 @@ async def _handle_check_run(
 async def _handle_pull_request(
     payload: dict,
     *,
-    db: Database,
+    db: AsyncDatabase,
     project_id: Optional[int],
     protocol_run_id: Optional[int],
 ):
@@ -509,7 +511,7 @@ async def _handle_pull_request(
     action = payload.get("action")
     pr = payload.get("pull_request", {})
 
-    _emit_ci_event(
+    await _emit_ci_event(
         db,
         event_type="ci_pull_request",
         message=f"GitHub pull request {action}",
@@ -533,7 +535,7 @@ async def gitlab_webhook(
     x_gitlab_token: str = Header(None),
     project_id: Optional[int] = Query(None, description="Override project ID for logging"),
     protocol_run_id: Optional[int] = Query(None, description="Override protocol run ID for logging"),
-    db: Database = Depends(get_db),
+    db: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Handle GitLab webhooks.
@@ -548,7 +550,7 @@ async def gitlab_webhook(
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
-    config = load_config()
+    config = get_cached_config()
     if config.webhook_token:
         if not _verify_gitlab_token(config.webhook_token, x_gitlab_token):
             raise HTTPException(status_code=401, detail="Invalid GitLab token")
@@ -571,11 +573,11 @@ async def gitlab_webhook(
         project.get("http_url"),
         project.get("ssh_url"),
     ]
-    resolved_project_id = project_id or _resolve_project_id(db, candidate_urls)
+    resolved_project_id = project_id or await _resolve_project_id(db, candidate_urls)
 
     event_type = f"ci_webhook_gitlab_{object_kind}" if object_kind else "ci_webhook_gitlab"
     attrs = payload.get("object_attributes", {}) or {}
-    _emit_ci_event(
+    await _emit_ci_event(
         db,
         event_type=event_type,
         message=f"GitLab webhook {object_kind or 'event'} received",
@@ -611,7 +613,7 @@ async def gitlab_webhook(
 async def _handle_gitlab_pipeline(
     payload: dict,
     *,
-    db: Database,
+    db: AsyncDatabase,
     project_id: Optional[int],
     protocol_run_id: Optional[int],
 ):
@@ -619,7 +621,7 @@ async def _handle_gitlab_pipeline(
     attrs = payload.get("object_attributes", {})
     status = attrs.get("status")
     if status == "success":
-        _emit_ci_event(
+        await _emit_ci_event(
             db,
             event_type="ci_pipeline_success",
             message="GitLab pipeline succeeded",
@@ -627,10 +629,10 @@ async def _handle_gitlab_pipeline(
             protocol_run_id=protocol_run_id,
             metadata={"pipeline_id": attrs.get("id")},
         )
-        if load_config().auto_qa_on_ci:
-            _maybe_advance_protocol_on_ci(db, protocol_run_id=protocol_run_id)
+        if get_cached_config().auto_qa_on_ci:
+            await db.run(_maybe_advance_protocol_on_ci, db.sync, protocol_run_id=protocol_run_id)
     elif status in ("failed", "canceled", "cancelled"):
-        _emit_ci_event(
+        await _emit_ci_event(
             db,
             event_type="ci_pipeline_failed",
             message="GitLab pipeline failed",
@@ -639,7 +641,7 @@ async def _handle_gitlab_pipeline(
             metadata={"pipeline_id": attrs.get("id")},
         )
         if protocol_run_id is not None:
-            db.update_protocol_status(protocol_run_id, ProtocolStatus.BLOCKED)
+            await db.update_protocol_status(protocol_run_id, ProtocolStatus.BLOCKED)
     return {
         "status": "processed",
         "pipeline_status": attrs.get("status"),
@@ -649,13 +651,13 @@ async def _handle_gitlab_pipeline(
 async def _handle_gitlab_mr(
     payload: dict,
     *,
-    db: Database,
+    db: AsyncDatabase,
     project_id: Optional[int],
     protocol_run_id: Optional[int],
 ):
     """Handle GitLab merge request event."""
     attrs = payload.get("object_attributes", {})
-    _emit_ci_event(
+    await _emit_ci_event(
         db,
         event_type="ci_merge_request",
         message=f"GitLab merge request {attrs.get('action')}",
@@ -44,6 +44,8 @@ class Health(BaseModel):
     status: str = "ok"
     version: str = "0.1.0"
     service: str = "devgodzilla"
+    stale: bool = False
+    checked_at: Optional[str] = None
 
 # =============================================================================
 # Project Models
@@ -398,6 +400,8 @@ class ArtifactContentOut(BaseModel):
     type: str
     content: str
     truncated: bool = False
+    offset: int = 0  # byte offset of ``content`` within the artifact
+    size: Optional[int] = None  # total artifact size in bytes
 
 
 class ProtocolArtifactOut(ArtifactOut):
@@ -638,6 +642,27 @@ class SprintMetricsOut(BaseModel):
     burndown: List[BurndownPointOut]
     velocity_trend: List[int]
 
+class SprintBurndownPointOut(BaseModel):
+    date: str
+    ideal: float
+    remaining: Optional[float] = None
+    completed: Optional[float] = None
+    scope: Optional[float] = None
+
+class SprintBurndownOut(BaseModel):
+    sprint_id: int
+    total_points: int
+    completed_points: int
+    points: List[SprintBurndownPointOut]
+
+class SprintDependenciesOut(BaseModel):
+    sprint_id: int
+    blocked: List[int]
+    unblocked: List[int]
+    blockers: Dict[int, List[int]]
+    critical_chain: List[int]
+    critical_chain_points: int
+
 class AgileTaskCreate(BaseModel):
     project_id: int
     title: str
@@ -0,0 +1,182 @@
+"""
+DevGodzilla API Serialization
+
+Fast JSON encoding for trusted database output. Domain objects loaded by the
+row converters already have the types the response schemas declare, so list
+endpoints and event streams project them straight onto the schema's fields
+and encode once, instead of validating each row into a Pydantic model and
+dumping it back out. Uses orjson when it is installed.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from devgodzilla.api.schemas import EventOut
+from devgodzilla.models.domain import Event
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(value: Any) -> bytes:
+        """Encode ``value`` as compact UTF-8 JSON."""
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+
+    def dumps_str(value: Any) -> str:
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS).decode("utf-8")
+
+else:
+
+    def dumps(value: Any) -> bytes:
+        """Encode ``value`` as compact UTF-8 JSON."""
+        return dumps_str(value).encode("utf-8")
+
+    def dumps_str(value: Any) -> str:
+        return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":"))
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse encoded with :func:`dumps`.
+
+    Routes return it with content from :func:`dump_trusted_many` so FastAPI
+    skips ``response_model`` validation; keep ``response_model`` on the route
+    for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# =============================================================================
+# Trusted projection
+# =============================================================================
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _schema_fields(schema: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    fields = []
+    for name, info in schema.model_fields.items():
+        default = info.default
+        if info.default_factory is not None or default is PydanticUndefined:
+            default = _MISSING
+        fields.append((name, default))
+    return tuple(fields)
+
+
+def dump_trusted(schema: Type[BaseModel], obj: Any) -> Dict[str, Any]:
+    """
+    Project ``obj`` onto the fields of the flat response ``schema``.
+
+    Equivalent to ``schema.model_validate(obj).model_dump()`` for objects
+    built by the database row converters, without validating anything.
+    Attributes ``obj`` lacks take the field default, or None.
+    """
+    payload: Dict[str, Any] = {}
+    for name, default in _schema_fields(schema):
+        value = getattr(obj, name, _MISSING)
+        if value is _MISSING:
+            value = None if default is _MISSING else default
+        payload[name] = value
+    return payload
+
+
+def dump_trusted_many(schema: Type[BaseModel], objs: Iterable[Any]) -> List[Dict[str, Any]]:
+    return [dump_trusted(schema, obj) for obj in objs]
+
+
+# =============================================================================
+# Events
+# =============================================================================
+
+class _EventJSONCache:
+    """Bounded map of encoded events, shared by every stream in the process."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._maxsize = maxsize
+        self._items: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[str]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[Any, ...], value: str) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_event_json_cache = _EventJSONCache()
+
+
+def event_payload(event: Event) -> Dict[str, Any]:
+    """The ``EventOut`` payload of ``event`` as a plain dict."""
+    return dump_trusted(EventOut, event)
+
+
+def event_json(event: Event) -> str:
+    """
+    The ``EventOut`` JSON of ``event``.
+
+    Events are append-only, so the encoding is cached and reused across polls
+    and subscribers. Ids are only unique within one database, so the key also
+    carries the row's creation time, run and type (and the joined names).
+    """
+    key = (
+        event.id,
+        event.created_at,
+        event.protocol_run_id,
+        event.event_type,
+        event.protocol_name,
+        event.project_name,
+    )
+    cached = _event_json_cache.get(key)
+    if cached is None:
+        cached = dumps_str(event_payload(event))
+        _event_json_cache.put(key, cached)
+    return cached
@@ -0,0 +1,121 @@
+"""
+DevGodzilla Versioned Responses
+
+Conditional GET for the read endpoints the console polls. Each response is
+tied to change counters in ``resource_versions`` that database triggers bump
+on every write to the rows behind it (see ``db/schema.py``): ``projects``,
+``protocol:<id>`` (the run, its steps and QA results) and ``queue:*`` (the
+sum of the per-run job-run counters).
+
+A request first reads its counters in one indexed lookup. The strong ETag is
+a hash of the route, query parameters and counters, so a matching
+``If-None-Match`` is answered with 304 before any other query runs, and an
+unchanged response another client already asked for is served from a small
+in-process cache of encoded bodies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from fastapi import Request, Response
+
+from devgodzilla.api.serialization import dumps
+from devgodzilla.db.database import Database
+
+_CacheKey = Tuple[Any, ...]
+
+
+class ResponseCache:
+    """Bounded LRU of encoded response bodies keyed by (route, params, versions)."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._items: "OrderedDict[_CacheKey, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: _CacheKey) -> Optional[bytes]:
+        with self._lock:
+            body = self._items.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: _CacheKey, body: bytes) -> None:
+        with self._lock:
+            self._items[key] = body
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+# One cache per database handle, so tests and tools that swap databases never
+# see each other's bodies; it goes away with the handle.
+_CACHES: "weakref.WeakKeyDictionary[Any, ResponseCache]" = weakref.WeakKeyDictionary()
+_CACHES_LOCK = threading.Lock()
+
+
+def response_cache(db: Database) -> ResponseCache:
+    with _CACHES_LOCK:
+        cache = _CACHES.get(db)
+        if cache is None:
+            cache = _CACHES[db] = ResponseCache()
+        return cache
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def versioned_response(
+    request: Request,
+    db: Database,
+    *,
+    scopes: Sequence[str],
+    build: Callable[[], Any],
+) -> Response:
+    """
+    Serve ``build()`` as JSON, revalidated against the counters of ``scopes``.
+
+    ``build`` runs only when neither the client nor the cache holds the
+    current version. Exceptions it raises (404s) propagate uncached.
+    """
+    # Read before building: a write racing the build can only leave a body
+    # newer than its key, never an outdated body under a current key.
+    versions = db.get_resource_versions(scopes)
+    params = tuple(sorted(request.query_params.multi_items()))
+    key = (request.url.path, params, tuple(sorted(versions.items())))
+    location = str(getattr(db, "db_path", None) or getattr(db, "db_url", "") or "")
+    digest = hashlib.blake2b(repr((location, key)).encode("utf-8"), digest_size=12).hexdigest()
+    headers = {"ETag": f'"{digest}"', "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    cache = response_cache(db)
+    body = cache.get(key)
+    if body is None:
+        body = dumps(build())
+        cache.put(key, body)
+    return Response(content=body, media_type="application/json", headers=headers)
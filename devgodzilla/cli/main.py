@@ -11,11 +11,18 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from devgodzilla import __version__
 from devgodzilla.logging import get_logger, init_cli_logging
-from devgodzilla.services.path_contract import validate_path_contract
 
 logger = get_logger(__name__)
 
+
+def validate_path_contract(config):
+    """Validate core path contracts (imported on use to keep CLI startup fast)."""
+    from devgodzilla.services.path_contract import validate_path_contract as _validate
+
+    return _validate(config)
+
 # Banner for display
 BANNER = r"""
 ██████╗ ███████╗██╗   ██╗ ██████╗  ██████╗ ██████╗ ███████╗██╗██╗     ██╗      █████╗ 
@@ -33,27 +40,29 @@ def get_service_context(project_id: Optional[int] = None):
     Args:
         project_id: Optional project ID for request-scoped context.
     """
-    from devgodzilla.config import load_config
+    from devgodzilla.config import get_cached_config
     from devgodzilla.services.base import ServiceContext
     
-    config = load_config()
+    config = get_cached_config()
     return ServiceContext(config=config, project_id=project_id)
 
 
 def get_db():
     """Get database connection."""
     from devgodzilla.db import get_database
-    from devgodzilla.config import load_config
+    from devgodzilla.config import get_cached_config
     from devgodzilla.services.event_persistence import install_db_event_sink
+    from devgodzilla.services.events import get_event_bus
     
-    global _DB, _DB_KEY
+    global _DB, _DB_KEY, _DB_SINK
     try:
         _DB
     except NameError:  # pragma: no cover
         _DB = None  # type: ignore[assignment]
         _DB_KEY = None  # type: ignore[assignment]
+        _DB_SINK = None  # type: ignore[assignment]
 
-    config = load_config()
+    config = get_cached_config()
     current_key = (
         config.db_url,
         str(config.db_path) if getattr(config, "db_path", None) else None,
@@ -69,7 +78,12 @@ def get_db():
         _DB.init_schema()
         _DB_KEY = current_key  # type: ignore[assignment]
 
-    install_db_event_sink(db_provider=lambda: _DB)  # type: ignore[arg-type]
+    # The sink provider reads the module global, so it only needs
+    # installing once per event bus rather than on every call.
+    bus = get_event_bus()
+    if _DB_SINK is not bus:
+        install_db_event_sink(db_provider=lambda: _DB)  # type: ignore[arg-type]
+        _DB_SINK = bus  # type: ignore[assignment]
     return _DB  # type: ignore[return-value]
 
 
@@ -77,7 +91,38 @@ def get_db():
 # Main CLI Group
 # =============================================================================
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands defined in other modules are imported only
+    when invoked (or listed in --help), keyed by ``"module:attribute"``.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[dict] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            import importlib
+
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "project": "devgodzilla.cli.projects:project",
+        "agent": "devgodzilla.cli.agents:agent",
+        "spec": "devgodzilla.cli.speckit:spec_cli",
+        "clarify": "devgodzilla.cli.clarifications:clarification_cli",
+    },
+)
+@click.version_option(__version__, prog_name="DevGodzilla", message="%(prog)s v%(version)s")
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose output")
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
 @click.pass_context
@@ -120,21 +165,11 @@ def cli(ctx, verbose, json_output):
             if verbose:
                 click.echo(f"Warning: Failed to load agent config: {e}", err=True)
 
-from devgodzilla.cli.projects import project
-from devgodzilla.cli.agents import agent
-from devgodzilla.cli.speckit import spec_cli
-from devgodzilla.cli.clarifications import clarification_cli
-
-cli.add_command(project)
-cli.add_command(agent)
-cli.add_command(spec_cli)
-cli.add_command(clarification_cli)
-
 
 @cli.command()
 def version():
     """Show version information."""
-    click.echo("DevGodzilla v0.1.0")
+    click.echo(f"DevGodzilla v{__version__}")
 
 
 @cli.command()
@@ -1104,6 +1139,54 @@ def qa_gates(ctx):
             click.echo(f"                    {g['description']}")
 
 
+# =============================================================================
+# Retention Commands
+# =============================================================================
+
+@cli.group()
+def retention():
+    """History retention commands."""
+    pass
+
+
+@retention.command('run')
+@click.option('--dry-run', is_flag=True, help='Report the first expired batch per table without deleting')
+@click.pass_context
+def retention_run(ctx, dry_run):
+    """Archive and prune expired events, job runs, artifacts and QA history."""
+    from devgodzilla.services.retention import RetentionService
+
+    service = RetentionService(get_service_context(), get_db())
+    results = service.run(dry_run=dry_run)
+
+    if ctx.obj and ctx.obj.get("JSON"):
+        click.echo(json.dumps([
+            {
+                'table': r.table,
+                'cutoff': r.cutoff.isoformat() if r.cutoff else None,
+                'deleted': r.deleted,
+                'archived': r.archived,
+                'batches': r.batches,
+                'partitions_dropped': r.partitions_dropped,
+                'skipped': r.skipped,
+            }
+            for r in results
+        ]))
+        return
+
+    verb = "would delete" if dry_run else "deleted"
+    for r in results:
+        if r.skipped:
+            click.echo(f"  {r.table:16} skipped ({r.skipped})")
+            continue
+        line = f"  {r.table:16} {verb} {r.deleted}"
+        if not dry_run:
+            line += f", archived {r.archived}"
+            if r.partitions_dropped:
+                line += f", dropped partitions {', '.join(r.partitions_dropped)}"
+        click.echo(line)
+
+
 # =============================================================================
 # Entry Point
 # =============================================================================
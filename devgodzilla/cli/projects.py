@@ -206,6 +206,8 @@ def discover_project(
                     "prompt_path": str(s.prompt_path),
                     "success": s.success,
                     "error": s.error,
+                    "cached": s.cached,
+                    "duration_ms": int(s.duration_seconds * 1000),
                 }
                 for s in result.stages
             ],
@@ -6,20 +6,36 @@ Uses DEVGODZILLA_ prefix for all environment variables.
 Supports .env file loading via python-dotenv.
 """
 
+import hashlib
+import hmac
 import os
 import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
 try:
-    from dotenv import load_dotenv
+    from dotenv import dotenv_values
     _HAS_DOTENV = True
 except ImportError:
     _HAS_DOTENV = False
 
 _DOTENV_LOADED = False
+# Keys each env-file source wrote into os.environ, with the value written, so
+# a reload can update or drop them without touching real environment values.
+_INJECTED_ENV: Dict[str, Dict[str, str]] = {}
+
+# Default per-table retention in days (overridable via DEVGODZILLA_RETENTION_TTL_DAYS).
+DEFAULT_RETENTION_TTL_DAYS: Dict[str, int] = {
+    "events": 30,
+    "job_runs": 90,
+    "run_artifacts": 90,
+    "feedback_events": 180,
+    "qa_results": 180,
+}
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 _DEFAULT_WINDMILL_IMPORT_ROOT = _REPO_ROOT / "windmill"
 
@@ -36,12 +52,20 @@ class Config(BaseModel):
     - DEVGODZILLA_WEBHOOK_TOKEN (optional shared secret)
     - DEVGODZILLA_DEFAULT_ENGINE_ID (default: opencode)
     - DEVGODZILLA_DISCOVERY_ENGINE_ID / PLANNING_ENGINE_ID / EXEC_ENGINE_ID / QA_ENGINE_ID
+    - DEVGODZILLA_RETENTION_ENABLED / RETENTION_TTL_DAYS (e.g. events=30,job_runs=90)
+    - DEVGODZILLA_RETENTION_ARCHIVE_DIR (set to "off" to delete without archiving)
+    - DEVGODZILLA_DB_ASYNC_WORKERS (threads serving async DB calls, default: 4)
+    - DEVGODZILLA_SPEC_CATALOG_INTERVAL_SECONDS (spec catalog reconcile period, 0 disables, default: 300)
+    - DEVGODZILLA_PROTOCOL_WATCHDOG_INTERVAL_SECONDS / PROTOCOL_WATCHDOG_STALE_SECONDS (stuck-protocol recovery, default: 60 / 300)
+    - DEVGODZILLA_LOOP_LAG_WARN_MS (event loop stall warning threshold, default: 100)
     """
 
     # Database
     db_url: Optional[str] = Field(default=None)
     db_path: Path = Field(default=Path(".devgodzilla.sqlite"))
     db_pool_size: int = Field(default=20)
+    db_async_workers: int = Field(default=4)
+    loop_lag_warn_ms: float = Field(default=100.0)
     
     # Environment
     environment: str = Field(default="local")
@@ -80,6 +104,8 @@ class Config(BaseModel):
     exec_engine_id: Optional[str] = Field(default=None)
     qa_engine_id: Optional[str] = Field(default=None)
     agent_config_path: Optional[Path] = Field(default=None)
+    # Discovery pipeline stages run concurrently up to this many at a time
+    discovery_max_parallel_stages: int = Field(default=3)
 
     # Token budgets
     max_tokens_per_step: Optional[int] = Field(default=None)
@@ -95,6 +121,12 @@ class Config(BaseModel):
     # Git settings
     git_lock_max_retries: int = Field(default=5)
     git_lock_retry_delay: float = Field(default=1.0)
+    git_capture_max_diff_bytes: int = Field(default=5 * 1024 * 1024)  # per diff artifact; 0 = no cap
+
+    # Content-addressed artifact blobs (see engines/artifact_store.py); None
+    # writes artifacts as plain files. Relative paths are resolved against
+    # projects_root.
+    artifact_store_dir: Optional[Path] = Field(default=Path(".devgodzilla/artifact-store"))
 
     # Projects
     projects_root: Path = Field(default=Path("projects"))
@@ -103,6 +135,27 @@ class Config(BaseModel):
     spec_audit_interval_seconds: Optional[int] = Field(default=None)
     skip_simple_decompose: bool = Field(default=False)
 
+    # Retention (see services/retention.py); a TTL of 0 keeps rows forever
+    retention_enabled: bool = Field(default=False)
+    retention_interval_seconds: int = Field(default=3600)
+    retention_ttl_days: Dict[str, int] = Field(default_factory=lambda: dict(DEFAULT_RETENTION_TTL_DAYS))
+    retention_batch_size: int = Field(default=500)
+    retention_archive_dir: Optional[Path] = Field(default=Path(".devgodzilla/archive"))
+
+    # Specification catalog reconciler (see services/spec_catalog.py); 0 disables it
+    spec_catalog_interval_seconds: int = Field(default=300)
+
+    # Stuck-protocol recovery watchdog (see services/protocol_watchdog.py); an
+    # interval of 0 runs a single pass at startup
+    protocol_watchdog_interval_seconds: int = Field(default=60)
+    protocol_watchdog_stale_seconds: int = Field(default=300)
+
+    # Background health probing (see services/health.py); an interval of 0
+    # probes every component inline on each readiness request
+    health_probe_interval_seconds: float = Field(default=5.0)
+    health_windmill_ttl_seconds: float = Field(default=30.0)
+    health_agents_ttl_seconds: float = Field(default=60.0)
+
     # API / web
     cors_allow_origins: List[str] = Field(default_factory=list)
     
@@ -177,6 +230,16 @@ def _parse_csv(value: Optional[str]) -> List[str]:
     return [v.strip() for v in value.split(",") if v.strip()]
 
 
+def _parse_ttl_days(value: Optional[str]) -> Dict[str, int]:
+    """Parse "events=30,job_runs=90" over the default retention TTLs."""
+    ttls = dict(DEFAULT_RETENTION_TTL_DAYS)
+    for item in _parse_csv(value):
+        table, sep, days = item.partition("=")
+        if sep and table.strip():
+            ttls[table.strip()] = int(days)
+    return ttls
+
+
 def _normalize_path(value: str) -> Path:
     """Expand and resolve a path without requiring existence."""
     return Path(value).expanduser().resolve(strict=False)
@@ -241,38 +304,65 @@ def _maybe_load_windmill_env_defaults() -> None:
             if env:
                 break
 
-    if not env:
-        return
+    values: Dict[str, str] = {}
+    token = env.get("DEVGODZILLA_WINDMILL_TOKEN") or env.get("WINDMILL_TOKEN") or env.get("VITE_TOKEN")
+    if token:
+        values["DEVGODZILLA_WINDMILL_TOKEN"] = token
 
-    if not os.environ.get("DEVGODZILLA_WINDMILL_TOKEN"):
-        token = env.get("DEVGODZILLA_WINDMILL_TOKEN") or env.get("WINDMILL_TOKEN") or env.get("VITE_TOKEN")
-        if token:
-            os.environ["DEVGODZILLA_WINDMILL_TOKEN"] = token
+    workspace = env.get("DEVGODZILLA_WINDMILL_WORKSPACE") or env.get("VITE_WORKSPACE")
+    if workspace:
+        values["DEVGODZILLA_WINDMILL_WORKSPACE"] = workspace
 
-    if not os.environ.get("DEVGODZILLA_WINDMILL_WORKSPACE"):
-        workspace = env.get("DEVGODZILLA_WINDMILL_WORKSPACE") or env.get("VITE_WORKSPACE")
-        if workspace:
-            os.environ["DEVGODZILLA_WINDMILL_WORKSPACE"] = workspace
+    url = env.get("DEVGODZILLA_WINDMILL_URL") or env.get("WINDMILL_URL") or env.get("VITE_API_URL")
+    if url:
+        normalized = url.strip().rstrip("/")
+        if normalized.endswith("/api"):
+            normalized = normalized[: -len("/api")]
+        values["DEVGODZILLA_WINDMILL_URL"] = normalized
 
-    if not os.environ.get("DEVGODZILLA_WINDMILL_URL"):
-        url = env.get("DEVGODZILLA_WINDMILL_URL") or env.get("WINDMILL_URL") or env.get("VITE_API_URL")
-        if url:
-            normalized = url.strip().rstrip("/")
-            if normalized.endswith("/api"):
-                normalized = normalized[: -len("/api")]
-            os.environ["DEVGODZILLA_WINDMILL_URL"] = normalized
+    _sync_injected_env("windmill", values)
+
+
+def _sync_injected_env(source: str, values: Dict[str, str]) -> None:
+    """
+    Apply env-file values to os.environ without overriding the real environment.
+
+    A key is written only when it is unset or still holds the value this
+    source wrote last time; keys the source no longer provides are removed.
+    Re-running this after an env file changes therefore picks up rotated
+    values, while variables set by the process environment (or by an earlier
+    source) keep precedence.
+    """
+    previous = _INJECTED_ENV.get(source, {})
+    applied: Dict[str, str] = {}
+    for key, value in values.items():
+        current = os.environ.get(key)
+        if current and previous.get(key) != current:
+            continue
+        os.environ[key] = value
+        applied[key] = value
+    for key, value in previous.items():
+        if key not in applied and os.environ.get(key) == value:
+            del os.environ[key]
+    _INJECTED_ENV[source] = applied
 
 
 def _maybe_load_dotenv() -> None:
-    """Load .env file if python-dotenv is available and file exists."""
+    """Load .env file if python-dotenv is available and file exists.
+
+    Re-parsed after reload_config() or an env file change; see
+    _sync_injected_env for how earlier values are replaced.
+    """
     global _DOTENV_LOADED
     if _DOTENV_LOADED or not _HAS_DOTENV:
         return
     _DOTENV_LOADED = True
+    values: Dict[str, str] = {}
     for env_path in [Path(".env"), Path(".env.local")]:
         if env_path.exists():
-            load_dotenv(env_path, override=False)
+            values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
             break
+    _sync_injected_env("dotenv", values)
 
 
 def load_config() -> Config:
@@ -294,6 +384,8 @@ def load_config() -> Config:
         db_url=os.environ.get("DEVGODZILLA_DB_URL"),
         db_path=Path(os.environ.get("DEVGODZILLA_DB_PATH", ".devgodzilla.sqlite")).expanduser(),
         db_pool_size=int(os.environ.get("DEVGODZILLA_DB_POOL_SIZE", "20")),
+        db_async_workers=int(os.environ.get("DEVGODZILLA_DB_ASYNC_WORKERS", "4")),
+        loop_lag_warn_ms=float(os.environ.get("DEVGODZILLA_LOOP_LAG_WARN_MS", "100")),
         
         # Environment
         environment=env,
@@ -332,6 +424,7 @@ def load_config() -> Config:
         exec_engine_id=os.environ.get("DEVGODZILLA_EXEC_ENGINE_ID") or None,
         qa_engine_id=os.environ.get("DEVGODZILLA_QA_ENGINE_ID") or None,
         agent_config_path=Path(os.environ.get("DEVGODZILLA_AGENT_CONFIG_PATH")) if os.environ.get("DEVGODZILLA_AGENT_CONFIG_PATH") else Path("config/agents.yaml"),
+        discovery_max_parallel_stages=int(os.environ.get("DEVGODZILLA_DISCOVERY_MAX_PARALLEL_STAGES", "3")),
         
         # Token budgets
         max_tokens_per_step=int(v) if (v := os.environ.get("DEVGODZILLA_MAX_TOKENS_PER_STEP")) else None,
@@ -347,6 +440,13 @@ def load_config() -> Config:
         # Git
         git_lock_max_retries=int(os.environ.get("DEVGODZILLA_GIT_LOCK_MAX_RETRIES", "5")),
         git_lock_retry_delay=float(os.environ.get("DEVGODZILLA_GIT_LOCK_RETRY_DELAY", "1.0")),
+        git_capture_max_diff_bytes=int(os.environ.get("DEVGODZILLA_GIT_CAPTURE_MAX_DIFF_BYTES", str(5 * 1024 * 1024))),
+        artifact_store_dir=(
+            None
+            if (v := os.environ.get("DEVGODZILLA_ARTIFACT_STORE_DIR", ".devgodzilla/artifact-store")).strip().lower()
+            in ("", "none", "off")
+            else Path(v).expanduser()
+        ),
 
         # Projects
         projects_root=_normalize_path(os.environ.get("DEVGODZILLA_PROJECTS_ROOT", "projects")),
@@ -355,6 +455,26 @@ def load_config() -> Config:
         spec_audit_interval_seconds=int(v) if (v := os.environ.get("DEVGODZILLA_SPEC_AUDIT_INTERVAL_SECONDS")) else None,
         skip_simple_decompose=_parse_bool(os.environ.get("DEVGODZILLA_SKIP_SIMPLE_DECOMPOSE")),
 
+        # Retention
+        retention_enabled=_parse_bool(os.environ.get("DEVGODZILLA_RETENTION_ENABLED")),
+        retention_interval_seconds=int(os.environ.get("DEVGODZILLA_RETENTION_INTERVAL_SECONDS", "3600")),
+        retention_ttl_days=_parse_ttl_days(os.environ.get("DEVGODZILLA_RETENTION_TTL_DAYS")),
+        retention_batch_size=int(os.environ.get("DEVGODZILLA_RETENTION_BATCH_SIZE", "500")),
+        retention_archive_dir=(
+            None
+            if (v := os.environ.get("DEVGODZILLA_RETENTION_ARCHIVE_DIR", ".devgodzilla/archive")).strip().lower()
+            in ("", "none", "off")
+            else Path(v).expanduser()
+        ),
+        spec_catalog_interval_seconds=int(os.environ.get("DEVGODZILLA_SPEC_CATALOG_INTERVAL_SECONDS", "300")),
+        protocol_watchdog_interval_seconds=int(
+            os.environ.get("DEVGODZILLA_PROTOCOL_WATCHDOG_INTERVAL_SECONDS", "60")
+        ),
+        protocol_watchdog_stale_seconds=int(os.environ.get("DEVGODZILLA_PROTOCOL_WATCHDOG_STALE_SECONDS", "300")),
+        health_probe_interval_seconds=float(os.environ.get("DEVGODZILLA_HEALTH_PROBE_INTERVAL_SECONDS", "5")),
+        health_windmill_ttl_seconds=float(os.environ.get("DEVGODZILLA_HEALTH_WINDMILL_TTL_SECONDS", "30")),
+        health_agents_ttl_seconds=float(os.environ.get("DEVGODZILLA_HEALTH_AGENTS_TTL_SECONDS", "60")),
+
         # API / web
         cors_allow_origins=cors,
         
@@ -390,6 +510,193 @@ def get_config() -> Config:
 
 def _reset_config_for_tests() -> None:
     """Reset the global config cache (tests only)."""
-    global _config
+    global _config, _snapshot, _DOTENV_LOADED, _reload_pending
     with _config_lock:
         _config = None
+    with _snapshot_lock:
+        _snapshot = None
+        _reload_pending = False
+        for source in list(_INJECTED_ENV):
+            _sync_injected_env(source, {})
+        _DOTENV_LOADED = False
+
+
+# =============================================================================
+# Request fast path
+# =============================================================================
+
+# Env files whose contents feed load_config(); a change to any of them
+# (or to a DEVGODZILLA_* variable) invalidates the cached snapshot.
+_WATCHED_ENV_FILES = (
+    Path(".env"),
+    Path(".env.local"),
+    Path("windmill/apps/devgodzilla-react-app/.env.development"),
+    Path(".env.development"),
+)
+
+# Env files are stat'ed at most this often; env vars are checked every call.
+_FILE_CHECK_INTERVAL_SECONDS = 1.0
+
+
+class _FrozenConfig(Config):
+    """Immutable Config shared by every request that reads the snapshot."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+
+def _token_digest(token: Optional[str]) -> Optional[bytes]:
+    if not token:
+        return None
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def token_matches(candidate: Optional[str], expected_digest: Optional[bytes]) -> bool:
+    """
+    Compare a presented token against a precomputed digest in constant time.
+
+    Hashing both sides first keeps the comparison independent of the
+    candidate's length as well as its contents.
+    """
+    if not candidate or expected_digest is None:
+        return False
+    return hmac.compare_digest(_token_digest(candidate) or b"", expected_digest)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """A loaded Config plus values precomputed for the request hot path."""
+
+    config: Config
+    env_fingerprint: Tuple[Tuple[str, str], ...]
+    files_fingerprint: Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]
+    api_token_digest: Optional[bytes]
+    webhook_token_digest: Optional[bytes]
+    loaded_at: float
+
+
+_snapshot: Optional[ConfigSnapshot] = None
+_snapshot_checked_at = 0.0
+_snapshot_lock = threading.Lock()
+# Set from the SIGHUP handler; the next get_config_snapshot() does the reload.
+_reload_pending = False
+
+
+def _env_fingerprint() -> Tuple[Tuple[str, str], ...]:
+    cwd = os.getcwd()
+    items = [(k, v) for k, v in os.environ.items() if k.startswith("DEVGODZILLA_")]
+    items.sort()
+    items.append(("<cwd>", cwd))
+    return tuple(items)
+
+
+def _files_fingerprint() -> Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]:
+    paths = list(_WATCHED_ENV_FILES)
+    explicit = os.environ.get("DEVGODZILLA_WINDMILL_ENV_FILE")
+    if explicit:
+        paths.append(Path(explicit).expanduser())
+    result = []
+    for path in paths:
+        try:
+            st = path.stat()
+            result.append((str(path), (st.st_mtime_ns, st.st_size)))
+        except OSError:
+            result.append((str(path), None))
+    return tuple(result)
+
+
+def _build_snapshot(files_fingerprint) -> ConfigSnapshot:
+    config = load_config()
+    if isinstance(config, Config) and not isinstance(config, _FrozenConfig):
+        config = _FrozenConfig.model_construct(**dict(config))
+    return ConfigSnapshot(
+        config=config,
+        # Taken after load_config(), which may seed Windmill defaults into
+        # os.environ, so the next call sees an unchanged environment.
+        env_fingerprint=_env_fingerprint(),
+        files_fingerprint=files_fingerprint,
+        api_token_digest=_token_digest(getattr(config, "api_token", None)),
+        webhook_token_digest=_token_digest(getattr(config, "webhook_token", None)),
+        loaded_at=time.time(),
+    )
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """
+    Return the cached config snapshot, reloading only when inputs change.
+
+    The snapshot is rebuilt when a DEVGODZILLA_* variable or the working
+    directory changes, when a watched env file changes on disk (checked at
+    most once per second), or after reload_config() / SIGHUP.
+    """
+    global _snapshot, _snapshot_checked_at, _DOTENV_LOADED, _reload_pending
+    snap = _snapshot
+    now = time.monotonic()
+    if snap is not None and not _reload_pending and snap.env_fingerprint == _env_fingerprint():
+        if now - _snapshot_checked_at < _FILE_CHECK_INTERVAL_SECONDS:
+            return snap
+        if snap.files_fingerprint == _files_fingerprint():
+            _snapshot_checked_at = now
+            return snap
+
+    with _snapshot_lock:
+        if _reload_pending:
+            _reload_pending = False
+            _snapshot = None
+            _DOTENV_LOADED = False
+        files = _files_fingerprint()
+        snap = _snapshot
+        if (
+            snap is not None
+            and snap.env_fingerprint == _env_fingerprint()
+            and snap.files_fingerprint == files
+        ):
+            _snapshot_checked_at = now
+            return snap
+        if snap is not None and snap.files_fingerprint != files:
+            # Let load_config() pick up keys added to .env since the last load.
+            _DOTENV_LOADED = False
+        _snapshot = _build_snapshot(files)
+        _snapshot_checked_at = now
+        return _snapshot
+
+
+def get_cached_config() -> Config:
+    """Return the Config from the current snapshot (see get_config_snapshot)."""
+    return get_config_snapshot().config
+
+
+def reload_config() -> ConfigSnapshot:
+    """Force the next snapshot to be rebuilt from the environment and env files."""
+    global _snapshot, _DOTENV_LOADED
+    with _snapshot_lock:
+        _snapshot = None
+        _DOTENV_LOADED = False
+    return get_config_snapshot()
+
+
+def _request_reload(_signum=None, _frame=None) -> None:
+    global _reload_pending
+    _reload_pending = True
+
+
+def install_reload_signal_handler() -> bool:
+    """
+    Reload the config snapshot on SIGHUP.
+
+    The handler only flags the snapshot as stale: it may interrupt a thread
+    holding the snapshot lock, so the reload itself happens on the next
+    get_config_snapshot() call.
+
+    Returns False when the platform has no SIGHUP or the caller is not the
+    main thread (signal handlers can only be installed there).
+    """
+    import signal
+
+    sighup = getattr(signal, "SIGHUP", None)
+    if sighup is None:
+        return False
+    try:
+        signal.signal(sighup, _request_reload)
+    except ValueError:
+        return False
+    return True
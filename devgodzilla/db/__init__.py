@@ -10,6 +10,18 @@ from devgodzilla.db.database import (
     SQLiteDatabase,
     PostgresDatabase,
     get_database,
+    add_change_listener,
+    db_identity,
+    remove_change_listener,
+    notify_change,
+    RETENTION_TABLES,
+)
+from devgodzilla.db.async_database import (
+    AsyncDatabase,
+    AsyncPostgresDatabase,
+    LoopLagMonitor,
+    get_async_database,
+    get_loop_lag_monitor,
 )
 from devgodzilla.db.schema import SCHEMA_SQLITE, SCHEMA_POSTGRES
 
@@ -19,6 +31,16 @@ __all__ = [
     "SQLiteDatabase",
     "PostgresDatabase",
     "get_database",
+    "add_change_listener",
+    "db_identity",
+    "remove_change_listener",
+    "notify_change",
+    "RETENTION_TABLES",
+    "AsyncDatabase",
+    "AsyncPostgresDatabase",
+    "LoopLagMonitor",
+    "get_async_database",
+    "get_loop_lag_monitor",
     "SCHEMA_SQLITE",
     "SCHEMA_POSTGRES",
 ]
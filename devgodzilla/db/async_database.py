@@ -0,0 +1,280 @@
+"""
+DevGodzilla Async Database Access
+
+Async facade over the synchronous Database classes for code running on the
+event loop (SSE/WebSocket streams, async webhooks, reconciliation).
+
+Every ``DatabaseProtocol`` method is available as a coroutine with the same
+signature:
+
+- SQLite: calls run on a dedicated, bounded thread pool so a slow query
+  occupies a DB worker thread instead of the event loop (and never starves
+  the default executor used by the rest of the app).
+- PostgreSQL: the hot read paths (event tailing, protocol/step lookups) run
+  natively on a psycopg ``AsyncConnectionPool``; everything else uses the
+  same bounded executor.
+
+``LoopLagMonitor`` measures how late the loop wakes up from a fixed sleep,
+which is the direct symptom of blocking calls on the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from devgodzilla.db.database import Database, PostgresDatabase
+from devgodzilla.logging import get_logger
+from devgodzilla.models.domain import Event, ProtocolRun, StepRun
+
+try:
+    from psycopg import AsyncConnection
+    from psycopg_pool import AsyncConnectionPool
+except ImportError:
+    AsyncConnection = None  # type: ignore
+    AsyncConnectionPool = None  # type: ignore
+
+logger = get_logger(__name__)
+
+
+class AsyncDatabase:
+    """
+    Coroutine view of a synchronous Database.
+
+    Example:
+        adb = AsyncDatabase(db)
+        events = await adb.list_events_since_id(since_id=0, limit=50)
+    """
+
+    def __init__(self, db: Database, *, max_workers: int = 4) -> None:
+        self.sync = db
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="devgodzilla-db",
+        )
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        target = getattr(self.sync, name)
+        if not callable(target):
+            return target
+
+        @functools.wraps(target)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(target, *args, **kwargs)
+
+        # Cache so later lookups skip __getattr__.
+        self.__dict__[name] = call
+        return call
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking callable on the DB executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Stop the executor without waiting for in-flight calls."""
+        self._executor.shutdown(wait=False)
+
+    async def close(self) -> None:
+        self.shutdown()
+
+
+class AsyncPostgresDatabase(AsyncDatabase):
+    """AsyncDatabase with native async reads on a psycopg AsyncConnectionPool."""
+
+    def __init__(self, db: PostgresDatabase, *, max_workers: int = 4, pool_size: int = 10) -> None:
+        super().__init__(db, max_workers=max_workers)
+        self.pool_size = max(1, int(pool_size))
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _get_pool(self):
+        if AsyncConnectionPool is None:
+            return None
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    pool = AsyncConnectionPool(
+                        conninfo=self.sync.db_url,
+                        min_size=1,
+                        max_size=self.pool_size,
+                        kwargs={"row_factory": self.sync.row_factory},
+                        open=False,
+                    )
+                    await pool.open()
+                    self._pool = pool
+        return self._pool
+
+    async def _fetchall(self, query: str, params: List[Any]) -> List[Dict[str, Any]]:
+        pool = await self._get_pool()
+        if pool is None:
+            conn = await AsyncConnection.connect(self.sync.db_url, row_factory=self.sync.row_factory)
+            async with conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, tuple(params))
+                    return await cur.fetchall() or []
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(query, tuple(params))
+                return await cur.fetchall() or []
+
+    async def _fetchone(self, query: str, params: List[Any]) -> Optional[Dict[str, Any]]:
+        rows = await self._fetchall(query, params)
+        return rows[0] if rows else None
+
+    async def list_events_since_id(
+        self,
+        *,
+        since_id: int,
+        limit: int = 200,
+        protocol_run_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        event_types: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+    ) -> List[Event]:
+        sql, params = self.sync._events_query(
+            limit=limit,
+            since_id=since_id,
+            protocol_run_id=protocol_run_id,
+            project_id=project_id,
+            event_types=event_types,
+        )
+        rows = await self._fetchall(sql, params)
+        return self.sync._filter_event_categories([self.sync._row_to_event(r) for r in rows], categories)
+
+    async def list_recent_events(
+        self,
+        *,
+        limit: int = 50,
+        protocol_run_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        event_types: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+    ) -> List[Event]:
+        sql, params = self.sync._events_query(
+            limit=limit,
+            protocol_run_id=protocol_run_id,
+            project_id=project_id,
+            event_types=event_types,
+        )
+        rows = await self._fetchall(sql, params)
+        return self.sync._filter_event_categories([self.sync._row_to_event(r) for r in rows], categories)
+
+    async def get_protocol_run(self, run_id: int) -> ProtocolRun:
+        row = await self._fetchone("SELECT * FROM protocol_runs WHERE id = %s", [run_id])
+        if row is None:
+            raise KeyError(f"ProtocolRun {run_id} not found")
+        return self.sync._row_to_protocol_run(row)
+
+    async def get_step_run(self, step_run_id: int) -> StepRun:
+        row = await self._fetchone("SELECT * FROM step_runs WHERE id = %s", [step_run_id])
+        if row is None:
+            raise KeyError(f"StepRun {step_run_id} not found")
+        return self.sync._row_to_step_run(row)
+
+    async def list_step_runs(self, protocol_run_id: int) -> List[StepRun]:
+        rows = await self._fetchall(
+            "SELECT * FROM step_runs WHERE protocol_run_id = %s ORDER BY step_index ASC",
+            [protocol_run_id],
+        )
+        return [self.sync._row_to_step_run(row) for row in rows]
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        await super().close()
+
+
+def get_async_database(db: Any, *, max_workers: int = 4, pool_size: int = 10) -> AsyncDatabase:
+    """Wrap a Database (or an existing AsyncDatabase) for use on the event loop."""
+    if isinstance(db, AsyncDatabase):
+        return db
+    if isinstance(db, PostgresDatabase):
+        return AsyncPostgresDatabase(db, max_workers=max_workers, pool_size=pool_size)
+    return AsyncDatabase(db, max_workers=max_workers)
+
+
+# =============================================================================
+# Event loop lag monitoring
+# =============================================================================
+
+class LoopLagMonitor:
+    """
+    Samples event loop responsiveness.
+
+    Every ``interval_seconds`` the monitor sleeps and records how much later
+    than requested it woke up. Lag above ``warn_ms`` is logged as
+    ``event_loop_lag`` and counted as a stall.
+    """
+
+    def __init__(self, *, interval_seconds: float = 0.5, warn_ms: float = 100.0) -> None:
+        self.interval_seconds = interval_seconds
+        self.warn_ms = warn_ms
+        self.samples = 0
+        self.stalls = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def record(self, lag_ms: float) -> None:
+        with self._lock:
+            self.samples += 1
+            self.last_ms = lag_ms
+            self.max_ms = max(self.max_ms, lag_ms)
+            stalled = lag_ms >= self.warn_ms
+            if stalled:
+                self.stalls += 1
+        if stalled:
+            logger.warning("event_loop_lag", extra={"lag_ms": round(lag_ms, 1)})
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "samples": self.samples,
+                "stalls": self.stalls,
+                "last_ms": round(self.last_ms, 3),
+                "max_ms": round(self.max_ms, 3),
+                "warn_ms": self.warn_ms,
+            }
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval_seconds)
+            elapsed = time.perf_counter() - started
+            self.record(max(0.0, (elapsed - self.interval_seconds) * 1000.0))
+
+
+_LOOP_LAG_MONITOR: Optional[LoopLagMonitor] = None
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """Process-wide loop lag monitor (started by the API on startup)."""
+    global _LOOP_LAG_MONITOR
+    if _LOOP_LAG_MONITOR is None:
+        from devgodzilla.config import get_cached_config
+
+        _LOOP_LAG_MONITOR = LoopLagMonitor(warn_ms=get_cached_config().loop_lag_warn_ms)
+    return _LOOP_LAG_MONITOR
@@ -6,12 +6,15 @@ Uses the Protocol pattern to define the database contract.
 """
 
 import json
+import re
 import sqlite3
+import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Protocol, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple, Union
 
+from devgodzilla.db.task_graph import TaskGraph
 from devgodzilla.events_catalog import event_type_variants, infer_event_category, normalize_event_type
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import (
@@ -26,6 +29,7 @@ from devgodzilla.models.domain import (
     QAResultRecord,
     RunArtifact,
     SpeckitSpec,
+    SpecCatalogEntry,
     SpecRun,
     Sprint,
     StepRun,
@@ -48,10 +52,260 @@ except ImportError:
 _UNSET = object()
 
 
+# Process-wide listeners notified after committed writes, so in-process caches
+# (policy resolution, agent config views, ...) can invalidate precisely.
+# Listeners receive (entity, keys), e.g. ("policy_pack", {"key": ..., "version": ...}).
+ChangeListener = Callable[[str, Dict[str, Any]], None]
+_change_listeners: List[ChangeListener] = []
+
+
+def add_change_listener(listener: ChangeListener) -> None:
+    """Register a listener for committed DB changes (idempotent)."""
+    if listener not in _change_listeners:
+        _change_listeners.append(listener)
+
+
+def remove_change_listener(listener: ChangeListener) -> None:
+    """Unregister a change listener."""
+    if listener in _change_listeners:
+        _change_listeners.remove(listener)
+
+
+def db_identity(db: Any) -> str:
+    """Identify the backing store so process-wide caches never mix databases."""
+    return str(getattr(db, "db_path", None) or getattr(db, "db_url", None) or id(db))
+
+
+def notify_change(entity: str, **keys: Any) -> None:
+    """Notify listeners of a committed change. Listener errors are logged, never raised."""
+    for listener in list(_change_listeners):
+        try:
+            listener(entity, keys)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "db_change_listener_failed",
+                extra={"entity": entity, "error": str(exc)},
+            )
+
+
+# Tables pruned by the retention service, mapped to their primary key.
+RETENTION_TABLES: Dict[str, str] = {
+    "events": "id",
+    "job_runs": "run_id",
+    "run_artifacts": "id",
+    "feedback_events": "id",
+    "qa_results": "id",
+}
+
+# Monthly range partitions of events on PostgreSQL (events_pYYYYMM).
+_EVENT_PARTITION_RE = re.compile(r"^events_p(\d{4})(\d{2})$")
+
+
+def _retention_key(table: str) -> str:
+    """Validate a retention table (or events partition) name and return its key."""
+    if table in RETENTION_TABLES:
+        return RETENTION_TABLES[table]
+    if _EVENT_PARTITION_RE.match(table):
+        return "id"
+    raise ValueError(f"Table not eligible for retention: {table}")
+
+
+def _month_start(value: datetime, offset: int = 0) -> datetime:
+    index = value.year * 12 + (value.month - 1) + offset
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+# Bulk writes send rows as a VALUES list in chunks of this many rows.
+_BULK_CHUNK_ROWS = 200
+
+_TASK_BULK_COLUMNS = (
+    "project_id", "title", "task_type", "priority", "board_status",
+    "sprint_id", "protocol_run_id", "step_run_id", "description",
+    "assignee", "reporter", "story_points", "labels", "acceptance_criteria",
+    "due_date", "blocked_by", "blocks",
+)
+
+_STEP_BULK_COLUMNS = (
+    "protocol_run_id", "step_index", "step_name", "step_type", "status",
+    "depends_on", "parallel_group", "assigned_agent",
+)
+
+# Postgres cannot infer VALUES column types from bind parameters (NULLs in
+# particular), so bulk statements cast every non-text column explicitly.
+_BULK_PG_TYPES = {
+    "project_id": "integer",
+    "sprint_id": "integer",
+    "protocol_run_id": "integer",
+    "step_run_id": "integer",
+    "story_points": "integer",
+    "step_index": "integer",
+    "labels": "jsonb",
+    "acceptance_criteria": "jsonb",
+    "blocked_by": "jsonb",
+    "blocks": "jsonb",
+    "depends_on": "jsonb",
+    "due_date": "timestamp",
+}
+
+
+def _task_bulk_row(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a create_task-style dict into a full tasks row."""
+    if "project_id" not in task or not task.get("title"):
+        raise ValueError("bulk task rows require project_id and title")
+    return {
+        "project_id": task["project_id"],
+        "title": task["title"],
+        "task_type": task.get("task_type") or "story",
+        "priority": task.get("priority") or "medium",
+        "board_status": task.get("board_status") or "backlog",
+        "sprint_id": task.get("sprint_id"),
+        "protocol_run_id": task.get("protocol_run_id"),
+        "step_run_id": task.get("step_run_id"),
+        "description": task.get("description"),
+        "assignee": task.get("assignee"),
+        "reporter": task.get("reporter"),
+        "story_points": task.get("story_points"),
+        "labels": json.dumps(task.get("labels") or []),
+        "acceptance_criteria": json.dumps(task.get("acceptance_criteria") or []),
+        "due_date": task.get("due_date"),
+        "blocked_by": json.dumps(task.get("blocked_by") or []),
+        "blocks": json.dumps(task.get("blocks") or []),
+    }
+
+
+def _step_bulk_row(step: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a create_step_run-style dict into a full step_runs row."""
+    return {
+        "protocol_run_id": step["protocol_run_id"],
+        "step_index": step["step_index"],
+        "step_name": step["step_name"],
+        "step_type": step["step_type"],
+        "status": step["status"],
+        "depends_on": json.dumps(step.get("depends_on") or []),
+        "parallel_group": step.get("parallel_group"),
+        "assigned_agent": step.get("assigned_agent"),
+    }
+
+
+# Step statuses reported per protocol by list_stuck_protocol_candidates.
+_STEP_STATUS_COUNTS = (
+    "pending", "running", "needs_qa", "completed", "failed",
+    "timeout", "cancelled", "skipped", "blocked",
+)
+
+
+def _stuck_protocol_query(ph: str, stale: bool) -> str:
+    """Per RUNNING protocol with no in-flight step: counts by step status and latest step update."""
+    counts = ",\n".join(
+        f"SUM(CASE WHEN s.status = '{status}' THEN 1 ELSE 0 END) AS {status}"
+        for status in _STEP_STATUS_COUNTS
+    )
+    having = "SUM(CASE WHEN s.status IN ('running', 'needs_qa') THEN 1 ELSE 0 END) = 0"
+    if stale:
+        having += f" AND MAX(s.updated_at) < {ph}"
+    # The literal 'running' lets the planner use the partial idx_protocol_runs_running.
+    return f"""
+        SELECT s.protocol_run_id, COUNT(*) AS total_steps,
+               {counts},
+               MAX(s.updated_at) AS last_step_update
+        FROM protocol_runs pr JOIN step_runs s ON s.protocol_run_id = pr.id
+        WHERE pr.status = 'running'
+        GROUP BY s.protocol_run_id
+        HAVING {having}
+        ORDER BY s.protocol_run_id
+        LIMIT {ph}
+    """
+
+
+def _stuck_protocol_row(row: Any) -> Dict[str, Any]:
+    row = dict(row)
+    return {
+        "protocol_run_id": row["protocol_run_id"],
+        "total_steps": int(row["total_steps"]),
+        "counts": {status: int(row[status] or 0) for status in _STEP_STATUS_COUNTS},
+        "last_step_update": row["last_step_update"],
+    }
+
+
+# Task fields whose change moves a sprint's burndown.
+_BURNDOWN_FIELDS = frozenset({"board_status", "story_points", "sprint_id"})
+
+
+def _burndown_day() -> str:
+    """Snapshot key for sprint_burndown: today's UTC date."""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _has_spec_label(labels: Optional[Iterable[str]]) -> bool:
+    """Whether a task's labels tie it to a spec (and so to spec_catalog counts)."""
+    return any(str(label).startswith("spec:") for label in labels or ())
+
+
+def _dedupe_rows(rows: List[Dict[str, Any]], key: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Keep the first row for each natural key."""
+    seen = set()
+    out = []
+    for row in rows:
+        marker = tuple(row.get(k) for k in key)
+        if marker in seen:
+            continue
+        seen.add(marker)
+        out.append(row)
+    return out
+
+
+def _resource_versions_query(
+    scopes: List[str], placeholder: str, *, column: str = "scope"
+) -> Tuple[str, List[str]]:
+    """
+    One query reading the counters of ``scopes``.
+
+    A scope ending in ``*`` reads as the sum of every counter with that
+    prefix (``queue:*`` spans the per-run queue scopes). Counters only grow,
+    so the sum changes whenever any of them does. The prefix is matched as a
+    byte-order range on ``column`` so SQLite can use the primary key.
+    """
+    exact = [s for s in scopes if not s.endswith("*")]
+    parts: List[str] = []
+    params: List[str] = []
+    if exact:
+        parts.append(
+            "SELECT scope, version FROM resource_versions "
+            f"WHERE scope IN ({', '.join([placeholder] * len(exact))})"
+        )
+        params.extend(exact)
+    for scope in scopes:
+        if scope.endswith("*"):
+            parts.append(
+                f"SELECT CAST({placeholder} AS TEXT) AS scope, COALESCE(SUM(version), 0) AS version "
+                f"FROM resource_versions WHERE {column} >= {placeholder} AND {column} < {placeholder}"
+            )
+            prefix = scope[:-1]
+            params.extend([scope, prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)])
+    return " UNION ALL ".join(parts), params
+
+
+def _reject_duplicate_steps(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Raise ValueError if two rows share a (protocol_run_id, step_name)."""
+    seen = set()
+    for row in rows:
+        marker = (row["protocol_run_id"], row["step_name"])
+        if marker in seen:
+            raise ValueError(
+                f"Duplicate step name {row['step_name']!r} for protocol run {row['protocol_run_id']}"
+            )
+        seen.add(marker)
+    return rows
+
+
 class DatabaseProtocol(Protocol):
     """Protocol defining the database interface."""
     
     def init_schema(self) -> None: ...
+
+    def get_resource_versions(self, scopes: Sequence[str]) -> Dict[str, int]: ...
+
+    def ping(self) -> None: ...
     
     # Projects
     def create_project(
@@ -353,7 +607,83 @@ class DatabaseProtocol(Protocol):
         limit: int = 100,
     ) -> List[AgileTask]: ...
     def update_task(self, task_id: int, **kwargs: Any) -> AgileTask: ...
+    def load_task_graph(self, project_id: int) -> TaskGraph: ...
     def delete_task(self, task_id: int) -> None: ...
+    def delete_sprint_tasks(self, sprint_id: int) -> int: ...
+    def bulk_create_tasks(self, tasks: List[Dict[str, Any]]) -> List[AgileTask]: ...
+    def bulk_upsert_tasks_by_step(
+        self,
+        tasks: List[Dict[str, Any]],
+        *,
+        update_fields: Tuple[str, ...] = ("sprint_id", "protocol_run_id", "board_status"),
+        create_missing: bool = True,
+    ) -> List[AgileTask]: ...
+    def bulk_create_step_runs(self, steps: List[Dict[str, Any]]) -> List[StepRun]: ...
+
+    # Sprint analytics
+    def get_sprint_stats(self, sprint_id: int) -> Dict[str, int]: ...
+    def list_sprint_velocities(
+        self,
+        project_id: int,
+        *,
+        status: Optional[str] = None,
+        exclude_sprint_id: Optional[int] = None,
+        limit: int = 5,
+    ) -> List[Dict[str, int]]: ...
+    def record_sprint_snapshots(self, sprint_ids: Iterable[int], *, day: Optional[str] = None) -> None: ...
+    def list_sprint_snapshots(self, sprint_id: int) -> List[Dict[str, Any]]: ...
+
+    # Specification catalog
+    def upsert_spec_catalog_entries(
+        self,
+        project_id: int,
+        entries: List[Dict[str, Any]],
+        *,
+        replace: bool = False,
+    ) -> int: ...
+    def refresh_spec_catalog_tasks(self, project_id: int) -> None: ...
+    def list_spec_catalog(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        sprint_id: Optional[int] = None,
+        status: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        has_plan: Optional[bool] = None,
+        has_tasks: Optional[bool] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[List[SpecCatalogEntry], int]: ...
+    def get_spec_catalog_entry(self, spec_id: int) -> SpecCatalogEntry: ...
+
+    # Recovery
+    def list_stuck_protocol_candidates(
+        self,
+        *,
+        stale_before: Optional[datetime] = None,
+        limit: int = 200,
+    ) -> List[Dict[str, Any]]: ...
+    def acquire_lease(self, name: str, holder: str, ttl_seconds: float) -> bool: ...
+    def release_lease(self, name: str, holder: str) -> None: ...
+
+    # Retention
+    def fetch_expired_rows(
+        self,
+        table: str,
+        *,
+        before: datetime,
+        limit: int = 500,
+        statuses: Optional[List[str]] = None,
+        after_key: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]: ...
+    def delete_rows(self, table: str, keys: List[Any]) -> int: ...
+    def events_partitioned(self) -> bool: ...
+    def list_event_partitions(self) -> List[Dict[str, Any]]: ...
+    def ensure_event_partitions(self, *, months_ahead: int = 2) -> List[str]: ...
+    def drop_event_partition(self, name: str) -> bool: ...
 
 
 
@@ -394,13 +724,45 @@ class SQLiteDatabase:
             cur = conn.execute(query, tuple(params))
             return cur.fetchall()
 
+    def _write_returning(self, query: str, params: Iterable[Any] = ()) -> Optional[sqlite3.Row]:
+        """Run one INSERT/UPDATE ... RETURNING statement and return the written row."""
+        with self._transaction() as conn:
+            rows = conn.execute(query, tuple(params)).fetchall()
+        return rows[0] if rows else None
+
     def init_schema(self) -> None:
         """Initialize database schema."""
-        from devgodzilla.db.schema import SCHEMA_SQLITE
+        from devgodzilla.db.schema import RESOURCE_VERSIONS_SQLITE, SCHEMA_SQLITE, SPEC_CATALOG_SEARCH_SQLITE
         
         with self._transaction() as conn:
             conn.executescript(SCHEMA_SQLITE)
+            conn.executescript(RESOURCE_VERSIONS_SQLITE)
+            conn.commit()
+            try:
+                conn.executescript(SPEC_CATALOG_SEARCH_SQLITE)
+            except sqlite3.OperationalError as exc:
+                # SQLite built without FTS5 / trigram: search falls back to a scan.
+                logger.warning("spec_catalog_fts_unavailable", extra={"error": str(exc)})
             conn.commit()
+        self._spec_catalog_fts = None
+
+    def get_resource_versions(self, scopes: Sequence[str]) -> Dict[str, int]:
+        """
+        Current change counters for ``scopes``; scopes never written read as 0.
+
+        A scope ending in ``*`` is the sum of the counters with that prefix.
+        """
+        scopes = list(dict.fromkeys(scopes))
+        if not scopes:
+            return {}
+        rows = self._fetchall(*_resource_versions_query(scopes, "?"))
+        versions = {scope: 0 for scope in scopes}
+        versions.update({row["scope"]: int(row["version"]) for row in rows})
+        return versions
+
+    def ping(self) -> None:
+        """Cheapest round trip to the database; raises if it is unreachable."""
+        self._fetchone("SELECT 1")
 
     # Helper methods for JSON and timestamp parsing
     @staticmethod
@@ -700,28 +1062,27 @@ class SQLiteDatabase:
         policy_pack_key: Optional[str] = None,
         policy_pack_version: Optional[str] = None,
     ) -> Project:
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO projects (
-                    name, git_url, base_branch, ci_provider,
-                    default_models, secrets, local_path,
-                    project_classification, policy_pack_key, policy_pack_version,
-                    policy_enforcement_mode
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'warn')
-                """,
-                (
-                    name, git_url, base_branch, ci_provider,
-                    json.dumps(default_models) if default_models else None,
-                    json.dumps(secrets) if secrets else None,
-                    local_path, project_classification,
-                    policy_pack_key or "default",
-                    policy_pack_version or "1.0",
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO projects (
+                name, git_url, base_branch, ci_provider,
+                default_models, secrets, local_path,
+                project_classification, policy_pack_key, policy_pack_version,
+                policy_enforcement_mode
             )
-            project_id = cur.lastrowid
-        return self.get_project(project_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'warn')
+            RETURNING *
+            """,
+            (
+                name, git_url, base_branch, ci_provider,
+                json.dumps(default_models) if default_models else None,
+                json.dumps(secrets) if secrets else None,
+                local_path, project_classification,
+                policy_pack_key or "default",
+                policy_pack_version or "1.0",
+            ),
+        )
+        return self._row_to_project(row)
 
     def get_project(self, project_id: int) -> Project:
         row = self._fetchone("SELECT * FROM projects WHERE id = ?", (project_id,))
@@ -734,12 +1095,13 @@ class SQLiteDatabase:
         return [self._row_to_project(row) for row in rows]
 
     def update_project_local_path(self, project_id: int, local_path: str) -> Project:
-        with self._transaction() as conn:
-            conn.execute(
-                "UPDATE projects SET local_path = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (local_path, project_id),
-            )
-        return self.get_project(project_id)
+        row = self._write_returning(
+            "UPDATE projects SET local_path = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ? RETURNING *",
+            (local_path, project_id),
+        )
+        if row is None:
+            raise KeyError(f"Project {project_id} not found")
+        return self._row_to_project(row)
 
     def update_project(
         self,
@@ -783,12 +1145,13 @@ class SQLiteDatabase:
             params.append(constitution_hash)
         params.append(project_id)
         
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE projects SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_project(project_id)
+        row = self._write_returning(
+            f"UPDATE projects SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"Project {project_id} not found")
+        return self._row_to_project(row)
 
     def delete_project(self, project_id: int) -> None:
         """Delete a project and all associated data."""
@@ -832,10 +1195,15 @@ class SQLiteDatabase:
             )
             conn.execute("DELETE FROM events WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM clarifications WHERE project_id = ?", (project_id,))
+            conn.execute("DELETE FROM spec_catalog WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM spec_runs WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM speckit_specs WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM spec_sprint_links WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM tasks WHERE project_id = ?", (project_id,))
+            conn.execute(
+                "DELETE FROM sprint_burndown WHERE sprint_id IN (SELECT id FROM sprints WHERE project_id = ?)",
+                (project_id,),
+            )
             conn.execute("DELETE FROM sprints WHERE project_id = ?", (project_id,))
             conn.execute(
                 "DELETE FROM step_runs WHERE protocol_run_id IN (SELECT id FROM protocol_runs WHERE project_id = ?)",
@@ -855,19 +1223,18 @@ class SQLiteDatabase:
         protocol_root: Optional[str] = None,
         description: Optional[str] = None,
     ) -> ProtocolRun:
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO protocol_runs (
-                    project_id, protocol_name, status, base_branch,
-                    worktree_path, protocol_root, description
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (project_id, protocol_name, status, base_branch, worktree_path, protocol_root, description),
+        row = self._write_returning(
+            """
+            INSERT INTO protocol_runs (
+                project_id, protocol_name, status, base_branch,
+                worktree_path, protocol_root, description
             )
-            run_id = cur.lastrowid
-        return self.get_protocol_run(run_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (project_id, protocol_name, status, base_branch, worktree_path, protocol_root, description),
+        )
+        return self._row_to_protocol_run(row)
 
     def get_protocol_run(self, run_id: int) -> ProtocolRun:
         row = self._fetchone("SELECT * FROM protocol_runs WHERE id = ?", (run_id,))
@@ -891,12 +1258,13 @@ class SQLiteDatabase:
         return [self._row_to_protocol_run(row) for row in rows]
 
     def update_protocol_status(self, run_id: int, status: str) -> ProtocolRun:
-        with self._transaction() as conn:
-            conn.execute(
-                "UPDATE protocol_runs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (status, run_id),
-            )
-        return self.get_protocol_run(run_id)
+        row = self._write_returning(
+            "UPDATE protocol_runs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ? RETURNING *",
+            (status, run_id),
+        )
+        if row is None:
+            raise KeyError(f"ProtocolRun {run_id} not found")
+        return self._row_to_protocol_run(row)
 
     def update_protocol_windmill(
         self,
@@ -915,12 +1283,13 @@ class SQLiteDatabase:
             params.append(json.dumps(speckit_metadata))
         params.append(run_id)
         
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE protocol_runs SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_protocol_run(run_id)
+        row = self._write_returning(
+            f"UPDATE protocol_runs SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"ProtocolRun {run_id} not found")
+        return self._row_to_protocol_run(row)
 
     def update_protocol_paths(
         self,
@@ -944,12 +1313,13 @@ class SQLiteDatabase:
             return self.get_protocol_run(run_id)
 
         params.append(run_id)
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE protocol_runs SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_protocol_run(run_id)
+        row = self._write_returning(
+            f"UPDATE protocol_runs SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"ProtocolRun {run_id} not found")
+        return self._row_to_protocol_run(row)
 
     # SpecKit spec operations
     def upsert_speckit_spec(
@@ -973,61 +1343,55 @@ class SQLiteDatabase:
         has_implement: Optional[bool] = None,
         constitution_hash: Optional[str] = None,
     ) -> SpeckitSpec:
-        with self._transaction() as conn:
-            conn.execute(
-                """
-                INSERT INTO speckit_specs (
-                    project_id, name, spec_number, feature_name,
-                    spec_path, plan_path, tasks_path, checklist_path,
-                    analysis_path, implement_path,
-                    has_spec, has_plan, has_tasks, has_checklist, has_analysis, has_implement,
-                    constitution_hash, updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(project_id, name) DO UPDATE SET
-                    spec_number=COALESCE(excluded.spec_number, speckit_specs.spec_number),
-                    feature_name=COALESCE(excluded.feature_name, speckit_specs.feature_name),
-                    spec_path=COALESCE(excluded.spec_path, speckit_specs.spec_path),
-                    plan_path=COALESCE(excluded.plan_path, speckit_specs.plan_path),
-                    tasks_path=COALESCE(excluded.tasks_path, speckit_specs.tasks_path),
-                    checklist_path=COALESCE(excluded.checklist_path, speckit_specs.checklist_path),
-                    analysis_path=COALESCE(excluded.analysis_path, speckit_specs.analysis_path),
-                    implement_path=COALESCE(excluded.implement_path, speckit_specs.implement_path),
-                    has_spec=COALESCE(excluded.has_spec, speckit_specs.has_spec),
-                    has_plan=COALESCE(excluded.has_plan, speckit_specs.has_plan),
-                    has_tasks=COALESCE(excluded.has_tasks, speckit_specs.has_tasks),
-                    has_checklist=COALESCE(excluded.has_checklist, speckit_specs.has_checklist),
-                    has_analysis=COALESCE(excluded.has_analysis, speckit_specs.has_analysis),
-                    has_implement=COALESCE(excluded.has_implement, speckit_specs.has_implement),
-                    constitution_hash=COALESCE(excluded.constitution_hash, speckit_specs.constitution_hash),
-                    updated_at=CURRENT_TIMESTAMP
-                """,
-                (
-                    project_id,
-                    name,
-                    spec_number,
-                    feature_name,
-                    spec_path,
-                    plan_path,
-                    tasks_path,
-                    checklist_path,
-                    analysis_path,
-                    implement_path,
-                    1 if has_spec is True else 0 if has_spec is False else None,
-                    1 if has_plan is True else 0 if has_plan is False else None,
-                    1 if has_tasks is True else 0 if has_tasks is False else None,
-                    1 if has_checklist is True else 0 if has_checklist is False else None,
-                    1 if has_analysis is True else 0 if has_analysis is False else None,
-                    1 if has_implement is True else 0 if has_implement is False else None,
-                    constitution_hash,
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO speckit_specs (
+                project_id, name, spec_number, feature_name,
+                spec_path, plan_path, tasks_path, checklist_path,
+                analysis_path, implement_path,
+                has_spec, has_plan, has_tasks, has_checklist, has_analysis, has_implement,
+                constitution_hash, updated_at
             )
-        row = self._fetchone(
-            "SELECT * FROM speckit_specs WHERE project_id = ? AND name = ? LIMIT 1",
-            (project_id, name),
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(project_id, name) DO UPDATE SET
+                spec_number=COALESCE(excluded.spec_number, speckit_specs.spec_number),
+                feature_name=COALESCE(excluded.feature_name, speckit_specs.feature_name),
+                spec_path=COALESCE(excluded.spec_path, speckit_specs.spec_path),
+                plan_path=COALESCE(excluded.plan_path, speckit_specs.plan_path),
+                tasks_path=COALESCE(excluded.tasks_path, speckit_specs.tasks_path),
+                checklist_path=COALESCE(excluded.checklist_path, speckit_specs.checklist_path),
+                analysis_path=COALESCE(excluded.analysis_path, speckit_specs.analysis_path),
+                implement_path=COALESCE(excluded.implement_path, speckit_specs.implement_path),
+                has_spec=COALESCE(excluded.has_spec, speckit_specs.has_spec),
+                has_plan=COALESCE(excluded.has_plan, speckit_specs.has_plan),
+                has_tasks=COALESCE(excluded.has_tasks, speckit_specs.has_tasks),
+                has_checklist=COALESCE(excluded.has_checklist, speckit_specs.has_checklist),
+                has_analysis=COALESCE(excluded.has_analysis, speckit_specs.has_analysis),
+                has_implement=COALESCE(excluded.has_implement, speckit_specs.has_implement),
+                constitution_hash=COALESCE(excluded.constitution_hash, speckit_specs.constitution_hash),
+                updated_at=CURRENT_TIMESTAMP
+            RETURNING *
+            """,
+            (
+                project_id,
+                name,
+                spec_number,
+                feature_name,
+                spec_path,
+                plan_path,
+                tasks_path,
+                checklist_path,
+                analysis_path,
+                implement_path,
+                1 if has_spec is True else 0 if has_spec is False else None,
+                1 if has_plan is True else 0 if has_plan is False else None,
+                1 if has_tasks is True else 0 if has_tasks is False else None,
+                1 if has_checklist is True else 0 if has_checklist is False else None,
+                1 if has_analysis is True else 0 if has_analysis is False else None,
+                1 if has_implement is True else 0 if has_implement is False else None,
+                constitution_hash,
+            ),
         )
-        if row is None:
-            raise KeyError("Speckit spec not found after upsert")
         return self._row_to_speckit_spec(row)
 
     def list_speckit_specs(self, project_id: int) -> List[SpeckitSpec]:
@@ -1058,51 +1422,52 @@ class SQLiteDatabase:
         implement_path: Optional[str] = None,
         protocol_run_id: Optional[int] = None,
     ) -> SpecRun:
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO spec_runs (
-                    project_id,
-                    spec_name,
-                    status,
-                    base_branch,
-                    branch_name,
-                    worktree_path,
-                    spec_root,
-                    spec_number,
-                    feature_name,
-                    spec_path,
-                    plan_path,
-                    tasks_path,
-                    checklist_path,
-                    analysis_path,
-                    implement_path,
-                    protocol_run_id,
-                    updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                (
-                    project_id,
-                    spec_name,
-                    status,
-                    base_branch,
-                    branch_name,
-                    worktree_path,
-                    spec_root,
-                    spec_number,
-                    feature_name,
-                    spec_path,
-                    plan_path,
-                    tasks_path,
-                    checklist_path,
-                    analysis_path,
-                    implement_path,
-                    protocol_run_id,
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO spec_runs (
+                project_id,
+                spec_name,
+                status,
+                base_branch,
+                branch_name,
+                worktree_path,
+                spec_root,
+                spec_number,
+                feature_name,
+                spec_path,
+                plan_path,
+                tasks_path,
+                checklist_path,
+                analysis_path,
+                implement_path,
+                protocol_run_id,
+                updated_at
             )
-            spec_run_id = cur.lastrowid
-        return self.get_spec_run(spec_run_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            RETURNING *
+            """,
+            (
+                project_id,
+                spec_name,
+                status,
+                base_branch,
+                branch_name,
+                worktree_path,
+                spec_root,
+                spec_number,
+                feature_name,
+                spec_path,
+                plan_path,
+                tasks_path,
+                checklist_path,
+                analysis_path,
+                implement_path,
+                protocol_run_id,
+            ),
+        )
+        run = self._row_to_spec_run(row)
+        self._sync_spec_catalog_run(run)
+        return run
 
     def get_spec_run(self, spec_run_id: int) -> SpecRun:
         row = self._fetchone("SELECT * FROM spec_runs WHERE id = ?", (spec_run_id,))
@@ -1146,12 +1511,15 @@ class SQLiteDatabase:
             return self.get_spec_run(spec_run_id)
         fields.append("updated_at = CURRENT_TIMESTAMP")
         params.append(spec_run_id)
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE spec_runs SET {', '.join(fields)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_spec_run(spec_run_id)
+        row = self._write_returning(
+            f"UPDATE spec_runs SET {', '.join(fields)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"SpecRun {spec_run_id} not found")
+        run = self._row_to_spec_run(row)
+        self._sync_spec_catalog_run(run)
+        return run
 
     # Step run operations
     def create_step_run(
@@ -1165,22 +1533,21 @@ class SQLiteDatabase:
         parallel_group: Optional[str] = None,
         assigned_agent: Optional[str] = None,
     ) -> StepRun:
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO step_runs (
-                    protocol_run_id, step_index, step_name, step_type, status,
-                    depends_on, parallel_group, assigned_agent
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    protocol_run_id, step_index, step_name, step_type, status,
-                    json.dumps(depends_on or []), parallel_group, assigned_agent,
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO step_runs (
+                protocol_run_id, step_index, step_name, step_type, status,
+                depends_on, parallel_group, assigned_agent
             )
-            step_id = cur.lastrowid
-        return self.get_step_run(step_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (
+                protocol_run_id, step_index, step_name, step_type, status,
+                json.dumps(depends_on or []), parallel_group, assigned_agent,
+            ),
+        )
+        return self._row_to_step_run(row)
 
     def get_step_run(self, step_run_id: int) -> StepRun:
         row = self._fetchone("SELECT * FROM step_runs WHERE id = ?", (step_run_id,))
@@ -1226,12 +1593,13 @@ class SQLiteDatabase:
         
         params.append(step_run_id)
         
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE step_runs SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_step_run(step_run_id)
+        row = self._write_returning(
+            f"UPDATE step_runs SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"StepRun {step_run_id} not found")
+        return self._row_to_step_run(row)
 
     def update_step_run(self, step_run_id: int, **kwargs) -> StepRun:
         """
@@ -1259,12 +1627,13 @@ class SQLiteDatabase:
             return self.get_step_run(step_run_id)
 
         params.append(step_run_id)
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE step_runs SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_step_run(step_run_id)
+        row = self._write_returning(
+            f"UPDATE step_runs SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"StepRun {step_run_id} not found")
+        return self._row_to_step_run(row)
 
     def update_step_assigned_agent(self, step_run_id: int, assigned_agent: Optional[str]) -> StepRun:
         return self.update_step_run(step_run_id, assigned_agent=assigned_agent)
@@ -1401,6 +1770,7 @@ class SQLiteDatabase:
                         metadata_value,
                     ),
                 )
+        notify_change("agent_assignment", project_id=project_id)
 
     def delete_agent_assignment(self, project_id: int, process_key: str) -> None:
         with self._transaction() as conn:
@@ -1408,6 +1778,7 @@ class SQLiteDatabase:
                 "DELETE FROM agent_assignments WHERE project_id = ? AND process_key = ?",
                 (project_id, process_key),
             )
+        notify_change("agent_assignment", project_id=project_id)
 
     def get_agent_assignment_settings(self, project_id: int) -> Dict[str, Any]:
         row = self._fetchone(
@@ -1430,6 +1801,7 @@ class SQLiteDatabase:
                 """,
                 (project_id, 1 if inherit_global else 0),
             )
+        notify_change("agent_assignment", project_id=project_id)
         return {"inherit_global": inherit_global}
 
     def list_agent_overrides(self, project_id: int) -> Dict[str, Dict[str, Any]]:
@@ -1457,6 +1829,7 @@ class SQLiteDatabase:
                 """,
                 (project_id, agent_id, payload),
             )
+        notify_change("agent_override", project_id=project_id)
         return overrides
 
     # Event operations
@@ -1472,30 +1845,25 @@ class SQLiteDatabase:
         event_type = normalize_event_type(event_type)
         if protocol_run_id is None and project_id is None:
             raise ValueError("append_event requires protocol_run_id or project_id")
-        if project_id is None and protocol_run_id is not None:
-            try:
-                project_id = self.get_protocol_run(protocol_run_id).project_id
-            except Exception:
-                project_id = None
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO events (
-                    protocol_run_id, project_id, step_run_id, event_type, message, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    protocol_run_id,
-                    project_id,
-                    step_run_id,
-                    event_type,
-                    message,
-                    json.dumps(metadata) if metadata else None,
-                ),
+        # project_id defaults to the run's project, resolved in the same statement.
+        row = self._write_returning(
+            """
+            INSERT INTO events (
+                protocol_run_id, project_id, step_run_id, event_type, message, metadata
             )
-            event_id = cur.lastrowid
-        row = self._fetchone("SELECT * FROM events WHERE id = ?", (event_id,))
+            VALUES (?, COALESCE(?, (SELECT project_id FROM protocol_runs WHERE id = ?)), ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (
+                protocol_run_id,
+                project_id,
+                protocol_run_id,
+                step_run_id,
+                event_type,
+                message,
+                json.dumps(metadata) if metadata else None,
+            ),
+        )
         return self._row_to_event(row)
 
     def list_events(
@@ -1751,36 +2119,34 @@ class SQLiteDatabase:
         report_text: Optional[str] = None,
         duration_seconds: Optional[float] = None,
     ) -> QAResultRecord:
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO qa_results (
-                    project_id, protocol_run_id, step_run_id,
-                    verdict, summary, gate_results, findings,
-                    prompt_path, prompt_hash, engine_id, model,
-                    report_path, report_text, duration_seconds
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    project_id,
-                    protocol_run_id,
-                    step_run_id,
-                    verdict,
-                    summary,
-                    json.dumps(gate_results) if gate_results is not None else None,
-                    json.dumps(findings) if findings is not None else None,
-                    prompt_path,
-                    prompt_hash,
-                    engine_id,
-                    model,
-                    report_path,
-                    report_text,
-                    duration_seconds,
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO qa_results (
+                project_id, protocol_run_id, step_run_id,
+                verdict, summary, gate_results, findings,
+                prompt_path, prompt_hash, engine_id, model,
+                report_path, report_text, duration_seconds
             )
-            result_id = cur.lastrowid
-        row = self._fetchone("SELECT * FROM qa_results WHERE id = ?", (result_id,))
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (
+                project_id,
+                protocol_run_id,
+                step_run_id,
+                verdict,
+                summary,
+                json.dumps(gate_results) if gate_results is not None else None,
+                json.dumps(findings) if findings is not None else None,
+                prompt_path,
+                prompt_hash,
+                engine_id,
+                model,
+                report_path,
+                report_text,
+                duration_seconds,
+            ),
+        )
         return self._row_to_qa_result(row)
 
     def list_qa_results(
@@ -1845,39 +2211,39 @@ class SQLiteDatabase:
         cost_cents: Optional[int] = None,
         windmill_job_id: Optional[str] = None,
     ) -> JobRun:
-        with self._transaction() as conn:
-            conn.execute(
-                """
-                INSERT INTO job_runs (
-                    run_id, job_type, status, run_kind,
-                    project_id, protocol_run_id, step_run_id,
-                    queue, attempt, worker_id,
-                    params, result, error, log_path,
-                    cost_tokens, cost_cents, windmill_job_id
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    run_id,
-                    job_type,
-                    status,
-                    run_kind,
-                    project_id,
-                    protocol_run_id,
-                    step_run_id,
-                    queue,
-                    attempt,
-                    worker_id,
-                    json.dumps(params) if params is not None else None,
-                    json.dumps(result) if result is not None else None,
-                    error,
-                    log_path,
-                    cost_tokens,
-                    cost_cents,
-                    windmill_job_id,
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO job_runs (
+                run_id, job_type, status, run_kind,
+                project_id, protocol_run_id, step_run_id,
+                queue, attempt, worker_id,
+                params, result, error, log_path,
+                cost_tokens, cost_cents, windmill_job_id
             )
-        return self.get_job_run(run_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (
+                run_id,
+                job_type,
+                status,
+                run_kind,
+                project_id,
+                protocol_run_id,
+                step_run_id,
+                queue,
+                attempt,
+                worker_id,
+                json.dumps(params) if params is not None else None,
+                json.dumps(result) if result is not None else None,
+                error,
+                log_path,
+                cost_tokens,
+                cost_cents,
+                windmill_job_id,
+            ),
+        )
+        return self._row_to_job_run(row)
 
     def get_job_run(self, run_id: str) -> JobRun:
         row = self._fetchone("SELECT * FROM job_runs WHERE run_id = ?", (run_id,))
@@ -1926,6 +2292,9 @@ class SQLiteDatabase:
         return [self._row_to_job_run(row) for row in rows]
 
     def update_job_run(self, run_id: str, **kwargs: Any) -> JobRun:
+        return self._update_job_run_where("run_id = ?", run_id, f"JobRun {run_id} not found", kwargs)
+
+    def _update_job_run_where(self, match: str, match_value: Any, missing: str, kwargs: Dict[str, Any]) -> JobRun:
         allowed = {
             "status",
             "run_kind",
@@ -1959,20 +2328,23 @@ class SQLiteDatabase:
             params.append(value)
 
         updates.append("updated_at = CURRENT_TIMESTAMP")
-        params.append(run_id)
+        params.append(match_value)
 
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE job_runs SET {', '.join(updates)} WHERE run_id = ?",
-                tuple(params),
-            )
-        return self.get_job_run(run_id)
+        row = self._write_returning(
+            f"UPDATE job_runs SET {', '.join(updates)} WHERE {match} RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(missing)
+        return self._row_to_job_run(row)
 
     def update_job_run_by_windmill_id(self, windmill_job_id: str, **kwargs: Any) -> JobRun:
-        row = self._fetchone("SELECT run_id FROM job_runs WHERE windmill_job_id = ? LIMIT 1", (windmill_job_id,))
-        if row is None:
-            raise KeyError(f"JobRun with windmill_job_id={windmill_job_id} not found")
-        return self.update_job_run(row["run_id"], **kwargs)
+        return self._update_job_run_where(
+            "run_id = (SELECT run_id FROM job_runs WHERE windmill_job_id = ? LIMIT 1)",
+            windmill_job_id,
+            f"JobRun with windmill_job_id={windmill_job_id} not found",
+            kwargs,
+        )
 
     def create_run_artifact(
         self,
@@ -1984,20 +2356,20 @@ class SQLiteDatabase:
         sha256: Optional[str] = None,
         bytes: Optional[int] = None,
     ) -> RunArtifact:
-        with self._transaction() as conn:
-            conn.execute(
-                """
-                INSERT INTO run_artifacts (run_id, name, kind, path, sha256, bytes)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(run_id, name) DO UPDATE SET
-                    kind=excluded.kind,
-                    path=excluded.path,
-                    sha256=excluded.sha256,
-                    bytes=excluded.bytes
-                """,
-                (run_id, name, kind, path, sha256, bytes),
-            )
-        return self.get_run_artifact(run_id, name)
+        row = self._write_returning(
+            """
+            INSERT INTO run_artifacts (run_id, name, kind, path, sha256, bytes)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(run_id, name) DO UPDATE SET
+                kind=excluded.kind,
+                path=excluded.path,
+                sha256=excluded.sha256,
+                bytes=excluded.bytes
+            RETURNING *
+            """,
+            (run_id, name, kind, path, sha256, bytes),
+        )
+        return self._row_to_run_artifact(row)
 
     def list_run_artifacts(self, run_id: str) -> List[RunArtifact]:
         rows = self._fetchall(
@@ -2092,23 +2464,21 @@ class SQLiteDatabase:
         step_run_id: Optional[int] = None,
         context: Optional[Dict[str, Any]] = None,
     ) -> FeedbackEvent:
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO feedback_events (
-                    protocol_run_id, step_run_id, error_type,
-                    action_taken, attempt_number, context
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    protocol_run_id, step_run_id, error_type,
-                    action_taken, attempt_number,
-                    json.dumps(context) if context else None,
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO feedback_events (
+                protocol_run_id, step_run_id, error_type,
+                action_taken, attempt_number, context
             )
-            event_id = cur.lastrowid
-        row = self._fetchone("SELECT * FROM feedback_events WHERE id = ?", (event_id,))
+            VALUES (?, ?, ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (
+                protocol_run_id, step_run_id, error_type,
+                action_taken, attempt_number,
+                json.dumps(context) if context else None,
+            ),
+        )
         return FeedbackEvent(
             id=row["id"],
             protocol_run_id=row["protocol_run_id"],
@@ -2136,42 +2506,39 @@ class SQLiteDatabase:
         step_run_id: Optional[int] = None,
     ) -> Clarification:
         """Insert or update a clarification."""
-        with self._transaction() as conn:
-            conn.execute(
-                """
-                INSERT INTO clarifications (
-                    scope, project_id, protocol_run_id, step_run_id,
-                    key, question, recommended, options, applies_to, blocking,
-                    status, updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'open', CURRENT_TIMESTAMP)
-                ON CONFLICT(scope, key) DO UPDATE SET
-                    project_id=excluded.project_id,
-                    protocol_run_id=excluded.protocol_run_id,
-                    step_run_id=excluded.step_run_id,
-                    question=excluded.question,
-                    recommended=excluded.recommended,
-                    options=excluded.options,
-                    applies_to=excluded.applies_to,
-                    blocking=excluded.blocking,
-                    updated_at=CURRENT_TIMESTAMP
-                """,
-                (
-                    scope,
-                    project_id,
-                    protocol_run_id,
-                    step_run_id,
-                    key,
-                    question,
-                    json.dumps(recommended) if recommended is not None else None,
-                    json.dumps(options) if options is not None else None,
-                    applies_to,
-                    1 if blocking else 0,
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO clarifications (
+                scope, project_id, protocol_run_id, step_run_id,
+                key, question, recommended, options, applies_to, blocking,
+                status, updated_at
             )
-        row = self._fetchone("SELECT * FROM clarifications WHERE scope = ? AND key = ? LIMIT 1", (scope, key))
-        if row is None:
-            raise KeyError("Clarification not found after upsert")
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'open', CURRENT_TIMESTAMP)
+            ON CONFLICT(scope, key) DO UPDATE SET
+                project_id=excluded.project_id,
+                protocol_run_id=excluded.protocol_run_id,
+                step_run_id=excluded.step_run_id,
+                question=excluded.question,
+                recommended=excluded.recommended,
+                options=excluded.options,
+                applies_to=excluded.applies_to,
+                blocking=excluded.blocking,
+                updated_at=CURRENT_TIMESTAMP
+            RETURNING *
+            """,
+            (
+                scope,
+                project_id,
+                protocol_run_id,
+                step_run_id,
+                key,
+                question,
+                json.dumps(recommended) if recommended is not None else None,
+                json.dumps(options) if options is not None else None,
+                applies_to,
+                1 if blocking else 0,
+            ),
+        )
         return self._row_to_clarification(row)
 
     def _row_to_clarification(self, row) -> Clarification:
@@ -2320,21 +2687,22 @@ class SQLiteDatabase:
         pack: dict,
     ) -> PolicyPack:
         """Insert or update a policy pack."""
-        with self._transaction() as conn:
-            conn.execute(
-                """
-                INSERT INTO policy_packs (key, version, name, description, status, pack, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(key, version) DO UPDATE SET
-                    name=excluded.name,
-                    description=excluded.description,
-                    status=excluded.status,
-                    pack=excluded.pack,
-                    updated_at=CURRENT_TIMESTAMP
-                """,
-                (key, version, name, description, status, json.dumps(pack)),
-            )
-        return self.get_policy_pack(key=key, version=version)
+        row = self._write_returning(
+            """
+            INSERT INTO policy_packs (key, version, name, description, status, pack, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(key, version) DO UPDATE SET
+                name=excluded.name,
+                description=excluded.description,
+                status=excluded.status,
+                pack=excluded.pack,
+                updated_at=CURRENT_TIMESTAMP
+            RETURNING *
+            """,
+            (key, version, name, description, status, json.dumps(pack)),
+        )
+        notify_change("policy_pack", key=key, version=version)
+        return self._row_to_policy_pack(row)
 
     def list_policy_packs(
         self,
@@ -2390,12 +2758,14 @@ class SQLiteDatabase:
             params.append(policy_enforcement_mode)
         params.append(project_id)
         
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE projects SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_project(project_id)
+        row = self._write_returning(
+            f"UPDATE projects SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"Project {project_id} not found")
+        notify_change("project_policy", project_id=project_id)
+        return self._row_to_project(row)
 
     # Protocol template operations
     def update_protocol_template(
@@ -2416,12 +2786,13 @@ class SQLiteDatabase:
             params.append(json.dumps(template_source))
         params.append(protocol_run_id)
         
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE protocol_runs SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_protocol_run(protocol_run_id)
+        row = self._write_returning(
+            f"UPDATE protocol_runs SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"ProtocolRun {protocol_run_id} not found")
+        return self._row_to_protocol_run(row)
 
     def update_protocol_policy_audit(
         self,
@@ -2433,26 +2804,28 @@ class SQLiteDatabase:
         policy_effective_json: Optional[dict] = None,
     ) -> ProtocolRun:
         """Record the effective policy used for a protocol run (audit trail)."""
-        with self._transaction() as conn:
-            conn.execute(
-                """
-                UPDATE protocol_runs
-                SET policy_pack_key = ?,
-                    policy_pack_version = ?,
-                    policy_effective_hash = ?,
-                    policy_effective_json = ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (
-                    policy_pack_key,
-                    policy_pack_version,
-                    policy_effective_hash,
-                    json.dumps(policy_effective_json) if policy_effective_json else None,
-                    protocol_run_id,
-                ),
-            )
-        return self.get_protocol_run(protocol_run_id)
+        row = self._write_returning(
+            """
+            UPDATE protocol_runs
+            SET policy_pack_key = ?,
+                policy_pack_version = ?,
+                policy_effective_hash = ?,
+                policy_effective_json = ?,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            RETURNING *
+            """,
+            (
+                policy_pack_key,
+                policy_pack_version,
+                policy_effective_hash,
+                json.dumps(policy_effective_json) if policy_effective_json else None,
+                protocol_run_id,
+            ),
+        )
+        if row is None:
+            raise KeyError(f"ProtocolRun {protocol_run_id} not found")
+        return self._row_to_protocol_run(row)
 
     # Agile: Sprints
     def create_sprint(
@@ -2465,22 +2838,21 @@ class SQLiteDatabase:
         end_date: Optional[str] = None,
         velocity_planned: Optional[int] = None,
     ) -> Sprint:
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO sprints (
-                    project_id, name, status, goal,
-                    start_date, end_date, velocity_planned
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    project_id, name, status, goal,
-                    start_date, end_date, velocity_planned,
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO sprints (
+                project_id, name, status, goal,
+                start_date, end_date, velocity_planned
             )
-            sprint_id = cur.lastrowid
-        return self.get_sprint(sprint_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (
+                project_id, name, status, goal,
+                start_date, end_date, velocity_planned,
+            ),
+        )
+        return self._row_to_sprint(row)
 
     def get_sprint(self, sprint_id: int) -> Sprint:
         row = self._fetchone("SELECT * FROM sprints WHERE id = ?", (sprint_id,))
@@ -2557,12 +2929,13 @@ class SQLiteDatabase:
             return self.get_sprint(sprint_id)
             
         params.append(sprint_id)
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE sprints SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_sprint(sprint_id)
+        row = self._write_returning(
+            f"UPDATE sprints SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"Sprint {sprint_id} not found")
+        return self._row_to_sprint(row)
 
     # Agile: Tasks
     def create_task(
@@ -2585,30 +2958,33 @@ class SQLiteDatabase:
         blocked_by: Optional[List[int]] = None,
         blocks: Optional[List[int]] = None,
     ) -> AgileTask:
-        with self._transaction() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO tasks (
-                    project_id, title, task_type, priority, board_status,
-                    sprint_id, protocol_run_id, step_run_id, description,
-                    assignee, reporter, story_points, labels, acceptance_criteria,
-                    due_date, blocked_by, blocks
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    project_id, title, task_type, priority, board_status,
-                    sprint_id, protocol_run_id, step_run_id, description,
-                    assignee, reporter, story_points,
-                    json.dumps(labels or []),
-                    json.dumps(acceptance_criteria or []),
-                    due_date,
-                    json.dumps(blocked_by or []),
-                    json.dumps(blocks or []),
-                ),
+        row = self._write_returning(
+            """
+            INSERT INTO tasks (
+                project_id, title, task_type, priority, board_status,
+                sprint_id, protocol_run_id, step_run_id, description,
+                assignee, reporter, story_points, labels, acceptance_criteria,
+                due_date, blocked_by, blocks
             )
-            task_id = cur.lastrowid
-        return self.get_task(task_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (
+                project_id, title, task_type, priority, board_status,
+                sprint_id, protocol_run_id, step_run_id, description,
+                assignee, reporter, story_points,
+                json.dumps(labels or []),
+                json.dumps(acceptance_criteria or []),
+                due_date,
+                json.dumps(blocked_by or []),
+                json.dumps(blocks or []),
+            ),
+        )
+        if _has_spec_label(labels):
+            self._touch_spec_catalog(project_id)
+        if sprint_id is not None:
+            self._touch_sprint_burndown([sprint_id])
+        return self._row_to_agile_task(row)
 
     def get_task(self, task_id: int) -> AgileTask:
         row = self._fetchone("SELECT * FROM tasks WHERE id = ?", (task_id,))
@@ -2648,36 +3024,44 @@ class SQLiteDatabase:
         return [self._row_to_agile_task(row) for row in rows]
 
     def _check_circular_task_dependencies(self, task_id: int, blocked_by: List[int]) -> None:
-        """Check for circular dependencies in task blocking relationships."""
+        """
+        Reject ``blocked_by`` edges that would close a cycle through ``task_id``.
+
+        Only edges not already on the task are checked, and one recursive
+        query walks just the new blockers' ancestors.
+        """
         if not blocked_by:
             return
+        row = self._fetchone(
+            """
+            WITH RECURSIVE reach(root, id) AS (
+                SELECT CAST(n.value AS INTEGER), CAST(n.value AS INTEGER)
+                FROM json_each(?) n
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM tasks cur, json_each(cur.blocked_by) o
+                    WHERE cur.id = ? AND o.value = n.value
+                )
+                UNION
+                SELECT r.root, CAST(j.value AS INTEGER)
+                FROM reach r JOIN tasks t ON t.id = r.id, json_each(t.blocked_by) j
+                WHERE r.id <> ?
+            )
+            SELECT root FROM reach WHERE id = ? LIMIT 1
+            """,
+            (json.dumps([int(b) for b in blocked_by]), task_id, task_id, task_id),
+        )
+        if row is not None:
+            raise ValueError(
+                f"Circular dependency detected: task {task_id} cannot be blocked by {row['root']}"
+            )
 
-        visited = set()
-
-        def has_cycle(current_id: int, path: set) -> bool:
-            """DFS to detect cycles in dependency graph."""
-            if current_id == task_id:
-                return True
-            if current_id in visited or current_id in path:
-                return current_id == task_id
-
-            visited.add(current_id)
-            path.add(current_id)
-
-            try:
-                task = self.get_task(current_id)
-                for blocked_id in task.blocked_by or []:
-                    if has_cycle(blocked_id, path):
-                        return True
-            except KeyError:
-                pass
-
-            path.remove(current_id)
-            return False
-
-        for blocked_id in blocked_by:
-            if has_cycle(blocked_id, set()):
-                raise ValueError(f"Circular dependency detected: task {task_id} cannot be blocked by {blocked_id}")
+    def load_task_graph(self, project_id: int) -> TaskGraph:
+        """Load a project's task dependency index in one query."""
+        rows = self._fetchall(
+            "SELECT id, board_status, story_points, sprint_id, blocked_by FROM tasks WHERE project_id = ?",
+            (project_id,),
+        )
+        return TaskGraph.from_rows(rows, parse_json=self._parse_json)
 
     def update_task(self, task_id: int, **kwargs: Any) -> AgileTask:
         updates = ["updated_at = CURRENT_TIMESTAMP"]
@@ -2707,22 +3091,575 @@ class SQLiteDatabase:
         if len(updates) == 1:
             return self.get_task(task_id)
 
+        previous_sprint = None
+        if "sprint_id" in kwargs:
+            row = self._fetchone("SELECT sprint_id FROM tasks WHERE id = ?", (task_id,))
+            previous_sprint = row["sprint_id"] if row is not None else None
         params.append(task_id)
-        with self._transaction() as conn:
-            conn.execute(
-                f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?",
-                tuple(params),
-            )
-        return self.get_task(task_id)
+        row = self._write_returning(
+            f"UPDATE tasks SET {', '.join(updates)} WHERE id = ? RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"Task {task_id} not found")
+        task = self._row_to_agile_task(row)
+        if "labels" in kwargs or _has_spec_label(task.labels):
+            self._touch_spec_catalog(task.project_id)
+        if _BURNDOWN_FIELDS.intersection(kwargs):
+            self._touch_sprint_burndown([task.sprint_id, previous_sprint])
+        return task
 
     def delete_sprint(self, sprint_id: int) -> None:
         with self._transaction() as conn:
             conn.execute("UPDATE tasks SET sprint_id = NULL WHERE sprint_id = ?", (sprint_id,))
+            conn.execute("DELETE FROM sprint_burndown WHERE sprint_id = ?", (sprint_id,))
             conn.execute("DELETE FROM sprints WHERE id = ?", (sprint_id,))
 
     def delete_task(self, task_id: int) -> None:
         with self._transaction() as conn:
-            conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            row = conn.execute(
+                "DELETE FROM tasks WHERE id = ? RETURNING project_id, sprint_id, labels", (task_id,)
+            ).fetchone()
+        if row is not None and _has_spec_label(self._parse_json(row["labels"])):
+            self._touch_spec_catalog(row["project_id"])
+        if row is not None and row["sprint_id"] is not None:
+            self._touch_sprint_burndown([row["sprint_id"]])
+
+    def delete_sprint_tasks(self, sprint_id: int) -> int:
+        """Delete every task in a sprint with one statement; returns the count."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "DELETE FROM tasks WHERE sprint_id = ? RETURNING project_id, labels", (sprint_id,)
+            ).fetchall()
+        for project_id in {r["project_id"] for r in rows if _has_spec_label(self._parse_json(r["labels"]))}:
+            self._touch_spec_catalog(project_id)
+        if rows:
+            self._touch_sprint_burndown([sprint_id])
+        return len(rows)
+
+    # Bulk writes
+    def _bulk_execute(
+        self,
+        conn: sqlite3.Connection,
+        statement: str,
+        columns: Tuple[str, ...],
+        rows: List[Dict[str, Any]],
+    ) -> List[sqlite3.Row]:
+        """Run ``WITH v(columns) AS (VALUES ...) <statement>`` over rows in chunks."""
+        placeholder = "(" + ", ".join("?" for _ in columns) + ")"
+        out: List[sqlite3.Row] = []
+        for start in range(0, len(rows), _BULK_CHUNK_ROWS):
+            chunk = rows[start:start + _BULK_CHUNK_ROWS]
+            values = ", ".join([placeholder] * len(chunk))
+            params = [row[c] for row in chunk for c in columns]
+            sql = f"WITH v({', '.join(columns)}) AS (VALUES {values}) {statement}"
+            out.extend(conn.execute(sql, params).fetchall())
+        return out
+
+    def bulk_create_tasks(self, tasks: List[Dict[str, Any]]) -> List[AgileTask]:
+        """
+        Insert many tasks in one transaction.
+
+        Rows take the same keys as create_task. A row whose (sprint_id, title)
+        already exists, in the table or earlier in ``tasks``, is skipped.
+        Returns the inserted tasks in id order.
+        """
+        rows = _dedupe_rows([_task_bulk_row(t) for t in tasks], ("sprint_id", "title"))
+        if not rows:
+            return []
+        cols = ", ".join(_TASK_BULK_COLUMNS)
+        statement = (
+            f"INSERT INTO tasks ({cols}) SELECT {cols} FROM v "
+            "WHERE NOT EXISTS (SELECT 1 FROM tasks t WHERE t.title = v.title AND t.sprint_id IS v.sprint_id) "
+            "RETURNING *"
+        )
+        with self._transaction() as conn:
+            created = self._bulk_execute(conn, statement, _TASK_BULK_COLUMNS, rows)
+        tasks_out = sorted((self._row_to_agile_task(r) for r in created), key=lambda t: t.id)
+        self._refresh_spec_catalog_for(tasks_out)
+        self._touch_sprint_burndown(t.sprint_id for t in tasks_out)
+        return tasks_out
+
+    def bulk_upsert_tasks_by_step(
+        self,
+        tasks: List[Dict[str, Any]],
+        *,
+        update_fields: Tuple[str, ...] = ("sprint_id", "protocol_run_id", "board_status"),
+        create_missing: bool = True,
+    ) -> List[AgileTask]:
+        """
+        Update or create the task linked to each row's step_run_id.
+
+        Existing tasks for a step get ``update_fields`` copied from the row;
+        steps without a task get one inserted (when ``create_missing``).
+        Returns one task per step, in input order.
+        """
+        unknown = set(update_fields) - set(_TASK_BULK_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot bulk update task fields: {sorted(unknown)}")
+        rows = _dedupe_rows([_task_bulk_row(t) for t in tasks], ("step_run_id",))
+        if not rows:
+            return []
+        assignments = ", ".join(f"{f} = v.{f}" for f in update_fields)
+        update = (
+            f"UPDATE tasks SET {assignments}, updated_at = CURRENT_TIMESTAMP "
+            "FROM v WHERE tasks.step_run_id = v.step_run_id RETURNING *"
+        )
+        cols = ", ".join(_TASK_BULK_COLUMNS)
+        insert = (
+            f"INSERT INTO tasks ({cols}) SELECT {cols} FROM v "
+            "WHERE NOT EXISTS (SELECT 1 FROM tasks t WHERE t.step_run_id = v.step_run_id) "
+            "RETURNING *"
+        )
+        previous = (
+            "SELECT DISTINCT t.sprint_id FROM tasks t JOIN v ON t.step_run_id = v.step_run_id "
+            "WHERE t.sprint_id IS NOT NULL"
+        )
+        with self._transaction() as conn:
+            moved = []
+            if "sprint_id" in update_fields:
+                moved = self._bulk_execute(conn, previous, _TASK_BULK_COLUMNS, rows)
+            written = self._bulk_execute(conn, update, _TASK_BULK_COLUMNS, rows)
+            if create_missing:
+                written += self._bulk_execute(conn, insert, _TASK_BULK_COLUMNS, rows)
+        by_step = {}
+        for task in sorted((self._row_to_agile_task(r) for r in written), key=lambda t: t.id):
+            by_step.setdefault(task.step_run_id, task)
+        self._refresh_spec_catalog_for(by_step.values())
+        self._touch_sprint_burndown(
+            [t.sprint_id for t in by_step.values()] + [r["sprint_id"] for r in moved]
+        )
+        return [by_step[r["step_run_id"]] for r in rows if r["step_run_id"] in by_step]
+
+    def bulk_create_step_runs(self, steps: List[Dict[str, Any]]) -> List[StepRun]:
+        """
+        Insert many step runs in one transaction.
+
+        Rows take the same keys as create_step_run. A step whose
+        (protocol_run_id, step_name) already exists is skipped; two rows with
+        the same key raise ValueError. Returns the inserted steps in id order.
+        """
+        rows = _reject_duplicate_steps([_step_bulk_row(s) for s in steps])
+        if not rows:
+            return []
+        cols = ", ".join(_STEP_BULK_COLUMNS)
+        statement = (
+            f"INSERT INTO step_runs ({cols}) SELECT {cols} FROM v "
+            "WHERE NOT EXISTS (SELECT 1 FROM step_runs s "
+            "WHERE s.protocol_run_id = v.protocol_run_id AND s.step_name = v.step_name) "
+            "RETURNING *"
+        )
+        with self._transaction() as conn:
+            created = self._bulk_execute(conn, statement, _STEP_BULK_COLUMNS, rows)
+        return sorted((self._row_to_step_run(r) for r in created), key=lambda s: s.id)
+
+    # Sprint analytics
+    def get_sprint_stats(self, sprint_id: int) -> Dict[str, int]:
+        """Task and story-point totals for a sprint, aggregated in SQL."""
+        row = self._fetchone(
+            """
+            SELECT COUNT(*) AS total_tasks,
+                   COALESCE(SUM(CASE WHEN board_status = 'done' THEN 1 ELSE 0 END), 0) AS completed_tasks,
+                   COALESCE(SUM(story_points), 0) AS total_points,
+                   COALESCE(SUM(CASE WHEN board_status = 'done' THEN story_points ELSE 0 END), 0) AS completed_points
+            FROM tasks WHERE sprint_id = ?
+            """,
+            (sprint_id,),
+        )
+        return {key: int(row[key] or 0) for key in row.keys()}
+
+    def list_sprint_velocities(
+        self,
+        project_id: int,
+        *,
+        status: Optional[str] = None,
+        exclude_sprint_id: Optional[int] = None,
+        limit: int = 5,
+    ) -> List[Dict[str, int]]:
+        """Completed story points of a project's sprints, oldest first."""
+        where = ["project_id = ?"]
+        params: List[Any] = [project_id]
+        if status is not None:
+            where.append("status = ?")
+            params.append(status)
+        if exclude_sprint_id is not None:
+            where.append("id <> ?")
+            params.append(exclude_sprint_id)
+        rows = self._fetchall(
+            f"""
+            SELECT s.id AS sprint_id,
+                   COALESCE(SUM(CASE WHEN t.board_status = 'done' THEN t.story_points ELSE 0 END), 0)
+                       AS completed_points
+            FROM (
+                SELECT id, created_at FROM sprints WHERE {' AND '.join(where)}
+                ORDER BY created_at ASC, id ASC LIMIT ?
+            ) s
+            LEFT JOIN tasks t ON t.sprint_id = s.id
+            GROUP BY s.id, s.created_at
+            ORDER BY s.created_at ASC, s.id ASC
+            """,
+            (*params, limit),
+        )
+        return [{"sprint_id": r["sprint_id"], "completed_points": int(r["completed_points"])} for r in rows]
+
+    def record_sprint_snapshots(self, sprint_ids: Iterable[int], *, day: Optional[str] = None) -> None:
+        """Upsert each sprint's burndown row for ``day`` (default today, UTC)."""
+        ids = sorted({int(i) for i in sprint_ids if i is not None})
+        if not ids:
+            return
+        with self._transaction() as conn:
+            conn.execute(
+                f"""
+                INSERT INTO sprint_burndown (
+                    sprint_id, day, total_tasks, completed_tasks, total_points, completed_points
+                )
+                SELECT s.id, ?, COUNT(t.id),
+                       COALESCE(SUM(CASE WHEN t.board_status = 'done' THEN 1 ELSE 0 END), 0),
+                       COALESCE(SUM(t.story_points), 0),
+                       COALESCE(SUM(CASE WHEN t.board_status = 'done' THEN t.story_points ELSE 0 END), 0)
+                FROM sprints s LEFT JOIN tasks t ON t.sprint_id = s.id
+                WHERE s.id IN ({', '.join('?' for _ in ids)})
+                GROUP BY s.id
+                ON CONFLICT (sprint_id, day) DO UPDATE SET
+                    total_tasks = excluded.total_tasks,
+                    completed_tasks = excluded.completed_tasks,
+                    total_points = excluded.total_points,
+                    completed_points = excluded.completed_points,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (day or _burndown_day(), *ids),
+            )
+
+    def list_sprint_snapshots(self, sprint_id: int) -> List[Dict[str, Any]]:
+        rows = self._fetchall(
+            """
+            SELECT day, total_tasks, completed_tasks, total_points, completed_points
+            FROM sprint_burndown WHERE sprint_id = ? ORDER BY day
+            """,
+            (sprint_id,),
+        )
+        return [dict(r) for r in rows]
+
+    def _touch_sprint_burndown(self, sprint_ids: Iterable[Optional[int]]) -> None:
+        """Refresh today's burndown rows after a task write; never fails the write."""
+        ids = [i for i in sprint_ids if i is not None]
+        if not ids:
+            return
+        try:
+            self.record_sprint_snapshots(ids)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("sprint_burndown_refresh_failed", extra={"sprint_ids": ids, "error": str(exc)})
+
+    # Specification catalog
+    def _row_to_spec_catalog_entry(self, row: Any) -> SpecCatalogEntry:
+        row = dict(row)
+        return SpecCatalogEntry(
+            id=row["id"],
+            project_id=row["project_id"],
+            spec_key=row["spec_key"],
+            slug=row["slug"],
+            name=row["name"],
+            title=row["title"],
+            path=row["path"],
+            status=row["status"],
+            project_name=row.get("project_name"),
+            spec_run_id=row["spec_run_id"],
+            spec_path=row["spec_path"],
+            plan_path=row["plan_path"],
+            tasks_path=row["tasks_path"],
+            checklist_path=row["checklist_path"],
+            analysis_path=row["analysis_path"],
+            implement_path=row["implement_path"],
+            has_spec=bool(row["has_spec"]),
+            has_plan=bool(row["has_plan"]),
+            has_tasks=bool(row["has_tasks"]),
+            worktree_path=row["worktree_path"],
+            branch_name=row["branch_name"],
+            base_branch=row["base_branch"],
+            feature_name=row["feature_name"],
+            spec_number=row["spec_number"],
+            spec_created_at=row["spec_created_at"],
+            linked_tasks=row["linked_tasks"] or 0,
+            completed_tasks=row["completed_tasks"] or 0,
+            story_points=row["story_points"] or 0,
+            sprint_id=row.get("sprint_id"),
+            sprint_name=row.get("sprint_name"),
+            updated_at=self._coerce_ts(row["updated_at"]) if row["updated_at"] else None,
+        )
+
+    def _has_spec_catalog_fts(self) -> bool:
+        if getattr(self, "_spec_catalog_fts", None) is None:
+            row = self._fetchone(
+                "SELECT 1 AS present FROM sqlite_master WHERE name = 'spec_catalog_fts'", ()
+            )
+            self._spec_catalog_fts = row is not None
+        return self._spec_catalog_fts
+
+    def _sync_spec_catalog_run(self, run: SpecRun) -> None:
+        """Mirror a spec run write into spec_catalog."""
+        from devgodzilla.db.spec_catalog import catalog_entry_from_run
+
+        try:
+            row = self._fetchone("SELECT local_path FROM projects WHERE id = ?", (run.project_id,))
+            entry = catalog_entry_from_run(run, project_path=row["local_path"] if row else None)
+            self.upsert_spec_catalog_entries(run.project_id, [entry])
+        except Exception as exc:  # noqa: BLE001
+            # The reconciler repairs the catalog; a spec run write must not fail on it.
+            logger.warning("spec_catalog_sync_failed", extra={"spec_run_id": run.id, "error": str(exc)})
+
+    def _refresh_spec_catalog_for(self, tasks: Iterable[AgileTask]) -> None:
+        for project_id in sorted({t.project_id for t in tasks if _has_spec_label(t.labels)}):
+            self._touch_spec_catalog(project_id)
+
+    def _touch_spec_catalog(self, project_id: int) -> None:
+        """Refresh catalog task counts after a task write; never fails the write."""
+        try:
+            self.refresh_spec_catalog_tasks(project_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("spec_catalog_refresh_failed", extra={"project_id": project_id, "error": str(exc)})
+
+    def upsert_spec_catalog_entries(
+        self,
+        project_id: int,
+        entries: List[Dict[str, Any]],
+        *,
+        replace: bool = False,
+    ) -> int:
+        """
+        Write catalog rows for one project, keyed on (project_id, spec_key).
+
+        ``replace=True`` (the reconciler) also deletes the project's rows
+        missing from ``entries``. Otherwise (spec run writes) only
+        filesystem-discovered rows are dropped, since a project with spec
+        runs lists runs instead of folders. Returns the number of rows written.
+        """
+        from devgodzilla.db.spec_catalog import SPEC_CATALOG_COLUMNS
+
+        cols = ", ".join(SPEC_CATALOG_COLUMNS)
+        placeholders = ", ".join("?" for _ in SPEC_CATALOG_COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in SPEC_CATALOG_COLUMNS if c != "spec_key")
+        with self._transaction() as conn:
+            if replace:
+                keep = {e["spec_key"] for e in entries}
+                existing = conn.execute(
+                    "SELECT spec_key FROM spec_catalog WHERE project_id = ?", (project_id,)
+                ).fetchall()
+                conn.executemany(
+                    "DELETE FROM spec_catalog WHERE project_id = ? AND spec_key = ?",
+                    [(project_id, r["spec_key"]) for r in existing if r["spec_key"] not in keep],
+                )
+            else:
+                conn.execute(
+                    "DELETE FROM spec_catalog WHERE project_id = ? AND spec_run_id IS NULL",
+                    (project_id,),
+                )
+            conn.executemany(
+                f"""
+                INSERT INTO spec_catalog (project_id, {cols}, updated_at)
+                VALUES (?, {placeholders}, CURRENT_TIMESTAMP)
+                ON CONFLICT(project_id, spec_key) DO UPDATE SET
+                    {updates}, updated_at = CURRENT_TIMESTAMP
+                """,
+                [(project_id, *[e.get(c) for c in SPEC_CATALOG_COLUMNS]) for e in entries],
+            )
+        self.refresh_spec_catalog_tasks(project_id)
+        return len(entries)
+
+    def refresh_spec_catalog_tasks(self, project_id: int) -> None:
+        """Recompute task counts, points and sprint for a project's catalog rows."""
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                UPDATE spec_catalog SET linked_tasks = 0, completed_tasks = 0, story_points = 0,
+                    task_sprint_id = NULL, task_sprint_count = 0
+                WHERE project_id = ?
+                """,
+                (project_id,),
+            )
+            conn.execute(
+                """
+                UPDATE spec_catalog SET
+                    linked_tasks = agg.linked,
+                    completed_tasks = agg.completed,
+                    story_points = agg.points,
+                    task_sprint_id = agg.sprint_id,
+                    task_sprint_count = agg.sprints
+                FROM (
+                    SELECT substr(j.value, 6) AS slug,
+                        COUNT(*) AS linked,
+                        SUM(CASE WHEN t.board_status = 'done' THEN 1 ELSE 0 END) AS completed,
+                        SUM(COALESCE(t.story_points, 0)) AS points,
+                        COUNT(DISTINCT t.sprint_id) AS sprints,
+                        MIN(t.sprint_id) AS sprint_id
+                    FROM tasks t, json_each(t.labels) j
+                    WHERE t.project_id = ? AND substr(j.value, 1, 5) = 'spec:'
+                    GROUP BY substr(j.value, 6)
+                ) AS agg
+                WHERE spec_catalog.project_id = ? AND spec_catalog.slug = agg.slug
+                """,
+                (project_id, project_id),
+            )
+
+    def list_spec_catalog(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        sprint_id: Optional[int] = None,
+        status: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        has_plan: Optional[bool] = None,
+        has_tasks: Optional[bool] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[List[SpecCatalogEntry], int]:
+        """Return one page of catalog entries and the total matching count."""
+        from devgodzilla.db.spec_catalog import build_catalog_query
+
+        sql, params, count_sql, count_params = build_catalog_query(
+            dialect="sqlite",
+            fts=self._has_spec_catalog_fts(),
+            project_id=project_id,
+            sprint_id=sprint_id,
+            status=status,
+            date_from=date_from,
+            date_to=date_to,
+            has_plan=has_plan,
+            has_tasks=has_tasks,
+            search=search,
+            sort=sort,
+            limit=max(1, min(int(limit), 500)),
+            offset=max(0, int(offset)),
+        )
+        rows = self._fetchall(sql, tuple(params))
+        total = self._fetchone(count_sql, tuple(count_params))["total"]
+        return [self._row_to_spec_catalog_entry(r) for r in rows], int(total)
+
+    def get_spec_catalog_entry(self, spec_id: int) -> SpecCatalogEntry:
+        """Look up a listed spec by its API id (spec run id, else catalog id)."""
+        from devgodzilla.db.spec_catalog import build_catalog_query
+
+        sql, params, _, _ = build_catalog_query(dialect="sqlite", spec_id=spec_id, limit=1)
+        row = self._fetchone(sql, tuple(params))
+        if row is None:
+            raise KeyError(f"Specification {spec_id} not found")
+        return self._row_to_spec_catalog_entry(row)
+
+    # Recovery
+    def list_stuck_protocol_candidates(
+        self,
+        *,
+        stale_before: Optional[datetime] = None,
+        limit: int = 200,
+    ) -> List[Dict[str, Any]]:
+        """
+        RUNNING protocols that have steps but none running or awaiting QA.
+
+        One aggregate query; each row carries ``counts`` by step status and
+        ``last_step_update``. With ``stale_before``, only protocols whose
+        latest step update is older are returned.
+        """
+        params: List[Any] = []
+        if stale_before is not None:
+            if stale_before.tzinfo is not None:
+                stale_before = stale_before.astimezone(timezone.utc).replace(tzinfo=None)
+            # Matches the CURRENT_TIMESTAMP text format used by the column default.
+            params.append(stale_before.strftime("%Y-%m-%d %H:%M:%S"))
+        params.append(limit)
+        rows = self._fetchall(_stuck_protocol_query("?", stale_before is not None), params)
+        return [_stuck_protocol_row(row) for row in rows]
+
+    def acquire_lease(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        """
+        Take or renew the named lease for ``ttl_seconds``.
+
+        Succeeds when the lease is free, expired, or already held by
+        ``holder``; replicas use it so only one runs a singleton job.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                """
+                INSERT INTO worker_leases (name, holder, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at
+                WHERE worker_leases.holder = excluded.holder OR worker_leases.expires_at < ?
+                RETURNING holder
+                """,
+                (name, holder, now + ttl_seconds, now),
+            ).fetchone()
+        return row is not None
+
+    def release_lease(self, name: str, holder: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM worker_leases WHERE name = ? AND holder = ?", (name, holder))
+
+    # Retention
+    def fetch_expired_rows(
+        self,
+        table: str,
+        *,
+        before: datetime,
+        limit: int = 500,
+        statuses: Optional[List[str]] = None,
+        after_key: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return up to ``limit`` rows of ``table`` created before ``before``.
+
+        Rows come oldest first; pass ``after_key`` to page by primary key
+        instead (used when rows are archived without being deleted).
+        """
+        key = _retention_key(table)
+        if before.tzinfo is not None:
+            before = before.astimezone(timezone.utc).replace(tzinfo=None)
+        # Matches the CURRENT_TIMESTAMP text format used by the column default.
+        where = ["created_at < ?"]
+        params: List[Any] = [before.strftime("%Y-%m-%d %H:%M:%S")]
+        if statuses:
+            where.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        order = "created_at, " + key
+        if after_key is not None:
+            where.append(f"{key} > ?")
+            params.append(after_key)
+            order = key
+        params.append(limit)
+        rows = self._fetchall(
+            f"SELECT * FROM {table} WHERE {' AND '.join(where)} ORDER BY {order} LIMIT ?",
+            params,
+        )
+        return [dict(row) for row in rows]
+
+    def delete_rows(self, table: str, keys: List[Any]) -> int:
+        """Delete rows of a retention table by primary key in one short transaction."""
+        key = _retention_key(table)
+        if not keys:
+            return 0
+        with self._transaction() as conn:
+            cur = conn.execute(
+                f"DELETE FROM {table} WHERE {key} IN ({', '.join('?' for _ in keys)})",
+                tuple(keys),
+            )
+            return cur.rowcount
+
+    def events_partitioned(self) -> bool:
+        """SQLite has no table partitioning."""
+        return False
+
+    def list_event_partitions(self) -> List[Dict[str, Any]]:
+        return []
+
+    def ensure_event_partitions(self, *, months_ahead: int = 2) -> List[str]:
+        return []
+
+    def drop_event_partition(self, name: str) -> bool:
+        """
+        No-op: SQLite has no partitions (list_event_partitions is always
+        empty), so events retention there is purely delete-based.
+        """
+        return False
 
 
 
@@ -2778,13 +3715,42 @@ class PostgresDatabase:
                 cur.execute(query, tuple(params))
                 return cur.fetchall() or []
 
+    def _write_returning(self, query: str, params: Iterable[Any] = ()) -> Optional[Dict[str, Any]]:
+        """Run one INSERT/UPDATE ... RETURNING statement and return the written row."""
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, tuple(params))
+                return cur.fetchone()
+
     def init_schema(self) -> None:
         """Initialize database schema."""
-        from devgodzilla.db.schema import SCHEMA_POSTGRES
+        from devgodzilla.db.schema import RESOURCE_VERSIONS_POSTGRES, SCHEMA_POSTGRES, SPEC_CATALOG_SEARCH_POSTGRES
         
         with self._transaction() as conn:
             with conn.cursor() as cur:
                 cur.execute(SCHEMA_POSTGRES)
+                cur.execute(RESOURCE_VERSIONS_POSTGRES)
+        try:
+            with self._transaction() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(SPEC_CATALOG_SEARCH_POSTGRES)
+        except Exception as exc:
+            # pg_trgm needs CREATE privilege; without it search is an unindexed ILIKE.
+            logger.warning("spec_catalog_trgm_unavailable", extra={"error": str(exc)})
+
+    def get_resource_versions(self, scopes: Sequence[str]) -> Dict[str, int]:
+        scopes = list(dict.fromkeys(scopes))
+        if not scopes:
+            return {}
+        # Byte order, not the database collation, defines a prefix range.
+        rows = self._fetchall(*_resource_versions_query(scopes, "%s", column='scope COLLATE "C"'))
+        versions = {scope: 0 for scope in scopes}
+        versions.update({row["scope"]: int(row["version"]) for row in rows})
+        return versions
+
+    def ping(self) -> None:
+        """Cheapest round trip to the database; raises if it is unreachable."""
+        self._fetchone("SELECT 1")
 
     # Helper methods for JSON and timestamp parsing (reuse SQLite implementations)
     @staticmethod
@@ -3042,24 +4008,21 @@ class PostgresDatabase:
         end_date: Optional[str] = None,
         velocity_planned: Optional[int] = None,
     ) -> Sprint:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO sprints (
-                        project_id, name, status, goal,
-                        start_date, end_date, velocity_planned
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
-                    (
-                        project_id, name, status, goal,
-                        start_date, end_date, velocity_planned,
-                    ),
-                )
-                sprint_id = cur.fetchone()["id"]
-        return self.get_sprint(sprint_id)
+        row = self._write_returning(
+            """
+            INSERT INTO sprints (
+                project_id, name, status, goal,
+                start_date, end_date, velocity_planned
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            RETURNING *
+            """,
+            (
+                project_id, name, status, goal,
+                start_date, end_date, velocity_planned,
+            ),
+        )
+        return self._row_to_sprint(row)
 
     def get_sprint(self, sprint_id: int) -> Sprint:
         row = self._fetchone("SELECT * FROM sprints WHERE id = %s", (sprint_id,))
@@ -3137,13 +4100,13 @@ class PostgresDatabase:
             return self.get_sprint(sprint_id)
             
         params.append(sprint_id)
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"UPDATE sprints SET {', '.join(updates)} WHERE id = %s",
-                    tuple(params),
-                )
-        return self.get_sprint(sprint_id)
+        row = self._write_returning(
+            f"UPDATE sprints SET {', '.join(updates)} WHERE id = %s RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"Sprint {sprint_id} not found")
+        return self._row_to_sprint(row)
 
     # Agile: Tasks
     def create_task(
@@ -3166,32 +4129,33 @@ class PostgresDatabase:
         blocked_by: Optional[List[int]] = None,
         blocks: Optional[List[int]] = None,
     ) -> AgileTask:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO tasks (
-                        project_id, title, task_type, priority, board_status,
-                        sprint_id, protocol_run_id, step_run_id, description,
-                        assignee, reporter, story_points, labels, acceptance_criteria,
-                        due_date, blocked_by, blocks
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
-                    (
-                        project_id, title, task_type, priority, board_status,
-                        sprint_id, protocol_run_id, step_run_id, description,
-                        assignee, reporter, story_points,
-                        json.dumps(labels or []),
-                        json.dumps(acceptance_criteria or []),
-                        due_date,
-                        json.dumps(blocked_by or []),
-                        json.dumps(blocks or []),
-                    ),
-                )
-                task_id = cur.fetchone()["id"]
-        return self.get_task(task_id)
+        row = self._write_returning(
+            """
+            INSERT INTO tasks (
+                project_id, title, task_type, priority, board_status,
+                sprint_id, protocol_run_id, step_run_id, description,
+                assignee, reporter, story_points, labels, acceptance_criteria,
+                due_date, blocked_by, blocks
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING *
+            """,
+            (
+                project_id, title, task_type, priority, board_status,
+                sprint_id, protocol_run_id, step_run_id, description,
+                assignee, reporter, story_points,
+                json.dumps(labels or []),
+                json.dumps(acceptance_criteria or []),
+                due_date,
+                json.dumps(blocked_by or []),
+                json.dumps(blocks or []),
+            ),
+        )
+        if _has_spec_label(labels):
+            self._touch_spec_catalog(project_id)
+        if sprint_id is not None:
+            self._touch_sprint_burndown([sprint_id])
+        return self._row_to_agile_task(row)
 
     def get_task(self, task_id: int) -> AgileTask:
         row = self._fetchone("SELECT * FROM tasks WHERE id = %s", (task_id,))
@@ -3231,36 +4195,46 @@ class PostgresDatabase:
         return [self._row_to_agile_task(row) for row in rows]
 
     def _check_circular_task_dependencies(self, task_id: int, blocked_by: List[int]) -> None:
-        """Check for circular dependencies in task blocking relationships."""
+        """
+        Reject ``blocked_by`` edges that would close a cycle through ``task_id``.
+
+        Only edges not already on the task are checked, and one recursive
+        query walks just the new blockers' ancestors.
+        """
         if not blocked_by:
             return
+        row = self._fetchone(
+            """
+            WITH RECURSIVE reach(root, id) AS (
+                SELECT n::int, n::int
+                FROM jsonb_array_elements_text(%s::jsonb) n
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM tasks cur
+                    WHERE cur.id = %s AND cur.blocked_by @> jsonb_build_array(n::int)
+                )
+                UNION
+                SELECT r.root, j::int
+                FROM reach r
+                JOIN tasks t ON t.id = r.id
+                CROSS JOIN LATERAL jsonb_array_elements_text(COALESCE(t.blocked_by, '[]'::jsonb)) j
+                WHERE r.id <> %s
+            )
+            SELECT root FROM reach WHERE id = %s LIMIT 1
+            """,
+            (json.dumps([int(b) for b in blocked_by]), task_id, task_id, task_id),
+        )
+        if row is not None:
+            raise ValueError(
+                f"Circular dependency detected: task {task_id} cannot be blocked by {row['root']}"
+            )
 
-        visited = set()
-
-        def has_cycle(current_id: int, path: set) -> bool:
-            """DFS to detect cycles in dependency graph."""
-            if current_id == task_id:
-                return True
-            if current_id in visited or current_id in path:
-                return current_id == task_id
-
-            visited.add(current_id)
-            path.add(current_id)
-
-            try:
-                task = self.get_task(current_id)
-                for blocked_id in task.blocked_by or []:
-                    if has_cycle(blocked_id, path):
-                        return True
-            except KeyError:
-                pass
-
-            path.remove(current_id)
-            return False
-
-        for blocked_id in blocked_by:
-            if has_cycle(blocked_id, set()):
-                raise ValueError(f"Circular dependency detected: task {task_id} cannot be blocked by {blocked_id}")
+    def load_task_graph(self, project_id: int) -> TaskGraph:
+        """Load a project's task dependency index in one query."""
+        rows = self._fetchall(
+            "SELECT id, board_status, story_points, sprint_id, blocked_by FROM tasks WHERE project_id = %s",
+            (project_id,),
+        )
+        return TaskGraph.from_rows(rows, parse_json=self._parse_json)
 
     def update_task(self, task_id: int, **kwargs: Any) -> AgileTask:
         updates = ["updated_at = CURRENT_TIMESTAMP"]
@@ -3289,26 +4263,390 @@ class PostgresDatabase:
 
         if len(updates) == 1:
             return self.get_task(task_id)
-            
+
+        previous_sprint = None
+        if "sprint_id" in kwargs:
+            row = self._fetchone("SELECT sprint_id FROM tasks WHERE id = %s", (task_id,))
+            previous_sprint = row["sprint_id"] if row is not None else None
         params.append(task_id)
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"UPDATE tasks SET {', '.join(updates)} WHERE id = %s",
-                    tuple(params),
-                )
-        return self.get_task(task_id)
+        row = self._write_returning(
+            f"UPDATE tasks SET {', '.join(updates)} WHERE id = %s RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"Task {task_id} not found")
+        task = self._row_to_agile_task(row)
+        if "labels" in kwargs or _has_spec_label(task.labels):
+            self._touch_spec_catalog(task.project_id)
+        if _BURNDOWN_FIELDS.intersection(kwargs):
+            self._touch_sprint_burndown([task.sprint_id, previous_sprint])
+        return task
 
     def delete_sprint(self, sprint_id: int) -> None:
         with self._transaction() as conn:
             with conn.cursor() as cur:
                 cur.execute("UPDATE tasks SET sprint_id = NULL WHERE sprint_id = %s", (sprint_id,))
+                cur.execute("DELETE FROM sprint_burndown WHERE sprint_id = %s", (sprint_id,))
                 cur.execute("DELETE FROM sprints WHERE id = %s", (sprint_id,))
 
     def delete_task(self, task_id: int) -> None:
         with self._transaction() as conn:
             with conn.cursor() as cur:
-                cur.execute("DELETE FROM tasks WHERE id = %s", (task_id,))
+                cur.execute("DELETE FROM tasks WHERE id = %s RETURNING project_id, sprint_id, labels", (task_id,))
+                row = cur.fetchone()
+        if row is not None and _has_spec_label(self._parse_json(row["labels"])):
+            self._touch_spec_catalog(row["project_id"])
+        if row is not None and row["sprint_id"] is not None:
+            self._touch_sprint_burndown([row["sprint_id"]])
+
+    def delete_sprint_tasks(self, sprint_id: int) -> int:
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM tasks WHERE sprint_id = %s RETURNING project_id, labels", (sprint_id,)
+                )
+                rows = cur.fetchall() or []
+        for project_id in {r["project_id"] for r in rows if _has_spec_label(self._parse_json(r["labels"]))}:
+            self._touch_spec_catalog(project_id)
+        if rows:
+            self._touch_sprint_burndown([sprint_id])
+        return len(rows)
+
+    # Bulk writes
+    def _bulk_execute(
+        self,
+        conn: Any,
+        statement: str,
+        columns: Tuple[str, ...],
+        rows: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Run ``WITH v(columns) AS (VALUES ...) <statement>`` over rows in chunks."""
+        placeholder = "(" + ", ".join(
+            f"%s::{_BULK_PG_TYPES[c]}" if c in _BULK_PG_TYPES else "%s::text" for c in columns
+        ) + ")"
+        out: List[Dict[str, Any]] = []
+        with conn.cursor() as cur:
+            for start in range(0, len(rows), _BULK_CHUNK_ROWS):
+                chunk = rows[start:start + _BULK_CHUNK_ROWS]
+                values = ", ".join([placeholder] * len(chunk))
+                params = [row[c] for row in chunk for c in columns]
+                cur.execute(f"WITH v({', '.join(columns)}) AS (VALUES {values}) {statement}", params)
+                out.extend(cur.fetchall() or [])
+        return out
+
+    def bulk_create_tasks(self, tasks: List[Dict[str, Any]]) -> List[AgileTask]:
+        rows = _dedupe_rows([_task_bulk_row(t) for t in tasks], ("sprint_id", "title"))
+        if not rows:
+            return []
+        cols = ", ".join(_TASK_BULK_COLUMNS)
+        statement = (
+            f"INSERT INTO tasks ({cols}) SELECT {cols} FROM v "
+            "WHERE NOT EXISTS (SELECT 1 FROM tasks t "
+            "WHERE t.title = v.title AND t.sprint_id IS NOT DISTINCT FROM v.sprint_id) "
+            "RETURNING *"
+        )
+        with self._transaction() as conn:
+            created = self._bulk_execute(conn, statement, _TASK_BULK_COLUMNS, rows)
+        tasks_out = sorted((self._row_to_agile_task(r) for r in created), key=lambda t: t.id)
+        self._refresh_spec_catalog_for(tasks_out)
+        self._touch_sprint_burndown(t.sprint_id for t in tasks_out)
+        return tasks_out
+
+    def bulk_upsert_tasks_by_step(
+        self,
+        tasks: List[Dict[str, Any]],
+        *,
+        update_fields: Tuple[str, ...] = ("sprint_id", "protocol_run_id", "board_status"),
+        create_missing: bool = True,
+    ) -> List[AgileTask]:
+        unknown = set(update_fields) - set(_TASK_BULK_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot bulk update task fields: {sorted(unknown)}")
+        rows = _dedupe_rows([_task_bulk_row(t) for t in tasks], ("step_run_id",))
+        if not rows:
+            return []
+        assignments = ", ".join(f"{f} = v.{f}" for f in update_fields)
+        update = (
+            f"UPDATE tasks SET {assignments}, updated_at = CURRENT_TIMESTAMP "
+            "FROM v WHERE tasks.step_run_id = v.step_run_id RETURNING tasks.*"
+        )
+        cols = ", ".join(_TASK_BULK_COLUMNS)
+        insert = (
+            f"INSERT INTO tasks ({cols}) SELECT {cols} FROM v "
+            "WHERE NOT EXISTS (SELECT 1 FROM tasks t WHERE t.step_run_id = v.step_run_id) "
+            "RETURNING *"
+        )
+        previous = (
+            "SELECT DISTINCT t.sprint_id FROM tasks t JOIN v ON t.step_run_id = v.step_run_id "
+            "WHERE t.sprint_id IS NOT NULL"
+        )
+        with self._transaction() as conn:
+            moved = []
+            if "sprint_id" in update_fields:
+                moved = self._bulk_execute(conn, previous, _TASK_BULK_COLUMNS, rows)
+            written = self._bulk_execute(conn, update, _TASK_BULK_COLUMNS, rows)
+            if create_missing:
+                written += self._bulk_execute(conn, insert, _TASK_BULK_COLUMNS, rows)
+        by_step = {}
+        for task in sorted((self._row_to_agile_task(r) for r in written), key=lambda t: t.id):
+            by_step.setdefault(task.step_run_id, task)
+        self._refresh_spec_catalog_for(by_step.values())
+        self._touch_sprint_burndown(
+            [t.sprint_id for t in by_step.values()] + [r["sprint_id"] for r in moved]
+        )
+        return [by_step[r["step_run_id"]] for r in rows if r["step_run_id"] in by_step]
+
+    def bulk_create_step_runs(self, steps: List[Dict[str, Any]]) -> List[StepRun]:
+        rows = _reject_duplicate_steps([_step_bulk_row(s) for s in steps])
+        if not rows:
+            return []
+        cols = ", ".join(_STEP_BULK_COLUMNS)
+        statement = (
+            f"INSERT INTO step_runs ({cols}) SELECT {cols} FROM v "
+            "WHERE NOT EXISTS (SELECT 1 FROM step_runs s "
+            "WHERE s.protocol_run_id = v.protocol_run_id AND s.step_name = v.step_name) "
+            "RETURNING *"
+        )
+        with self._transaction() as conn:
+            created = self._bulk_execute(conn, statement, _STEP_BULK_COLUMNS, rows)
+        return sorted((self._row_to_step_run(r) for r in created), key=lambda s: s.id)
+
+    # Sprint analytics
+    def get_sprint_stats(self, sprint_id: int) -> Dict[str, int]:
+        row = self._fetchone(
+            """
+            SELECT COUNT(*) AS total_tasks,
+                   COALESCE(SUM(CASE WHEN board_status = 'done' THEN 1 ELSE 0 END), 0) AS completed_tasks,
+                   COALESCE(SUM(story_points), 0) AS total_points,
+                   COALESCE(SUM(CASE WHEN board_status = 'done' THEN story_points ELSE 0 END), 0) AS completed_points
+            FROM tasks WHERE sprint_id = %s
+            """,
+            (sprint_id,),
+        )
+        return {key: int(value or 0) for key, value in row.items()}
+
+    def list_sprint_velocities(
+        self,
+        project_id: int,
+        *,
+        status: Optional[str] = None,
+        exclude_sprint_id: Optional[int] = None,
+        limit: int = 5,
+    ) -> List[Dict[str, int]]:
+        where = ["project_id = %s"]
+        params: List[Any] = [project_id]
+        if status is not None:
+            where.append("status = %s")
+            params.append(status)
+        if exclude_sprint_id is not None:
+            where.append("id <> %s")
+            params.append(exclude_sprint_id)
+        rows = self._fetchall(
+            f"""
+            SELECT s.id AS sprint_id,
+                   COALESCE(SUM(CASE WHEN t.board_status = 'done' THEN t.story_points ELSE 0 END), 0)
+                       AS completed_points
+            FROM (
+                SELECT id, created_at FROM sprints WHERE {' AND '.join(where)}
+                ORDER BY created_at ASC, id ASC LIMIT %s
+            ) s
+            LEFT JOIN tasks t ON t.sprint_id = s.id
+            GROUP BY s.id, s.created_at
+            ORDER BY s.created_at ASC, s.id ASC
+            """,
+            (*params, limit),
+        )
+        return [{"sprint_id": r["sprint_id"], "completed_points": int(r["completed_points"])} for r in rows]
+
+    def record_sprint_snapshots(self, sprint_ids: Iterable[int], *, day: Optional[str] = None) -> None:
+        ids = sorted({int(i) for i in sprint_ids if i is not None})
+        if not ids:
+            return
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO sprint_burndown (
+                        sprint_id, day, total_tasks, completed_tasks, total_points, completed_points
+                    )
+                    SELECT s.id, %s, COUNT(t.id),
+                           COALESCE(SUM(CASE WHEN t.board_status = 'done' THEN 1 ELSE 0 END), 0),
+                           COALESCE(SUM(t.story_points), 0),
+                           COALESCE(SUM(CASE WHEN t.board_status = 'done' THEN t.story_points ELSE 0 END), 0)
+                    FROM sprints s LEFT JOIN tasks t ON t.sprint_id = s.id
+                    WHERE s.id = ANY(%s)
+                    GROUP BY s.id
+                    ON CONFLICT (sprint_id, day) DO UPDATE SET
+                        total_tasks = EXCLUDED.total_tasks,
+                        completed_tasks = EXCLUDED.completed_tasks,
+                        total_points = EXCLUDED.total_points,
+                        completed_points = EXCLUDED.completed_points,
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    (day or _burndown_day(), ids),
+                )
+
+    def list_sprint_snapshots(self, sprint_id: int) -> List[Dict[str, Any]]:
+        rows = self._fetchall(
+            """
+            SELECT day, total_tasks, completed_tasks, total_points, completed_points
+            FROM sprint_burndown WHERE sprint_id = %s ORDER BY day
+            """,
+            (sprint_id,),
+        )
+        return [dict(r) for r in rows]
+
+    def _touch_sprint_burndown(self, sprint_ids: Iterable[Optional[int]]) -> None:
+        """Refresh today's burndown rows after a task write; never fails the write."""
+        ids = [i for i in sprint_ids if i is not None]
+        if not ids:
+            return
+        try:
+            self.record_sprint_snapshots(ids)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("sprint_burndown_refresh_failed", extra={"sprint_ids": ids, "error": str(exc)})
+
+    # Specification catalog
+    def _row_to_spec_catalog_entry(self, row: Dict[str, Any]) -> SpecCatalogEntry:
+        return SQLiteDatabase._row_to_spec_catalog_entry(self, row)
+
+    def _sync_spec_catalog_run(self, run: SpecRun) -> None:
+        from devgodzilla.db.spec_catalog import catalog_entry_from_run
+
+        try:
+            row = self._fetchone("SELECT local_path FROM projects WHERE id = %s", (run.project_id,))
+            entry = catalog_entry_from_run(run, project_path=row["local_path"] if row else None)
+            self.upsert_spec_catalog_entries(run.project_id, [entry])
+        except Exception as exc:  # noqa: BLE001
+            # The reconciler repairs the catalog; a spec run write must not fail on it.
+            logger.warning("spec_catalog_sync_failed", extra={"spec_run_id": run.id, "error": str(exc)})
+
+    def _refresh_spec_catalog_for(self, tasks: Iterable[AgileTask]) -> None:
+        for project_id in sorted({t.project_id for t in tasks if _has_spec_label(t.labels)}):
+            self._touch_spec_catalog(project_id)
+
+    def _touch_spec_catalog(self, project_id: int) -> None:
+        """Refresh catalog task counts after a task write; never fails the write."""
+        try:
+            self.refresh_spec_catalog_tasks(project_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("spec_catalog_refresh_failed", extra={"project_id": project_id, "error": str(exc)})
+
+    def upsert_spec_catalog_entries(
+        self,
+        project_id: int,
+        entries: List[Dict[str, Any]],
+        *,
+        replace: bool = False,
+    ) -> int:
+        from devgodzilla.db.spec_catalog import SPEC_CATALOG_COLUMNS
+
+        cols = ", ".join(SPEC_CATALOG_COLUMNS)
+        placeholders = ", ".join("%s" for _ in SPEC_CATALOG_COLUMNS)
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in SPEC_CATALOG_COLUMNS if c != "spec_key")
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                if replace:
+                    cur.execute(
+                        "DELETE FROM spec_catalog WHERE project_id = %s AND NOT (spec_key = ANY(%s))",
+                        (project_id, [e["spec_key"] for e in entries]),
+                    )
+                else:
+                    cur.execute(
+                        "DELETE FROM spec_catalog WHERE project_id = %s AND spec_run_id IS NULL",
+                        (project_id,),
+                    )
+                cur.executemany(
+                    f"""
+                    INSERT INTO spec_catalog (project_id, {cols}, updated_at)
+                    VALUES (%s, {placeholders}, CURRENT_TIMESTAMP)
+                    ON CONFLICT (project_id, spec_key) DO UPDATE SET
+                        {updates}, updated_at = CURRENT_TIMESTAMP
+                    """,
+                    [(project_id, *[e.get(c) for c in SPEC_CATALOG_COLUMNS]) for e in entries],
+                )
+        self.refresh_spec_catalog_tasks(project_id)
+        return len(entries)
+
+    def refresh_spec_catalog_tasks(self, project_id: int) -> None:
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    UPDATE spec_catalog SET linked_tasks = 0, completed_tasks = 0, story_points = 0,
+                        task_sprint_id = NULL, task_sprint_count = 0
+                    WHERE project_id = %s
+                    """,
+                    (project_id,),
+                )
+                cur.execute(
+                    """
+                    UPDATE spec_catalog SET
+                        linked_tasks = agg.linked,
+                        completed_tasks = agg.completed,
+                        story_points = agg.points,
+                        task_sprint_id = agg.sprint_id,
+                        task_sprint_count = agg.sprints
+                    FROM (
+                        SELECT substr(j.value, 6) AS slug,
+                            COUNT(*) AS linked,
+                            SUM(CASE WHEN t.board_status = 'done' THEN 1 ELSE 0 END) AS completed,
+                            SUM(COALESCE(t.story_points, 0)) AS points,
+                            COUNT(DISTINCT t.sprint_id) AS sprints,
+                            MIN(t.sprint_id) AS sprint_id
+                        FROM tasks t
+                        CROSS JOIN LATERAL jsonb_array_elements_text(COALESCE(t.labels, '[]'::jsonb)) AS j(value)
+                        WHERE t.project_id = %s AND left(j.value, 5) = 'spec:'
+                        GROUP BY substr(j.value, 6)
+                    ) AS agg
+                    WHERE spec_catalog.project_id = %s AND spec_catalog.slug = agg.slug
+                    """,
+                    (project_id, project_id),
+                )
+
+    def list_spec_catalog(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        sprint_id: Optional[int] = None,
+        status: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        has_plan: Optional[bool] = None,
+        has_tasks: Optional[bool] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[List[SpecCatalogEntry], int]:
+        from devgodzilla.db.spec_catalog import build_catalog_query
+
+        sql, params, count_sql, count_params = build_catalog_query(
+            dialect="postgres",
+            project_id=project_id,
+            sprint_id=sprint_id,
+            status=status,
+            date_from=date_from,
+            date_to=date_to,
+            has_plan=has_plan,
+            has_tasks=has_tasks,
+            search=search,
+            sort=sort,
+            limit=max(1, min(int(limit), 500)),
+            offset=max(0, int(offset)),
+        )
+        rows = self._fetchall(sql, tuple(params))
+        total = self._fetchone(count_sql, tuple(count_params))["total"]
+        return [self._row_to_spec_catalog_entry(r) for r in rows], int(total)
+
+    def get_spec_catalog_entry(self, spec_id: int) -> SpecCatalogEntry:
+        from devgodzilla.db.spec_catalog import build_catalog_query
+
+        sql, params, _, _ = build_catalog_query(dialect="postgres", spec_id=spec_id, limit=1)
+        row = self._fetchone(sql, tuple(params))
+        if row is None:
+            raise KeyError(f"Specification {spec_id} not found")
+        return self._row_to_spec_catalog_entry(row)
 
     # Policy pack operations (PostgreSQL uses %s instead of ?)
     def _row_to_policy_pack(self, row: Dict[str, Any]) -> PolicyPack:
@@ -3375,22 +4713,22 @@ class PostgresDatabase:
         pack: dict,
     ) -> PolicyPack:
         """Insert or update a policy pack."""
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO policy_packs (key, version, name, description, status, pack, updated_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-                    ON CONFLICT(key, version) DO UPDATE SET
-                        name=excluded.name,
-                        description=excluded.description,
-                        status=excluded.status,
-                        pack=excluded.pack,
-                        updated_at=CURRENT_TIMESTAMP
-                    """,
-                    (key, version, name, description, status, json.dumps(pack)),
-                )
-        return self.get_policy_pack(key=key, version=version)
+        row = self._write_returning(
+            """
+            INSERT INTO policy_packs (key, version, name, description, status, pack, updated_at)
+            VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT(key, version) DO UPDATE SET
+                name=excluded.name,
+                description=excluded.description,
+                status=excluded.status,
+                pack=excluded.pack,
+                updated_at=CURRENT_TIMESTAMP
+            RETURNING *
+            """,
+            (key, version, name, description, status, json.dumps(pack)),
+        )
+        notify_change("policy_pack", key=key, version=version)
+        return self._row_to_policy_pack(row)
 
     # Clarification operations (PostgreSQL uses %s instead of ?)
     def _row_to_clarification(self, row: Dict[str, Any]) -> Clarification:
@@ -3507,34 +4845,30 @@ class PostgresDatabase:
         blocking: bool = False,
     ) -> Clarification:
         """Upsert a clarification record."""
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO clarifications (
-                        scope, project_id, protocol_run_id, step_run_id,
-                        key, question, recommended, options, applies_to, blocking
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT(scope, key) DO UPDATE SET
-                        question = excluded.question,
-                        recommended = excluded.recommended,
-                        options = excluded.options,
-                        applies_to = excluded.applies_to,
-                        blocking = excluded.blocking,
-                        updated_at = CURRENT_TIMESTAMP
-                    """,
-                    (
-                        scope, project_id, protocol_run_id, step_run_id,
-                        key, question,
-                        json.dumps(recommended) if recommended else None,
-                        json.dumps(options) if options else None,
-                        applies_to, blocking,
-                    ),
-                )
-        row = self._fetchone("SELECT * FROM clarifications WHERE scope = %s AND key = %s LIMIT 1", (scope, key))
-        if row is None:
-            raise KeyError("Clarification not found after upsert")
+        row = self._write_returning(
+            """
+            INSERT INTO clarifications (
+                scope, project_id, protocol_run_id, step_run_id,
+                key, question, recommended, options, applies_to, blocking
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT(scope, key) DO UPDATE SET
+                question = excluded.question,
+                recommended = excluded.recommended,
+                options = excluded.options,
+                applies_to = excluded.applies_to,
+                blocking = excluded.blocking,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING *
+            """,
+            (
+                scope, project_id, protocol_run_id, step_run_id,
+                key, question,
+                json.dumps(recommended) if recommended else None,
+                json.dumps(options) if options else None,
+                applies_to, blocking,
+            ),
+        )
         return self._row_to_clarification(row)
 
     # Project operations (PostgreSQL uses %s instead of ?)
@@ -3551,30 +4885,27 @@ class PostgresDatabase:
         policy_pack_key: Optional[str] = None,
         policy_pack_version: Optional[str] = None,
     ) -> Project:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO projects (
-                        name, git_url, base_branch, ci_provider,
-                        default_models, secrets, local_path,
-                        project_classification, policy_pack_key, policy_pack_version,
-                        policy_enforcement_mode
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'warn')
-                    RETURNING id
-                    """,
-                    (
-                        name, git_url, base_branch, ci_provider,
-                        json.dumps(default_models) if default_models else None,
-                        json.dumps(secrets) if secrets else None,
-                        local_path, project_classification,
-                        policy_pack_key or "default",
-                        policy_pack_version or "1.0",
-                    ),
-                )
-                project_id = cur.fetchone()["id"]
-        return self.get_project(project_id)
+        row = self._write_returning(
+            """
+            INSERT INTO projects (
+                name, git_url, base_branch, ci_provider,
+                default_models, secrets, local_path,
+                project_classification, policy_pack_key, policy_pack_version,
+                policy_enforcement_mode
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'warn')
+            RETURNING *
+            """,
+            (
+                name, git_url, base_branch, ci_provider,
+                json.dumps(default_models) if default_models else None,
+                json.dumps(secrets) if secrets else None,
+                local_path, project_classification,
+                policy_pack_key or "default",
+                policy_pack_version or "1.0",
+            ),
+        )
+        return self._row_to_project(row)
 
     def get_project(self, project_id: int) -> Project:
         row = self._fetchone("SELECT * FROM projects WHERE id = %s", (project_id,))
@@ -3587,13 +4918,13 @@ class PostgresDatabase:
         return [self._row_to_project(row) for row in rows]
 
     def update_project_local_path(self, project_id: int, local_path: str) -> Project:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE projects SET local_path = %s, updated_at = CURRENT_TIMESTAMP WHERE id = %s",
-                    (local_path, project_id),
-                )
-        return self.get_project(project_id)
+        row = self._write_returning(
+            "UPDATE projects SET local_path = %s, updated_at = CURRENT_TIMESTAMP WHERE id = %s RETURNING *",
+            (local_path, project_id),
+        )
+        if row is None:
+            raise KeyError(f"Project {project_id} not found")
+        return self._row_to_project(row)
 
     def update_project(
         self,
@@ -3638,13 +4969,13 @@ class PostgresDatabase:
 
         params.append(project_id)
 
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"UPDATE projects SET {', '.join(updates)} WHERE id = %s",
-                    tuple(params),
-                )
-        return self.get_project(project_id)
+        row = self._write_returning(
+            f"UPDATE projects SET {', '.join(updates)} WHERE id = %s RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"Project {project_id} not found")
+        return self._row_to_project(row)
 
     def delete_project(self, project_id: int) -> None:
         """Delete a project and all associated data (PostgreSQL)."""
@@ -3695,10 +5026,15 @@ class PostgresDatabase:
                 )
                 cur.execute("DELETE FROM events WHERE project_id = %s", (project_id,))
                 cur.execute("DELETE FROM clarifications WHERE project_id = %s", (project_id,))
+                cur.execute("DELETE FROM spec_catalog WHERE project_id = %s", (project_id,))
                 cur.execute("DELETE FROM spec_runs WHERE project_id = %s", (project_id,))
                 cur.execute("DELETE FROM speckit_specs WHERE project_id = %s", (project_id,))
                 cur.execute("DELETE FROM spec_sprint_links WHERE project_id = %s", (project_id,))
                 cur.execute("DELETE FROM tasks WHERE project_id = %s", (project_id,))
+                cur.execute(
+                    "DELETE FROM sprint_burndown WHERE sprint_id IN (SELECT id FROM sprints WHERE project_id = %s)",
+                    (project_id,),
+                )
                 cur.execute("DELETE FROM sprints WHERE project_id = %s", (project_id,))
                 cur.execute(
                     "DELETE FROM step_runs WHERE protocol_run_id IN (SELECT id FROM protocol_runs WHERE project_id = %s)",
@@ -3742,13 +5078,14 @@ class PostgresDatabase:
         
         params.append(project_id)
         
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"UPDATE projects SET {', '.join(updates)} WHERE id = %s",
-                    tuple(params),
-                )
-        return self.get_project(project_id)
+        row = self._write_returning(
+            f"UPDATE projects SET {', '.join(updates)} WHERE id = %s RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"Project {project_id} not found")
+        notify_change("project_policy", project_id=project_id)
+        return self._row_to_project(row)
 
     # Protocol run operations
     def create_protocol_run(
@@ -3761,21 +5098,18 @@ class PostgresDatabase:
         protocol_root: Optional[str] = None,
         description: Optional[str] = None,
     ) -> ProtocolRun:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO protocol_runs (
-                        project_id, protocol_name, status, base_branch,
-                        worktree_path, protocol_root, description
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
-                    (project_id, protocol_name, status, base_branch, worktree_path, protocol_root, description),
-                )
-                run_id = cur.fetchone()["id"]
-        return self.get_protocol_run(run_id)
+        row = self._write_returning(
+            """
+            INSERT INTO protocol_runs (
+                project_id, protocol_name, status, base_branch,
+                worktree_path, protocol_root, description
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            RETURNING *
+            """,
+            (project_id, protocol_name, status, base_branch, worktree_path, protocol_root, description),
+        )
+        return self._row_to_protocol_run(row)
 
     def get_protocol_run(self, run_id: int) -> ProtocolRun:
         row = self._fetchone("SELECT * FROM protocol_runs WHERE id = %s", (run_id,))
@@ -3799,13 +5133,13 @@ class PostgresDatabase:
         return [self._row_to_protocol_run(row) for row in rows]
 
     def update_protocol_status(self, run_id: int, status: str) -> ProtocolRun:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE protocol_runs SET status = %s, updated_at = CURRENT_TIMESTAMP WHERE id = %s",
-                    (status, run_id),
-                )
-        return self.get_protocol_run(run_id)
+        row = self._write_returning(
+            "UPDATE protocol_runs SET status = %s, updated_at = CURRENT_TIMESTAMP WHERE id = %s RETURNING *",
+            (status, run_id),
+        )
+        if row is None:
+            raise KeyError(f"ProtocolRun {run_id} not found")
+        return self._row_to_protocol_run(row)
 
     # SpecKit spec operations
     def upsert_speckit_spec(
@@ -3908,58 +5242,57 @@ class PostgresDatabase:
         spec_path: Optional[str] = None,
         plan_path: Optional[str] = None,
         tasks_path: Optional[str] = None,
-        checklist_path: Optional[str] = None,
-        analysis_path: Optional[str] = None,
-        implement_path: Optional[str] = None,
-        protocol_run_id: Optional[int] = None,
-    ) -> SpecRun:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO spec_runs (
-                        project_id,
-                        spec_name,
-                        status,
-                        base_branch,
-                        branch_name,
-                        worktree_path,
-                        spec_root,
-                        spec_number,
-                        feature_name,
-                        spec_path,
-                        plan_path,
-                        tasks_path,
-                        checklist_path,
-                        analysis_path,
-                        implement_path,
-                        protocol_run_id,
-                        updated_at
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-                    RETURNING id
-                    """,
-                    (
-                        project_id,
-                        spec_name,
-                        status,
-                        base_branch,
-                        branch_name,
-                        worktree_path,
-                        spec_root,
-                        spec_number,
-                        feature_name,
-                        spec_path,
-                        plan_path,
-                        tasks_path,
-                        checklist_path,
-                        analysis_path,
-                        implement_path,
-                        protocol_run_id,
-                    ),
-                )
-                spec_run_id = cur.fetchone()["id"]
-        return self.get_spec_run(spec_run_id)
+        checklist_path: Optional[str] = None,
+        analysis_path: Optional[str] = None,
+        implement_path: Optional[str] = None,
+        protocol_run_id: Optional[int] = None,
+    ) -> SpecRun:
+        row = self._write_returning(
+            """
+            INSERT INTO spec_runs (
+                project_id,
+                spec_name,
+                status,
+                base_branch,
+                branch_name,
+                worktree_path,
+                spec_root,
+                spec_number,
+                feature_name,
+                spec_path,
+                plan_path,
+                tasks_path,
+                checklist_path,
+                analysis_path,
+                implement_path,
+                protocol_run_id,
+                updated_at
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+            RETURNING *
+            """,
+            (
+                project_id,
+                spec_name,
+                status,
+                base_branch,
+                branch_name,
+                worktree_path,
+                spec_root,
+                spec_number,
+                feature_name,
+                spec_path,
+                plan_path,
+                tasks_path,
+                checklist_path,
+                analysis_path,
+                implement_path,
+                protocol_run_id,
+            ),
+        )
+        run = self._row_to_spec_run(row)
+        self._sync_spec_catalog_run(run)
+        return run
 
     def get_spec_run(self, spec_run_id: int) -> SpecRun:
         row = self._fetchone("SELECT * FROM spec_runs WHERE id = %s", (spec_run_id,))
@@ -4003,13 +5336,15 @@ class PostgresDatabase:
             return self.get_spec_run(spec_run_id)
         fields.append("updated_at = CURRENT_TIMESTAMP")
         params.append(spec_run_id)
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"UPDATE spec_runs SET {', '.join(fields)} WHERE id = %s",
-                    tuple(params),
-                )
-        return self.get_spec_run(spec_run_id)
+        row = self._write_returning(
+            f"UPDATE spec_runs SET {', '.join(fields)} WHERE id = %s RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"SpecRun {spec_run_id} not found")
+        run = self._row_to_spec_run(row)
+        self._sync_spec_catalog_run(run)
+        return run
 
     # Step run operations
     def create_step_run(
@@ -4023,24 +5358,21 @@ class PostgresDatabase:
         parallel_group: Optional[str] = None,
         assigned_agent: Optional[str] = None,
     ) -> StepRun:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO step_runs (
-                        protocol_run_id, step_index, step_name, step_type, status,
-                        depends_on, parallel_group, assigned_agent
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
-                    (
-                        protocol_run_id, step_index, step_name, step_type, status,
-                        json.dumps(depends_on or []), parallel_group, assigned_agent,
-                    ),
-                )
-                step_id = cur.fetchone()["id"]
-        return self.get_step_run(step_id)
+        row = self._write_returning(
+            """
+            INSERT INTO step_runs (
+                protocol_run_id, step_index, step_name, step_type, status,
+                depends_on, parallel_group, assigned_agent
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING *
+            """,
+            (
+                protocol_run_id, step_index, step_name, step_type, status,
+                json.dumps(depends_on or []), parallel_group, assigned_agent,
+            ),
+        )
+        return self._row_to_step_run(row)
 
     def get_step_run(self, step_run_id: int) -> StepRun:
         row = self._fetchone("SELECT * FROM step_runs WHERE id = %s", (step_run_id,))
@@ -4086,13 +5418,13 @@ class PostgresDatabase:
         
         params.append(step_run_id)
         
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"UPDATE step_runs SET {', '.join(updates)} WHERE id = %s",
-                    tuple(params),
-                )
-        return self.get_step_run(step_run_id)
+        row = self._write_returning(
+            f"UPDATE step_runs SET {', '.join(updates)} WHERE id = %s RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"StepRun {step_run_id} not found")
+        return self._row_to_step_run(row)
 
     def update_step_run(self, step_run_id: int, **kwargs) -> StepRun:
         """
@@ -4120,13 +5452,13 @@ class PostgresDatabase:
             return self.get_step_run(step_run_id)
 
         params.append(step_run_id)
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"UPDATE step_runs SET {', '.join(updates)} WHERE id = %s",
-                    tuple(params),
-                )
-        return self.get_step_run(step_run_id)
+        row = self._write_returning(
+            f"UPDATE step_runs SET {', '.join(updates)} WHERE id = %s RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(f"StepRun {step_run_id} not found")
+        return self._row_to_step_run(row)
 
     def update_step_assigned_agent(self, step_run_id: int, assigned_agent: Optional[str]) -> StepRun:
         return self.update_step_run(step_run_id, assigned_agent=assigned_agent)
@@ -4263,6 +5595,7 @@ class PostgresDatabase:
                             json.dumps(metadata) if metadata is not None else None,
                         ),
                     )
+        notify_change("agent_assignment", project_id=project_id)
 
     def delete_agent_assignment(self, project_id: int, process_key: str) -> None:
         with self._transaction() as conn:
@@ -4271,6 +5604,7 @@ class PostgresDatabase:
                     "DELETE FROM agent_assignments WHERE project_id = %s AND process_key = %s",
                     (project_id, process_key),
                 )
+        notify_change("agent_assignment", project_id=project_id)
 
     def get_agent_assignment_settings(self, project_id: int) -> Dict[str, Any]:
         row = self._fetchone(
@@ -4295,6 +5629,7 @@ class PostgresDatabase:
                     """,
                     (project_id, inherit_global),
                 )
+        notify_change("agent_assignment", project_id=project_id)
         return {"inherit_global": inherit_global}
 
     def list_agent_overrides(self, project_id: int) -> Dict[str, Dict[str, Any]]:
@@ -4322,6 +5657,7 @@ class PostgresDatabase:
                     """,
                     (project_id, agent_id, json.dumps(overrides) if overrides is not None else None),
                 )
+        notify_change("agent_override", project_id=project_id)
         return overrides
 
     # Event operations
@@ -4337,32 +5673,29 @@ class PostgresDatabase:
         event_type = normalize_event_type(event_type)
         if protocol_run_id is None and project_id is None:
             raise ValueError("append_event requires protocol_run_id or project_id")
-        if project_id is None and protocol_run_id is not None:
-            try:
-                project_id = self.get_protocol_run(protocol_run_id).project_id
-            except Exception:
-                project_id = None
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO events (
-                        protocol_run_id, project_id, step_run_id, event_type, message, metadata
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
-                    (
-                        protocol_run_id,
-                        project_id,
-                        step_run_id,
-                        event_type,
-                        message,
-                        json.dumps(metadata) if metadata else None,
-                    ),
-                )
-                event_id = cur.fetchone()["id"]
-        row = self._fetchone("SELECT * FROM events WHERE id = %s", (event_id,))
+        # project_id defaults to the run's project, resolved in the same statement.
+        row = self._write_returning(
+            """
+            INSERT INTO events (
+                protocol_run_id, project_id, step_run_id, event_type, message, metadata
+            )
+            VALUES (
+                %s,
+                COALESCE(%s::integer, (SELECT project_id FROM protocol_runs WHERE id = %s::integer)),
+                %s, %s, %s, %s
+            )
+            RETURNING *
+            """,
+            (
+                protocol_run_id,
+                project_id,
+                protocol_run_id,
+                step_run_id,
+                event_type,
+                message,
+                json.dumps(metadata) if metadata else None,
+            ),
+        )
         return self._row_to_event(row)
 
     def list_events(
@@ -4405,18 +5738,21 @@ class PostgresDatabase:
                 events = [event for event in events if (event.event_category or "other") in category_set]
         return events
 
-    def list_recent_events(
-        self,
+    @staticmethod
+    def _events_query(
         *,
-        limit: int = 50,
+        limit: int,
+        since_id: Optional[int] = None,
         protocol_run_id: Optional[int] = None,
         project_id: Optional[int] = None,
         event_types: Optional[List[str]] = None,
-        categories: Optional[List[str]] = None,
-    ) -> List[Event]:
-        limit = max(1, min(int(limit), 500))
+    ) -> Tuple[str, List[Any]]:
+        """Build the event list query shared by the sync and async read paths."""
         where: list[str] = []
         params: list[Any] = []
+        if since_id is not None:
+            where.append("e.id > %s")
+            params.append(int(since_id))
         if protocol_run_id is not None:
             where.append("e.protocol_run_id = %s")
             params.append(protocol_run_id)
@@ -4444,17 +5780,37 @@ class PostgresDatabase:
         """
         if where:
             sql += " WHERE " + " AND ".join(where)
-        sql += " ORDER BY e.id DESC LIMIT %s"
-        params.append(limit)
+        # Tailing (since_id) reads oldest first; "recent" reads newest first.
+        sql += " ORDER BY e.id ASC LIMIT %s" if since_id is not None else " ORDER BY e.id DESC LIMIT %s"
+        params.append(max(1, min(int(limit), 500)))
+        return sql, params
 
-        rows = self._fetchall(sql, params)
-        events = [self._row_to_event(row) for row in rows]
+    @staticmethod
+    def _filter_event_categories(events: List[Event], categories: Optional[List[str]]) -> List[Event]:
         if categories:
             category_set = {normalize_event_type(c) for c in categories if c}
             if category_set:
                 events = [event for event in events if (event.event_category or "other") in category_set]
         return events
 
+    def list_recent_events(
+        self,
+        *,
+        limit: int = 50,
+        protocol_run_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        event_types: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+    ) -> List[Event]:
+        sql, params = self._events_query(
+            limit=limit,
+            protocol_run_id=protocol_run_id,
+            project_id=project_id,
+            event_types=event_types,
+        )
+        rows = self._fetchall(sql, params)
+        return self._filter_event_categories([self._row_to_event(row) for row in rows], categories)
+
     def list_events_since_id(
         self,
         *,
@@ -4465,46 +5821,15 @@ class PostgresDatabase:
         event_types: Optional[List[str]] = None,
         categories: Optional[List[str]] = None,
     ) -> List[Event]:
-        limit = max(1, min(int(limit), 500))
-        where: list[str] = ["e.id > %s"]
-        params: list[Any] = [int(since_id)]
-        if protocol_run_id is not None:
-            where.append("e.protocol_run_id = %s")
-            params.append(protocol_run_id)
-        if project_id is not None:
-            where.append("COALESCE(e.project_id, pr.project_id) = %s")
-            params.append(project_id)
-        if event_types:
-            variants: list[str] = []
-            for event_type in event_types:
-                variants.extend(event_type_variants(event_type))
-            unique_variants = sorted(set(variants))
-            if unique_variants:
-                where.append(f"e.event_type IN ({', '.join(['%s'] * len(unique_variants))})")
-                params.extend(unique_variants)
-
-        sql = """
-            SELECT
-                e.*,
-                pr.protocol_name,
-                COALESCE(e.project_id, pr.project_id) AS project_id,
-                p.name AS project_name
-            FROM events e
-            LEFT JOIN protocol_runs pr ON pr.id = e.protocol_run_id
-            LEFT JOIN projects p ON p.id = COALESCE(e.project_id, pr.project_id)
-            WHERE
-        """
-        sql += " AND ".join(where)
-        sql += " ORDER BY e.id ASC LIMIT %s"
-        params.append(limit)
-
+        sql, params = self._events_query(
+            limit=limit,
+            since_id=since_id,
+            protocol_run_id=protocol_run_id,
+            project_id=project_id,
+            event_types=event_types,
+        )
         rows = self._fetchall(sql, params)
-        events = [self._row_to_event(row) for row in rows]
-        if categories:
-            category_set = {normalize_event_type(c) for c in categories if c}
-            if category_set:
-                events = [event for event in events if (event.event_category or "other") in category_set]
-        return events
+        return self._filter_event_categories([self._row_to_event(row) for row in rows], categories)
 
     # QA results
     def create_qa_result(
@@ -4525,38 +5850,34 @@ class PostgresDatabase:
         report_text: Optional[str] = None,
         duration_seconds: Optional[float] = None,
     ) -> QAResultRecord:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO qa_results (
-                        project_id, protocol_run_id, step_run_id,
-                        verdict, summary, gate_results, findings,
-                        prompt_path, prompt_hash, engine_id, model,
-                        report_path, report_text, duration_seconds
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
-                    (
-                        project_id,
-                        protocol_run_id,
-                        step_run_id,
-                        verdict,
-                        summary,
-                        json.dumps(gate_results) if gate_results is not None else None,
-                        json.dumps(findings) if findings is not None else None,
-                        prompt_path,
-                        prompt_hash,
-                        engine_id,
-                        model,
-                        report_path,
-                        report_text,
-                        duration_seconds,
-                    ),
-                )
-                result_id = cur.fetchone()["id"]
-        row = self._fetchone("SELECT * FROM qa_results WHERE id = %s", (result_id,))
+        row = self._write_returning(
+            """
+            INSERT INTO qa_results (
+                project_id, protocol_run_id, step_run_id,
+                verdict, summary, gate_results, findings,
+                prompt_path, prompt_hash, engine_id, model,
+                report_path, report_text, duration_seconds
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING *
+            """,
+            (
+                project_id,
+                protocol_run_id,
+                step_run_id,
+                verdict,
+                summary,
+                json.dumps(gate_results) if gate_results is not None else None,
+                json.dumps(findings) if findings is not None else None,
+                prompt_path,
+                prompt_hash,
+                engine_id,
+                model,
+                report_path,
+                report_text,
+                duration_seconds,
+            ),
+        )
         return self._row_to_qa_result(row)
 
     def list_qa_results(
@@ -4621,40 +5942,39 @@ class PostgresDatabase:
         cost_cents: Optional[int] = None,
         windmill_job_id: Optional[str] = None,
     ) -> JobRun:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO job_runs (
-                        run_id, job_type, status, run_kind,
-                        project_id, protocol_run_id, step_run_id,
-                        queue, attempt, worker_id,
-                        params, result, error, log_path,
-                        cost_tokens, cost_cents, windmill_job_id
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        run_id,
-                        job_type,
-                        status,
-                        run_kind,
-                        project_id,
-                        protocol_run_id,
-                        step_run_id,
-                        queue,
-                        attempt,
-                        worker_id,
-                        json.dumps(params) if params is not None else None,
-                        json.dumps(result) if result is not None else None,
-                        error,
-                        log_path,
-                        cost_tokens,
-                        cost_cents,
-                        windmill_job_id,
-                    ),
-                )
-        return self.get_job_run(run_id)
+        row = self._write_returning(
+            """
+            INSERT INTO job_runs (
+                run_id, job_type, status, run_kind,
+                project_id, protocol_run_id, step_run_id,
+                queue, attempt, worker_id,
+                params, result, error, log_path,
+                cost_tokens, cost_cents, windmill_job_id
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING *
+            """,
+            (
+                run_id,
+                job_type,
+                status,
+                run_kind,
+                project_id,
+                protocol_run_id,
+                step_run_id,
+                queue,
+                attempt,
+                worker_id,
+                json.dumps(params) if params is not None else None,
+                json.dumps(result) if result is not None else None,
+                error,
+                log_path,
+                cost_tokens,
+                cost_cents,
+                windmill_job_id,
+            ),
+        )
+        return self._row_to_job_run(row)
 
     def get_job_run(self, run_id: str) -> JobRun:
         row = self._fetchone("SELECT * FROM job_runs WHERE run_id = %s", (run_id,))
@@ -4703,6 +6023,9 @@ class PostgresDatabase:
         return [self._row_to_job_run(row) for row in rows]
 
     def update_job_run(self, run_id: str, **kwargs: Any) -> JobRun:
+        return self._update_job_run_where("run_id = %s", run_id, f"JobRun {run_id} not found", kwargs)
+
+    def _update_job_run_where(self, match: str, match_value: Any, missing: str, kwargs: Dict[str, Any]) -> JobRun:
         allowed = {
             "status",
             "run_kind",
@@ -4736,24 +6059,23 @@ class PostgresDatabase:
             params.append(value)
 
         updates.append("updated_at = CURRENT_TIMESTAMP")
-        params.append(run_id)
+        params.append(match_value)
 
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"UPDATE job_runs SET {', '.join(updates)} WHERE run_id = %s",
-                    tuple(params),
-                )
-        return self.get_job_run(run_id)
+        row = self._write_returning(
+            f"UPDATE job_runs SET {', '.join(updates)} WHERE {match} RETURNING *",
+            params,
+        )
+        if row is None:
+            raise KeyError(missing)
+        return self._row_to_job_run(row)
 
     def update_job_run_by_windmill_id(self, windmill_job_id: str, **kwargs: Any) -> JobRun:
-        row = self._fetchone(
-            "SELECT run_id FROM job_runs WHERE windmill_job_id = %s LIMIT 1",
-            (windmill_job_id,),
+        return self._update_job_run_where(
+            "run_id = (SELECT run_id FROM job_runs WHERE windmill_job_id = %s LIMIT 1)",
+            windmill_job_id,
+            f"JobRun with windmill_job_id={windmill_job_id} not found",
+            kwargs,
         )
-        if row is None:
-            raise KeyError(f"JobRun with windmill_job_id={windmill_job_id} not found")
-        return self.update_job_run(row["run_id"], **kwargs)
 
     def create_run_artifact(
         self,
@@ -4765,21 +6087,20 @@ class PostgresDatabase:
         sha256: Optional[str] = None,
         bytes: Optional[int] = None,
     ) -> RunArtifact:
-        with self._transaction() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO run_artifacts (run_id, name, kind, path, sha256, bytes)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (run_id, name) DO UPDATE SET
-                        kind=excluded.kind,
-                        path=excluded.path,
-                        sha256=excluded.sha256,
-                        bytes=excluded.bytes
-                    """,
-                    (run_id, name, kind, path, sha256, bytes),
-                )
-        return self.get_run_artifact(run_id, name)
+        row = self._write_returning(
+            """
+            INSERT INTO run_artifacts (run_id, name, kind, path, sha256, bytes)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON CONFLICT (run_id, name) DO UPDATE SET
+                kind=excluded.kind,
+                path=excluded.path,
+                sha256=excluded.sha256,
+                bytes=excluded.bytes
+            RETURNING *
+            """,
+            (run_id, name, kind, path, sha256, bytes),
+        )
+        return self._row_to_run_artifact(row)
 
     def list_run_artifacts(self, run_id: str) -> List[RunArtifact]:
         rows = self._fetchall(
@@ -4864,6 +6185,158 @@ class PostgresDatabase:
             result.append(job)
         return result
 
+    # Recovery
+    def list_stuck_protocol_candidates(
+        self,
+        *,
+        stale_before: Optional[datetime] = None,
+        limit: int = 200,
+    ) -> List[Dict[str, Any]]:
+        params: List[Any] = []
+        if stale_before is not None:
+            if stale_before.tzinfo is not None:
+                stale_before = stale_before.astimezone(timezone.utc).replace(tzinfo=None)
+            params.append(stale_before)
+        params.append(limit)
+        rows = self._fetchall(_stuck_protocol_query("%s", stale_before is not None), params)
+        return [_stuck_protocol_row(row) for row in rows]
+
+    def acquire_lease(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO worker_leases (name, holder, expires_at) VALUES (%s, %s, %s)
+                    ON CONFLICT (name) DO UPDATE SET holder = EXCLUDED.holder, expires_at = EXCLUDED.expires_at
+                    WHERE worker_leases.holder = EXCLUDED.holder OR worker_leases.expires_at < %s
+                    RETURNING holder
+                    """,
+                    (name, holder, now + ttl_seconds, now),
+                )
+                row = cur.fetchone()
+        return row is not None
+
+    def release_lease(self, name: str, holder: str) -> None:
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM worker_leases WHERE name = %s AND holder = %s", (name, holder))
+
+    # Retention
+    def fetch_expired_rows(
+        self,
+        table: str,
+        *,
+        before: datetime,
+        limit: int = 500,
+        statuses: Optional[List[str]] = None,
+        after_key: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        key = _retention_key(table)
+        if before.tzinfo is not None:
+            before = before.astimezone(timezone.utc).replace(tzinfo=None)
+        where = ["created_at < %s"]
+        params: List[Any] = [before]
+        if statuses:
+            where.append(f"status IN ({', '.join('%s' for _ in statuses)})")
+            params.extend(statuses)
+        order = "created_at, " + key
+        if after_key is not None:
+            where.append(f"{key} > %s")
+            params.append(after_key)
+            order = key
+        params.append(limit)
+        return self._fetchall(
+            f"SELECT * FROM {table} WHERE {' AND '.join(where)} ORDER BY {order} LIMIT %s",
+            params,
+        )
+
+    def delete_rows(self, table: str, keys: List[Any]) -> int:
+        key = _retention_key(table)
+        if not keys:
+            return 0
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"DELETE FROM {table} WHERE {key} = ANY(%s)", (list(keys),))
+                return cur.rowcount
+
+    def events_partitioned(self) -> bool:
+        """Whether ``events`` is a range-partitioned table (migration 0006)."""
+        row = self._fetchone(
+            """
+            SELECT 1 AS partitioned
+            FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = 'events'
+            """
+        )
+        return row is not None
+
+    def list_event_partitions(self) -> List[Dict[str, Any]]:
+        """Monthly partitions of events as {name, start, end}, oldest first."""
+        rows = self._fetchall(
+            """
+            SELECT c.relname AS name
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = 'events'
+            """
+        )
+        partitions = []
+        for row in rows:
+            match = _EVENT_PARTITION_RE.match(row["name"])
+            if not match:
+                continue
+            start = datetime(int(match.group(1)), int(match.group(2)), 1)
+            partitions.append({"name": row["name"], "start": start, "end": _month_start(start, 1)})
+        partitions.sort(key=lambda p: p["start"])
+        return partitions
+
+    def ensure_event_partitions(self, *, months_ahead: int = 2) -> List[str]:
+        """
+        Create monthly partitions for the next ``months_ahead`` months.
+
+        The current month is covered by whatever already exists (or the
+        default partition); creating it late would fail once the default
+        partition holds rows in its range.
+        """
+        if not self.events_partitioned():
+            return []
+        existing = {p["name"] for p in self.list_event_partitions()}
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        created = []
+        for offset in range(1, months_ahead + 1):
+            start = _month_start(now, offset)
+            end = _month_start(now, offset + 1)
+            name = f"events_p{start.year:04d}{start.month:02d}"
+            if name in existing:
+                continue
+            try:
+                with self._transaction() as conn:
+                    with conn.cursor() as cur:
+                        # DDL cannot take bind parameters; bounds are generated dates.
+                        cur.execute(
+                            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF events "
+                            f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+                        )
+                created.append(name)
+            except Exception as exc:
+                logger.warning(
+                    "event_partition_create_failed",
+                    extra={"partition": name, "error": str(exc)},
+                )
+        return created
+
+    def drop_event_partition(self, name: str) -> bool:
+        """Drop one monthly events partition (callers archive it first)."""
+        if not _EVENT_PARTITION_RE.match(name):
+            raise ValueError(f"Not an events partition: {name}")
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {name}")
+        return True
+
 
 # Type alias for the unified database interface
 Database = Union[SQLiteDatabase, PostgresDatabase]
@@ -0,0 +1,489 @@
+"""
+DevGodzilla Query Plan Harness
+
+Runs a representative workload of Database calls against a seeded dataset,
+captures every statement the DB layer issues, and checks each one with
+``EXPLAIN QUERY PLAN`` (SQLite) or ``EXPLAIN (FORMAT JSON)`` (PostgreSQL).
+
+Full table scans are compared against a checked-in baseline
+(``query_plan_baseline.json``): a scan that is not in the baseline is a
+regression and makes the harness exit non-zero. Intentional scans (e.g.
+listing every project) live in the baseline.
+
+Usage:
+    python -m devgodzilla.db.query_plans
+    python -m devgodzilla.db.query_plans --db-url postgresql://...
+    python -m devgodzilla.db.query_plans --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from devgodzilla.db.database import PostgresDatabase, SQLiteDatabase
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover - optional dependency
+    psycopg = None  # type: ignore[assignment]
+
+BASELINE_PATH = Path(__file__).with_name("query_plan_baseline.json")
+
+# Only statements that read rows can regress; INSERTs and transaction
+# control are skipped.
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+# Statements SQLite's FTS5 module runs against its own shadow tables; they are
+# not ours to index and would otherwise show up as full scans.
+_FTS_SHADOW = re.compile(r"_fts_(?:config|data|idx|docsize|content)\b")
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+@dataclass
+class CapturedQuery:
+    """A statement issued by the DB layer while running the workload."""
+
+    label: str
+    sql: str
+    params: Optional[Sequence[Any]] = None
+
+
+@dataclass
+class QueryPlan:
+    """The plan for one distinct statement."""
+
+    backend: str
+    key: str
+    labels: List[str]
+    full_scans: List[str]
+    detail: List[str] = field(default_factory=list)
+
+
+@dataclass
+class QueryPlanReport:
+    """All plans from one harness run."""
+
+    backend: str
+    plans: List[QueryPlan] = field(default_factory=list)
+
+    def full_scans(self) -> Dict[str, List[str]]:
+        """Map of normalized SQL -> tables read with a full scan."""
+        return {p.key: p.full_scans for p in self.plans if p.full_scans}
+
+    def regressions(self, baseline: Dict[str, Any]) -> List[QueryPlan]:
+        """Plans with a full scan the baseline does not allow."""
+        allowed = baseline.get(self.backend, {})
+        out = []
+        for plan in self.plans:
+            permitted = set(allowed.get(plan.key, []))
+            if any(table not in permitted for table in plan.full_scans):
+                out.append(plan)
+        return out
+
+    def to_baseline(self) -> Dict[str, List[str]]:
+        return {key: sorted(set(tables)) for key, tables in sorted(self.full_scans().items())}
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse literals, placeholders and whitespace so equal queries share a key."""
+    text = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    text = text.replace("%s", "?")
+    text = re.sub(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])", "?", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    text = re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)", "(?)", text)
+    return text
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+# =============================================================================
+# Capture
+# =============================================================================
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.label = ""
+        self.queries: List[CapturedQuery] = []
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, params: Optional[Sequence[Any]] = None) -> None:
+        if not self.enabled:
+            return
+        head = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+        if head not in _EXPLAINABLE or _FTS_SHADOW.search(sql):
+            return
+        with self._lock:
+            self.queries.append(CapturedQuery(self.label, sql, params))
+
+
+class _TracingSQLiteDatabase(SQLiteDatabase):
+    """SQLiteDatabase that reports every executed statement to a recorder."""
+
+    def __init__(self, db_path: Path, recorder: _Recorder) -> None:
+        super().__init__(db_path)
+        self._recorder = recorder
+
+    def _connect(self):
+        conn = super()._connect()
+        conn.set_trace_callback(self._recorder.record)
+        return conn
+
+
+class _TracingPostgresDatabase(PostgresDatabase):
+    """PostgresDatabase whose cursors report statements and params to a recorder."""
+
+    def __init__(self, db_url: str, recorder: _Recorder) -> None:
+        super().__init__(db_url, pool_size=2)
+        base = psycopg.Cursor
+
+        class _Cursor(base):  # type: ignore[misc, valid-type]
+            def execute(self, query, params=None, **kwargs):
+                recorder.record(str(query), params)
+                return super().execute(query, params, **kwargs)
+
+        self._cursor_class = _Cursor
+
+    @contextmanager
+    def _connect(self):
+        with super()._connect() as conn:
+            previous = conn.cursor_factory
+            conn.cursor_factory = self._cursor_class
+            try:
+                yield conn
+            finally:
+                conn.cursor_factory = previous
+
+
+# =============================================================================
+# Workload
+# =============================================================================
+
+@dataclass
+class SeedInfo:
+    project_ids: List[int] = field(default_factory=list)
+    protocol_run_ids: List[int] = field(default_factory=list)
+    step_run_ids: List[int] = field(default_factory=list)
+    sprint_ids: List[int] = field(default_factory=list)
+    task_ids: List[int] = field(default_factory=list)
+    job_run_ids: List[str] = field(default_factory=list)
+
+
+def seed_dataset(db: Any, *, projects: int = 3, runs_per_project: int = 3, steps_per_run: int = 4) -> SeedInfo:
+    """Create a small but fully linked dataset through the public DB API."""
+    info = SeedInfo()
+    for p in range(projects):
+        project = db.create_project(
+            name=f"explain-{p}",
+            git_url=f"https://example.invalid/explain-{p}.git",
+            base_branch="main",
+        )
+        info.project_ids.append(project.id)
+        sprint = db.create_sprint(project_id=project.id, name=f"sprint-{p}", status="active")
+        info.sprint_ids.append(sprint.id)
+        db.create_spec_run(
+            project_id=project.id,
+            spec_name=f"00{p}-explain",
+            status="draft",
+            base_branch="main",
+            spec_root=f"/tmp/explain-{p}/specs/00{p}-explain",
+            spec_path=f"/tmp/explain-{p}/specs/00{p}-explain/spec.md",
+        )
+        for r in range(runs_per_project):
+            run = db.create_protocol_run(
+                project_id=project.id,
+                protocol_name=f"proto-{p}-{r}",
+                status="running" if r == 0 else "completed",
+                base_branch="main",
+            )
+            info.protocol_run_ids.append(run.id)
+            db.append_event(run.id, "protocol_started", "started", project_id=project.id)
+            for s in range(steps_per_run):
+                step = db.create_step_run(
+                    protocol_run_id=run.id,
+                    step_index=s,
+                    step_name=f"step-{s}",
+                    step_type="work",
+                    status="pending" if s else "running",
+                )
+                info.step_run_ids.append(step.id)
+                task = db.create_task(
+                    project_id=project.id,
+                    title=f"task-{p}-{r}-{s}",
+                    sprint_id=sprint.id,
+                    protocol_run_id=run.id,
+                    step_run_id=step.id,
+                    blocked_by=[info.task_ids[-1]] if s else None,
+                )
+                info.task_ids.append(task.id)
+            job_id = f"explain-job-{p}-{r}"
+            db.create_job_run(
+                job_id,
+                "execute_step",
+                "queued",
+                project_id=project.id,
+                protocol_run_id=run.id,
+                step_run_id=info.step_run_ids[-1],
+            )
+            info.job_run_ids.append(job_id)
+            db.create_run_artifact(job_id, "stdout", "log", f"/tmp/{job_id}.log")
+            db.append_feedback_event(run.id, "transient", "retry", 1, step_run_id=info.step_run_ids[-1])
+            db.create_qa_result(
+                project_id=project.id,
+                protocol_run_id=run.id,
+                step_run_id=info.step_run_ids[-1],
+                verdict="pass",
+            )
+            db.upsert_clarification(
+                scope="protocol",
+                project_id=project.id,
+                key=f"q-{r}",
+                question="?",
+                protocol_run_id=run.id,
+            )
+    return info
+
+
+def build_workload(db: Any, seed: SeedInfo) -> List[Tuple[str, Callable[[], Any]]]:
+    """The hot read/update paths used by the API, orchestrator and workers."""
+    project_id = seed.project_ids[0]
+    run_id = seed.protocol_run_ids[0]
+    step_id = seed.step_run_ids[0]
+    job_id = seed.job_run_ids[0]
+    cutoff = datetime(2000, 1, 1)
+    return [
+        ("get_project", lambda: db.get_project(project_id)),
+        ("list_projects", lambda: db.list_projects()),
+        ("get_protocol_run", lambda: db.get_protocol_run(run_id)),
+        ("list_protocol_runs", lambda: db.list_protocol_runs(project_id)),
+        ("list_all_protocol_runs", lambda: db.list_all_protocol_runs(limit=50)),
+        ("update_protocol_status", lambda: db.update_protocol_status(run_id, "running")),
+        ("get_step_run", lambda: db.get_step_run(step_id)),
+        ("list_step_runs", lambda: db.list_step_runs(run_id)),
+        ("update_step_status", lambda: db.update_step_status(step_id, "running")),
+        ("list_events", lambda: db.list_events(run_id)),
+        ("list_recent_events", lambda: db.list_recent_events(limit=20, project_id=project_id)),
+        ("list_events_since_id", lambda: db.list_events_since_id(since_id=0, protocol_run_id=run_id)),
+        ("list_job_runs", lambda: db.list_job_runs(protocol_run_id=run_id)),
+        ("list_job_runs_by_step", lambda: db.list_job_runs(step_run_id=step_id)),
+        ("get_job_run", lambda: db.get_job_run(job_id)),
+        ("list_run_artifacts", lambda: db.list_run_artifacts(job_id)),
+        ("list_qa_results", lambda: db.list_qa_results(protocol_run_id=run_id)),
+        ("get_latest_qa_result", lambda: db.get_latest_qa_result(step_run_id=step_id)),
+        ("list_clarifications", lambda: db.list_clarifications(protocol_run_id=run_id, status="open")),
+        ("list_sprints", lambda: db.list_sprints(project_id=project_id)),
+        ("list_tasks", lambda: db.list_tasks(project_id=project_id)),
+        ("list_tasks_by_sprint", lambda: db.list_tasks(sprint_id=seed.sprint_ids[0])),
+        ("load_task_graph", lambda: db.load_task_graph(project_id)),
+        ("get_sprint_stats", lambda: db.get_sprint_stats(seed.sprint_ids[0])),
+        ("list_sprint_velocities", lambda: db.list_sprint_velocities(project_id, status="completed")),
+        ("record_sprint_snapshots", lambda: db.record_sprint_snapshots(seed.sprint_ids[:2])),
+        ("list_sprint_snapshots", lambda: db.list_sprint_snapshots(seed.sprint_ids[0])),
+        ("update_task_blocked_by", lambda: db.update_task(seed.task_ids[0], blocked_by=[seed.task_ids[-1]])),
+        ("list_agent_assignments", lambda: db.list_agent_assignments(project_id)),
+        ("list_speckit_specs", lambda: db.list_speckit_specs(project_id)),
+        ("list_spec_runs", lambda: db.list_spec_runs(project_id)),
+        ("list_spec_catalog", lambda: db.list_spec_catalog(limit=50)),
+        (
+            "list_spec_catalog_filtered",
+            lambda: db.list_spec_catalog(project_id=project_id, status="draft", search="explain"),
+        ),
+        ("list_spec_catalog_by_sprint", lambda: db.list_spec_catalog(sprint_id=seed.sprint_ids[0])),
+        ("refresh_spec_catalog_tasks", lambda: db.refresh_spec_catalog_tasks(project_id)),
+        ("get_queue_stats", lambda: db.get_queue_stats()),
+        ("get_resource_versions", lambda: db.get_resource_versions(["projects", f"protocol:{run_id}", "queue:*"])),
+        ("list_stuck_protocol_candidates", lambda: db.list_stuck_protocol_candidates(stale_before=cutoff)),
+        ("acquire_lease", lambda: db.acquire_lease("explain", "harness", 60)),
+        ("fetch_expired_events", lambda: db.fetch_expired_rows("events", before=cutoff, limit=100)),
+        (
+            "fetch_expired_job_runs",
+            lambda: db.fetch_expired_rows(
+                "job_runs", before=cutoff, limit=100, statuses=["succeeded", "failed", "cancelled"]
+            ),
+        ),
+        ("fetch_expired_run_artifacts", lambda: db.fetch_expired_rows("run_artifacts", before=cutoff, limit=100)),
+        ("fetch_expired_qa_results", lambda: db.fetch_expired_rows("qa_results", before=cutoff, limit=100)),
+        ("delete_project", lambda: db.delete_project(seed.project_ids[-1])),
+    ]
+
+
+def _run_workload(db: Any, recorder: _Recorder, seed_kwargs: Dict[str, int]) -> List[CapturedQuery]:
+    db.init_schema()
+    seed = seed_dataset(db, **seed_kwargs)
+    recorder.enabled = True
+    for label, call in build_workload(db, seed):
+        recorder.label = label
+        call()
+    recorder.enabled = False
+    return recorder.queries
+
+
+def _group(queries: Sequence[CapturedQuery]) -> Dict[str, Tuple[CapturedQuery, List[str]]]:
+    grouped: Dict[str, Tuple[CapturedQuery, List[str]]] = {}
+    for q in queries:
+        key = normalize_sql(q.sql)
+        if key not in grouped:
+            grouped[key] = (q, [])
+        if q.label not in grouped[key][1]:
+            grouped[key][1].append(q.label)
+    return grouped
+
+
+# =============================================================================
+# Plan analysis
+# =============================================================================
+
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)(.*)$")
+
+
+def sqlite_full_scans(detail: Sequence[str]) -> List[str]:
+    """Tables read with a bare ``SCAN`` (no index) in an EXPLAIN QUERY PLAN."""
+    tables = []
+    for line in detail:
+        match = _SQLITE_SCAN.match(line.strip())
+        if not match:
+            continue
+        table, rest = match.group(1), match.group(2)
+        if table == "CONSTANT" or "INDEX" in rest or "INTEGER PRIMARY KEY" in rest:
+            continue
+        tables.append(table)
+    return tables
+
+
+def explain_sqlite(db_path: Path, queries: Sequence[CapturedQuery]) -> QueryPlanReport:
+    import sqlite3
+
+    report = QueryPlanReport(backend="sqlite")
+    conn = sqlite3.connect(db_path)
+    try:
+        for key, (query, labels) in _group(queries).items():
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {query.sql}").fetchall()
+            detail = [str(row[-1]) for row in rows]
+            report.plans.append(
+                QueryPlan("sqlite", key, labels, sqlite_full_scans(detail), detail)
+            )
+    finally:
+        conn.close()
+    return report
+
+
+def postgres_full_scans(plan: Dict[str, Any]) -> List[str]:
+    """Relations read by a ``Seq Scan`` node anywhere in a JSON plan."""
+    tables = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name"):
+            tables.append(node["Relation Name"])
+        stack.extend(node.get("Plans", []))
+    return tables
+
+
+def explain_postgres(db_url: str, queries: Sequence[CapturedQuery]) -> QueryPlanReport:
+    report = QueryPlanReport(backend="postgres")
+    with psycopg.connect(db_url) as conn:
+        for key, (query, labels) in _group(queries).items():
+            with conn.transaction():
+                with conn.cursor() as cur:
+                    # With sequential scans disabled the planner still picks
+                    # one only when no index can serve the query, so tiny
+                    # seeded tables do not mask missing indexes.
+                    cur.execute("SET LOCAL enable_seqscan = off")
+                    cur.execute(f"EXPLAIN (FORMAT JSON) {query.sql}", query.params)
+                    plan = cur.fetchone()[0][0]["Plan"]
+            report.plans.append(
+                QueryPlan(
+                    "postgres",
+                    key,
+                    labels,
+                    postgres_full_scans(plan),
+                    [json.dumps(plan, sort_keys=True)],
+                )
+            )
+    return report
+
+
+# =============================================================================
+# Entry points
+# =============================================================================
+
+def run_sqlite_harness(db_path: Optional[Path] = None, **seed_kwargs: int) -> QueryPlanReport:
+    """Seed a fresh SQLite database, run the workload and explain every statement."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(db_path) if db_path else Path(tmp) / "explain.sqlite"
+        recorder = _Recorder()
+        queries = _run_workload(_TracingSQLiteDatabase(path, recorder), recorder, seed_kwargs)
+        return explain_sqlite(path, queries)
+
+
+def run_postgres_harness(db_url: str, **seed_kwargs: int) -> QueryPlanReport:
+    """
+    Run the workload against a scratch PostgreSQL database and explain it.
+
+    The database should be empty and disposable: the harness creates the
+    schema and seed rows in it.
+    """
+    if psycopg is None:
+        raise ImportError("psycopg is required for Postgres support. Install psycopg[binary].")
+    recorder = _Recorder()
+    queries = _run_workload(_TracingPostgresDatabase(db_url, recorder), recorder, seed_kwargs)
+    return explain_postgres(db_url, queries)
+
+
+def _print_report(report: QueryPlanReport, regressions: Sequence[QueryPlan]) -> None:
+    scans = report.full_scans()
+    print(f"[{report.backend}] {len(report.plans)} distinct statements, {len(scans)} with full scans")
+    for plan in report.plans:
+        if not plan.full_scans:
+            continue
+        marker = "REGRESSION" if plan in regressions else "allowed"
+        print(f"  {marker}: scan {', '.join(plan.full_scans)} <- {', '.join(plan.labels)}")
+        print(f"    {plan.key}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN every DB-layer query and flag full scans.")
+    parser.add_argument("--db-url", help="Scratch PostgreSQL URL; also explains the Postgres backend")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON path")
+    parser.add_argument("--update-baseline", action="store_true", help="Write current scans as the baseline")
+    args = parser.parse_args(argv)
+
+    reports = [run_sqlite_harness()]
+    if args.db_url:
+        reports.append(run_postgres_harness(args.db_url))
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline:
+        for report in reports:
+            baseline[report.backend] = report.to_baseline()
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    failed = False
+    for report in reports:
+        regressions = report.regressions(baseline)
+        _print_report(report, regressions)
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -56,6 +56,7 @@ CREATE TABLE IF NOT EXISTS sprints (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_sprints_project ON sprints(project_id, status);
 
 CREATE TABLE IF NOT EXISTS protocol_runs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -78,6 +79,11 @@ CREATE TABLE IF NOT EXISTS protocol_runs (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_project_status ON protocol_runs(project_id, status);
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_created ON protocol_runs(created_at);
+-- Partial index: the recovery watchdog only looks at live runs.
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_running ON protocol_runs(id)
+    WHERE status = 'running';
 
 CREATE TABLE IF NOT EXISTS speckit_specs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -137,6 +143,45 @@ CREATE TABLE IF NOT EXISTS spec_sprint_links (
 );
 CREATE INDEX IF NOT EXISTS idx_spec_sprint_links_project ON spec_sprint_links(project_id, sprint_id);
 
+-- Materialized cross-project spec listing (see db/spec_catalog.py)
+CREATE TABLE IF NOT EXISTS spec_catalog (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id INTEGER NOT NULL REFERENCES projects(id),
+    spec_key TEXT NOT NULL,
+    spec_run_id INTEGER,
+    slug TEXT NOT NULL,
+    name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    path TEXT NOT NULL,
+    spec_path TEXT,
+    plan_path TEXT,
+    tasks_path TEXT,
+    checklist_path TEXT,
+    analysis_path TEXT,
+    implement_path TEXT,
+    status TEXT,
+    has_spec INTEGER DEFAULT 0,
+    has_plan INTEGER DEFAULT 0,
+    has_tasks INTEGER DEFAULT 0,
+    worktree_path TEXT,
+    branch_name TEXT,
+    base_branch TEXT,
+    feature_name TEXT,
+    spec_number INTEGER,
+    spec_created_at TEXT,
+    linked_tasks INTEGER DEFAULT 0,
+    completed_tasks INTEGER DEFAULT 0,
+    story_points INTEGER DEFAULT 0,
+    task_sprint_id INTEGER,
+    task_sprint_count INTEGER DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(project_id, spec_key)
+);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_project ON spec_catalog(project_id, spec_run_id);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_run ON spec_catalog(spec_run_id);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_status ON spec_catalog(status, has_plan, has_tasks);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_created ON spec_catalog(spec_created_at);
+
 CREATE TABLE IF NOT EXISTS step_runs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     protocol_run_id INTEGER NOT NULL REFERENCES protocol_runs(id),
@@ -158,6 +203,10 @@ CREATE TABLE IF NOT EXISTS step_runs (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_step_runs_protocol ON step_runs(protocol_run_id, step_index);
+-- Partial index: only steps that can still make progress.
+CREATE INDEX IF NOT EXISTS idx_step_runs_active ON step_runs(protocol_run_id, status)
+    WHERE status IN ('pending', 'running', 'needs_qa');
 
 CREATE TABLE IF NOT EXISTS agent_assignments (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -205,6 +254,7 @@ CREATE TABLE IF NOT EXISTS events (
 
 CREATE INDEX IF NOT EXISTS idx_events_project ON events(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_events_protocol ON events(protocol_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at);
 
 CREATE TABLE IF NOT EXISTS job_runs (
     run_id TEXT PRIMARY KEY,
@@ -235,6 +285,7 @@ CREATE INDEX IF NOT EXISTS idx_job_runs_job_status ON job_runs(job_type, status,
 CREATE INDEX IF NOT EXISTS idx_job_runs_project ON job_runs(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_protocol ON job_runs(protocol_run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_step ON job_runs(step_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_job_runs_created ON job_runs(created_at);
 
 CREATE TABLE IF NOT EXISTS run_artifacts (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -248,6 +299,7 @@ CREATE TABLE IF NOT EXISTS run_artifacts (
     UNIQUE(run_id, name)
 );
 CREATE INDEX IF NOT EXISTS idx_run_artifacts_run_id ON run_artifacts(run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_run_artifacts_created ON run_artifacts(created_at);
 
 CREATE TABLE IF NOT EXISTS clarifications (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -284,6 +336,7 @@ CREATE TABLE IF NOT EXISTS feedback_events (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 CREATE INDEX IF NOT EXISTS idx_feedback_events_protocol ON feedback_events(protocol_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_feedback_events_created ON feedback_events(created_at);
 
 CREATE TABLE IF NOT EXISTS qa_results (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -307,6 +360,7 @@ CREATE TABLE IF NOT EXISTS qa_results (
 CREATE INDEX IF NOT EXISTS idx_qa_results_project ON qa_results(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_qa_results_protocol ON qa_results(protocol_run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_qa_results_step ON qa_results(step_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_qa_results_created ON qa_results(created_at);
 
 CREATE TABLE IF NOT EXISTS tasks (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -334,6 +388,25 @@ CREATE TABLE IF NOT EXISTS tasks (
 );
 CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id, board_status);
 CREATE INDEX IF NOT EXISTS idx_tasks_sprint ON tasks(sprint_id);
+
+-- One row per sprint per day, upserted on task writes (burndown/burnup series).
+CREATE TABLE IF NOT EXISTS sprint_burndown (
+    sprint_id INTEGER NOT NULL REFERENCES sprints(id),
+    day TEXT NOT NULL,
+    total_tasks INTEGER NOT NULL DEFAULT 0,
+    completed_tasks INTEGER NOT NULL DEFAULT 0,
+    total_points INTEGER NOT NULL DEFAULT 0,
+    completed_points INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (sprint_id, day)
+);
+
+-- Named leases so only one replica runs a singleton background job.
+CREATE TABLE IF NOT EXISTS worker_leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
 """
 
 SCHEMA_POSTGRES = """
@@ -387,6 +460,7 @@ CREATE TABLE IF NOT EXISTS sprints (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_sprints_project ON sprints(project_id, status);
 
 CREATE TABLE IF NOT EXISTS protocol_runs (
     id SERIAL PRIMARY KEY,
@@ -409,6 +483,11 @@ CREATE TABLE IF NOT EXISTS protocol_runs (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_project_status ON protocol_runs(project_id, status);
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_created ON protocol_runs(created_at);
+-- Partial index: the recovery watchdog only looks at live runs.
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_running ON protocol_runs(id)
+    WHERE status = 'running';
 
 CREATE TABLE IF NOT EXISTS speckit_specs (
     id SERIAL PRIMARY KEY,
@@ -468,6 +547,45 @@ CREATE TABLE IF NOT EXISTS spec_sprint_links (
 );
 CREATE INDEX IF NOT EXISTS idx_spec_sprint_links_project ON spec_sprint_links(project_id, sprint_id);
 
+-- Materialized cross-project spec listing (see db/spec_catalog.py)
+CREATE TABLE IF NOT EXISTS spec_catalog (
+    id SERIAL PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES projects(id),
+    spec_key TEXT NOT NULL,
+    spec_run_id INTEGER,
+    slug TEXT NOT NULL,
+    name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    path TEXT NOT NULL,
+    spec_path TEXT,
+    plan_path TEXT,
+    tasks_path TEXT,
+    checklist_path TEXT,
+    analysis_path TEXT,
+    implement_path TEXT,
+    status TEXT,
+    has_spec BOOLEAN DEFAULT FALSE,
+    has_plan BOOLEAN DEFAULT FALSE,
+    has_tasks BOOLEAN DEFAULT FALSE,
+    worktree_path TEXT,
+    branch_name TEXT,
+    base_branch TEXT,
+    feature_name TEXT,
+    spec_number INTEGER,
+    spec_created_at TEXT,
+    linked_tasks INTEGER DEFAULT 0,
+    completed_tasks INTEGER DEFAULT 0,
+    story_points INTEGER DEFAULT 0,
+    task_sprint_id INTEGER,
+    task_sprint_count INTEGER DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(project_id, spec_key)
+);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_project ON spec_catalog(project_id, spec_run_id);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_run ON spec_catalog(spec_run_id);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_status ON spec_catalog(status, has_plan, has_tasks);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_created ON spec_catalog(spec_created_at);
+
 CREATE TABLE IF NOT EXISTS step_runs (
     id SERIAL PRIMARY KEY,
     protocol_run_id INTEGER NOT NULL REFERENCES protocol_runs(id),
@@ -489,6 +607,10 @@ CREATE TABLE IF NOT EXISTS step_runs (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_step_runs_protocol ON step_runs(protocol_run_id, step_index);
+-- Partial index: only steps that can still make progress.
+CREATE INDEX IF NOT EXISTS idx_step_runs_active ON step_runs(protocol_run_id, status)
+    WHERE status IN ('pending', 'running', 'needs_qa');
 
 CREATE TABLE IF NOT EXISTS agent_assignments (
     id SERIAL PRIMARY KEY,
@@ -523,19 +645,35 @@ CREATE TABLE IF NOT EXISTS agent_assignment_settings (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Range-partitioned by month; the retention service creates upcoming
+-- partitions and drops expired ones after archiving them.
 CREATE TABLE IF NOT EXISTS events (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     protocol_run_id INTEGER REFERENCES protocol_runs(id),
     project_id INTEGER REFERENCES projects(id),
     step_run_id INTEGER REFERENCES step_runs(id),
     event_type TEXT NOT NULL,
     message TEXT NOT NULL,
     metadata JSONB,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+-- Databases created before partitioning keep a plain events table until
+-- Alembic revision 0006 converts it.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table pt
+        JOIN pg_class c ON c.oid = pt.partrelid
+        WHERE c.relname = 'events'
+    ) THEN
+        CREATE TABLE IF NOT EXISTS events_default PARTITION OF events DEFAULT;
+    END IF;
+END $$;
 
 CREATE INDEX IF NOT EXISTS idx_events_project ON events(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_events_protocol ON events(protocol_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at);
 
 CREATE TABLE IF NOT EXISTS job_runs (
     run_id TEXT PRIMARY KEY,
@@ -566,6 +704,7 @@ CREATE INDEX IF NOT EXISTS idx_job_runs_job_status ON job_runs(job_type, status,
 CREATE INDEX IF NOT EXISTS idx_job_runs_project ON job_runs(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_protocol ON job_runs(protocol_run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_step ON job_runs(step_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_job_runs_created ON job_runs(created_at);
 
 CREATE TABLE IF NOT EXISTS run_artifacts (
     id SERIAL PRIMARY KEY,
@@ -579,6 +718,7 @@ CREATE TABLE IF NOT EXISTS run_artifacts (
     UNIQUE(run_id, name)
 );
 CREATE INDEX IF NOT EXISTS idx_run_artifacts_run_id ON run_artifacts(run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_run_artifacts_created ON run_artifacts(created_at);
 
 CREATE TABLE IF NOT EXISTS clarifications (
     id SERIAL PRIMARY KEY,
@@ -615,6 +755,7 @@ CREATE TABLE IF NOT EXISTS feedback_events (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 CREATE INDEX IF NOT EXISTS idx_feedback_events_protocol ON feedback_events(protocol_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_feedback_events_created ON feedback_events(created_at);
 
 CREATE TABLE IF NOT EXISTS qa_results (
     id SERIAL PRIMARY KEY,
@@ -638,6 +779,7 @@ CREATE TABLE IF NOT EXISTS qa_results (
 CREATE INDEX IF NOT EXISTS idx_qa_results_project ON qa_results(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_qa_results_protocol ON qa_results(protocol_run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_qa_results_step ON qa_results(step_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_qa_results_created ON qa_results(created_at);
 
 CREATE TABLE IF NOT EXISTS tasks (
     id SERIAL PRIMARY KEY,
@@ -665,4 +807,119 @@ CREATE TABLE IF NOT EXISTS tasks (
 );
 CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id, board_status);
 CREATE INDEX IF NOT EXISTS idx_tasks_sprint ON tasks(sprint_id);
+
+-- One row per sprint per day, upserted on task writes (burndown/burnup series).
+CREATE TABLE IF NOT EXISTS sprint_burndown (
+    sprint_id INTEGER NOT NULL REFERENCES sprints(id),
+    day TEXT NOT NULL,
+    total_tasks INTEGER NOT NULL DEFAULT 0,
+    completed_tasks INTEGER NOT NULL DEFAULT 0,
+    total_points INTEGER NOT NULL DEFAULT 0,
+    completed_points INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (sprint_id, day)
+);
+
+-- Named leases so only one replica runs a singleton background job.
+CREATE TABLE IF NOT EXISTS worker_leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at DOUBLE PRECISION NOT NULL
+);
+"""
+
+# Search index for spec_catalog; optional because FTS5 (SQLite) and pg_trgm
+# (PostgreSQL) may be unavailable. Without it search falls back to a scan.
+SPEC_CATALOG_SEARCH_SQLITE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS spec_catalog_fts USING fts5(
+    title, path, content='spec_catalog', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS spec_catalog_fts_ai AFTER INSERT ON spec_catalog BEGIN
+    INSERT INTO spec_catalog_fts(rowid, title, path) VALUES (new.id, new.title, new.path);
+END;
+CREATE TRIGGER IF NOT EXISTS spec_catalog_fts_ad AFTER DELETE ON spec_catalog BEGIN
+    INSERT INTO spec_catalog_fts(spec_catalog_fts, rowid, title, path) VALUES ('delete', old.id, old.title, old.path);
+END;
+CREATE TRIGGER IF NOT EXISTS spec_catalog_fts_au AFTER UPDATE OF title, path ON spec_catalog BEGIN
+    INSERT INTO spec_catalog_fts(spec_catalog_fts, rowid, title, path) VALUES ('delete', old.id, old.title, old.path);
+    INSERT INTO spec_catalog_fts(rowid, title, path) VALUES (new.id, new.title, new.path);
+END;
+"""
+
+SPEC_CATALOG_SEARCH_POSTGRES = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_title_trgm ON spec_catalog USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_spec_catalog_path_trgm ON spec_catalog USING gin (path gin_trgm_ops);
+"""
+
+# Change counters behind the API's versioned responses (api/versioning.py).
+# Triggers bump a scope's counter in the same transaction as every write to
+# the rows it covers, whichever process makes the write. {row} is NEW or OLD.
+# Job runs bump one scope per protocol run (or project), never a shared
+# 'queue' row that every concurrent writer would lock until commit; readers
+# sum them as 'queue:*'.
+VERSIONED_TABLES = (
+    ("projects", "'projects'"),
+    ("protocol_runs", "'protocol:' || {row}.id"),
+    ("step_runs", "'protocol:' || {row}.protocol_run_id"),
+    ("qa_results", "'protocol:' || {row}.protocol_run_id"),
+    ("job_runs", "'queue:' || COALESCE('run:' || {row}.protocol_run_id, 'project:' || {row}.project_id, 'none')"),
+)
+
+_BUMP = """INSERT INTO resource_versions (scope, version) VALUES ({scope}, 1)
+        ON CONFLICT (scope) DO UPDATE SET version = resource_versions.version + 1;"""
+
+
+def _sqlite_version_triggers() -> str:
+    statements = []
+    for table, scope in VERSIONED_TABLES:
+        for suffix, event, row in (("ai", "INSERT", "new"), ("au", "UPDATE", "new"), ("ad", "DELETE", "old")):
+            # Recreated each time, like CREATE OR REPLACE on Postgres, so
+            # databases built before a scope change pick up the new body.
+            statements.append(f"DROP TRIGGER IF EXISTS {table}_version_{suffix};")
+            statements.append(
+                f"CREATE TRIGGER {table}_version_{suffix} AFTER {event} ON {table} BEGIN\n"
+                f"    {_BUMP.format(scope=scope.format(row=row))}\nEND;"
+            )
+    return "\n".join(statements)
+
+
+def _postgres_version_triggers() -> str:
+    statements = []
+    for table, scope in VERSIONED_TABLES:
+        statements.append(
+            f"""CREATE OR REPLACE FUNCTION {table}_version_bump() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        {_BUMP.format(scope=scope.format(row="OLD"))}
+    ELSE
+        {_BUMP.format(scope=scope.format(row="NEW"))}
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+DO $$ BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = '{table}_version') THEN
+        CREATE TRIGGER {table}_version AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {table}_version_bump();
+    END IF;
+END $$;"""
+        )
+    return "\n".join(statements)
+
+
+RESOURCE_VERSIONS_SQLITE = f"""
+CREATE TABLE IF NOT EXISTS resource_versions (
+    scope TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+{_sqlite_version_triggers()}
+"""
+
+RESOURCE_VERSIONS_POSTGRES = f"""
+CREATE TABLE IF NOT EXISTS resource_versions (
+    scope TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+{_postgres_version_triggers()}
 """
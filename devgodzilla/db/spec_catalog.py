@@ -0,0 +1,285 @@
+"""
+DevGodzilla Specification Catalog
+
+Row derivation and query building for the ``spec_catalog`` table, the
+materialized cross-project view behind ``GET /specifications``.
+
+Rows are written from two places: spec run writes (``create_spec_run`` /
+``update_spec_run``) and the filesystem reconciler
+(``services/spec_catalog.py``). Listing then runs as one indexed query plus a
+count, instead of walking every project's specs directory per request.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from devgodzilla.models.domain import SpecRun
+
+# Columns written by upserts (project_id and the task aggregates excluded).
+SPEC_CATALOG_COLUMNS = (
+    "spec_key",
+    "spec_run_id",
+    "slug",
+    "name",
+    "title",
+    "path",
+    "spec_path",
+    "plan_path",
+    "tasks_path",
+    "checklist_path",
+    "analysis_path",
+    "implement_path",
+    "status",
+    "has_spec",
+    "has_plan",
+    "has_tasks",
+    "worktree_path",
+    "branch_name",
+    "base_branch",
+    "feature_name",
+    "spec_number",
+    "spec_created_at",
+)
+
+# Statuses a spec run can force regardless of which files exist.
+_TERMINAL_SPEC_STATUSES = ("cleaned", "failed")
+
+# ``sort`` values accepted by the listing, mapped to catalog columns.
+SPEC_CATALOG_SORTS = {
+    "title": "c.title",
+    "status": "c.status",
+    "created_at": "c.spec_created_at",
+    "updated_at": "c.updated_at",
+}
+
+# Shortest search handled by the trigram index; shorter terms use a scan.
+MIN_INDEXED_SEARCH = 3
+
+
+def spec_title(name: str) -> str:
+    """Human title from a spec folder name (``feature-login`` -> ``Login``)."""
+    title = name.replace("-", " ").replace("_", " ").title()
+    if title.startswith("Feature "):
+        title = title[8:]
+    return title
+
+
+def spec_status(
+    *,
+    has_spec: bool,
+    has_plan: bool,
+    has_tasks: bool,
+    run_status: Optional[str] = None,
+) -> Optional[str]:
+    """Catalog status; None means the spec has no spec.md yet and is not listed."""
+    if run_status in _TERMINAL_SPEC_STATUSES:
+        return run_status
+    if has_tasks:
+        return "completed"
+    if has_plan:
+        return "in-progress"
+    if has_spec:
+        return "draft"
+    return None
+
+
+def _spec_file_mtime(spec: Mapping[str, Any], project_path: Optional[str]) -> Optional[str]:
+    candidates = []
+    if spec.get("spec_path"):
+        candidates.append(Path(spec["spec_path"]))
+    if spec.get("path"):
+        spec_dir = Path(spec["path"])
+        if not spec_dir.is_absolute() and project_path:
+            spec_dir = Path(project_path) / spec_dir
+        candidates.append(spec_dir / "spec.md")
+    for candidate in candidates:
+        if not candidate.is_absolute() and project_path:
+            candidate = Path(project_path) / candidate
+        try:
+            return datetime.fromtimestamp(candidate.stat().st_mtime).isoformat()
+        except OSError:
+            continue
+    return None
+
+
+def catalog_entry(spec: Mapping[str, Any], *, project_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build a catalog row from a ``SpecificationService.list_specs`` item.
+
+    Stats spec.md once for ``spec_created_at``.
+    """
+    path = str(spec.get("path") or "")
+    spec_run_id = spec.get("spec_run_id") or spec.get("id")
+    name = str(spec.get("name") or "spec")
+    slug = Path(path).name if path else name
+    has_spec = bool(spec.get("has_spec", spec.get("spec_path")))
+    has_plan = bool(spec.get("has_plan", spec.get("plan_path")))
+    has_tasks = bool(spec.get("has_tasks", spec.get("tasks_path")))
+    return {
+        "spec_key": f"run:{spec_run_id}" if spec_run_id is not None else f"slug:{slug}",
+        "spec_run_id": spec_run_id,
+        "slug": slug,
+        "name": name,
+        "title": spec_title(name),
+        "path": path,
+        "spec_path": spec.get("spec_path"),
+        "plan_path": spec.get("plan_path"),
+        "tasks_path": spec.get("tasks_path"),
+        "checklist_path": spec.get("checklist_path"),
+        "analysis_path": spec.get("analysis_path"),
+        "implement_path": spec.get("implement_path"),
+        "status": spec_status(
+            has_spec=has_spec,
+            has_plan=has_plan,
+            has_tasks=has_tasks,
+            run_status=spec.get("status"),
+        ),
+        "has_spec": has_spec,
+        "has_plan": has_plan,
+        "has_tasks": has_tasks,
+        "worktree_path": spec.get("worktree_path"),
+        "branch_name": spec.get("branch_name"),
+        "base_branch": spec.get("base_branch"),
+        "feature_name": spec.get("feature_name"),
+        "spec_number": spec.get("spec_number"),
+        "spec_created_at": _spec_file_mtime(spec, project_path),
+    }
+
+
+def catalog_entry_from_run(run: SpecRun, *, project_path: Optional[str] = None) -> Dict[str, Any]:
+    """Build a catalog row for a spec run (same shape list_specs uses for runs)."""
+    return catalog_entry(
+        {
+            "spec_run_id": run.id,
+            "name": run.spec_name,
+            "path": run.spec_root or "",
+            "spec_path": run.spec_path,
+            "plan_path": run.plan_path,
+            "tasks_path": run.tasks_path,
+            "checklist_path": run.checklist_path,
+            "analysis_path": run.analysis_path,
+            "implement_path": run.implement_path,
+            "status": run.status,
+            "worktree_path": run.worktree_path,
+            "branch_name": run.branch_name,
+            "base_branch": run.base_branch,
+            "spec_number": run.spec_number,
+            "feature_name": run.feature_name,
+        },
+        project_path=project_path,
+    )
+
+
+def _normalize_date(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=None).isoformat()
+
+
+def build_catalog_query(
+    *,
+    dialect: str,
+    fts: bool = False,
+    spec_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    sprint_id: Optional[int] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    has_plan: Optional[bool] = None,
+    has_tasks: Optional[bool] = None,
+    search: Optional[str] = None,
+    sort: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> Tuple[str, List[Any], str, List[Any]]:
+    """
+    Build the catalog page query and its count query.
+
+    ``dialect`` is ``"sqlite"`` or ``"postgres"``; ``fts`` enables the SQLite
+    FTS5 trigram table for search. Returns (select_sql, select_params,
+    count_sql, count_params).
+    """
+    pg = dialect == "postgres"
+    ph = "%s" if pg else "?"
+    task_sprint = "CASE WHEN c.task_sprint_count = 1 THEN c.task_sprint_id END"
+    joins = (
+        " FROM spec_catalog c"
+        " JOIN projects p ON p.id = c.project_id"
+        " LEFT JOIN spec_sprint_links l ON l.project_id = c.project_id AND l.spec_key = c.spec_key"
+    )
+    where = ["c.status IS NOT NULL", "p.local_path IS NOT NULL", "p.local_path <> ''"]
+    params: List[Any] = []
+
+    if spec_id is not None:
+        where.append(f"(c.spec_run_id = {ph} OR (c.spec_run_id IS NULL AND c.id = {ph}))")
+        params.extend([spec_id, spec_id])
+    if project_id is not None:
+        where.append(f"c.project_id = {ph}")
+        params.append(project_id)
+    if sprint_id is not None:
+        if pg:
+            has_label = "t.labels ? ('spec:' || c.slug)"
+        else:
+            has_label = "instr(t.labels, '\"spec:' || c.slug || '\"') > 0"
+        where.append(
+            f"c.project_id = (SELECT project_id FROM sprints WHERE id = {ph})"
+            f" AND (l.sprint_id = {ph} OR EXISTS (SELECT 1 FROM tasks t"
+            f" WHERE t.sprint_id = {ph} AND t.project_id = c.project_id AND {has_label}))"
+        )
+        params.extend([sprint_id, sprint_id, sprint_id])
+    if status:
+        where.append(f"c.status = {ph}")
+        params.append(status)
+    if has_plan is not None:
+        where.append(f"c.has_plan = {ph}")
+        params.append(bool(has_plan) if pg else int(bool(has_plan)))
+    if has_tasks is not None:
+        where.append(f"c.has_tasks = {ph}")
+        params.append(bool(has_tasks) if pg else int(bool(has_tasks)))
+    for bound, op in ((_normalize_date(date_from), ">="), (_normalize_date(date_to), "<=")):
+        if bound is not None:
+            where.append(f"(c.spec_created_at IS NULL OR c.spec_created_at {op} {ph})")
+            params.append(bound)
+
+    term = (search or "").strip()
+    if term:
+        if pg:
+            escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            where.append(f"(c.title ILIKE {ph} OR c.path ILIKE {ph})")
+            params.extend([f"%{escaped}%", f"%{escaped}%"])
+        elif fts and len(term) >= MIN_INDEXED_SEARCH:
+            where.append(f"c.id IN (SELECT rowid FROM spec_catalog_fts WHERE spec_catalog_fts MATCH {ph})")
+            params.append('"' + term.replace('"', '""') + '"')
+        else:
+            where.append(f"(instr(lower(c.title), {ph}) > 0 OR instr(lower(c.path), {ph}) > 0)")
+            params.extend([term.lower(), term.lower()])
+
+    where_sql = " WHERE " + " AND ".join(where)
+    count_sql = "SELECT COUNT(*) AS total" + joins + where_sql
+
+    descending = bool(sort) and sort.startswith("-")
+    column = SPEC_CATALOG_SORTS.get((sort or "").lstrip("-"))
+    if column:
+        order = f"{column} {'DESC' if descending else 'ASC'}, c.id ASC"
+    else:
+        # Default: project order, newest spec run first, then folder name.
+        order = "c.project_id ASC, c.spec_run_id DESC, c.slug ASC"
+
+    select_sql = (
+        "SELECT c.*, p.name AS project_name,"
+        f" COALESCE(l.sprint_id, {task_sprint}) AS sprint_id,"
+        " CASE WHEN l.sprint_id IS NULL AND c.task_sprint_count > 1 THEN 'Multiple' ELSE s.name END AS sprint_name"
+        + joins
+        + f" LEFT JOIN sprints s ON s.id = COALESCE(l.sprint_id, {task_sprint}) AND s.project_id = c.project_id"
+        + where_sql
+        + f" ORDER BY {order} LIMIT {ph} OFFSET {ph}"
+    )
+    return select_sql, params + [limit, offset], count_sql, list(params)
@@ -0,0 +1,173 @@
+"""
+DevGodzilla Task Dependency Graph
+
+In-memory adjacency index over a project's ``tasks.blocked_by`` edges, loaded
+with one query (``Database.load_task_graph``). Boards use it to compute
+blocked/unblocked sets and critical chains for a whole sprint at once instead
+of fetching blockers task by task.
+
+``blocked_by`` is the canonical edge list: ``B in A.blocked_by`` means A waits
+for B. The ``blocks`` column is informational and is not read here.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Board status that releases a blocker.
+DONE_STATUS = "done"
+
+
+@dataclass(frozen=True)
+class TaskNode:
+    """The slice of a task the dependency graph needs."""
+    id: int
+    board_status: str
+    story_points: Optional[int] = None
+    sprint_id: Optional[int] = None
+    blocked_by: Tuple[int, ...] = ()
+
+    @property
+    def done(self) -> bool:
+        return self.board_status == DONE_STATUS
+
+    @property
+    def weight(self) -> int:
+        """Critical-chain weight; unestimated tasks count as one point."""
+        return self.story_points if self.story_points and self.story_points > 0 else 1
+
+
+def _edge_ids(value: Any) -> Tuple[int, ...]:
+    ids = []
+    for item in value or ():
+        try:
+            ids.append(int(item))
+        except (TypeError, ValueError):
+            continue
+    return tuple(dict.fromkeys(ids))
+
+
+class TaskGraph:
+    """
+    Dependency index for one project's tasks.
+
+    Example:
+        graph = db.load_task_graph(project_id)
+        ready = graph.unblocked_ids(sprint_task_ids)
+        chain = graph.critical_chain(sprint_task_ids)
+    """
+
+    def __init__(self, nodes: Iterable[TaskNode]) -> None:
+        self.nodes: Dict[int, TaskNode] = {node.id: node for node in nodes}
+        self.dependents: Dict[int, List[int]] = {}
+        for node in self.nodes.values():
+            for blocker in node.blocked_by:
+                self.dependents.setdefault(blocker, []).append(node.id)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]], parse_json=None) -> "TaskGraph":
+        """Build from ``id, board_status, story_points, sprint_id, blocked_by`` rows."""
+        nodes = []
+        for row in rows:
+            blocked_by = row["blocked_by"]
+            if parse_json is not None:
+                blocked_by = parse_json(blocked_by)
+            nodes.append(
+                TaskNode(
+                    id=int(row["id"]),
+                    board_status=row["board_status"],
+                    story_points=row["story_points"],
+                    sprint_id=row["sprint_id"],
+                    blocked_by=_edge_ids(blocked_by if isinstance(blocked_by, list) else ()),
+                )
+            )
+        return cls(nodes)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def sprint_task_ids(self, sprint_id: int) -> List[int]:
+        return [node.id for node in self.nodes.values() if node.sprint_id == sprint_id]
+
+    def open_blockers(self, task_id: int) -> List[int]:
+        """Blockers of a task that exist and are not done yet."""
+        node = self.nodes.get(task_id)
+        if node is None:
+            return []
+        return [b for b in node.blocked_by if b in self.nodes and not self.nodes[b].done]
+
+    def is_blocked(self, task_id: int) -> bool:
+        return bool(self.open_blockers(task_id))
+
+    def _scope(self, task_ids: Optional[Iterable[int]]) -> List[int]:
+        if task_ids is None:
+            return list(self.nodes)
+        return [task_id for task_id in dict.fromkeys(task_ids) if task_id in self.nodes]
+
+    def blocked_ids(self, task_ids: Optional[Iterable[int]] = None) -> List[int]:
+        """Open tasks (of ``task_ids``, default all) waiting on an open blocker."""
+        return [
+            task_id for task_id in self._scope(task_ids)
+            if not self.nodes[task_id].done and self.is_blocked(task_id)
+        ]
+
+    def unblocked_ids(self, task_ids: Optional[Iterable[int]] = None) -> List[int]:
+        """Open tasks (of ``task_ids``, default all) that can be started now."""
+        return [
+            task_id for task_id in self._scope(task_ids)
+            if not self.nodes[task_id].done and not self.is_blocked(task_id)
+        ]
+
+    def critical_chain(self, task_ids: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Longest chain of open tasks by story points, first task first.
+
+        Only edges between tasks in ``task_ids`` (default all) count, so a
+        sprint's chain ignores work outside the sprint. Tasks caught in a
+        pre-existing cycle are left out.
+        """
+        scope = {task_id for task_id in self._scope(task_ids) if not self.nodes[task_id].done}
+        indegree = {task_id: 0 for task_id in scope}
+        for task_id in scope:
+            for blocker in self.nodes[task_id].blocked_by:
+                if blocker in scope:
+                    indegree[task_id] += 1
+
+        best: Dict[int, int] = {}
+        previous: Dict[int, Optional[int]] = {}
+        ordered: List[int] = []
+        queue = deque(sorted(task_id for task_id, degree in indegree.items() if degree == 0))
+        for task_id in queue:
+            best[task_id] = self.nodes[task_id].weight
+            previous[task_id] = None
+        while queue:
+            current = queue.popleft()
+            ordered.append(current)
+            for dependent in self.dependents.get(current, ()):
+                if dependent not in scope:
+                    continue
+                length = best[current] + self.nodes[dependent].weight
+                if length > best.get(dependent, 0):
+                    best[dependent] = length
+                    previous[dependent] = current
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+
+        if not ordered:
+            return []
+        tail = max(ordered, key=lambda task_id: (best[task_id], -task_id))
+        chain = []
+        current: Optional[int] = tail
+        while current is not None:
+            chain.append(current)
+            current = previous[current]
+        return list(reversed(chain))
+
+    def chain_points(self, chain: Iterable[int]) -> int:
+        return sum(self.nodes[task_id].weight for task_id in chain if task_id in self.nodes)
@@ -13,6 +13,7 @@ from devgodzilla.engines.interface import (
     SandboxMode,
 )
 from devgodzilla.engines.registry import (
+    EngineDescriptor,
     EngineRegistry,
     EngineNotFoundError,
     get_registry,
@@ -20,39 +21,77 @@ from devgodzilla.engines.registry import (
     get_engine,
     get_default_engine,
 )
-from devgodzilla.engines.cli_adapter import CLIEngine, run_cli_command
-from devgodzilla.engines.ide import IDEEngine, IDECommand, IDECommandFile
-from devgodzilla.engines.api_engine import APIEngine, APIRequestConfig, APIResponse
-from devgodzilla.engines.codex import CodexEngine, register_codex_engine
-from devgodzilla.engines.claude_code import ClaudeCodeEngine, register_claude_code_engine
-from devgodzilla.engines.opencode import OpenCodeEngine, register_opencode_engine
-from devgodzilla.engines.cursor import CursorEngine, register_cursor_engine
-from devgodzilla.engines.copilot import (
-    CopilotEngine,
-    CopilotAPIEngine,
-    register_copilot_engine,
-    register_copilot_api_engine,
-)
-from devgodzilla.engines.qoder import QoderEngine, register_qoder_engine
-from devgodzilla.engines.qwen import QwenEngine, register_qwen_engine
-from devgodzilla.engines.amazon_q import AmazonQEngine, register_amazon_q_engine
-from devgodzilla.engines.auggie import AuggieEngine, register_auggie_engine
-from devgodzilla.engines.dummy import DummyEngine
-from devgodzilla.engines.artifacts import Artifact, ArtifactWriter
-from devgodzilla.engines.sandbox import (
-    SandboxType,
-    SandboxConfig,
-    SandboxRunner,
-    is_sandbox_available,
-    get_default_sandbox_type,
-    create_sandbox_runner,
-)
-from devgodzilla.engines.block_detector import (
-    BlockDetector,
-    BlockInfo,
-    BlockReason,
-    detect_block,
-)
+# Everything below the registry is imported on first attribute access
+# (PEP 562), so importing the package does not load every engine module.
+_LAZY_EXPORTS = {
+    "CLIEngine": "cli_adapter",
+    "run_cli_command": "cli_adapter",
+    "IDEEngine": "ide",
+    "IDECommand": "ide",
+    "IDECommandFile": "ide",
+    "APIEngine": "api_engine",
+    "APIRequestConfig": "api_engine",
+    "APIResponse": "api_engine",
+    "HTTPTransport": "http_transport",
+    "PooledHTTPTransport": "http_transport",
+    "UrllibTransport": "http_transport",
+    "get_default_transport": "http_transport",
+    "CodexEngine": "codex",
+    "register_codex_engine": "codex",
+    "ClaudeCodeEngine": "claude_code",
+    "register_claude_code_engine": "claude_code",
+    "OpenCodeEngine": "opencode",
+    "register_opencode_engine": "opencode",
+    "CursorEngine": "cursor",
+    "register_cursor_engine": "cursor",
+    "CopilotEngine": "copilot",
+    "CopilotAPIEngine": "copilot",
+    "register_copilot_engine": "copilot",
+    "register_copilot_api_engine": "copilot",
+    "QoderEngine": "qoder",
+    "register_qoder_engine": "qoder",
+    "QwenEngine": "qwen",
+    "register_qwen_engine": "qwen",
+    "AmazonQEngine": "amazon_q",
+    "register_amazon_q_engine": "amazon_q",
+    "AuggieEngine": "auggie",
+    "register_auggie_engine": "auggie",
+    "DummyEngine": "dummy",
+    "Artifact": "artifacts",
+    "ArtifactWriter": "artifacts",
+    "ArtifactStore": "artifact_store",
+    "get_artifact_store": "artifact_store",
+    "SandboxType": "sandbox",
+    "SandboxConfig": "sandbox",
+    "SandboxRunner": "sandbox",
+    "is_sandbox_available": "sandbox",
+    "get_default_sandbox_type": "sandbox",
+    "create_sandbox_runner": "sandbox",
+    "SandboxSession": "sandbox",
+    "SandboxSessionPool": "sandbox",
+    "create_sandbox_session": "sandbox",
+    "get_sandbox_pool": "sandbox",
+    "BlockDetector": "block_detector",
+    "BlockInfo": "block_detector",
+    "BlockReason": "block_detector",
+    "detect_block": "block_detector",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Interface
@@ -63,6 +102,7 @@ __all__ = [
     "EngineResult",
     "SandboxMode",
     # Registry
+    "EngineDescriptor",
     "EngineRegistry",
     "EngineNotFoundError",
     "get_registry",
@@ -78,6 +118,10 @@ __all__ = [
     "APIEngine",
     "APIRequestConfig",
     "APIResponse",
+    "HTTPTransport",
+    "PooledHTTPTransport",
+    "UrllibTransport",
+    "get_default_transport",
     # Engine implementations
     "CodexEngine",
     "register_codex_engine",
@@ -103,6 +147,8 @@ __all__ = [
     # Artifacts
     "Artifact",
     "ArtifactWriter",
+    "ArtifactStore",
+    "get_artifact_store",
     # Sandbox
     "SandboxType",
     "SandboxConfig",
@@ -110,6 +156,10 @@ __all__ = [
     "is_sandbox_available",
     "get_default_sandbox_type",
     "create_sandbox_runner",
+    "SandboxSession",
+    "SandboxSessionPool",
+    "create_sandbox_session",
+    "get_sandbox_pool",
     # Block Detection
     "BlockDetector",
     "BlockInfo",
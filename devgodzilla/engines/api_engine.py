@@ -6,11 +6,13 @@ Provides common functionality for REST API interactions.
 """
 
 import json
+import threading
 import time
 from abc import abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlencode
 
 from devgodzilla.engines.interface import (
     Engine,
@@ -20,6 +22,14 @@ from devgodzilla.engines.interface import (
     EngineResult,
     SandboxMode,
 )
+from devgodzilla.engines.http_transport import (
+    HTTPTransport,
+    OutputCallback,
+    TransportError,
+    TransportHTTPError,
+    compute_backoff,
+    get_default_transport,
+)
 from devgodzilla.logging import get_logger
 
 logger = get_logger(__name__)
@@ -39,6 +49,9 @@ class APIRequestConfig:
     timeout: int = 300
     retries: int = 3
     retry_delay: float = 1.0
+    max_retry_delay: float = 60.0
+    # Ask for a streamed (SSE / NDJSON) response
+    stream: bool = False
 
 
 @dataclass
@@ -53,6 +66,7 @@ class APIResponse:
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     raw_response: Optional[str] = None
+    events: List[Any] = field(default_factory=list)
 
 
 class APIEngine(Engine):
@@ -107,6 +121,8 @@ class APIEngine(Engine):
         api_key: Optional[str] = None,
         default_timeout: int = 300,
         max_retries: int = 3,
+        transport: Optional[HTTPTransport] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         """
         Initialize API engine.
@@ -116,11 +132,18 @@ class APIEngine(Engine):
             api_key: API key for authentication
             default_timeout: Default request timeout in seconds
             max_retries: Maximum number of retry attempts
+            transport: HTTP transport (defaults to the shared keep-alive pool)
+            max_concurrency: Maximum in-flight requests for this engine
         """
         self._base_url = base_url
         self._api_key = api_key
         self._default_timeout = default_timeout
         self._max_retries = max_retries
+        self._transport = transport or get_default_transport()
+        self._max_concurrency = max_concurrency
+        self._concurrency = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
 
     @property
     def metadata(self) -> EngineMetadata:
@@ -178,7 +201,7 @@ class APIEngine(Engine):
         """
         headers = {
             "Content-Type": "application/json",
-            "Accept": "application/json",
+            "Accept": "text/event-stream" if config.stream else "application/json",
         }
         headers.update(config.headers)
         
@@ -192,70 +215,91 @@ class APIEngine(Engine):
         self,
         config: APIRequestConfig,
         body: Dict[str, Any],
+        on_output: Optional[OutputCallback] = None,
     ) -> APIResponse:
         """
         Make HTTP request with retries.
         
-        Uses urllib to avoid external dependencies.
+        Goes through the engine's transport (a shared keep-alive pool by
+        default). Streamed responses feed incremental text to ``on_output``
+        as ("stdout", text). Retries back off with jitter and honor
+        ``Retry-After``; client errors other than 408/429 are not retried,
+        and neither is a stream that fails after text reached ``on_output``,
+        since replaying it would duplicate that output.
         """
-        import urllib.request
-        import urllib.error
-        
         url = config.endpoint
         if config.params:
-            query = "&".join(f"{k}={v}" for k, v in config.params.items())
-            url = f"{url}?{query}"
+            url = f"{url}?{urlencode(config.params)}"
         
         headers = config.headers
         data = json.dumps(body).encode("utf-8")
         
+        on_event = None
+        emitted = False
+        if on_output is not None:
+            def on_event(event: Any) -> None:
+                nonlocal emitted
+                text = self._extract_stream_text(event)
+                if not text:
+                    return
+                emitted = True
+                try:
+                    on_output("stdout", text)
+                except Exception as e:
+                    logger.warning(
+                        "api_engine_output_callback_failed",
+                        extra={"error": str(e)},
+                    )
+        
         last_error: Optional[str] = None
         
         for attempt in range(config.retries):
+            retry_after: Optional[float] = None
             try:
-                request = urllib.request.Request(
+                response = self._transport.request(
+                    config.method,
                     url,
-                    data=data,
                     headers=headers,
-                    method=config.method,
+                    body=data,
+                    timeout=config.timeout,
+                    on_event=on_event,
                 )
+                if response.streamed:
+                    response_data = self._assemble_stream_data(response.events)
+                else:
+                    response_data = json.loads(response.body)
                 
-                with urllib.request.urlopen(request, timeout=config.timeout) as response:
-                    raw = response.read().decode("utf-8")
-                    response_data = json.loads(raw)
-                    
-                    return APIResponse(
-                        success=True,
-                        status_code=response.status,
-                        data=response_data,
-                        raw_response=raw,
-                    )
+                return APIResponse(
+                    success=True,
+                    status_code=response.status_code,
+                    data=response_data,
+                    raw_response=response.body,
+                    events=response.events,
+                )
                     
-            except urllib.error.HTTPError as e:
-                last_error = f"HTTP {e.code}: {e.reason}"
-                try:
-                    error_body = e.read().decode("utf-8")
-                    logger.warning(
-                        "api_engine_http_error",
-                        extra={
-                            "status_code": e.code,
-                            "reason": e.reason,
-                            "body": error_body[:500],
-                            "attempt": attempt + 1,
-                        },
-                    )
-                except Exception:
-                    pass
+            except TransportHTTPError as e:
+                last_error = f"HTTP {e.status_code}: {e.reason}"
+                retry_after = e.retry_after
+                logger.warning(
+                    "api_engine_http_error",
+                    extra={
+                        "status_code": e.status_code,
+                        "reason": e.reason,
+                        "body": e.body[:500],
+                        "attempt": attempt + 1,
+                        "retry_after": retry_after,
+                    },
+                )
                     
-                # Don't retry client errors
-                if 400 <= e.code < 500:
+                # Don't retry client errors (except timeouts / rate limits)
+                if 400 <= e.status_code < 500 and e.status_code not in (408, 429):
                     break
                     
-            except urllib.error.URLError as e:
+            except TransportError as e:
                 last_error = f"URL Error: {e.reason}"
                 logger.warning(
                     "api_engine_url_error",
-                    extra={"reason": str(e.reason), "attempt": attempt + 1},
+                    extra={"reason": e.reason, "attempt": attempt + 1},
                 )
                 
             except json.JSONDecodeError as e:
@@ -273,9 +317,20 @@ class APIEngine(Engine):
                     extra={"error": str(e), "attempt": attempt + 1},
                 )
             
+            if emitted:
+                last_error = f"Stream interrupted after partial output: {last_error}"
+                break
+
             # Wait before retry
             if attempt < config.retries - 1:
-                time.sleep(config.retry_delay * (attempt + 1))
+                time.sleep(
+                    compute_backoff(
+                        attempt,
+                        base_delay=config.retry_delay,
+                        retry_after=retry_after,
+                        max_delay=config.max_retry_delay,
+                    )
+                )
         
         return APIResponse(
             success=False,
@@ -283,6 +338,43 @@ class APIEngine(Engine):
             error=last_error or "Unknown error",
         )
 
+    def _extract_stream_text(self, event: Any) -> Optional[str]:
+        """
+        Extract incremental output text from one streamed event.
+        
+        Handles plain-text events, OpenAI-style ``choices[].delta.content``
+        chunks and flat ``output``/``text``/``content`` fields. Override for
+        other wire formats.
+        """
+        if isinstance(event, str):
+            return event
+        if not isinstance(event, dict):
+            return None
+        choices = event.get("choices")
+        if isinstance(choices, list) and choices:
+            choice = choices[0] or {}
+            delta = choice.get("delta") or choice.get("message") or {}
+            content = delta.get("content") if isinstance(delta, dict) else None
+            if isinstance(content, str):
+                return content
+            text = choice.get("text")
+            return text if isinstance(text, str) else None
+        for key in ("output", "text", "content"):
+            value = event.get(key)
+            if isinstance(value, str):
+                return value
+        return None
+
+    def _assemble_stream_data(self, events: List[Any]) -> Dict[str, Any]:
+        """
+        Fold streamed events into the ``data`` dict given to _parse_response.
+        
+        The default keeps the raw events and the concatenated text as
+        ``output``; override when the final event carries the full payload.
+        """
+        parts = [self._extract_stream_text(event) or "" for event in events]
+        return {"events": events, "output": "".join(parts)}
+
     def _execute_via_api(
         self,
         req: EngineRequest,
@@ -320,8 +412,17 @@ class APIEngine(Engine):
             },
         )
         
-        # Make request
-        response = self._make_request(config, body)
+        # Stream incremental output to the same callback the CLI engines use
+        on_output = (req.extra or {}).get("log_callback")
+        if not callable(on_output):
+            on_output = None
+        
+        # Make request (bounded by the per-engine concurrency limit)
+        if self._concurrency is not None:
+            with self._concurrency:
+                response = self._make_request(config, body, on_output)
+        else:
+            response = self._make_request(config, body, on_output)
         
         # Parse response
         result = self._parse_response(response, req)
@@ -356,13 +457,9 @@ class APIEngine(Engine):
             return False
         
         try:
-            import urllib.request
-            
             health_url = f"{self._base_url.rstrip('/')}/health"
-            request = urllib.request.Request(health_url, method="GET")
-            
-            with urllib.request.urlopen(request, timeout=10) as response:
-                return response.status == 200
+            response = self._transport.request("GET", health_url, timeout=10)
+            return response.status_code == 200
                 
         except Exception:
             return False
@@ -0,0 +1,421 @@
+"""
+DevGodzilla Artifact Store
+
+Content-addressed storage for execution artifacts. Each distinct content is
+stored once as a blob named by its SHA-256, so retries, QA re-runs and
+identical logs or plans across steps share one copy. Text artifacts (logs,
+diffs, reports, JSON) are compressed with zstd when ``zstandard`` is
+installed and gzip otherwise.
+
+Layout::
+
+    <root>/blobs/<aa>/<sha256>[.zst|.gz]   one blob per distinct content
+    <root>/manifests/<key>.ref             path of each manifest using the store
+
+A step's artifacts directory holds a manifest (``.artifacts.json``) mapping
+artifact names to blobs, alongside any plain files written directly.
+:func:`list_stored_artifacts` and :func:`open_stored_artifact` read both.
+
+:meth:`ArtifactStore.gc` removes blobs no manifest references and, when
+given a cutoff, expires manifests older than it (see RetentionService).
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None  # type: ignore
+    ZSTD_AVAILABLE = False
+
+MANIFEST_NAME = ".artifacts.json"
+
+# Artifact kinds stored compressed; everything else is stored as-is. Logs are
+# left out: they are what clients tail, and a window near the end of a
+# compressed blob means decompressing everything before it on every poll.
+TEXT_KINDS = frozenset({"output", "diff", "meta", "data", "report", "manifest"})
+
+_SUFFIXES = {"zstd": ".zst", "gzip": ".gz", "identity": ""}
+_MIN_COMPRESS_BYTES = 256
+_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass
+class BlobRef:
+    """A stored blob: digest and sizes of the content and of the file on disk."""
+    digest: str
+    size: int
+    stored_size: int
+    encoding: str = "identity"
+
+
+@dataclass
+class GCResult:
+    blobs_removed: int = 0
+    bytes_freed: int = 0
+    manifests_expired: int = 0
+    manifests_dropped: int = 0
+
+
+class ArtifactStore:
+    """
+    Content-addressed blob store shared by every step that writes artifacts.
+
+    Example:
+        store = ArtifactStore(Path(".devgodzilla/artifact-store"))
+        ref = store.put_bytes(b"log line\\n", compress=True)
+        with store.open(ref.digest) as fh:
+            data = fh.read()
+    """
+
+    def __init__(self, root: Path, *, compression: Optional[str] = None) -> None:
+        self.root = Path(root).expanduser().resolve()
+        if compression is None:
+            compression = "zstd" if ZSTD_AVAILABLE else "gzip"
+        if compression not in _SUFFIXES:
+            raise ValueError(f"Unknown artifact compression: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the zstandard package")
+        self.compression = compression
+
+    # -- writing ---------------------------------------------------------
+
+    def put_bytes(self, data: bytes, *, compress: bool = True) -> BlobRef:
+        """Store ``data``, reusing an existing blob with the same content."""
+        return self.put_stream([data], compress=compress and len(data) >= _MIN_COMPRESS_BYTES)
+
+    def put_stream(self, chunks: Iterable[bytes], *, compress: bool = True) -> BlobRef:
+        """
+        Store content from ``chunks`` without holding it in memory.
+
+        The content is hashed and compressed into a temporary file, which
+        becomes the blob unless one with the same digest already exists.
+        """
+        encoding = self.compression if compress else "identity"
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=tmp_dir)
+        tmp = Path(tmp_name)
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                sink = _compressing_writer(raw, encoding)
+                for chunk in chunks:
+                    if not chunk:
+                        continue
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    sink.write(chunk)
+                if sink is not raw:
+                    sink.close()
+            digest = hasher.hexdigest()
+            existing = self._find(digest)
+            if existing is not None:
+                tmp.unlink()
+                # Refresh mtime so a concurrent gc() keeps the reused blob.
+                os.utime(existing)
+                return BlobRef(digest, size, existing.stat().st_size, _encoding_of(existing))
+            target = self._blob_path(digest, encoding)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp, target)
+            return BlobRef(digest, size, target.stat().st_size, encoding)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    # -- reading ---------------------------------------------------------
+
+    def exists(self, digest: str) -> bool:
+        return self._find(digest) is not None
+
+    def locate(self, digest: str) -> Optional[Path]:
+        """Path of the stored (possibly compressed) blob file, if present."""
+        return self._find(digest)
+
+    def open(self, digest: str) -> BinaryIO:
+        """Open a blob for streaming reads of its original content."""
+        path = self._find(digest)
+        if path is None:
+            raise FileNotFoundError(f"Artifact blob not found: {digest}")
+        return _open_blob(path)
+
+    def read_bytes(self, digest: str) -> bytes:
+        with self.open(digest) as fh:
+            return fh.read()
+
+    # -- manifests and gc ------------------------------------------------
+
+    def register_manifest(self, manifest_path: Path) -> None:
+        """Record that ``manifest_path`` references blobs in this store."""
+        manifest_path = Path(manifest_path).resolve()
+        key = hashlib.sha1(str(manifest_path).encode("utf-8")).hexdigest()
+        ref = self.root / "manifests" / f"{key}.ref"
+        if ref.exists():
+            return
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        ref.write_text(str(manifest_path), encoding="utf-8")
+
+    def gc(
+        self,
+        *,
+        grace_seconds: float = 3600.0,
+        expire_manifests_before: Optional[float] = None,
+    ) -> GCResult:
+        """
+        Remove blobs that no registered manifest references.
+
+        Blobs and temp files younger than ``grace_seconds`` are kept so writes
+        in flight survive. Manifests last modified before
+        ``expire_manifests_before`` (epoch seconds) are deleted first, which
+        releases their blobs.
+        """
+        result = GCResult()
+        live = set()
+        manifests_dir = self.root / "manifests"
+        for ref in sorted(manifests_dir.glob("*.ref")) if manifests_dir.exists() else []:
+            manifest_path = Path(ref.read_text(encoding="utf-8").strip())
+            try:
+                stat = manifest_path.stat()
+            except FileNotFoundError:
+                ref.unlink(missing_ok=True)
+                result.manifests_dropped += 1
+                continue
+            if expire_manifests_before is not None and stat.st_mtime < expire_manifests_before:
+                manifest_path.unlink(missing_ok=True)
+                ref.unlink(missing_ok=True)
+                result.manifests_expired += 1
+                continue
+            manifest = _read_manifest(manifest_path)
+            for entry in manifest.get("artifacts", {}).values():
+                if entry.get("blob"):
+                    live.add(entry["blob"])
+
+        cutoff = time.time() - grace_seconds
+        for directory in ("blobs", "tmp"):
+            base = self.root / directory
+            if not base.exists():
+                continue
+            for path in base.rglob("*"):
+                if not path.is_file():
+                    continue
+                if directory == "blobs" and path.name.split(".", 1)[0] in live:
+                    continue
+                stat = path.stat()
+                if stat.st_mtime >= cutoff:
+                    continue
+                path.unlink(missing_ok=True)
+                result.blobs_removed += 1 if directory == "blobs" else 0
+                result.bytes_freed += stat.st_size
+
+        return result
+
+    # -- internals -------------------------------------------------------
+
+    def _blob_path(self, digest: str, encoding: str) -> Path:
+        return self.root / "blobs" / digest[:2] / f"{digest}{_SUFFIXES[encoding]}"
+
+    def _find(self, digest: str) -> Optional[Path]:
+        for encoding in _SUFFIXES:
+            path = self._blob_path(digest, encoding)
+            if path.exists():
+                return path
+        return None
+
+
+def _encoding_of(path: Path) -> str:
+    for encoding, suffix in _SUFFIXES.items():
+        if suffix and path.name.endswith(suffix):
+            return encoding
+    return "identity"
+
+
+def _compressing_writer(raw: BinaryIO, encoding: str):
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False)
+    if encoding == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0)
+    return raw
+
+
+def _open_blob(path: Path) -> BinaryIO:
+    encoding = _encoding_of(path)
+    if encoding == "gzip":
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if encoding == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+_stores: Dict[Path, ArtifactStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_artifact_store(config: Any) -> Optional[ArtifactStore]:
+    """
+    The store at ``config.artifact_store_dir``, or None when disabled.
+
+    A relative directory is resolved against ``config.projects_root``, the
+    directory deployments already persist and share between the API and
+    workers, so blobs live alongside the step manifests that point at them.
+    """
+    root = getattr(config, "artifact_store_dir", None)
+    if not isinstance(root, (str, os.PathLike)) or not str(root):
+        return None
+    root = Path(root).expanduser()
+    if not root.is_absolute():
+        projects_root = getattr(config, "projects_root", None)
+        base = Path(projects_root).expanduser() if projects_root else Path.cwd()
+        root = base / root
+    root = root.resolve()
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = ArtifactStore(root)
+        return store
+
+
+# =============================================================================
+# Manifests
+# =============================================================================
+
+def _read_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def load_manifest(artifacts_dir: Path) -> Dict[str, Any]:
+    """The manifest of a step's artifacts directory (empty if there is none)."""
+    return _read_manifest(Path(artifacts_dir) / MANIFEST_NAME)
+
+
+def write_manifest(artifacts_dir: Path, manifest: Dict[str, Any]) -> Path:
+    """Atomically replace the manifest of ``artifacts_dir``."""
+    path = Path(artifacts_dir) / MANIFEST_NAME
+    tmp = path.with_name(f"{MANIFEST_NAME}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True, default=str), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+@dataclass
+class StoredArtifact:
+    """An artifact in a step directory, backed by a blob or a plain file."""
+    name: str
+    size: int
+    modified: float
+    kind: Optional[str] = None
+    path: Optional[Path] = None
+    blob: Optional[str] = None
+    store_root: Optional[Path] = None
+    encoding: str = "identity"
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_file(cls, path: Path, name: Optional[str] = None) -> Optional["StoredArtifact"]:
+        """A plain-file artifact, or None if ``path`` is not a regular file."""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not path.is_file():
+            return None
+        return cls(name=name or path.name, size=stat.st_size, modified=stat.st_mtime, path=path)
+
+    @property
+    def etag(self) -> str:
+        """Strong validator: the blob digest, or size and mtime for plain files."""
+        if self.blob is not None:
+            return self.blob
+        return f"{self.size:x}-{int(self.modified * 1_000_000):x}"
+
+    def stored_path(self) -> Optional[Path]:
+        """The file holding the content as stored (compressed for text blobs)."""
+        if self.blob is not None:
+            return ArtifactStore(self.store_root or Path(".")).locate(self.blob)
+        return self.path
+
+    def open(self) -> BinaryIO:
+        """Open the artifact's original content for streaming reads."""
+        if self.blob is not None:
+            return ArtifactStore(self.store_root or Path(".")).open(self.blob)
+        return open(self.path, "rb")  # type: ignore[arg-type]
+
+    def iter_chunks(self, chunk_size: int = _CHUNK_BYTES) -> Iterator[bytes]:
+        with self.open() as fh:
+            while True:
+                chunk = fh.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def read(self, max_bytes: Optional[int] = None) -> bytes:
+        with self.open() as fh:
+            return fh.read() if max_bytes is None else fh.read(max_bytes)
+
+
+def list_stored_artifacts(artifacts_dir: Path) -> List[StoredArtifact]:
+    """
+    Artifacts of a step: manifest entries plus plain files, newest first.
+
+    When a name exists both ways, the more recently written one wins.
+    """
+    artifacts_dir = Path(artifacts_dir)
+    found: Dict[str, StoredArtifact] = {}
+    manifest = load_manifest(artifacts_dir)
+    store_root = Path(manifest["store"]) if manifest.get("store") else None
+    for name, entry in manifest.get("artifacts", {}).items():
+        found[name] = StoredArtifact(
+            name=name,
+            size=int(entry.get("size") or 0),
+            modified=float(entry.get("modified") or 0.0),
+            kind=entry.get("kind"),
+            blob=entry.get("blob"),
+            store_root=store_root,
+            encoding=entry.get("encoding") or "identity",
+            metadata=entry.get("metadata") or {},
+        )
+    if artifacts_dir.exists():
+        for path in artifacts_dir.iterdir():
+            if path.name.startswith(".") or not path.is_file():
+                continue
+            stat = path.stat()
+            current = found.get(path.name)
+            if current is not None and current.modified >= stat.st_mtime:
+                continue
+            found[path.name] = StoredArtifact(name=path.name, size=stat.st_size, modified=stat.st_mtime, path=path)
+    return sorted(found.values(), key=lambda a: a.modified, reverse=True)
+
+
+def open_stored_artifact(artifacts_dir: Path, name: str) -> Optional[StoredArtifact]:
+    """Look up one artifact by name, or None if the step has no such artifact."""
+    for artifact in list_stored_artifacts(artifacts_dir):
+        if artifact.name == name:
+            return artifact
+    return None
+
+
+def copy_stream(source: BinaryIO, chunk_size: int = _CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield ``source`` in chunks (for feeding files to :meth:`ArtifactStore.put_stream`)."""
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
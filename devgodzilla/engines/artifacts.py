@@ -2,17 +2,26 @@
 DevGodzilla Artifact Writer
 
 Utilities for capturing and storing execution artifacts.
+
+With an ArtifactStore, content goes to deduplicated (and, for text kinds,
+compressed) blobs and the artifacts directory only holds a manifest naming
+them; see engines/artifact_store.py.
 """
 
 import hashlib
 import json
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
 
 from devgodzilla.logging import get_logger
 
+if TYPE_CHECKING:
+    from devgodzilla.engines.artifact_store import ArtifactStore
+
 logger = get_logger(__name__)
 
 
@@ -26,6 +35,10 @@ class Artifact:
     hash: Optional[str] = None
     created_at: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    blob: Optional[str] = None  # store digest; path is then the stored blob file
+
+
+_manifest_lock = threading.Lock()
 
 
 class ArtifactWriter:
@@ -55,6 +68,9 @@ class ArtifactWriter:
             data={"passed": True, "findings": []},
             kind="report",
         )
+
+        # Store content as shared blobs instead of files
+        writer = ArtifactWriter(artifacts_dir, store=get_artifact_store(config))
     """
 
     def __init__(
@@ -63,10 +79,12 @@ class ArtifactWriter:
         *,
         run_id: Optional[str] = None,
         step_run_id: Optional[int] = None,
+        store: Optional["ArtifactStore"] = None,
     ) -> None:
         self.artifacts_dir = Path(artifacts_dir)
         self.run_id = run_id
         self.step_run_id = step_run_id
+        self.store = store
         self._artifacts: List[Artifact] = []
 
     def _ensure_dir(self, subdir: Optional[str] = None) -> Path:
@@ -81,6 +99,61 @@ class ArtifactWriter:
         """Generate SHA256 hash of content."""
         return hashlib.sha256(content).hexdigest()[:16]
 
+    def _store_artifact(
+        self,
+        name: str,
+        filename: str,
+        chunks: Iterable[bytes],
+        kind: str,
+        metadata: Dict[str, Any],
+    ) -> Artifact:
+        """Put content in the store and record it in the directory manifest."""
+        from devgodzilla.engines.artifact_store import TEXT_KINDS, load_manifest, write_manifest
+
+        assert self.store is not None
+        ref = self.store.put_stream(chunks, compress=kind in TEXT_KINDS)
+        target_dir = self._ensure_dir()
+        with _manifest_lock:
+            manifest = load_manifest(target_dir)
+            manifest.update(
+                version=1,
+                store=str(self.store.root),
+                run_id=self.run_id,
+                step_run_id=self.step_run_id,
+            )
+            manifest.setdefault("artifacts", {})[filename] = {
+                "kind": kind,
+                "blob": ref.digest,
+                "size": ref.size,
+                "stored_size": ref.stored_size,
+                "encoding": ref.encoding,
+                "modified": time.time(),
+                "metadata": metadata,
+            }
+            manifest_path = write_manifest(target_dir, manifest)
+        self.store.register_manifest(manifest_path)
+        # A file left by an earlier write of the same name would shadow the blob.
+        (target_dir / filename).unlink(missing_ok=True)
+
+        artifact = Artifact(
+            name=name,
+            kind=kind,
+            # The blob file (compressed for text kinds); the logical name
+            # lives on in the manifest.
+            path=self.store.locate(ref.digest) or target_dir / filename,
+            size_bytes=ref.size,
+            hash=ref.digest[:16],
+            created_at=datetime.now(timezone.utc),
+            metadata=metadata,
+            blob=ref.digest,
+        )
+        self._artifacts.append(artifact)
+        logger.debug(
+            "artifact_stored",
+            extra={"name": name, "kind": kind, "size": ref.size, "stored_size": ref.stored_size},
+        )
+        return artifact
+
     def write_text(
         self,
         name: str,
@@ -103,11 +176,13 @@ class ArtifactWriter:
         Returns:
             Created Artifact
         """
-        target_dir = self._ensure_dir()
         filename = f"{name}{extension}"
-        path = target_dir / filename
-        
         content_bytes = content.encode("utf-8")
+        if self.store is not None:
+            return self._store_artifact(name, filename, [content_bytes], kind, metadata or {})
+
+        target_dir = self._ensure_dir()
+        path = target_dir / filename
         path.write_bytes(content_bytes)
         
         artifact = Artifact(
@@ -129,6 +204,70 @@ class ArtifactWriter:
         
         return artifact
 
+    def write_stream(
+        self,
+        name: str,
+        chunks: Iterable[bytes],
+        kind: str = "output",
+        *,
+        extension: str = ".txt",
+        max_bytes: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Artifact:
+        """
+        Stream byte chunks to an artifact without holding the content in memory.
+
+        Stops reading ``chunks`` once ``max_bytes`` is reached, cutting at the
+        last full line, and appends a truncation marker; the artifact's
+        metadata then has ``truncated: True``.
+
+        Args:
+            name: Artifact name (becomes filename)
+            chunks: Content, in order
+            kind: Artifact kind
+            extension: File extension
+            max_bytes: Optional size cap (0 or None for no cap)
+            metadata: Optional metadata
+
+        Returns:
+            Created Artifact
+        """
+        artifact_metadata = dict(metadata or {})
+        # Sets artifact_metadata["truncated"] once the cap is hit.
+        capped = _cap_chunks(chunks, max_bytes, artifact_metadata)
+        if self.store is not None:
+            return self._store_artifact(name, f"{name}{extension}", capped, kind, artifact_metadata)
+
+        target_dir = self._ensure_dir()
+        path = target_dir / f"{name}{extension}"
+        digest = hashlib.sha256()
+        size = 0
+
+        with path.open("wb") as fh:
+            for chunk in capped:
+                fh.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+
+        artifact = Artifact(
+            name=name,
+            kind=kind,
+            path=path,
+            size_bytes=size,
+            hash=digest.hexdigest()[:16],
+            created_at=datetime.now(timezone.utc),
+            metadata=artifact_metadata,
+        )
+
+        self._artifacts.append(artifact)
+
+        logger.debug(
+            "artifact_written",
+            extra={"name": name, "kind": kind, "size": size, "truncated": bool(artifact_metadata.get("truncated"))},
+        )
+
+        return artifact
+
     def write_json(
         self,
         name: str,
@@ -182,10 +321,12 @@ class ArtifactWriter:
         Returns:
             Created Artifact
         """
-        target_dir = self._ensure_dir()
         filename = f"{name}{extension}"
+        if self.store is not None:
+            return self._store_artifact(name, filename, [content], kind, metadata or {})
+
+        target_dir = self._ensure_dir()
         path = target_dir / filename
-        
         path.write_bytes(content)
         
         artifact = Artifact(
@@ -227,10 +368,15 @@ class ArtifactWriter:
         if not source.exists():
             raise FileNotFoundError(f"Source file not found: {source}")
         
-        target_dir = self._ensure_dir()
         target_name = name or source.name
+        if self.store is not None:
+            from devgodzilla.engines.artifact_store import copy_stream
+
+            with source.open("rb") as fh:
+                return self._store_artifact(target_name, target_name, copy_stream(fh), kind, metadata or {})
+
+        target_dir = self._ensure_dir()
         target = target_dir / target_name
-        
         shutil.copy2(source, target)
         
         content = target.read_bytes()
@@ -300,6 +446,7 @@ class ArtifactWriter:
                     "hash": a.hash,
                     "created_at": a.created_at.isoformat() if a.created_at else None,
                     "metadata": a.metadata,
+                    "blob": a.blob,
                 }
                 for a in self._artifacts
             ],
@@ -314,6 +461,21 @@ class ArtifactWriter:
         )
 
 
+def _cap_chunks(chunks: Iterable[bytes], max_bytes: Optional[int], metadata: Dict[str, Any]) -> Iterator[bytes]:
+    """Yield ``chunks`` up to ``max_bytes``, cut at a line end, then a truncation marker."""
+    size = 0
+    for chunk in chunks:
+        if max_bytes and size + len(chunk) > max_bytes:
+            room = max_bytes - size
+            cut = chunk.rfind(b"\n", 0, room)
+            yield chunk[: cut + 1 if cut >= 0 else room]
+            metadata["truncated"] = True
+            yield f"\n... truncated at {max_bytes} bytes ...\n".encode("utf-8")
+            return
+        size += len(chunk)
+        yield chunk
+
+
 def get_run_artifacts_dir(
     runs_dir: Path,
     run_id: str,
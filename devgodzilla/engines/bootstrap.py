@@ -2,22 +2,33 @@
 DevGodzilla Engine Bootstrap
 
 Helpers to ensure a usable engine registry in all entrypoints (API, CLI, Windmill workers).
+Engines are registered as descriptors, so an engine module is only imported
+when that engine is first looked up.
 """
 
 from __future__ import annotations
 
 from devgodzilla.config import get_config
-from devgodzilla.engines.registry import get_registry
-from devgodzilla.engines.claude_code import ClaudeCodeEngine
-from devgodzilla.engines.codex import CodexEngine
-from devgodzilla.engines.dummy import DummyEngine
-from devgodzilla.engines.opencode import OpenCodeEngine
+from devgodzilla.engines.registry import EngineDescriptor, get_registry
 from devgodzilla.logging import get_logger
 from devgodzilla.services.agent_config import AgentConfigService
 from devgodzilla.services.base import ServiceContext
 
 logger = get_logger(__name__)
 
+# Agent id -> "module:Class" for the engines agent config can enable.
+ENGINE_TARGETS = {
+    "opencode": "devgodzilla.engines.opencode:OpenCodeEngine",
+    "codex": "devgodzilla.engines.codex:CodexEngine",
+    "claude-code": "devgodzilla.engines.claude_code:ClaudeCodeEngine",
+}
+DUMMY_ENGINE = EngineDescriptor("dummy", "devgodzilla.engines.dummy:DummyEngine")
+
+
+def _register(registry, descriptor: EngineDescriptor, *, default: bool, replace: bool) -> None:
+    if replace or not registry.has(descriptor.id):
+        registry.register_lazy(descriptor, default=default, replace=replace)
+
 
 def _register_from_agent_config(*, replace: bool) -> None:
     registry = get_registry()
@@ -25,24 +36,14 @@ def _register_from_agent_config(*, replace: bool) -> None:
     cfg = AgentConfigService(ctx, config_path=str(ctx.config.agent_config_path) if ctx.config.agent_config_path else None)
     agents = cfg.list_agents(enabled_only=False)
 
-    def _register(engine, *, default: bool) -> None:
-        if replace or not registry.has(engine.metadata.id):
-            registry.register(engine, default=default, replace=replace)
-
-    engine_map = {
-        "opencode": OpenCodeEngine,
-        "codex": CodexEngine,
-        "claude-code": ClaudeCodeEngine,
-    }
-
     for agent in agents:
         if not agent.enabled:
             continue
-        factory = engine_map.get(agent.id)
-        if not factory:
+        target = ENGINE_TARGETS.get(agent.id)
+        if not target:
             continue
-        engine = factory(default_model=agent.default_model) if agent.default_model else factory()
-        _register(engine, default=False)
+        kwargs = {"default_model": agent.default_model} if agent.default_model else {}
+        _register(registry, EngineDescriptor(agent.id, target, kwargs), default=False, replace=replace)
 
     default_agent = cfg.get_default_agent("code_gen")
     if default_agent and registry.has(default_agent.id):
@@ -63,11 +64,7 @@ def bootstrap_default_engines(*, replace: bool = True) -> None:
     """
     registry = get_registry()
 
-    def _register(engine, *, default: bool) -> None:
-        if replace or not registry.has(engine.metadata.id):
-            registry.register(engine, default=default, replace=replace)
-
-    _register(DummyEngine(), default=True)
+    _register(registry, DUMMY_ENGINE, default=True, replace=replace)
     _register_from_agent_config(replace=replace)
 
     # In local/dev stacks we keep Dummy as the registry default for safety and to
@@ -100,5 +97,5 @@ def bootstrap_default_engines(*, replace: bool = True) -> None:
 
     logger.info(
         "engines_bootstrapped",
-        extra={"engines": registry.list_ids(), "default": registry.get_default().metadata.id},
+        extra={"engines": registry.list_ids(), "default": registry.default_id},
     )
@@ -0,0 +1,492 @@
+"""
+DevGodzilla HTTP Transport
+
+Pluggable HTTP transport layer for API-based engines.
+
+Provides:
+- A keep-alive connection pool per endpoint (scheme, host, port)
+- Streamed response reading with SSE / NDJSON event parsing
+- Retry backoff with jitter that honors ``Retry-After``
+- ``HTTP(S)_PROXY`` / ``NO_PROXY`` handling matching urllib's (CONNECT
+  tunnels for https, absolute-form requests for http)
+"""
+
+from __future__ import annotations
+
+import base64
+import http.client
+import json
+import random
+import ssl
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from devgodzilla.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Callback receiving (source, text) - same shape as the CLI engines' on_output.
+OutputCallback = Callable[[str, str], None]
+
+STREAM_CONTENT_TYPES = ("text/event-stream", "application/x-ndjson", "application/jsonl")
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+class TransportError(Exception):
+    """Network-level failure (connection refused, reset, timeout)."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class TransportHTTPError(Exception):
+    """Non-2xx HTTP response."""
+
+    def __init__(
+        self,
+        status_code: int,
+        reason: str,
+        *,
+        body: str = "",
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(f"HTTP {status_code}: {reason}")
+        self.status_code = status_code
+        self.reason = reason
+        self.body = body
+        self.retry_after = retry_after
+
+
+@dataclass
+class TransportResponse:
+    """Fully consumed HTTP response."""
+    status_code: int
+    headers: Dict[str, str]
+    body: str
+    # Parsed stream events (SSE ``data:`` payloads or NDJSON lines), if streamed.
+    events: List[Any] = field(default_factory=list)
+    streamed: bool = False
+    elapsed_seconds: float = 0.0
+    first_byte_seconds: Optional[float] = None
+
+
+def parse_retry_after(value: Optional[str], *, now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header into seconds.
+
+    Accepts both delta-seconds and HTTP-date forms.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    current = time.time() if now is None else now
+    return max(0.0, when.timestamp() - current)
+
+
+def compute_backoff(
+    attempt: int,
+    *,
+    base_delay: float,
+    retry_after: Optional[float] = None,
+    max_delay: float = 60.0,
+) -> float:
+    """
+    Compute the delay before retry ``attempt`` (0-based).
+
+    A server-provided ``Retry-After`` wins (capped at ``max_delay``); otherwise
+    exponential backoff with equal jitter so concurrent clients spread out.
+    """
+    if retry_after is not None:
+        return min(max_delay, max(0.0, retry_after))
+    cap = min(max_delay, max(0.0, base_delay) * (2 ** attempt))
+    half = cap / 2.0
+    return half + random.uniform(0.0, half)
+
+
+def iter_sse_events(lines: Iterator[str]) -> Iterator[str]:
+    """
+    Yield the ``data`` payload of each Server-Sent Event.
+
+    Multi-line ``data:`` fields are joined with newlines; comments and other
+    fields (``event:``, ``id:``, ``retry:``) are ignored.
+    """
+    data_lines: List[str] = []
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if not line:
+            if data_lines:
+                yield "\n".join(data_lines)
+                data_lines = []
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            data_lines.append(value)
+    if data_lines:
+        yield "\n".join(data_lines)
+
+
+def _decode_event(payload: str) -> Any:
+    try:
+        return json.loads(payload)
+    except (json.JSONDecodeError, ValueError):
+        return payload
+
+
+class HTTPTransport(ABC):
+    """
+    Abstract HTTP transport used by APIEngine.
+
+    A transport performs a single attempt; retry policy lives in the engine.
+    Implementations raise TransportHTTPError for non-2xx responses and
+    TransportError for network failures.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+        timeout: float = 300,
+        on_event: Optional[Callable[[Any], None]] = None,
+    ) -> TransportResponse:
+        """Send a request and return the fully consumed response."""
+        ...
+
+    def close(self) -> None:
+        """Release any pooled resources."""
+        pass
+
+
+class UrllibTransport(HTTPTransport):
+    """
+    Transport backed by ``urllib.request``.
+
+    Opens a new connection per request and does not stream. Kept for
+    environments where a raw ``http.client`` connection is undesirable
+    (e.g. custom urllib handlers).
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+        timeout: float = 300,
+        on_event: Optional[Callable[[Any], None]] = None,
+    ) -> TransportResponse:
+        import urllib.error
+        import urllib.request
+
+        start = time.monotonic()
+        request = urllib.request.Request(url, data=body, headers=headers or {}, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                raw = response.read().decode("utf-8")
+                status = response.status
+        except urllib.error.HTTPError as e:
+            try:
+                error_body = e.read().decode("utf-8") if e.fp is not None else ""
+            except Exception:
+                error_body = ""
+            retry_after = None
+            try:
+                retry_after = parse_retry_after((e.headers or {}).get("Retry-After"))
+            except Exception:
+                pass
+            raise TransportHTTPError(e.code, str(e.reason), body=error_body, retry_after=retry_after) from e
+        except urllib.error.URLError as e:
+            raise TransportError(str(e.reason)) from e
+        return TransportResponse(
+            status_code=status,
+            headers={},
+            body=raw,
+            elapsed_seconds=time.monotonic() - start,
+        )
+
+
+_PoolKey = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class _Proxy:
+    host: str
+    port: int
+    headers: Dict[str, str]
+
+
+def _proxy_for(key: _PoolKey) -> Optional[_Proxy]:
+    """The proxy urllib would use for ``key``, honoring ``NO_PROXY``."""
+    scheme, host, _ = key
+    proxy_url = urllib.request.getproxies().get(scheme)
+    if not proxy_url or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy_url:
+        proxy_url = f"http://{proxy_url}"
+    parts = urlsplit(proxy_url)
+    if not parts.hostname:
+        return None
+    headers: Dict[str, str] = {}
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    return _Proxy(host=parts.hostname, port=parts.port or 8080, headers=headers)
+
+
+class PooledHTTPTransport(HTTPTransport):
+    """
+    Keep-alive ``http.client`` connection pool keyed by (scheme, host, port).
+
+    Idle connections are reused across requests so TLS setup is paid once per
+    connection instead of once per call. Streaming responses (SSE / NDJSON)
+    are parsed incrementally and each event is passed to ``on_event`` as it
+    arrives. Proxies are taken from the environment, as urllib does.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_host: int = 8,
+        idle_timeout_seconds: float = 60.0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        self._max_idle_per_host = max(1, max_idle_per_host)
+        self._idle_timeout = idle_timeout_seconds
+        self._ssl_context = ssl_context
+        self._lock = threading.Lock()
+        self._idle: Dict[_PoolKey, Deque[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._stats: Dict[str, int] = {"created": 0, "reused": 0, "discarded": 0}
+
+    # Pool management
+
+    @staticmethod
+    def _pool_key(url: str) -> Tuple[_PoolKey, str]:
+        parts = urlsplit(url)
+        scheme = (parts.scheme or "http").lower()
+        if scheme not in ("http", "https"):
+            raise TransportError(f"Unsupported URL scheme: {scheme}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return (scheme, host, port), path
+
+    def _new_connection(self, key: _PoolKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        with self._lock:
+            self._stats["created"] += 1
+        proxy = _proxy_for(key)
+        if scheme == "https":
+            context = self._ssl_context or ssl.create_default_context()
+            if proxy is None:
+                return http.client.HTTPSConnection(host, port, timeout=timeout, context=context)
+            conn = http.client.HTTPSConnection(proxy.host, proxy.port, timeout=timeout, context=context)
+            conn.set_tunnel(host, port, headers=proxy.headers)
+            return conn
+        if proxy is not None:
+            return http.client.HTTPConnection(proxy.host, proxy.port, timeout=timeout)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _acquire(self, key: _PoolKey, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                conn, released_at = idle.pop()
+                if now - released_at > self._idle_timeout:
+                    self._stats["discarded"] += 1
+                    conn.close()
+                    continue
+                self._stats["reused"] += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._new_connection(key, timeout), False
+
+    def _release(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) >= self._max_idle_per_host:
+                self._stats["discarded"] += 1
+                conn.close()
+                return
+            idle.append((conn, time.monotonic()))
+
+    def close(self) -> None:
+        with self._lock:
+            for idle in self._idle.values():
+                for conn, _ in idle:
+                    conn.close()
+            self._idle.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Connection counters (created / reused / discarded / idle)."""
+        with self._lock:
+            out = dict(self._stats)
+            out["idle"] = sum(len(v) for v in self._idle.values())
+        return out
+
+    # Request path
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+        timeout: float = 300,
+        on_event: Optional[Callable[[Any], None]] = None,
+    ) -> TransportResponse:
+        key, path = self._pool_key(url)
+        send_headers = dict(headers or {})
+        send_headers.setdefault("Connection", "keep-alive")
+        # Plain http goes through a proxy as an absolute-form request.
+        proxy = _proxy_for(key) if key[0] == "http" else None
+        if proxy is not None:
+            path = url
+            send_headers.update(proxy.headers)
+
+        # A reused keep-alive connection may have been closed by the server
+        # while idle; retry once on a fresh connection in that case.
+        for fresh_attempt in (False, True):
+            if fresh_attempt:
+                conn, reused = self._new_connection(key, timeout), False
+            else:
+                conn, reused = self._acquire(key, timeout)
+            start = time.monotonic()
+            try:
+                conn.request(method, path, body=body, headers=send_headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                conn.close()
+                if reused and not fresh_attempt:
+                    continue
+                raise TransportError(str(e) or e.__class__.__name__) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise TransportError(str(e) or e.__class__.__name__) from e
+
+            try:
+                result = self._consume(response, start, on_event)
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise TransportError(str(e) or e.__class__.__name__) from e
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+
+            if not 200 <= result.status_code < 300:
+                raise TransportHTTPError(
+                    result.status_code,
+                    response.reason or "",
+                    body=result.body,
+                    retry_after=parse_retry_after(result.headers.get("retry-after")),
+                )
+            return result
+        raise TransportError("connection closed")  # pragma: no cover
+
+    def _consume(
+        self,
+        response: http.client.HTTPResponse,
+        start: float,
+        on_event: Optional[Callable[[Any], None]],
+    ) -> TransportResponse:
+        headers = {k.lower(): v for k, v in response.getheaders()}
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        first_byte = time.monotonic() - start
+
+        if 200 <= response.status < 300 and content_type in STREAM_CONTENT_TYPES:
+            events: List[Any] = []
+            raw_lines: List[str] = []
+
+            def _lines() -> Iterator[str]:
+                while True:
+                    line = response.readline()
+                    if not line:
+                        return
+                    text = line.decode("utf-8", errors="replace")
+                    raw_lines.append(text)
+                    yield text
+
+            if content_type == "text/event-stream":
+                payloads: Iterator[str] = iter_sse_events(_lines())
+            else:
+                payloads = (ln.strip() for ln in _lines() if ln.strip())
+
+            for payload in payloads:
+                if payload == "[DONE]":
+                    break
+                event = _decode_event(payload)
+                events.append(event)
+                if on_event is not None:
+                    on_event(event)
+            # Drain anything after a [DONE] marker so the connection can be reused.
+            while response.read(_READ_CHUNK_SIZE):
+                pass
+            return TransportResponse(
+                status_code=response.status,
+                headers=headers,
+                body="".join(raw_lines),
+                events=events,
+                streamed=True,
+                elapsed_seconds=time.monotonic() - start,
+                first_byte_seconds=first_byte,
+            )
+
+        chunks: List[bytes] = []
+        while True:
+            chunk = response.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return TransportResponse(
+            status_code=response.status,
+            headers=headers,
+            body=b"".join(chunks).decode("utf-8", errors="replace"),
+            elapsed_seconds=time.monotonic() - start,
+            first_byte_seconds=first_byte,
+        )
+
+
+_default_transport: Optional[PooledHTTPTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> PooledHTTPTransport:
+    """Get the process-wide pooled transport shared by API engines."""
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = PooledHTTPTransport()
+        return _default_transport
@@ -5,7 +5,9 @@ Central registry for AI coding engines.
 Manages engine registration, lookup, and health checks.
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any, Dict, List, Optional
 import threading
 
 from devgodzilla.engines.interface import Engine, EngineMetadata, EngineKind, EngineRequest, EngineResult
@@ -19,6 +21,24 @@ class EngineNotFoundError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class EngineDescriptor:
+    """
+    Entry-point style reference to an engine class, resolved on first use.
+
+    ``target`` is ``"package.module:ClassName"``; the class is imported and
+    instantiated with ``kwargs`` the first time the engine is looked up.
+    """
+    id: str
+    target: str
+    kwargs: Dict[str, Any] = field(default_factory=dict, hash=False, compare=False)
+
+    def load(self) -> Engine:
+        module_name, _, attr = self.target.partition(":")
+        factory = getattr(import_module(module_name), attr)
+        return factory(**self.kwargs)
+
+
 class EngineRegistry:
     """
     Central registry for AI coding engines.
@@ -28,6 +48,7 @@ class EngineRegistry:
     - Default engine selection
     - Engine lookup by ID
     - Health checks
+    - Lazy registration (descriptors resolved on first lookup)
     
     Example:
         registry = EngineRegistry()
@@ -40,7 +61,9 @@ class EngineRegistry:
 
     def __init__(self) -> None:
         self._engines: Dict[str, Engine] = {}
+        self._pending: Dict[str, EngineDescriptor] = {}
         self._default_id: Optional[str] = None
+        self._resolve_lock = threading.RLock()
 
     def register(
         self,
@@ -59,9 +82,10 @@ class EngineRegistry:
         """
         engine_id = engine.metadata.id
         
-        if engine_id in self._engines and not replace:
+        if self.has(engine_id) and not replace:
             raise ValueError(f"Engine '{engine_id}' already registered")
         
+        self._pending.pop(engine_id, None)
         self._engines[engine_id] = engine
         
         if default or self._default_id is None:
@@ -77,12 +101,51 @@ class EngineRegistry:
             },
         )
 
+    def register_lazy(
+        self,
+        descriptor: EngineDescriptor,
+        *,
+        default: bool = False,
+        replace: bool = False,
+    ) -> None:
+        """
+        Register an engine by descriptor without importing it.
+
+        The engine module is imported and the engine constructed on the
+        first ``get``/``list_*`` call that needs it.
+        """
+        if self.has(descriptor.id) and not replace:
+            raise ValueError(f"Engine '{descriptor.id}' already registered")
+        self._engines.pop(descriptor.id, None)
+        self._pending[descriptor.id] = descriptor
+        if default or self._default_id is None:
+            self._default_id = descriptor.id
+
+    def _resolve(self, engine_id: str) -> Optional[Engine]:
+        engine = self._engines.get(engine_id)
+        if engine is not None:
+            return engine
+        with self._resolve_lock:
+            descriptor = self._pending.get(engine_id)
+            if descriptor is None:
+                return self._engines.get(engine_id)
+            engine = descriptor.load()
+            self._engines[engine_id] = engine
+            self._pending.pop(engine_id, None)
+            logger.info("engine_loaded", extra={"engine_id": engine_id, "target": descriptor.target})
+            return engine
+
+    def _resolve_all(self) -> None:
+        for engine_id in list(self._pending):
+            self._resolve(engine_id)
+
     def unregister(self, engine_id: str) -> None:
         """Remove an engine from the registry."""
-        if engine_id in self._engines:
-            del self._engines[engine_id]
+        if self.has(engine_id):
+            self._engines.pop(engine_id, None)
+            self._pending.pop(engine_id, None)
             if self._default_id == engine_id:
-                self._default_id = next(iter(self._engines), None)
+                self._default_id = next(iter(self.list_ids()), None)
 
     def get(self, engine_id: str) -> Engine:
         """
@@ -90,9 +153,10 @@ class EngineRegistry:
         
         Raises EngineNotFoundError if not found.
         """
-        if engine_id not in self._engines:
+        engine = self._resolve(engine_id)
+        if engine is None:
             raise EngineNotFoundError(f"Engine '{engine_id}' not registered")
-        return self._engines[engine_id]
+        return engine
 
     def get_or_default(self, engine_id: Optional[str] = None) -> Engine:
         """Get an engine by ID, or return the default engine."""
@@ -108,35 +172,45 @@ class EngineRegistry:
         """
         if not self._default_id:
             raise RuntimeError("No default engine configured")
-        return self._engines[self._default_id]
+        return self.get(self._default_id)
 
     def set_default(self, engine_id: str) -> None:
         """Set the default engine by ID."""
-        if engine_id not in self._engines:
+        if not self.has(engine_id):
             raise EngineNotFoundError(f"Engine '{engine_id}' not registered")
         self._default_id = engine_id
 
+    @property
+    def default_id(self) -> Optional[str]:
+        """ID of the default engine, without loading it."""
+        return self._default_id
+
     def list_all(self) -> List[Engine]:
         """List all registered engines."""
+        self._resolve_all()
         return list(self._engines.values())
 
     def list_ids(self) -> List[str]:
-        """List all registered engine IDs."""
-        return list(self._engines.keys())
+        """List all registered engine IDs (does not load lazy engines)."""
+        return list(self._engines.keys()) + [i for i in self._pending if i not in self._engines]
 
     def list_by_kind(self, kind: EngineKind) -> List[Engine]:
         """List engines of a specific kind."""
-        return [e for e in self._engines.values() if e.metadata.kind == kind]
+        return [e for e in self.list_all() if e.metadata.kind == kind]
 
     def has(self, engine_id: str) -> bool:
         """Check if an engine is registered."""
+        return engine_id in self._engines or engine_id in self._pending
+
+    def is_loaded(self, engine_id: str) -> bool:
+        """Whether the engine has been imported and constructed."""
         return engine_id in self._engines
 
     def check_all_available(self) -> Dict[str, bool]:
         """Check availability of all engines."""
         return {
-            engine_id: engine.check_availability()
-            for engine_id, engine in self._engines.items()
+            engine.metadata.id: engine.check_availability()
+            for engine in self.list_all()
         }
 
     def get_metadata(self, engine_id: str) -> EngineMetadata:
@@ -145,7 +219,7 @@ class EngineRegistry:
 
     def list_metadata(self) -> List[EngineMetadata]:
         """List metadata for all engines."""
-        return [e.metadata for e in self._engines.values()]
+        return [e.metadata for e in self.list_all()]
 
 class PlaceholderEngine(Engine):
     """Placeholder engine for agents loaded from config."""
@@ -5,15 +5,20 @@ Utilities for sandboxed execution of AI coding engines.
 Provides security isolation for step execution.
 """
 
+import atexit
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+import uuid
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from devgodzilla.errors import SandboxError
 from devgodzilla.logging import get_logger
 
 logger = get_logger(__name__)
@@ -185,6 +190,11 @@ class SandboxRunner:
         **kwargs,
     ) -> subprocess.CompletedProcess:
         """Run command in nsjail sandbox."""
+        nsjail_cmd = self._nsjail_command(cmd, kwargs.get("cwd") or Path.cwd())
+        return self._run_unsandboxed(nsjail_cmd, **kwargs)
+
+    def _nsjail_command(self, cmd: List[str], cwd: Path) -> List[str]:
+        """The nsjail argv that runs ``cmd`` in a one-shot jail."""
         nsjail_cmd = [
             self.config.nsjail_path,
             "--mode", "once",
@@ -199,7 +209,6 @@ class SandboxRunner:
             nsjail_cmd.extend(["-R", str(path)])
         
         # Add read-write binds
-        cwd = kwargs.get("cwd") or Path.cwd()
         nsjail_cmd.extend(["-B", str(cwd)])
         for path in self.config.read_write_paths:
             nsjail_cmd.extend(["-B", str(path)])
@@ -214,8 +223,7 @@ class SandboxRunner:
         # Add the actual command
         nsjail_cmd.append("--")
         nsjail_cmd.extend(cmd)
-        
-        return self._run_unsandboxed(nsjail_cmd, **kwargs)
+        return nsjail_cmd
 
     def _run_firejail(
         self,
@@ -224,21 +232,25 @@ class SandboxRunner:
     ) -> subprocess.CompletedProcess:
         """Run command in firejail sandbox."""
         firejail_cmd = ["firejail", "--quiet"]
+        firejail_cmd.extend(self._firejail_options())
         
+        # Add the actual command
+        firejail_cmd.extend(cmd)
+        
+        return self._run_unsandboxed(firejail_cmd, **kwargs)
+
+    def _firejail_options(self) -> List[str]:
+        """Resource limits, network and extra args for ``firejail``."""
         # Resource limits
-        firejail_cmd.extend(["--rlimit-as", str(self.config.max_memory_mb * 1024 * 1024)])
+        options = ["--rlimit-as", str(self.config.max_memory_mb * 1024 * 1024)]
         
         # Network
         if not self.config.allow_network:
-            firejail_cmd.append("--net=none")
+            options.append("--net=none")
         
         # Add extra args
-        firejail_cmd.extend(self.config.extra_args)
-        
-        # Add the actual command
-        firejail_cmd.extend(cmd)
-        
-        return self._run_unsandboxed(firejail_cmd, **kwargs)
+        options.extend(self.config.extra_args)
+        return options
 
     def _run_docker(
         self,
@@ -246,36 +258,40 @@ class SandboxRunner:
         **kwargs,
     ) -> subprocess.CompletedProcess:
         """Run command in docker container."""
-        docker_cmd = [
-            "docker", "run", "--rm",
+        docker_cmd = ["docker", "run", "--rm"]
+        docker_cmd.extend(self._docker_options(kwargs.get("cwd") or Path.cwd()))
+        
+        # Add image and command
+        docker_cmd.append(self.config.docker_image)
+        docker_cmd.extend(cmd)
+        
+        return self._run_unsandboxed(docker_cmd, **kwargs)
+
+    def _docker_options(self, cwd: Path) -> List[str]:
+        """Resource limits, network and mounts for ``docker run``."""
+        options = [
             "--memory", f"{self.config.max_memory_mb}m",
             "--cpus", "1",
         ]
         
         # Network
         if not self.config.allow_network:
-            docker_cmd.append("--network=none")
+            options.append("--network=none")
         
         # Mount working directory
-        cwd = kwargs.get("cwd") or Path.cwd()
-        docker_cmd.extend(["-v", f"{cwd}:/workspace", "-w", "/workspace"])
+        options.extend(["-v", f"{cwd}:/workspace", "-w", "/workspace"])
         
         # Mount read-write paths
         for path in self.config.read_write_paths:
-            docker_cmd.extend(["-v", f"{path}:{path}"])
+            options.extend(["-v", f"{path}:{path}"])
         
         # Mount read-only paths
         for path in self.config.read_only_paths:
-            docker_cmd.extend(["-v", f"{path}:{path}:ro"])
+            options.extend(["-v", f"{path}:{path}:ro"])
         
         # Add extra args
-        docker_cmd.extend(self.config.extra_args)
-        
-        # Add image and command
-        docker_cmd.append(self.config.docker_image)
-        docker_cmd.extend(cmd)
-        
-        return self._run_unsandboxed(docker_cmd, **kwargs)
+        options.extend(self.config.extra_args)
+        return options
 
 
 def create_sandbox_runner(
@@ -301,3 +317,451 @@ def create_sandbox_runner(
         allow_network=allow_network,
     )
     return SandboxRunner(config)
+
+
+# =============================================================================
+# Sessions
+# =============================================================================
+
+class SandboxSession:
+    """
+    One sandbox kept up for a series of commands.
+
+    ``SandboxRunner`` pays full container/jail startup for every command. A
+    session starts the sandbox once (per step or per worktree) and runs each
+    command inside it, under the same resource limits, until it is closed:
+
+    - docker: a detached ``sleep infinity`` container; commands run through
+      ``docker exec``. On close the container goes back to the pool's idle
+      list for its worktree, or is removed.
+    - firejail: a named jail holding ``sleep infinity``; commands run through
+      ``firejail --join``. Shut down on close.
+    - nsjail: nsjail cannot attach to a running jail, so each command still
+      runs in its own ``--mode once`` jail.
+    - none: commands run directly.
+
+    Example:
+        with create_sandbox_session(worktree) as session:
+            status = session.run(["git", "status", "--porcelain=v1"])
+            diff = session.run(["git", "diff"])
+    """
+
+    def __init__(
+        self,
+        config: SandboxConfig,
+        workspace_dir: Path,
+        *,
+        pool: Optional["SandboxSessionPool"] = None,
+    ) -> None:
+        self.config = config
+        self.workspace_dir = Path(workspace_dir).resolve()
+        self.pool = pool
+        self.started = False
+        self.warm = False
+        self.startup_seconds = 0.0
+        self.commands_run = 0
+        self._runner = SandboxRunner(config)
+        self._container_id: Optional[str] = None
+        self._jail_name: Optional[str] = None
+        self._jail_process: Optional[subprocess.Popen] = None
+        self._reusable = True
+
+    @property
+    def backend(self) -> SandboxType:
+        return self.config.sandbox_type
+
+    def __enter__(self) -> "SandboxSession":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def start(self) -> "SandboxSession":
+        """Start the sandbox (or take a warm one from the pool)."""
+        if self.started:
+            return self
+        started = time.perf_counter()
+        if self.backend == SandboxType.DOCKER:
+            container_id = self.pool.acquire(self.pool_key) if self.pool else None
+            self.warm = container_id is not None
+            self._container_id = container_id or self._start_container()
+        elif self.backend == SandboxType.FIREJAIL:
+            self._start_jail()
+        self.startup_seconds = time.perf_counter() - started
+        self.started = True
+        if self.pool:
+            self.pool.record_start(self.backend, self.startup_seconds, warm=self.warm)
+        logger.info(
+            "sandbox_session_started",
+            extra={
+                "backend": self.backend.value,
+                "workspace": str(self.workspace_dir),
+                "warm": self.warm,
+                "startup_ms": round(self.startup_seconds * 1000, 1),
+            },
+        )
+        return self
+
+    def run(
+        self,
+        cmd: List[str],
+        *,
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+        input_text: Optional[str] = None,
+        timeout: Optional[int] = None,
+        capture_output: bool = True,
+    ) -> subprocess.CompletedProcess:
+        """Run a command inside the session; same contract as ``SandboxRunner.run``."""
+        argv, host_cwd, proc_env = self._command(cmd, cwd=cwd, env=env, interactive=input_text is not None)
+        return self._run_guarded(
+            argv, cwd=host_cwd, env=proc_env, input_text=input_text,
+            timeout=timeout, capture_output=capture_output,
+        )
+
+    def popen(
+        self,
+        cmd: List[str],
+        *,
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+        **popen_kwargs: Any,
+    ) -> subprocess.Popen:
+        """Start a command inside the session without waiting, e.g. to stream its output."""
+        argv, host_cwd, proc_env = self._command(
+            cmd, cwd=cwd, env=env, interactive=popen_kwargs.get("stdin") is not None,
+        )
+        full_env = os.environ.copy()
+        full_env.update(proc_env or {})
+        return subprocess.Popen(argv, cwd=host_cwd, env=full_env, **popen_kwargs)  # noqa: S603
+
+    def _command(
+        self,
+        cmd: List[str],
+        *,
+        cwd: Optional[Path],
+        env: Optional[Dict[str, str]],
+        interactive: bool,
+    ) -> Tuple[List[str], Optional[Path], Optional[Dict[str, str]]]:
+        """The host argv, host cwd and extra environment that run ``cmd`` in the session."""
+        self.start()
+        self.commands_run += 1
+        host_cwd = Path(cwd) if cwd else self.workspace_dir
+        if self.backend == SandboxType.DOCKER:
+            exec_cmd = ["docker", "exec"]
+            if interactive:
+                exec_cmd.append("-i")
+            exec_cmd.extend(["-w", self._container_path(cwd)])
+            for key, value in (env or {}).items():
+                exec_cmd.extend(["-e", f"{key}={value}"])
+            exec_cmd.append(self._container_id or "")
+            exec_cmd.extend(cmd)
+            return exec_cmd, None, None
+        if self.backend == SandboxType.FIREJAIL:
+            return ["firejail", "--quiet", f"--join={self._jail_name}", *cmd], host_cwd, env
+        if self.backend == SandboxType.NSJAIL:
+            return self._runner._nsjail_command(cmd, host_cwd), host_cwd, env
+        return list(cmd), host_cwd, env
+
+    def close(self) -> None:
+        """Tear the session down, returning a healthy Docker container to the pool."""
+        if not self.started:
+            return
+        self.started = False
+        if self._container_id:
+            container_id, self._container_id = self._container_id, None
+            if self.pool and self._reusable:
+                self.pool.release(self.pool_key, container_id)
+            else:
+                _remove_container(container_id)
+        if self._jail_name:
+            _run_quiet(["firejail", "--quiet", f"--shutdown={self._jail_name}"])
+            self._jail_name = None
+        if self._jail_process is not None:
+            self._jail_process.terminate()
+            try:
+                self._jail_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._jail_process.kill()
+            self._jail_process = None
+        logger.info(
+            "sandbox_session_closed",
+            extra={
+                "backend": self.backend.value,
+                "workspace": str(self.workspace_dir),
+                "commands": self.commands_run,
+            },
+        )
+
+    @property
+    def pool_key(self) -> Tuple[Any, ...]:
+        """Sessions with equal keys can share a warm container."""
+        config = self.config
+        return (
+            config.docker_image,
+            config.max_memory_mb,
+            config.allow_network,
+            str(self.workspace_dir),
+            tuple(str(p) for p in config.read_write_paths),
+            tuple(str(p) for p in config.read_only_paths),
+            tuple(config.extra_args),
+        )
+
+    def _run_guarded(self, cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        try:
+            return self._runner._run_unsandboxed(cmd, **kwargs)
+        except subprocess.TimeoutExpired:
+            # The command may still be running inside the sandbox.
+            self._reusable = False
+            raise
+
+    def _start_container(self) -> str:
+        docker_cmd = ["docker", "run", "-d", "--rm", "--label", "devgodzilla.sandbox=session"]
+        docker_cmd.extend(self._runner._docker_options(self.workspace_dir))
+        docker_cmd.extend([self.config.docker_image, "sleep", "infinity"])
+        proc = self._runner._run_unsandboxed(docker_cmd, timeout=120, capture_output=True)
+        container_id = (proc.stdout or "").strip()
+        if proc.returncode != 0 or not container_id:
+            raise SandboxError(
+                "Failed to start sandbox container",
+                metadata={"stderr": (proc.stderr or "").strip()[-2000:]},
+            )
+        return container_id
+
+    def _start_jail(self) -> None:
+        name = f"devgodzilla-{uuid.uuid4().hex[:12]}"
+        jail_cmd = ["firejail", "--quiet", f"--name={name}"]
+        jail_cmd.extend(self._runner._firejail_options())
+        jail_cmd.extend(["sleep", "infinity"])
+        self._jail_process = subprocess.Popen(  # noqa: S603
+            jail_cmd,
+            cwd=self.workspace_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self._jail_name = name
+        deadline = time.monotonic() + _JAIL_READY_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if self._jail_process.poll() is not None:
+                break
+            if _run_quiet(["firejail", "--quiet", f"--join={name}", "true"]):
+                return
+            time.sleep(0.05)
+        self.started = True
+        self.close()
+        raise SandboxError("Firejail sandbox did not become ready", metadata={"name": name})
+
+    def _container_path(self, cwd: Optional[Path]) -> str:
+        if cwd is None:
+            return "/workspace"
+        path = Path(cwd).resolve()
+        try:
+            relative = path.relative_to(self.workspace_dir)
+        except ValueError:
+            mounted = [Path(p).resolve() for p in (*self.config.read_write_paths, *self.config.read_only_paths)]
+            if any(path == root or root in path.parents for root in mounted):
+                return str(path)
+            return "/workspace"
+        return "/workspace" if relative == Path(".") else f"/workspace/{relative.as_posix()}"
+
+
+_JAIL_READY_TIMEOUT_SECONDS = 5.0
+
+
+def _run_quiet(cmd: List[str]) -> bool:
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=30)  # noqa: S603
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return proc.returncode == 0
+
+
+def _remove_container(container_id: str) -> None:
+    if not _run_quiet(["docker", "rm", "-f", container_id]):
+        logger.warning("sandbox_container_remove_failed", extra={"container_id": container_id})
+
+
+class SandboxSessionPool:
+    """
+    Process-wide bookkeeping for sandbox sessions.
+
+    Keeps up to ``max_idle`` idle Docker containers per pool key (image,
+    limits, mounts and worktree) for ``idle_ttl_seconds``, so the next step on
+    the same worktree skips container startup, and records session startup
+    latency per backend.
+    """
+
+    def __init__(self, *, max_idle: int = 2, idle_ttl_seconds: float = 300.0) -> None:
+        self.max_idle = max_idle
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._idle: Dict[Tuple[Any, ...], List[Tuple[str, float]]] = {}
+        self._latency: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Tuple[Any, ...]) -> Optional[str]:
+        """Take a live idle container for ``key``, if there is one."""
+        while True:
+            container_id = self._pop_idle(key)
+            if container_id is None:
+                return None
+            if _container_running(container_id):
+                return container_id
+            # Dead or stopped; the others for this key stay parked.
+            self._count("discarded")
+            _remove_container(container_id)
+
+    def release(self, key: Tuple[Any, ...], container_id: str) -> None:
+        """Park ``container_id`` for reuse, or remove it when the key is full."""
+        expired = self._reap()
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            keep = len(idle) < self.max_idle
+            if keep:
+                idle.append((container_id, time.monotonic()))
+        if not keep:
+            expired.append(container_id)
+        for stale in expired:
+            _remove_container(stale)
+
+    def prewarm(self, config: SandboxConfig, workspace_dir: Path) -> None:
+        """Start a Docker session for ``workspace_dir`` and park it idle."""
+        if config.sandbox_type != SandboxType.DOCKER:
+            return
+        SandboxSession(config, workspace_dir, pool=self).start().close()
+
+    def record_start(self, backend: SandboxType, seconds: float, *, warm: bool) -> None:
+        millis = seconds * 1000.0
+        with self._lock:
+            entry = self._latency.setdefault(
+                backend.value,
+                {"sessions": 0, "warm": 0, "discarded": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0},
+            )
+            entry["sessions"] += 1
+            entry["warm"] += 1 if warm else 0
+            entry["total_ms"] += millis
+            entry["max_ms"] = max(entry["max_ms"], millis)
+            entry["last_ms"] = millis
+
+    def stats(self) -> Dict[str, Any]:
+        """Startup latency per backend and the idle container count."""
+        with self._lock:
+            backends = {
+                name: {
+                    "sessions": int(entry["sessions"]),
+                    "warm": int(entry["warm"]),
+                    "discarded": int(entry["discarded"]),
+                    "avg_startup_ms": round(entry["total_ms"] / entry["sessions"], 3) if entry["sessions"] else 0.0,
+                    "max_startup_ms": round(entry["max_ms"], 3),
+                    "last_startup_ms": round(entry["last_ms"], 3),
+                }
+                for name, entry in self._latency.items()
+            }
+            idle = sum(len(items) for items in self._idle.values())
+        return {"idle_containers": idle, "backends": backends}
+
+    def close_all(self) -> None:
+        """Remove every idle container."""
+        with self._lock:
+            containers = [cid for items in self._idle.values() for cid, _ in items]
+            self._idle.clear()
+        for container_id in containers:
+            _remove_container(container_id)
+
+    def _pop_idle(self, key: Tuple[Any, ...]) -> Optional[str]:
+        """Take the most recently parked container for ``key``, if any."""
+        expired = self._reap()
+        for stale in expired:
+            _remove_container(stale)
+        with self._lock:
+            idle = self._idle.get(key)
+            if not idle:
+                return None
+            container_id, _ = idle.pop()
+            if not idle:
+                del self._idle[key]
+        return container_id
+
+    def _reap(self) -> List[str]:
+        cutoff = time.monotonic() - self.idle_ttl_seconds
+        expired: List[str] = []
+        with self._lock:
+            for key in list(self._idle):
+                live = [(cid, parked) for cid, parked in self._idle[key] if parked >= cutoff]
+                expired.extend(cid for cid, parked in self._idle[key] if parked < cutoff)
+                if live:
+                    self._idle[key] = live
+                else:
+                    del self._idle[key]
+        return expired
+
+    def _count(self, field_name: str) -> None:
+        with self._lock:
+            entry = self._latency.setdefault(
+                SandboxType.DOCKER.value,
+                {"sessions": 0, "warm": 0, "discarded": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0},
+            )
+            entry[field_name] += 1
+
+
+def _container_running(container_id: str) -> bool:
+    try:
+        proc = subprocess.run(  # noqa: S603
+            ["docker", "inspect", "-f", "{{.State.Running}}", container_id],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return proc.returncode == 0 and proc.stdout.strip() == "true"
+
+
+_pool: Optional[SandboxSessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool() -> SandboxSessionPool:
+    """
+    Get the process-wide session pool.
+
+    Sized by ``DEVGODZILLA_SANDBOX_POOL_SIZE`` (idle containers per worktree,
+    default 2, 0 disables reuse) and ``DEVGODZILLA_SANDBOX_POOL_TTL`` (seconds
+    an idle container is kept, default 300).
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SandboxSessionPool(
+                    max_idle=_env_int("DEVGODZILLA_SANDBOX_POOL_SIZE", 2),
+                    idle_ttl_seconds=float(_env_int("DEVGODZILLA_SANDBOX_POOL_TTL", 300)),
+                )
+                atexit.register(_pool.close_all)
+    return _pool
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def create_sandbox_session(
+    workspace_dir: Path,
+    *,
+    sandbox_type: Optional[SandboxType] = None,
+    allow_network: bool = False,
+    pool: Optional[SandboxSessionPool] = None,
+) -> SandboxSession:
+    """
+    Create a sandbox session with the same defaults as ``create_sandbox_runner``.
+
+    The session is not started until it is entered or first used.
+    """
+    config = SandboxConfig(
+        sandbox_type=sandbox_type or get_default_sandbox_type(),
+        read_write_paths=[workspace_dir],
+        allow_network=allow_network,
+    )
+    return SandboxSession(config, workspace_dir, pool=pool or get_sandbox_pool())
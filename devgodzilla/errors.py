@@ -88,6 +88,12 @@ class GeminiCliError(EngineError):
     category = "gemini_cli"
 
 
+class SandboxError(EngineError):
+    """Raised when a sandbox session cannot be started."""
+
+    category = "sandbox"
+
+
 class EngineNotFoundError(EngineError):
     """Raised when a requested engine is not registered."""
 
@@ -65,7 +65,7 @@ class JobRunStatus:
 
 # Core Domain Models
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A project represents a codebase being managed by DevGodzilla."""
     id: int
@@ -93,7 +93,7 @@ class Project:
     constitution_hash: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProtocolRun:
     """
     A protocol run represents a single execution of a development protocol.
@@ -122,7 +122,7 @@ class ProtocolRun:
     speckit_metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeckitSpec:
     """Persisted SpecKit spec metadata."""
     id: int
@@ -147,7 +147,7 @@ class SpeckitSpec:
     constitution_hash: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecRun:
     """Represents a single SpecKit run with worktree and artifact tracking."""
     id: int
@@ -171,7 +171,48 @@ class SpecRun:
     protocol_run_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class SpecCatalogEntry:
+    """
+    Materialized row of the cross-project specification catalog.
+
+    Kept current by spec run writes and the filesystem reconciler; task
+    counts are aggregated from tasks labelled ``spec:<slug>``.
+    """
+    id: int
+    project_id: int
+    spec_key: str
+    slug: str
+    name: str
+    title: str
+    path: str
+    status: Optional[str]
+    project_name: Optional[str] = None
+    spec_run_id: Optional[int] = None
+    spec_path: Optional[str] = None
+    plan_path: Optional[str] = None
+    tasks_path: Optional[str] = None
+    checklist_path: Optional[str] = None
+    analysis_path: Optional[str] = None
+    implement_path: Optional[str] = None
+    has_spec: bool = False
+    has_plan: bool = False
+    has_tasks: bool = False
+    worktree_path: Optional[str] = None
+    branch_name: Optional[str] = None
+    base_branch: Optional[str] = None
+    feature_name: Optional[str] = None
+    spec_number: Optional[int] = None
+    spec_created_at: Optional[str] = None
+    linked_tasks: int = 0
+    completed_tasks: int = 0
+    story_points: int = 0
+    sprint_id: Optional[int] = None
+    sprint_name: Optional[str] = None
+    updated_at: Optional[str] = None
+
+
+@dataclass(slots=True)
 class StepRun:
     """
     A step represents a single task within a protocol run.
@@ -201,7 +242,7 @@ class StepRun:
     priority: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class QAResultRecord:
     """Persisted QA result for a step."""
     id: int
@@ -223,7 +264,7 @@ class QAResultRecord:
     updated_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """An event represents a significant occurrence during protocol execution."""
     id: int
@@ -240,7 +281,7 @@ class Event:
     project_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRun:
     """
     A job run represents a single Windmill job execution.
@@ -276,7 +317,7 @@ class JobRun:
 CodexRun = JobRun
 
 
-@dataclass
+@dataclass(slots=True)
 class RunArtifact:
     """An artifact produced by a job run (logs, outputs, diffs)."""
     id: int
@@ -289,7 +330,7 @@ class RunArtifact:
     bytes: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyPack:
     """A policy pack defines governance rules for projects."""
     id: int
@@ -303,7 +344,7 @@ class PolicyPack:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Clarification:
     """A clarification request for ambiguous requirements."""
     id: int
@@ -327,7 +368,7 @@ class Clarification:
 
 # New models for DevGodzilla
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackEvent:
     """
     Tracks QA feedback loop events for observability.
@@ -344,7 +385,7 @@ class FeedbackEvent:
     context: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Constitution:
     """
     Constitution file metadata for a project.
@@ -361,7 +402,7 @@ class Constitution:
     articles: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecKitSpec:
     """
     SpecKit specification tracking.
@@ -378,7 +419,7 @@ class SpecKitSpec:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """
     Agent configuration for a specific engine.
@@ -395,7 +436,7 @@ class AgentConfig:
     config: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Sprint:
     """An agile sprint for project management."""
     id: int
@@ -411,7 +452,7 @@ class Sprint:
     velocity_actual: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgileTask:
     """An agile task (story, bug, etc.) for tracking work."""
     id: int
@@ -6,8 +6,11 @@ Used for auditing and tracking which prompt versions were used in executions.
 """
 
 import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 
 def fingerprint_text(text: str, *, short: bool = True) -> str:
@@ -41,12 +44,10 @@ def fingerprint_file(path: Path, *, short: bool = True) -> str:
     Returns:
         Hash digest of the file contents, or 'missing' if file doesn't exist
     """
-    try:
-        data = path.read_bytes()
-    except FileNotFoundError:
+    cached = get_prompt_cache().read(path)
+    if cached is None:
         return "missing"
-    digest = hashlib.sha256(data).hexdigest()
-    return digest[:12] if short else digest
+    return cached.fingerprint[:12] if short else cached.fingerprint
 
 
 def prompt_version(prompt_path: Optional[Path]) -> str:
@@ -78,3 +79,149 @@ def content_hash(content: str) -> str:
         12-character SHA256 hash
     """
     return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+
+# =============================================================================
+# Prompt file cache
+# =============================================================================
+
+# Separator used between prompt sections (template, plan, task).
+PROMPT_SECTION_SEPARATOR = "\n\n---\n\n"
+
+
+@dataclass(frozen=True)
+class PromptFile:
+    """A prompt source file read through the cache."""
+
+    path: Path
+    text: str
+    fingerprint: str
+    size: int
+
+
+class PromptFileCache:
+    """
+    Process-wide cache of prompt sources and assembled prompt prefixes.
+
+    Files are keyed by resolved path and revalidated with a single stat
+    (mtime, size, inode); an unchanged file is neither re-read nor
+    re-hashed. Prefixes (e.g. template + plan) are keyed by the content
+    fingerprints of their parts, so every step of a protocol shares one
+    assembled string. Both tables are LRU-bounded, files by total bytes.
+    """
+
+    def __init__(self, *, max_bytes: int = 64 * 1024 * 1024, max_prefixes: int = 256) -> None:
+        self._max_bytes = max_bytes
+        self._max_prefixes = max_prefixes
+        self._files: "OrderedDict[str, Tuple[Tuple[int, int, int], PromptFile]]" = OrderedDict()
+        self._prefixes: "OrderedDict[Tuple[str, ...], str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._prefix_hits = 0
+        self._prefix_misses = 0
+
+    def read(self, path: Path) -> Optional[PromptFile]:
+        """Return the file's text and fingerprint, or None if it does not exist."""
+        path = Path(path)
+        try:
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        key = str(path.resolve(strict=False))
+
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None and entry[0] == signature:
+                self._files.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        cached = PromptFile(
+            path=path,
+            # The fingerprint covers the raw bytes; a stray non-UTF-8 byte
+            # must not fail fingerprinting or prompt assembly.
+            text=data.decode("utf-8", errors="replace"),
+            fingerprint=hashlib.sha256(data).hexdigest(),
+            size=len(data),
+        )
+
+        with self._lock:
+            previous = self._files.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1].size
+            if cached.size <= self._max_bytes:
+                self._files[key] = (signature, cached)
+                self._bytes += cached.size
+                while self._bytes > self._max_bytes and self._files:
+                    _, (_, evicted) = self._files.popitem(last=False)
+                    self._bytes -= evicted.size
+        return cached
+
+    def join_prefix(self, sections: Sequence[Tuple[str, str]]) -> str:
+        """
+        Join ``(fingerprint, text)`` sections with PROMPT_SECTION_SEPARATOR.
+
+        The joined string is cached by the sections' fingerprints so that
+        identical prefixes are assembled once and shared.
+        """
+        if not sections:
+            return ""
+        key = tuple(fp for fp, _ in sections)
+        with self._lock:
+            joined = self._prefixes.get(key)
+            if joined is not None:
+                self._prefixes.move_to_end(key)
+                self._prefix_hits += 1
+                return joined
+            self._prefix_misses += 1
+        joined = PROMPT_SECTION_SEPARATOR.join(text for _, text in sections)
+        with self._lock:
+            self._prefixes[key] = joined
+            while len(self._prefixes) > self._max_prefixes:
+                self._prefixes.popitem(last=False)
+        return joined
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+            self._prefixes.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "prefixes": len(self._prefixes),
+                "prefix_hits": self._prefix_hits,
+                "prefix_misses": self._prefix_misses,
+            }
+
+
+_prompt_cache: Optional[PromptFileCache] = None
+_prompt_cache_lock = threading.Lock()
+
+
+def get_prompt_cache() -> PromptFileCache:
+    """Get the process-wide prompt file cache."""
+    global _prompt_cache
+    if _prompt_cache is None:
+        with _prompt_cache_lock:
+            if _prompt_cache is None:
+                _prompt_cache = PromptFileCache()
+    return _prompt_cache
+
+
+def read_prompt_file(path: Path) -> Optional[PromptFile]:
+    """Read a prompt source through the shared cache (None if missing)."""
+    return get_prompt_cache().read(path)
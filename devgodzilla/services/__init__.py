@@ -50,6 +50,12 @@ if TYPE_CHECKING:
         StepReconciliation,
         ReconciliationAction,
     )
+    from devgodzilla.services.retention import (
+        ArchiveStore,
+        RetentionResult,
+        RetentionService,
+        RetentionWorker,
+    )
 
 __all__ = [
     # Base
@@ -118,6 +124,11 @@ __all__ = [
     "ProtocolReconciliation",
     "StepReconciliation",
     "ReconciliationAction",
+    # Retention
+    "ArchiveStore",
+    "RetentionResult",
+    "RetentionService",
+    "RetentionWorker",
 ]
 
 _EXPORTS = {
@@ -176,6 +187,11 @@ _EXPORTS = {
     "ProtocolReconciliation": "devgodzilla.services.reconciliation",
     "StepReconciliation": "devgodzilla.services.reconciliation",
     "ReconciliationAction": "devgodzilla.services.reconciliation",
+    # Retention
+    "ArchiveStore": "devgodzilla.services.retention",
+    "RetentionResult": "devgodzilla.services.retention",
+    "RetentionService": "devgodzilla.services.retention",
+    "RetentionWorker": "devgodzilla.services.retention",
 }
 
 
@@ -6,17 +6,24 @@ Provides runtime health checks and agent capability discovery.
 """
 
 import subprocess
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 try:
     import yaml
 except ImportError:  # pragma: no cover
     yaml = None  # type: ignore
 
+from devgodzilla.db.database import add_change_listener, db_identity
+from devgodzilla.logging import get_logger
 from devgodzilla.services.base import Service, ServiceContext
 
+logger = get_logger(__name__)
+
 
 @dataclass
 class AgentConfig:
@@ -58,6 +65,158 @@ class HealthCheckResult:
     response_time_ms: Optional[float] = None
 
 
+@dataclass(frozen=True)
+class AgentConfigSnapshot:
+    """
+    Immutable, parsed view of an agents.yaml file.
+    
+    Shared by every AgentConfigService in the process; the mappings must be
+    treated as read-only. ``signature`` is the file's (mtime_ns, size, inode)
+    at parse time and ``version`` increases on every reload.
+    """
+    path: str
+    signature: Tuple[int, int, int]
+    version: int
+    agents: Dict[str, AgentConfig]
+    defaults: Dict[str, Any]
+    health_config: Dict[str, Any]
+    prompts: Dict[str, Dict[str, Any]]
+    projects: Dict[str, Dict[str, Any]]
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class AgentConfigStore:
+    """
+    Process-wide store of agent config snapshots and per-project resolved views.
+    
+    Snapshots are re-parsed only when the file signature changes and are
+    swapped in atomically. Resolved views (agents, prompts, defaults,
+    assignments per project) are cached by snapshot version and database,
+    invalidated by DB change notifications for agent assignments/overrides,
+    and expire after ``view_ttl_seconds`` to bound staleness from writes made
+    by other processes.
+    """
+
+    def __init__(self, *, max_views: int = 1024, view_ttl_seconds: float = 30.0) -> None:
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, AgentConfigSnapshot] = {}
+        self._version = 0
+        self._views: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._max_views = max(1, max_views)
+        self._view_ttl = view_ttl_seconds
+        self._stats = {"reloads": 0, "view_hits": 0, "view_misses": 0, "invalidations": 0}
+
+    def snapshot(
+        self,
+        path: Path,
+        loader: Callable[[], Dict[str, Any]],
+        parse_agent: Callable[[str, Dict[str, Any]], AgentConfig],
+        *,
+        force: bool = False,
+    ) -> AgentConfigSnapshot:
+        """Return the current snapshot for ``path``, reloading if the file changed."""
+        key = str(path)
+        signature = _file_signature(path)
+        current = self._snapshots.get(key)
+        if current is not None and not force and signature is not None and current.signature == signature:
+            return current
+
+        data = loader()
+        # The loader may have created the file; re-stat so the signature matches.
+        signature = _file_signature(path) or (0, 0, 0)
+        agents: Dict[str, AgentConfig] = {}
+        for agent_id, agent_data in (data.get("agents") or {}).items():
+            if isinstance(agent_data, dict):
+                agents[agent_id] = parse_agent(agent_id, agent_data)
+
+        with self._lock:
+            self._version += 1
+            snapshot = AgentConfigSnapshot(
+                path=key,
+                signature=signature,
+                version=self._version,
+                agents=agents,
+                defaults=data.get("defaults", {}) or {},
+                health_config=data.get("health_check", {}) or {},
+                prompts=data.get("prompts", {}) or {},
+                projects=data.get("projects", {}) or {},
+            )
+            self._snapshots[key] = snapshot
+            self._stats["reloads"] += 1
+        logger.info(
+            "agent_config_loaded",
+            extra={"agent_count": len(agents), "path": key, "version": snapshot.version},
+        )
+        return snapshot
+
+    def view(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return a cached resolved view, computing it on miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._views.get(key)
+            if entry is not None and now - entry[0] <= self._view_ttl:
+                self._views.move_to_end(key)
+                self._stats["view_hits"] += 1
+                return entry[1]
+            self._stats["view_misses"] += 1
+        value = compute()
+        with self._lock:
+            self._views[key] = (now, value)
+            self._views.move_to_end(key)
+            while len(self._views) > self._max_views:
+                self._views.popitem(last=False)
+        return value
+
+    def invalidate_views(self, project_id: Optional[int | str] = None) -> None:
+        """
+        Drop cached views for a project; ``None`` drops all views (global
+        assignments are inherited by every project).
+        """
+        project_key = str(project_id) if project_id is not None else None
+        with self._lock:
+            if project_key is None:
+                self._views.clear()
+            else:
+                for key in [k for k in self._views if k[2] == project_key]:
+                    del self._views[key]
+            self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+            self._views.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._stats)
+            out["snapshots"] = len(self._snapshots)
+            out["views"] = len(self._views)
+            return out
+
+
+_agent_config_store = AgentConfigStore()
+
+
+def get_agent_config_store() -> AgentConfigStore:
+    """Get the process-wide agent config store."""
+    return _agent_config_store
+
+
+def _on_db_change(entity: str, keys: Dict[str, Any]) -> None:
+    if entity in ("agent_assignment", "agent_override"):
+        _agent_config_store.invalidate_views(keys.get("project_id"))
+
+
+add_change_listener(_on_db_change)
+
+
 class AgentConfigService(Service):
     """
     Manages agent configurations and health checks.
@@ -85,6 +244,7 @@ class AgentConfigService(Service):
         self._health_config: Dict[str, Any] = {}
         self._prompts: Dict[str, Dict[str, Any]] = {}
         self._projects: Dict[str, Dict[str, Any]] = {}
+        self._snapshot: Optional[AgentConfigSnapshot] = None
         self._loaded = False
 
     def _get_db(self):
@@ -117,11 +277,15 @@ class AgentConfigService(Service):
         return aliases.get(value)
     
     def load_config(self, force: bool = False) -> None:
-        """Load agent configuration from YAML file."""
-        if self._loaded and not force:
-            return
-
+        """
+        Load agent configuration from YAML file.
+        
+        Uses the process-wide snapshot, so the file is only parsed again when
+        its mtime/size changes (or ``force`` is set).
+        """
         if yaml is None:
+            if self._loaded and not force:
+                return
             # Minimal fallback when PyYAML isn't installed.
             self._agents = {
                 "codex": AgentConfig(id="codex", name="OpenAI Codex", kind="cli", enabled=True),
@@ -140,28 +304,26 @@ class AgentConfigService(Service):
             self._create_default_config(config_path)
 
         try:
-            data = self._load_raw_config()
-            self._agents = {}
-            for agent_id, agent_data in (data.get("agents") or {}).items():
-                if not isinstance(agent_data, dict):
-                    continue
-                self._agents[agent_id] = self._parse_agent(agent_id, agent_data)
-
-            self._defaults = data.get("defaults", {}) or {}
-            self._health_config = data.get("health_check", {}) or {}
-            self._prompts = data.get("prompts", {}) or {}
-            self._projects = data.get("projects", {}) or {}
-            self._loaded = True
-
-            self.logger.info(
-                "agent_config_loaded",
-                extra={"agent_count": len(self._agents), "path": str(config_path)},
+            snapshot = _agent_config_store.snapshot(
+                config_path,
+                self._load_raw_config,
+                self._parse_agent,
+                force=force,
             )
-
         except Exception as e:
             self.logger.error("agent_config_load_failed", extra={"error": str(e)})
             raise
 
+        if snapshot is self._snapshot:
+            return
+        self._snapshot = snapshot
+        self._agents = snapshot.agents
+        self._defaults = snapshot.defaults
+        self._health_config = snapshot.health_config
+        self._prompts = snapshot.prompts
+        self._projects = snapshot.projects
+        self._loaded = True
+
     def _load_raw_config(self) -> Dict[str, Any]:
         config_path = self._resolve_config_path()
         if not config_path.exists():
@@ -293,8 +455,23 @@ class AgentConfigService(Service):
         inherit = overrides.get("inherit", True)
         return bool(inherit) if inherit is not None else True
 
+    def _view_key(self, kind: str, project_id: Optional[int | str], *, uses_db: bool) -> Hashable:
+        db_key = None
+        if uses_db:
+            try:
+                db_key = db_identity(self._get_db())
+            except Exception:
+                db_key = None
+        version = self._snapshot.version if self._snapshot is not None else 0
+        return (kind, version, self._project_key(project_id), db_key)
+
     def _resolve_agents_map(self, project_id: Optional[int | str]) -> Dict[str, AgentConfig]:
         self.load_config()
+        key = self._view_key("agents", project_id, uses_db=project_id is not None)
+        view = _agent_config_store.view(key, lambda: self._compute_agents_map(project_id))
+        return {agent_id: replace(agent) for agent_id, agent in view.items()}
+
+    def _compute_agents_map(self, project_id: Optional[int | str]) -> Dict[str, AgentConfig]:
         resolved: Dict[str, AgentConfig] = {}
         for agent_id, agent in self._agents.items():
             resolved[agent_id] = replace(agent)
@@ -310,6 +487,11 @@ class AgentConfigService(Service):
 
     def _resolve_prompts_map(self, project_id: Optional[int | str]) -> Dict[str, Dict[str, Any]]:
         self.load_config()
+        key = self._view_key("prompts", project_id, uses_db=False)
+        view = _agent_config_store.view(key, lambda: self._compute_prompts_map(project_id))
+        return {prompt_id: dict(meta) for prompt_id, meta in view.items()}
+
+    def _compute_prompts_map(self, project_id: Optional[int | str]) -> Dict[str, Dict[str, Any]]:
         overrides = self._get_project_overrides(project_id)
         inherit = self._inherit_project(overrides)
         resolved: Dict[str, Dict[str, Any]] = {}
@@ -329,6 +511,10 @@ class AgentConfigService(Service):
 
     def _resolve_defaults(self, project_id: Optional[int | str]) -> Dict[str, Any]:
         self.load_config()
+        key = self._view_key("defaults", project_id, uses_db=False)
+        return dict(_agent_config_store.view(key, lambda: self._compute_defaults(project_id)))
+
+    def _compute_defaults(self, project_id: Optional[int | str]) -> Dict[str, Any]:
         overrides = self._get_project_overrides(project_id)
         inherit = self._inherit_project(overrides)
         defaults = dict(self._defaults or {})
@@ -340,6 +526,11 @@ class AgentConfigService(Service):
         return defaults
 
     def _resolve_assignments(self, project_id: Optional[int | str]) -> Dict[str, Dict[str, Any]]:
+        key = self._view_key("assignments", project_id, uses_db=True)
+        view = _agent_config_store.view(key, lambda: self._compute_assignments(project_id))
+        return {process_key: dict(value) for process_key, value in view.items()}
+
+    def _compute_assignments(self, project_id: Optional[int | str]) -> Dict[str, Dict[str, Any]]:
         try:
             db = self._get_db()
             project_value = int(project_id) if project_id is not None else None
@@ -0,0 +1,324 @@
+"""
+DevGodzilla Change Capture
+
+Records a step's workspace changes as execution artifacts in three git
+invocations, streamed straight to disk:
+
+- ``git status --porcelain=v2 -z``: staged/unstaged state and untracked files
+- ``git diff --numstat -p -z``: unstaged line counts, then the unstaged patch
+- ``git diff --cached --numstat -p -z``: the same for the index
+
+Patches are never held in memory; each is written as it arrives and cut off
+at ``max_diff_bytes`` (the git process is stopped once the cap is hit). Git
+already elides binary contents from patches, and numstat reports them as
+``-``, so binary files are flagged in the changed-files list instead.
+
+Artifacts: ``git-status.txt`` (porcelain v1 lines), ``changes.diff``,
+``changes_cached.diff`` and ``changed-files.json``.
+"""
+
+from __future__ import annotations
+
+import functools
+import subprocess
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from devgodzilla.engines.artifacts import ArtifactWriter
+from devgodzilla.errors import GitCommandError
+
+# Called as spawn(cmd, stdout=..., stderr=...); returns the started process.
+Spawner = Callable[..., subprocess.Popen]
+
+DEFAULT_MAX_DIFF_BYTES = 5 * 1024 * 1024
+_CHUNK_BYTES = 64 * 1024
+
+STATUS_COMMAND = ["git", "status", "--porcelain=v2", "-z"]
+UNSTAGED_DIFF_COMMAND = ["git", "diff", "--numstat", "-p", "-z"]
+STAGED_DIFF_COMMAND = ["git", "diff", "--cached", "--numstat", "-p", "-z"]
+
+
+@dataclass
+class LineCounts:
+    """Numstat for one side of a change; None counts mean a binary file."""
+    added: Optional[int] = None
+    deleted: Optional[int] = None
+
+    @property
+    def binary(self) -> bool:
+        return self.added is None
+
+
+@dataclass
+class ChangedFile:
+    """One path from ``git status``, with its staged and unstaged line counts."""
+    path: str
+    index_status: str = " "
+    worktree_status: str = " "
+    old_path: Optional[str] = None
+    untracked: bool = False
+    staged: Optional[LineCounts] = None
+    unstaged: Optional[LineCounts] = None
+
+    @property
+    def binary(self) -> bool:
+        return any(counts is not None and counts.binary for counts in (self.staged, self.unstaged))
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["binary"] = self.binary
+        return data
+
+    def status_line(self) -> str:
+        """The ``git status --porcelain=v1`` line for this path."""
+        if self.untracked:
+            return f"?? {self.path}"
+        code = f"{self.index_status}{self.worktree_status}"
+        if self.old_path:
+            return f"{code} {self.old_path} -> {self.path}"
+        return f"{code} {self.path}"
+
+
+@dataclass
+class ChangeCapture:
+    """Result of :func:`capture_changes`."""
+    files: List[ChangedFile] = field(default_factory=list)
+    artifacts: Dict[str, Path] = field(default_factory=dict)
+    truncated: Dict[str, bool] = field(default_factory=dict)
+
+    def totals(self) -> Dict[str, int]:
+        added = deleted = 0
+        for changed in self.files:
+            for counts in (changed.staged, changed.unstaged):
+                if counts is not None and not counts.binary:
+                    added += counts.added or 0
+                    deleted += counts.deleted or 0
+        return {
+            "files": len(self.files),
+            "insertions": added,
+            "deletions": deleted,
+            "binary": sum(1 for f in self.files if f.binary),
+            "untracked": sum(1 for f in self.files if f.untracked),
+        }
+
+    def summary(self, *, max_files: int = 500) -> Dict[str, Any]:
+        """Compact form for ``StepRun.runtime_state["changes"]``."""
+        return {
+            **self.totals(),
+            "truncated": any(self.truncated.values()),
+            "changed_files": [f.to_dict() for f in self.files[:max_files]],
+            "changed_files_complete": len(self.files) <= max_files,
+        }
+
+
+def capture_changes(
+    repo_root: Path,
+    writer: ArtifactWriter,
+    *,
+    spawn: Optional[Spawner] = None,
+    max_diff_bytes: int = DEFAULT_MAX_DIFF_BYTES,
+    timeout: float = 30.0,
+) -> ChangeCapture:
+    """
+    Capture status, numstat and both diffs of ``repo_root`` into ``writer``.
+
+    Args:
+        repo_root: Git worktree to inspect
+        writer: Artifact writer for the step
+        spawn: Starts a command, e.g. ``functools.partial(session.popen,
+            cwd=repo_root)``; defaults to a local subprocess in ``repo_root``
+        max_diff_bytes: Cap per diff artifact (0 for no cap)
+        timeout: Seconds each git invocation may run
+
+    Raises:
+        GitCommandError: If a git invocation fails.
+    """
+    spawn = spawn or functools.partial(subprocess.Popen, cwd=repo_root)
+    result = ChangeCapture()
+
+    with _GitStream(spawn, STATUS_COMMAND, timeout) as stream:
+        files = _parse_status(_nul_records(stream.chunks()))
+
+    by_path = {f.path: f for f in files}
+    for key, name, command, side in (
+        ("git_diff", "changes", UNSTAGED_DIFF_COMMAND, "unstaged"),
+        ("git_diff_cached", "changes_cached", STAGED_DIFF_COMMAND, "staged"),
+    ):
+        numstat: Dict[str, Tuple[LineCounts, Optional[str]]] = {}
+        with _GitStream(spawn, command, timeout) as stream:
+            artifact = writer.write_stream(
+                name,
+                _split_numstat(stream.chunks(), numstat),
+                kind="diff",
+                extension=".diff",
+                max_bytes=max_diff_bytes,
+            )
+            truncated = bool(artifact.metadata.get("truncated"))
+            stream.stopped_early = truncated
+        result.artifacts[key] = artifact.path
+        result.truncated[key] = truncated
+        for path, (counts, old_path) in numstat.items():
+            changed = by_path.get(path)
+            if changed is None:
+                changed = by_path[path] = ChangedFile(path=path, old_path=old_path)
+                files.append(changed)
+            setattr(changed, side, counts)
+
+    result.files = files
+    status_text = "".join(f"{f.status_line()}\n" for f in files)
+    result.artifacts["git_status"] = writer.write_text(
+        "git-status", status_text, kind="diff", extension=".txt",
+    ).path
+    result.artifacts["changed_files"] = writer.write_json(
+        "changed-files",
+        {
+            "totals": result.totals(),
+            "truncated": result.truncated,
+            "files": [f.to_dict() for f in files],
+        },
+        kind="data",
+    ).path
+    return result
+
+
+class _GitStream:
+    """A running git command whose stdout is read in chunks."""
+
+    def __init__(self, spawn: Spawner, cmd: List[str], timeout: float) -> None:
+        self.cmd = cmd
+        self.stopped_early = False
+        # stderr goes to a file so a chatty git can't block on a full pipe.
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            self._proc = spawn(cmd, stdout=subprocess.PIPE, stderr=self._stderr)
+        except BaseException:
+            self._stderr.close()
+            raise
+        self._timer = threading.Timer(timeout, self._proc.kill)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def __enter__(self) -> "_GitStream":
+        return self
+
+    def chunks(self) -> Iterator[bytes]:
+        stdout = self._proc.stdout
+        while True:
+            chunk = stdout.read1(_CHUNK_BYTES) if hasattr(stdout, "read1") else stdout.read(_CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        proc = self._proc
+        if exc_type is not None or self.stopped_early:
+            proc.kill()
+        returncode = proc.wait()
+        self._timer.cancel()
+        if proc.stdout:
+            proc.stdout.close()
+        self._stderr.seek(0)
+        stderr = self._stderr.read()
+        self._stderr.close()
+        if exc_type is None and not self.stopped_early and returncode != 0:
+            raise GitCommandError(
+                f"{' '.join(self.cmd)} exited with {returncode}",
+                metadata={"stderr": stderr.decode("utf-8", "replace").strip()[-2000:]},
+            )
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", "replace")
+
+
+def _nul_records(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *records, pending = pending.split(b"\0")
+        yield from records
+    if pending:
+        yield pending
+
+
+def _v1_code(code: str) -> str:
+    return code.replace(".", " ")
+
+
+def _parse_status(records: Iterable[bytes]) -> List[ChangedFile]:
+    """Parse ``git status --porcelain=v2 -z`` records."""
+    files: List[ChangedFile] = []
+    records = iter(records)
+    for record in records:
+        if not record:
+            continue
+        kind = record[:1]
+        if kind == b"?":
+            files.append(ChangedFile(path=_decode(record[2:]), index_status="?", worktree_status="?", untracked=True))
+        elif kind == b"1":
+            fields = record.split(b" ", 8)
+            code = _v1_code(_decode(fields[1]))
+            files.append(ChangedFile(path=_decode(fields[8]), index_status=code[0], worktree_status=code[1]))
+        elif kind == b"2":
+            fields = record.split(b" ", 9)
+            code = _v1_code(_decode(fields[1]))
+            old_path = _decode(next(records, b""))
+            files.append(
+                ChangedFile(path=_decode(fields[9]), index_status=code[0], worktree_status=code[1], old_path=old_path)
+            )
+        elif kind == b"u":
+            fields = record.split(b" ", 10)
+            code = _decode(fields[1])
+            files.append(ChangedFile(path=_decode(fields[10]), index_status=code[0], worktree_status=code[1]))
+    return files
+
+
+def _split_numstat(
+    chunks: Iterable[bytes],
+    numstat: Dict[str, Tuple[LineCounts, Optional[str]]],
+) -> Iterator[bytes]:
+    """
+    Collect the ``--numstat -z`` block into ``numstat`` and yield the patch.
+
+    The numstat records come first and end with an empty record (two NULs in
+    a row); everything after that is the patch.
+    """
+    pending = b""
+    in_numstat = True
+    for chunk in chunks:
+        if not in_numstat:
+            yield chunk
+            continue
+        start = max(0, len(pending) - 1)
+        pending += chunk
+        end = pending.find(b"\0\0", start)
+        if end < 0:
+            continue
+        _parse_numstat(pending[: end + 1], numstat)
+        in_numstat = False
+        rest, pending = pending[end + 2:], b""
+        if rest:
+            yield rest
+    if in_numstat and pending:
+        _parse_numstat(pending, numstat)
+
+
+def _parse_numstat(block: bytes, numstat: Dict[str, Tuple[LineCounts, Optional[str]]]) -> None:
+    records = iter(block.split(b"\0"))
+    for record in records:
+        if not record:
+            continue
+        added, deleted, path = record.split(b"\t", 2)
+        counts = LineCounts(
+            added=None if added == b"-" else int(added),
+            deleted=None if deleted == b"-" else int(deleted),
+        )
+        old_path: Optional[str] = None
+        if not path:
+            # Renames and copies: "added\tdeleted\t\0old\0new"
+            old_path = _decode(next(records, b""))
+            path = next(records, b"")
+        numstat[_decode(path)] = (counts, old_path)
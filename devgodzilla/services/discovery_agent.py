@@ -3,18 +3,30 @@ DevGodzilla Discovery Agent Service
 
 Runs repository discovery via an AI engine (typically `opencode`) using prompt files
 that instruct the agent to write durable artifacts into the repo.
+
+Pipeline stages declare the stages whose outputs they read; independent stages
+run concurrently (up to ``discovery_max_parallel_stages``). A stage that succeeds
+on a clean checkout is cached under ``.devgodzilla/discovery-cache`` keyed by the
+HEAD commit, the prompt text, the engine and model, and the keys of the stages it
+depends on, so retries and re-onboarding of an unchanged repo restore its outputs
+instead of running the agent again.
 """
 
 from __future__ import annotations
 
+import hashlib
 import os
 import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from devgodzilla.engines import EngineNotFoundError, EngineRequest, SandboxMode, get_registry
 from devgodzilla.logging import get_logger
+from devgodzilla.prompt_utils import read_prompt_file
 from devgodzilla.services.base import Service, ServiceContext
 from devgodzilla.services.agent_config import AgentConfigService
 from devgodzilla.services.cli_execution_tracker import ExecutionStatus, get_execution_tracker
@@ -23,6 +35,32 @@ from devgodzilla.spec import resolve_spec_path
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class DiscoveryStage:
+    name: str
+    prompt_name: str
+    outputs: tuple[str, ...]  # file names under specs/discovery/_runtime
+    depends_on: tuple[str, ...] = ()
+
+
+PIPELINE_STAGES: tuple[DiscoveryStage, ...] = (
+    DiscoveryStage("inventory", "discovery-inventory.prompt.md", ("DISCOVERY.md", "DISCOVERY_SUMMARY.json")),
+    DiscoveryStage("architecture", "discovery-architecture.prompt.md", ("ARCHITECTURE.md",), ("inventory",)),
+    DiscoveryStage("api_reference", "discovery-api-reference.prompt.md", ("API_REFERENCE.md",), ("inventory",)),
+    DiscoveryStage("ci_notes", "discovery-ci-notes.prompt.md", ("CI_NOTES.md",), ("inventory",)),
+)
+
+SINGLE_STAGES: tuple[DiscoveryStage, ...] = (
+    DiscoveryStage(
+        "repo_discovery",
+        "repo-discovery.prompt.md",
+        ("DISCOVERY.md", "ARCHITECTURE.md", "API_REFERENCE.md", "CI_NOTES.md"),
+    ),
+)
+
+_CACHE_ENTRIES_PER_STAGE = 5
+
+
 @dataclass
 class DiscoveryStageResult:
     stage: str
@@ -31,6 +69,9 @@ class DiscoveryStageResult:
     stdout: str = ""
     stderr: str = ""
     error: Optional[str] = None
+    duration_seconds: float = 0.0
+    cached: bool = False
+    cache_key: Optional[str] = None
 
 
 @dataclass
@@ -47,6 +88,22 @@ class DiscoveryResult:
     fallback_engine_id: Optional[str] = None  # Set when a fallback engine was used
     warning: Optional[str] = None  # Non-fatal warning message
 
+    def stage_timings(self) -> list[dict[str, Any]]:
+        """Per-stage outcome and wall time, for events and CLI output."""
+        return _stage_timings(self.stages)
+
+
+def _stage_timings(results: list[DiscoveryStageResult]) -> list[dict[str, Any]]:
+    return [
+        {
+            "stage": r.stage,
+            "success": r.success,
+            "cached": r.cached,
+            "duration_ms": int(r.duration_seconds * 1000),
+        }
+        for r in results
+    ]
+
 
 def _resolve_prompt(repo_root: Path, *, prompt_name: str) -> Path:
     repo_local = repo_root / "prompts" / prompt_name
@@ -56,6 +113,116 @@ def _resolve_prompt(repo_root: Path, *, prompt_name: str) -> Path:
     return fallback
 
 
+def _clean_head(repo_root: Path) -> Optional[str]:
+    """HEAD sha when the checkout (outside discovery's own outputs) is clean, else None."""
+    from devgodzilla.services.git import run_process
+
+    try:
+        head = run_process(["git", "rev-parse", "--verify", "HEAD"], cwd=repo_root, check=False)
+        if head.returncode != 0:
+            return None
+        status = run_process(
+            [
+                "git",
+                "status",
+                "--porcelain",
+                "--",
+                ".",
+                ":(exclude)specs/discovery",
+                ":(exclude).devgodzilla",
+            ],
+            cwd=repo_root,
+            check=False,
+        )
+    except Exception:
+        return None
+    if status.returncode != 0 or status.stdout.strip():
+        return None
+    return head.stdout.strip() or None
+
+
+class DiscoveryStageCache:
+    """Stage results and output files, one JSON entry per cache key."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.root = repo_root / ".devgodzilla" / "discovery-cache"
+
+    @staticmethod
+    def key(
+        *,
+        head: str,
+        stage: DiscoveryStage,
+        prompt_text: str,
+        engine_id: str,
+        model: Optional[str],
+        dependency_keys: list[str],
+    ) -> str:
+        payload = {
+            "head": head,
+            "stage": stage.name,
+            "outputs": list(stage.outputs),
+            "prompt": hashlib.sha256(prompt_text.encode("utf-8")).hexdigest(),
+            "engine": engine_id,
+            "model": model,
+            "dependencies": dependency_keys,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.root / f"{stage}-{key[:32]}.json"
+
+    def load(self, stage: DiscoveryStage, key: str) -> Optional[dict[str, Any]]:
+        try:
+            entry = json.loads(self._path(stage.name, key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        outputs = entry.get("outputs")
+        if not isinstance(outputs, dict) or set(outputs) != set(stage.outputs):
+            return None
+        return entry
+
+    def restore(self, entry: dict[str, Any], runtime_dir: Path) -> None:
+        for name, content in entry["outputs"].items():
+            path = runtime_dir / name
+            try:
+                if path.read_text(encoding="utf-8") == content:
+                    continue
+            except OSError:
+                pass
+            path.write_text(content, encoding="utf-8")
+
+    def store(self, stage: DiscoveryStage, key: str, *, runtime_dir: Path, result: DiscoveryStageResult) -> bool:
+        outputs: dict[str, str] = {}
+        for name in stage.outputs:
+            try:
+                outputs[name] = (runtime_dir / name).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                return False  # only complete, successful stages are reusable
+        entry = {
+            "key": key,
+            "stage": stage.name,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "duration_seconds": result.duration_seconds,
+            "outputs": outputs,
+        }
+        path = self._path(stage.name, key)
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp, path)
+            entries = sorted(self.root.glob(f"{stage.name}-*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+            for stale in entries[_CACHE_ENTRIES_PER_STAGE:]:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            return False
+        return True
+
+
 class DiscoveryAgentService(Service):
     def __init__(self, context: ServiceContext) -> None:
         super().__init__(context)
@@ -109,23 +276,14 @@ class DiscoveryAgentService(Service):
         timeout_seconds: int = 900,
         strict_outputs: bool = True,
         project_id: Optional[int] = None,
+        use_cache: bool = True,
     ) -> DiscoveryResult:
         repo_root = repo_root.expanduser().resolve()
         runtime_dir = self._ensure_discovery_runtime_dir(repo_root)
         log_path = runtime_dir / "opencode-discovery.log"
 
-        stage_map = (
-            {
-                "inventory": "discovery-inventory.prompt.md",
-                "architecture": "discovery-architecture.prompt.md",
-                "api_reference": "discovery-api-reference.prompt.md",
-                "ci_notes": "discovery-ci-notes.prompt.md",
-            }
-            if pipeline
-            else {"repo_discovery": "repo-discovery.prompt.md"}
-        )
-
-        selected = list(stage_map.keys()) if stages is None else stages
+        stage_specs_all = PIPELINE_STAGES if pipeline else SINGLE_STAGES
+        selected = [spec.name for spec in stage_specs_all] if stages is None else stages
 
         registry = get_registry()
         original_engine_id = engine_id
@@ -232,145 +390,97 @@ class DiscoveryAgentService(Service):
             tracked = tracker.get_execution(execution.execution_id)
             return bool(tracked and tracked.status == ExecutionStatus.CANCELLED)
 
-        results: list[DiscoveryStageResult] = []
-        for stage in selected:
-            if _execution_cancelled():
-                tracker.log(
-                    execution.execution_id,
-                    "warn",
-                    f"Discovery cancelled before stage {stage}; stopping remaining stages",
-                    source="tracker",
-                )
-                break
-            prompt_name = stage_map.get(stage)
-            if not prompt_name:
-                results.append(
-                    DiscoveryStageResult(
-                        stage=stage,
-                        prompt_path=Path("<unknown>"),
-                        success=False,
-                        error=f"Unknown stage: {stage}",
-                    )
-                )
-                continue
-
-            prompt_path = _resolve_prompt(repo_root, prompt_name=prompt_name)
-            try:
-                cfg = AgentConfigService(self.context)
-                assignment = cfg.resolve_prompt_assignment(f"discovery.{stage}", project_id=project_id)
-                if not assignment:
-                    assignment = cfg.resolve_prompt_assignment("discovery", project_id=project_id)
-                if assignment and assignment.get("path"):
-                    candidate = resolve_spec_path(str(assignment["path"]), repo_root, repo_root)
-                    if candidate.exists():
-                        prompt_path = candidate
-                    else:
-                        self.logger.warning(
-                            "discovery_prompt_assignment_missing",
-                            extra=self.log_extra(
-                                project_id=project_id,
-                                prompt_path=str(candidate),
-                                stage=stage,
-                            ),
+        head = _clean_head(repo_root) if use_cache and not fallback_used else None
+        cache = DiscoveryStageCache(repo_root) if head else None
+        stage_specs = {spec.name: spec for spec in stage_specs_all}
+        log_lock = threading.Lock()
+        finished: Dict[str, DiscoveryStageResult] = {}
+        pending = list(dict.fromkeys(selected))
+        cancelled_logged = False
+
+        def _ready(stage: str) -> bool:
+            spec = stage_specs.get(stage)
+            deps = [d for d in (spec.depends_on if spec else ()) if d in selected]
+            return all(d in finished for d in deps)
+
+        def _dependency_keys(stage: str) -> Optional[list[str]]:
+            spec = stage_specs[stage]
+            keys = []
+            for dep in spec.depends_on:
+                if dep not in selected:
+                    continue
+                dep_result = finished.get(dep)
+                if dep_result is None or not dep_result.success or not dep_result.cache_key:
+                    return None  # an upstream stage that cannot be cached makes this one uncacheable too
+                keys.append(dep_result.cache_key)
+            return keys
+
+        max_parallel = max(1, int(getattr(self.context.config, "discovery_max_parallel_stages", 3) or 1))
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="devgodzilla-discovery") as pool:
+            while pending or running:
+                if pending and _execution_cancelled():
+                    if not cancelled_logged:
+                        tracker.log(
+                            execution.execution_id,
+                            "warn",
+                            f"Discovery cancelled before stage {pending[0]}; stopping remaining stages",
+                            source="tracker",
                         )
-            except Exception:
-                prompt_path = prompt_path
-            if not prompt_path.is_file():
-                results.append(
-                    DiscoveryStageResult(
+                        cancelled_logged = True
+                    pending = []
+                for stage in [s for s in pending if _ready(s)]:
+                    if len(running) >= max_parallel:
+                        break
+                    pending.remove(stage)
+                    future = pool.submit(
+                        self._run_stage,
                         stage=stage,
-                        prompt_path=prompt_path,
-                        success=False,
-                        error=f"Prompt missing: {prompt_name}",
+                        spec=stage_specs.get(stage),
+                        repo_root=repo_root,
+                        runtime_dir=runtime_dir,
+                        log_path=log_path,
+                        log_lock=log_lock,
+                        engine=engine,
+                        engine_id=engine_id,
+                        run_model=run_model,
+                        timeout_seconds=timeout_seconds,
+                        project_id=project_id,
+                        execution_id=execution.execution_id,
+                        cache=cache,
+                        head=head,
+                        dependency_keys=_dependency_keys(stage) if cache and stage in stage_specs else None,
                     )
-                )
-                continue
-
-            prompt_text = prompt_path.read_text(encoding="utf-8")
-            
-            # Log stage start
-            tracker.log(execution.execution_id, "info", f"Executing stage: {stage}", source=engine_id, metadata={"prompt": prompt_name})
-            
-            streamed_output = False
-            def _log_output(source: str, line: str, *, _stage: str = stage) -> None:
-                nonlocal streamed_output
-                message = line.rstrip("\n")
-                if not message:
-                    return
-                streamed_output = True
-                level = "info" if source == "stdout" else "warn"
-                tracker.log(
-                    execution.execution_id,
-                    level,
-                    message,
-                    source=f"{engine_id}:{source}",
-                    metadata={"stage": _stage},
-                )
-
-            req = EngineRequest(
-                project_id=None,
-                protocol_run_id=None,
-                step_run_id=None,
-                model=run_model,
-                prompt_text=prompt_text,
-                prompt_files=[str(prompt_path)],
-                working_dir=str(repo_root),
-                sandbox=SandboxMode.WORKSPACE_WRITE,
-                timeout=timeout_seconds,
-                extra={
-                    "output_format": "text",
-                    "job_id": "discovery",
-                    "log_callback": _log_output,
-                    "cli_execution_id": execution.execution_id,
-                },
-            )
-            engine_result = engine.execute(req)
-
-            # Log stage result to tracker
-            if engine_result.success:
-                tracker.log(execution.execution_id, "info", f"Stage {stage} completed successfully", source=engine_id)
-            else:
-                tracker.log(execution.execution_id, "error", f"Stage {stage} failed: {engine_result.error or 'unknown error'}", source=engine_id)
-            
-            # Log stdout/stderr output (truncated for large outputs)
-            if engine_result.stdout and not streamed_output:
-                output_preview = engine_result.stdout[:1000] + ("..." if len(engine_result.stdout) > 1000 else "")
-                tracker.log(execution.execution_id, "debug", f"[{stage}] stdout: {output_preview}", source="stdout")
-            if engine_result.stderr and not streamed_output:
-                stderr_preview = engine_result.stderr[:500] + ("..." if len(engine_result.stderr) > 500 else "")
-                tracker.log(execution.execution_id, "warn", f"[{stage}] stderr: {stderr_preview}", source="stderr")
-
-            # Best-effort aggregated log for debugging.
-            try:
-                with log_path.open("a", encoding="utf-8") as f:
-                    f.write(f"\n\n===== discovery stage: {stage} ({prompt_name}) =====\n")
-                    if engine_result.stdout:
-                        f.write(engine_result.stdout)
-                    if engine_result.stderr:
-                        f.write("\n[stderr]\n")
-                        f.write(engine_result.stderr)
-            except Exception:
-                pass
-
-            results.append(
-                DiscoveryStageResult(
-                    stage=stage,
-                    prompt_path=prompt_path,
-                    success=engine_result.success,
-                    stdout=engine_result.stdout,
-                    stderr=engine_result.stderr,
-                    error=engine_result.error,
-                )
-            )
+                    running[future] = stage
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    finished[stage] = future.result()
+                    if _execution_cancelled() and not cancelled_logged:
+                        tracker.log(
+                            execution.execution_id,
+                            "warn",
+                            f"Discovery cancelled after stage {stage}; stopping remaining stages",
+                            source="tracker",
+                        )
+                        cancelled_logged = True
+                        pending = []
 
-            if _execution_cancelled():
-                tracker.log(
-                    execution.execution_id,
-                    "warn",
-                    f"Discovery cancelled after stage {stage}; stopping remaining stages",
-                    source="tracker",
-                )
-                break
+        results: list[DiscoveryStageResult] = [finished[s] for s in dict.fromkeys(selected) if s in finished]
+        slowest = max(results, key=lambda r: r.duration_seconds, default=None)
+        self.logger.info(
+            "discovery_stage_timings",
+            extra=self.log_extra(
+                project_id=project_id,
+                execution_id=execution.execution_id,
+                max_parallel=max_parallel,
+                head=head,
+                timings=_stage_timings(results),
+                slowest_stage=slowest.stage if slowest else None,
+            ),
+        )
 
         if fallback_used:
             # Ensure expected output files exist so strict output validation can pass.
@@ -433,6 +543,203 @@ class DiscoveryAgentService(Service):
             warning=warning,
         )
 
+    def _run_stage(
+        self,
+        *,
+        stage: str,
+        spec: Optional[DiscoveryStage],
+        repo_root: Path,
+        runtime_dir: Path,
+        log_path: Path,
+        log_lock: threading.Lock,
+        engine: Any,
+        engine_id: str,
+        run_model: Optional[str],
+        timeout_seconds: int,
+        project_id: Optional[int],
+        execution_id: str,
+        cache: Optional[DiscoveryStageCache],
+        head: Optional[str],
+        dependency_keys: Optional[list[str]],
+    ) -> DiscoveryStageResult:
+        """Run (or restore from cache) one discovery stage; safe to call from worker threads."""
+        tracker = get_execution_tracker()
+        started = time.perf_counter()
+        if spec is None:
+            return DiscoveryStageResult(
+                stage=stage,
+                prompt_path=Path("<unknown>"),
+                success=False,
+                error=f"Unknown stage: {stage}",
+            )
+        prompt_name = spec.prompt_name
+
+        prompt_path = _resolve_prompt(repo_root, prompt_name=prompt_name)
+        try:
+            cfg = AgentConfigService(self.context)
+            assignment = cfg.resolve_prompt_assignment(f"discovery.{stage}", project_id=project_id)
+            if not assignment:
+                assignment = cfg.resolve_prompt_assignment("discovery", project_id=project_id)
+            if assignment and assignment.get("path"):
+                candidate = resolve_spec_path(str(assignment["path"]), repo_root, repo_root)
+                if candidate.exists():
+                    prompt_path = candidate
+                else:
+                    self.logger.warning(
+                        "discovery_prompt_assignment_missing",
+                        extra=self.log_extra(
+                            project_id=project_id,
+                            prompt_path=str(candidate),
+                            stage=stage,
+                        ),
+                    )
+        except Exception:
+            prompt_path = prompt_path
+        if not prompt_path.is_file():
+            return DiscoveryStageResult(
+                stage=stage,
+                prompt_path=prompt_path,
+                success=False,
+                error=f"Prompt missing: {prompt_name}",
+            )
+
+        cached_prompt = read_prompt_file(prompt_path)
+        prompt_text = cached_prompt.text if cached_prompt is not None else ""
+
+        cache_key: Optional[str] = None
+        if cache is not None and head and dependency_keys is not None:
+            cache_key = DiscoveryStageCache.key(
+                head=head,
+                stage=spec,
+                prompt_text=prompt_text,
+                engine_id=engine_id,
+                model=run_model,
+                dependency_keys=dependency_keys,
+            )
+            entry = cache.load(spec, cache_key)
+            if entry is not None:
+                try:
+                    cache.restore(entry, runtime_dir)
+                except OSError:
+                    entry = None
+            if entry is not None:
+                duration = time.perf_counter() - started
+                tracker.log(
+                    execution_id,
+                    "info",
+                    f"Stage {stage} unchanged since {head[:12]}; restored cached outputs",
+                    source="cache",
+                    metadata={"stage": stage, "duration_ms": int(duration * 1000)},
+                )
+                with log_lock:
+                    try:
+                        with log_path.open("a", encoding="utf-8") as f:
+                            f.write(f"\n\n===== discovery stage: {stage} ({prompt_name}, cached {head[:12]}) =====\n")
+                    except Exception:
+                        pass
+                return DiscoveryStageResult(
+                    stage=stage,
+                    prompt_path=prompt_path,
+                    success=True,
+                    stdout=str(entry.get("stdout") or ""),
+                    stderr=str(entry.get("stderr") or ""),
+                    duration_seconds=duration,
+                    cached=True,
+                    cache_key=cache_key,
+                )
+
+        # Log stage start
+        tracker.log(execution_id, "info", f"Executing stage: {stage}", source=engine_id, metadata={"prompt": prompt_name})
+
+        streamed_output = False
+        def _log_output(source: str, line: str) -> None:
+            nonlocal streamed_output
+            message = line.rstrip("\n")
+            if not message:
+                return
+            streamed_output = True
+            level = "info" if source == "stdout" else "warn"
+            tracker.log(
+                execution_id,
+                level,
+                message,
+                source=f"{engine_id}:{source}",
+                metadata={"stage": stage},
+            )
+
+        req = EngineRequest(
+            project_id=None,
+            protocol_run_id=None,
+            step_run_id=None,
+            model=run_model,
+            prompt_text=prompt_text,
+            prompt_files=[str(prompt_path)],
+            working_dir=str(repo_root),
+            sandbox=SandboxMode.WORKSPACE_WRITE,
+            timeout=timeout_seconds,
+            extra={
+                "output_format": "text",
+                "job_id": "discovery",
+                "log_callback": _log_output,
+                "cli_execution_id": execution_id,
+            },
+        )
+        engine_result = engine.execute(req)
+        duration = time.perf_counter() - started
+
+        # Log stage result to tracker
+        if engine_result.success:
+            tracker.log(
+                execution_id,
+                "info",
+                f"Stage {stage} completed successfully in {duration:.1f}s",
+                source=engine_id,
+                metadata={"stage": stage, "duration_ms": int(duration * 1000)},
+            )
+        else:
+            tracker.log(
+                execution_id,
+                "error",
+                f"Stage {stage} failed after {duration:.1f}s: {engine_result.error or 'unknown error'}",
+                source=engine_id,
+                metadata={"stage": stage, "duration_ms": int(duration * 1000)},
+            )
+
+        # Log stdout/stderr output (truncated for large outputs)
+        if engine_result.stdout and not streamed_output:
+            output_preview = engine_result.stdout[:1000] + ("..." if len(engine_result.stdout) > 1000 else "")
+            tracker.log(execution_id, "debug", f"[{stage}] stdout: {output_preview}", source="stdout")
+        if engine_result.stderr and not streamed_output:
+            stderr_preview = engine_result.stderr[:500] + ("..." if len(engine_result.stderr) > 500 else "")
+            tracker.log(execution_id, "warn", f"[{stage}] stderr: {stderr_preview}", source="stderr")
+
+        # Best-effort aggregated log for debugging; one block per stage even when stages overlap.
+        with log_lock:
+            try:
+                with log_path.open("a", encoding="utf-8") as f:
+                    f.write(f"\n\n===== discovery stage: {stage} ({prompt_name}) =====\n")
+                    if engine_result.stdout:
+                        f.write(engine_result.stdout)
+                    if engine_result.stderr:
+                        f.write("\n[stderr]\n")
+                        f.write(engine_result.stderr)
+            except Exception:
+                pass
+
+        result = DiscoveryStageResult(
+            stage=stage,
+            prompt_path=prompt_path,
+            success=engine_result.success,
+            stdout=engine_result.stdout,
+            stderr=engine_result.stderr,
+            error=engine_result.error,
+            duration_seconds=duration,
+        )
+        if cache is not None and cache_key and engine_result.success:
+            if cache.store(spec, cache_key, runtime_dir=runtime_dir, result=result):
+                result.cache_key = cache_key
+        return result
+
     def _expected_outputs(self, *, pipeline: bool) -> list[Path]:
         base = Path("specs") / "discovery" / "_runtime"
         if pipeline:
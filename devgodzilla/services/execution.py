@@ -5,6 +5,7 @@ Service for executing protocol steps via AI coding engines.
 Coordinates repository setup, engine invocation, and QA triggering.
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -25,17 +26,26 @@ from devgodzilla.engines import (
     SandboxMode,
     get_registry,
 )
+from devgodzilla.engines.artifact_store import get_artifact_store
 from devgodzilla.engines.artifacts import ArtifactWriter
 from devgodzilla.engines.sandbox import (
     SandboxRunner,
     SandboxConfig,
+    SandboxSession,
     SandboxType,
     create_sandbox_runner,
+    create_sandbox_session,
     get_default_sandbox_type,
 )
 from devgodzilla.engines.block_detector import BlockDetector, BlockInfo, BlockReason
+from devgodzilla.prompt_utils import (
+    PROMPT_SECTION_SEPARATOR,
+    fingerprint_text,
+    get_prompt_cache,
+)
 from devgodzilla.spec import get_step_spec as get_step_spec_from_template, resolve_spec_path
 from devgodzilla.services.base import Service, ServiceContext
+from devgodzilla.services.change_capture import DEFAULT_MAX_DIFF_BYTES, capture_changes
 from devgodzilla.services.agent_config import AgentConfigService
 from devgodzilla.services.events import get_event_bus, StepStarted, StepCompleted, StepFailed
 from devgodzilla.services.clarifier import ClarifierService
@@ -107,6 +117,9 @@ class StepResolution:
     agent_id: Optional[str] = None
     step_name: Optional[str] = None
     spec_hash: Optional[str] = None
+    
+    # Size of the assembled prompt (prompt_version holds its fingerprint)
+    prompt_bytes: Optional[int] = None
 
 
 class ExecutionService(Service):
@@ -169,6 +182,23 @@ class ExecutionService(Service):
             allow_network=allow_network,
         )
 
+    def _create_sandbox_session(
+        self,
+        workspace_dir: Path,
+        *,
+        allow_network: bool = False,
+    ) -> SandboxSession:
+        """Create a sandbox session for a step's commands in the workspace.
+
+        The caller closes the session when the step is done with it.
+        """
+        sandbox_type = self._sandbox_type or get_default_sandbox_type()
+        return create_sandbox_session(
+            workspace_dir,
+            sandbox_type=sandbox_type,
+            allow_network=allow_network,
+        )
+
     def detect_block(self, output: str) -> Optional[BlockInfo]:
         """Detect if output indicates blocked execution.
         
@@ -490,6 +520,16 @@ class ExecutionService(Service):
             prompt_template_path=prompt_template_path,
         )
         prompt_path = step_prompt_path
+        prompt_fingerprint = fingerprint_text(prompt_text)
+        prompt_bytes = len(prompt_text.encode("utf-8"))
+        self.logger.info(
+            "step_prompt_built",
+            extra=self.log_extra(
+                step_run_id=step.id,
+                prompt_fingerprint=prompt_fingerprint,
+                prompt_bytes=prompt_bytes,
+            ),
+        )
         
         # Determine timeout
         timeout = None
@@ -501,13 +541,14 @@ class ExecutionService(Service):
             model=resolved_model,
             prompt_text=prompt_text,
             prompt_path=prompt_path if prompt_path.exists() else None,
-            prompt_version=None,
+            prompt_version=prompt_fingerprint,
             workdir=workspace_root,
             protocol_root=protocol_root,
             workspace_root=workspace_root,
             sandbox=SandboxMode.WORKSPACE_WRITE,
             timeout=timeout,
             step_name=step.step_name,
+            prompt_bytes=prompt_bytes,
         )
 
     def _get_step_spec(
@@ -531,26 +572,42 @@ class ExecutionService(Service):
         step_prompt_path: Optional[Path] = None,
         prompt_template_path: Optional[Path] = None,
     ) -> str:
-        """Build execution prompt for step."""
-        parts = []
+        """
+        Build execution prompt for step.
+
+        Sources are read through the shared prompt cache, so unchanged files
+        are not re-read, and the template + plan prefix is assembled once and
+        shared by every step of the protocol.
+        """
+        cache = get_prompt_cache()
+        prefix_sections = []
         
         # Include prompt template if assigned
-        if prompt_template_path and prompt_template_path.exists():
-            parts.append(prompt_template_path.read_text(encoding="utf-8"))
+        if prompt_template_path:
+            template = cache.read(prompt_template_path)
+            if template is not None:
+                prefix_sections.append((f"template:{template.fingerprint}", template.text))
 
         # Include plan if available
-        plan_path = protocol_root / "plan.md"
-        if plan_path.exists():
-            parts.append(f"# Plan\n\n{plan_path.read_text(encoding='utf-8')}")
+        plan = cache.read(protocol_root / "plan.md")
+        if plan is not None:
+            prefix_sections.append((f"plan:{plan.fingerprint}", f"# Plan\n\n{plan.text}"))
         
         # Include step file if available
+        task: Optional[str] = None
         step_path = step_prompt_path or (protocol_root / f"{step.step_name}.md")
-        if step_path.exists():
-            parts.append(f"# Task\n\n{step_path.read_text(encoding='utf-8')}")
+        step_file = cache.read(step_path)
+        if step_file is not None:
+            task = f"# Task\n\n{step_file.text}"
         elif step.summary:
-            parts.append(f"# Task\n\n{step.summary}")
+            task = f"# Task\n\n{step.summary}"
         
-        return "\n\n---\n\n".join(parts) if parts else f"Execute step: {step.step_name}"
+        prefix = cache.join_prefix(prefix_sections)
+        if prefix and task is not None:
+            return f"{prefix}{PROMPT_SECTION_SEPARATOR}{task}"
+        if prefix or task is not None:
+            return prefix or task
+        return f"Execute step: {step.step_name}"
 
     def _fail_step_pre_execution(
         self,
@@ -777,7 +834,12 @@ class ExecutionService(Service):
     ) -> Dict[str, Path]:
         protocol_root = resolution.protocol_root
         artifacts_dir = protocol_root / ".devgodzilla" / "steps" / str(step.id) / "artifacts"
-        writer = ArtifactWriter(artifacts_dir=artifacts_dir, step_run_id=step.id)
+        writer = ArtifactWriter(
+            artifacts_dir=artifacts_dir,
+            run_id=str(run.id),
+            step_run_id=step.id,
+            store=get_artifact_store(self.context.config),
+        )
 
         outputs: Dict[str, Path] = {}
 
@@ -789,6 +851,8 @@ class ExecutionService(Service):
             "step_name": step.step_name,
             "workspace_root": str(resolution.workspace_root),
             "protocol_root": str(protocol_root),
+            "prompt_fingerprint": resolution.prompt_version,
+            "prompt_bytes": resolution.prompt_bytes,
         }
         outputs["execution_meta"] = writer.write_json("execution", meta, kind="meta").path
 
@@ -799,16 +863,16 @@ class ExecutionService(Service):
         if engine_result.error:
             outputs["error"] = writer.write_text("error", engine_result.error, kind="log", extension=".txt").path
 
-        # Capture best-effort git status/diff if the workspace is a git repo.
-        # Use sandbox runner for safer git operations
+        # Capture best-effort git status/diffs if the workspace is a git repo.
+        # The git commands share one sandbox session, torn down when capture ends.
         repo_root = resolution.workspace_root
         if (repo_root / ".git").exists():
-            import subprocess
-            
+            max_diff_bytes = getattr(self.context.config, "git_capture_max_diff_bytes", DEFAULT_MAX_DIFF_BYTES)
+
             # Try sandboxed execution first, fall back to direct execution
-            sandbox_runner = None
+            sandbox_session = None
             try:
-                sandbox_runner = self._create_sandbox_runner(repo_root)
+                sandbox_session = self._create_sandbox_session(repo_root)
             except Exception as sandbox_err:
                 self.logger.warning(
                     "sandbox_runner_creation_failed",
@@ -817,70 +881,44 @@ class ExecutionService(Service):
                         error=str(sandbox_err),
                     ),
                 )
-            
-            def run_git_command(cmd: List[str]) -> str:
-                """Run a git command, using sandbox if available."""
-                try:
-                    if sandbox_runner:
-                        result = sandbox_runner.run(
-                            cmd,
-                            cwd=repo_root,
-                            capture_output=True,
-                            timeout=30,
+
+            changes = None
+            try:
+                if sandbox_session:
+                    try:
+                        changes = capture_changes(
+                            repo_root,
+                            writer,
+                            spawn=functools.partial(sandbox_session.popen, cwd=repo_root),
+                            max_diff_bytes=max_diff_bytes,
                         )
-                        return result.stdout or ""
-                except Exception as sandbox_error:
-                    self.logger.warning(
-                        "sandbox_git_command_failed",
-                        extra=self.log_extra(
-                            step_run_id=step.id,
-                            command=" ".join(cmd),
-                            error=str(sandbox_error),
-                        ),
-                    )
-                # Fallback to direct execution
+                    except Exception as sandbox_error:
+                        self.logger.warning(
+                            "sandbox_git_command_failed",
+                            extra=self.log_extra(step_run_id=step.id, error=str(sandbox_error)),
+                        )
+                if changes is None:
+                    # Fallback to direct execution
+                    changes = capture_changes(repo_root, writer, max_diff_bytes=max_diff_bytes)
+            except Exception as e:
+                self.logger.warning(
+                    "git_command_failed",
+                    extra=self.log_extra(step_run_id=step.id, error=str(e)),
+                )
+            finally:
+                if sandbox_session:
+                    sandbox_session.close()
+
+            if changes is not None:
+                outputs.update(changes.artifacts)
                 try:
-                    result = subprocess.run(  # noqa: S603
-                        cmd,
-                        cwd=repo_root,
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                    return result.stdout or ""
+                    runtime_state = dict(self.db.get_step_run(step.id).runtime_state or {})
+                    runtime_state["changes"] = changes.summary()
+                    self.db.update_step_run(step.id, runtime_state=runtime_state)
                 except Exception as e:
                     self.logger.warning(
-                        "git_command_failed",
-                        extra=self.log_extra(
-                            step_run_id=step.id,
-                            command=" ".join(cmd),
-                            error=str(e),
-                        ),
+                        "changed_files_persist_failed",
+                        extra=self.log_extra(step_run_id=step.id, error=str(e)),
                     )
-                    return ""
-
-            status_output = run_git_command(["git", "status", "--porcelain=v1"])
-            outputs["git_status"] = writer.write_text(
-                "git-status",
-                status_output.strip() + ("\n" if status_output.strip() else ""),
-                kind="diff",
-                extension=".txt",
-            ).path
-
-            diff_output = run_git_command(["git", "diff"])
-            outputs["git_diff"] = writer.write_text(
-                "changes",
-                diff_output,
-                kind="diff",
-                extension=".diff",
-            ).path
-
-            diff_cached_output = run_git_command(["git", "diff", "--cached"])
-            outputs["git_diff_cached"] = writer.write_text(
-                "changes_cached",
-                diff_cached_output,
-                kind="diff",
-                extension=".diff",
-            ).path
 
         return outputs
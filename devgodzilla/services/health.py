@@ -2,12 +2,19 @@
 DevGodzilla Health Checking Service
 
 Comprehensive health checking for database, Windmill, and agents.
+
+The API does not probe on request: a HealthProber refreshes each component
+in the background on its own cadence (a ``SELECT 1`` every few seconds, the
+Windmill version endpoint and agent binary lookups far less often) and
+``/health`` serves the latest snapshot, flagging components whose result
+has gone stale.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import asyncio
+import threading
 import time
 
 from devgodzilla.logging import get_logger
@@ -47,6 +54,23 @@ class AgentHealthSummary:
     details: List[Dict[str, Any]] = field(default_factory=list)
 
 
+def summarize(components: Dict[str, ComponentHealth]) -> HealthStatus:
+    """Overall status: ok if every component is, error if any is, else degraded."""
+    all_ok = all(c.status == "ok" for c in components.values())
+    any_error = any(c.status == "error" for c in components.values())
+
+    status = "ok" if all_ok else ("error" if any_error else "degraded")
+
+    return HealthStatus(
+        status=status,
+        version=__version__,
+        timestamp=datetime.now(timezone.utc),
+        components=components,
+        checks_passed=sum(1 for c in components.values() if c.status == "ok"),
+        checks_failed=sum(1 for c in components.values() if c.status == "error"),
+    )
+
+
 class HealthChecker:
     """
     Comprehensive health checking service.
@@ -68,11 +92,15 @@ class HealthChecker:
         windmill: Any,
         agent_registry: Any,
         *,
+        db_provider: Optional[Callable[[], Any]] = None,
         db_timeout_ms: int = 5000,
         windmill_timeout_ms: int = 5000,
         agent_timeout_ms: int = 2000,
     ) -> None:
         self.db = db
+        # Resolves the database at probe time, for long-lived checkers whose
+        # database may be swapped (the API's background prober).
+        self.db_provider = db_provider
         self.windmill = windmill
         self.agent_registry = agent_registry
         self.db_timeout_ms = db_timeout_ms
@@ -92,27 +120,13 @@ class HealthChecker:
         components["windmill"] = await windmill_task
         components["agents"] = await agents_task
         
-        # Determine overall status
-        all_ok = all(c.status == "ok" for c in components.values())
-        any_error = any(c.status == "error" for c in components.values())
-        
-        status = "ok" if all_ok else ("error" if any_error else "degraded")
-        
-        return HealthStatus(
-            status=status,
-            version=__version__,
-            timestamp=datetime.now(timezone.utc),
-            components=components,
-            checks_passed=sum(1 for c in components.values() if c.status == "ok"),
-            checks_failed=sum(1 for c in components.values() if c.status == "error"),
-        )
+        return summarize(components)
     
     async def _check_database(self) -> ComponentHealth:
         """Check database connectivity."""
         start = time.perf_counter()
         try:
-            # Simple query to verify connectivity
-            self.db.list_projects()
+            self._database().ping()
             latency_ms = int((time.perf_counter() - start) * 1000)
             
             return ComponentHealth(
@@ -276,6 +290,18 @@ class HealthChecker:
                 latency_ms=latency_ms,
             )
     
+    def _database(self) -> Any:
+        return self.db_provider() if self.db_provider is not None else self.db
+
+    def probe(self, component: str) -> ComponentHealth:
+        """Run one synchronous component check ("database", "windmill" or "agents")."""
+        checks: Dict[str, Callable[[], ComponentHealth]] = {
+            "database": self._check_database_sync,
+            "windmill": self._check_windmill_sync,
+            "agents": self._check_agents_sync,
+        }
+        return checks[component]()
+
     def check_all_sync(self) -> HealthStatus:
         """
         Synchronous version of check_all for use in non-async contexts.
@@ -293,26 +319,13 @@ class HealthChecker:
         # Agents check
         components["agents"] = self._check_agents_sync()
         
-        # Determine overall status
-        all_ok = all(c.status == "ok" for c in components.values())
-        any_error = any(c.status == "error" for c in components.values())
-        
-        status = "ok" if all_ok else ("error" if any_error else "degraded")
-        
-        return HealthStatus(
-            status=status,
-            version=__version__,
-            timestamp=datetime.now(timezone.utc),
-            components=components,
-            checks_passed=sum(1 for c in components.values() if c.status == "ok"),
-            checks_failed=sum(1 for c in components.values() if c.status == "error"),
-        )
+        return summarize(components)
     
     def _check_database_sync(self) -> ComponentHealth:
         """Synchronous database check."""
         start = time.perf_counter()
         try:
-            self.db.list_projects()
+            self._database().ping()
             latency_ms = int((time.perf_counter() - start) * 1000)
             return ComponentHealth(
                 name="database",
@@ -420,6 +433,145 @@ class HealthChecker:
             )
 
 
+class LatencyHistogram:
+    """Cumulative probe latency buckets, Prometheus-style (upper bounds in ms)."""
+
+    BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        index = len(self.BUCKETS_MS)
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if latency_ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.total += 1
+        self.sum_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self.BUCKETS_MS, self.counts):
+            running += count
+            buckets[f"le_{bound:g}"] = running
+        buckets["le_inf"] = running + self.counts[-1]
+        return {
+            "count": self.total,
+            "sum_ms": round(self.sum_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class HealthProber:
+    """
+    Refreshes component health in the background and serves snapshots.
+
+    Each component gets a daemon thread that runs its check every
+    ``intervals[name]`` seconds, so a hung Windmill request never delays the
+    database probe. A result older than ``stale_factor`` intervals is
+    reported as degraded with ``stale`` set; a component that has never been
+    probed is reported as ``pending``.
+    """
+
+    def __init__(
+        self,
+        checker: HealthChecker,
+        *,
+        intervals: Dict[str, float],
+        stale_factor: float = 3.0,
+    ) -> None:
+        self.checker = checker
+        self.intervals = {name: max(0.1, float(seconds)) for name, seconds in intervals.items()}
+        self.stale_factor = stale_factor
+        self._results: Dict[str, Tuple[ComponentHealth, float]] = {}
+        self._histograms = {name: LatencyHistogram() for name in self.intervals}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the probe threads; a no-op while they are running."""
+        with self._start_lock:
+            if any(thread.is_alive() for thread in self._threads):
+                return
+            self._stop.clear()
+            self._threads = [
+                threading.Thread(target=self._loop, args=(name,), name=f"devgodzilla-health-{name}", daemon=True)
+                for name in self.intervals
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def refresh(self, name: str) -> ComponentHealth:
+        """Probe one component now and record the result."""
+        start = time.perf_counter()
+        try:
+            result = self.checker.probe(name)
+        except Exception as exc:
+            result = ComponentHealth(name=name, status="error", message=str(exc))
+        latency_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._results[name] = (result, time.monotonic())
+            self._histograms[name].observe(latency_ms)
+        return result
+
+    def snapshot(self) -> HealthStatus:
+        """Latest result per component, with its age; never waits on a probe in flight."""
+        with self._lock:
+            results = dict(self._results)
+        now = time.monotonic()
+        components: Dict[str, ComponentHealth] = {}
+        for name, interval in self.intervals.items():
+            if name not in results:
+                components[name] = ComponentHealth(
+                    name=name,
+                    status="pending",
+                    message="not probed yet",
+                    details={"interval_seconds": interval, "stale": False},
+                )
+                continue
+            result, checked_at = results[name]
+            age = max(0.0, now - checked_at)
+            stale = age > interval * self.stale_factor
+            details = dict(result.details)
+            details.update({"age_seconds": round(age, 3), "interval_seconds": interval, "stale": stale})
+            components[name] = ComponentHealth(
+                name=result.name,
+                status="degraded" if stale and result.status == "ok" else result.status,
+                message="stale" if stale and result.message is None else result.message,
+                latency_ms=result.latency_ms,
+                details=details,
+            )
+        return summarize(components)
+
+    def latency(self) -> Dict[str, Dict[str, Any]]:
+        """Probe latency histogram per component."""
+        with self._lock:
+            return {name: histogram.to_dict() for name, histogram in self._histograms.items()}
+
+    def _loop(self, name: str) -> None:
+        interval = self.intervals[name]
+        while not self._stop.is_set():
+            self.refresh(name)
+            if self._stop.wait(interval):
+                return
+
+
 def health_status_to_dict(status: HealthStatus) -> Dict[str, Any]:
     """Convert HealthStatus to a JSON-serializable dict."""
     return {
@@ -7,7 +7,7 @@ Manages lifecycle of protocol runs and coordinates with Windmill for execution.
 
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -668,62 +668,63 @@ class OrchestratorService(Service):
         *,
         limit: int = 200,
         resume: bool = True,
+        stale_after_seconds: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """
         Attempt to recover protocols stuck in RUNNING without active steps.
 
+        Candidates come from one aggregate query (step counts by status per
+        RUNNING protocol), so historical runs cost nothing. With
+        ``stale_after_seconds``, protocols whose steps changed more recently
+        are left alone.
+
         This will:
         - complete protocols with all terminal steps
         - mark protocols blocked when failed/blocked steps exist
         - optionally enqueue the next runnable step
         """
         recovered: List[Dict[str, Any]] = []
-        runs = self.db.list_all_protocol_runs(limit=limit)
-        for run in runs:
-            if run.status != ProtocolStatus.RUNNING:
-                continue
-
-            steps = self.db.list_step_runs(run.id)
-            if not steps:
-                continue
-
-            in_flight = any(
-                s.status in (StepStatus.RUNNING, StepStatus.NEEDS_QA)
-                for s in steps
-            )
-            if in_flight:
-                continue
+        stale_before = None
+        if stale_after_seconds:
+            stale_before = datetime.now(timezone.utc) - timedelta(seconds=stale_after_seconds)
+        candidates = self.db.list_stuck_protocol_candidates(stale_before=stale_before, limit=limit)
+        terminal_statuses = (
+            StepStatus.COMPLETED, StepStatus.CANCELLED, StepStatus.SKIPPED,
+            StepStatus.FAILED, StepStatus.TIMEOUT,
+        )
+        for candidate in candidates:
+            run_id = candidate["protocol_run_id"]
+            counts = candidate["counts"]
 
-            if self.check_and_complete_protocol(run.id):
+            all_terminal = sum(counts[s] for s in terminal_statuses) == candidate["total_steps"]
+            if all_terminal and self.check_and_complete_protocol(run_id):
                 recovered.append(
-                    {"protocol_run_id": run.id, "action": "completed"}
+                    {"protocol_run_id": run_id, "action": "completed"}
                 )
                 self.logger.info(
                     "protocol_recovered_completed",
-                    extra=self.log_extra(protocol_run_id=run.id),
+                    extra=self.log_extra(protocol_run_id=run_id),
                 )
                 continue
 
-            if any(
-                s.status in (StepStatus.FAILED, StepStatus.TIMEOUT, StepStatus.BLOCKED)
-                for s in steps
-            ):
-                self.db.update_protocol_status(run.id, ProtocolStatus.BLOCKED)
+            if counts[StepStatus.FAILED] or counts[StepStatus.TIMEOUT] or counts[StepStatus.BLOCKED]:
+                self.db.update_protocol_status(run_id, ProtocolStatus.BLOCKED)
                 recovered.append(
-                    {"protocol_run_id": run.id, "action": "blocked_failed_step"}
+                    {"protocol_run_id": run_id, "action": "blocked_failed_step"}
                 )
                 self.logger.warning(
                     "protocol_recovered_blocked",
-                    extra=self.log_extra(protocol_run_id=run.id),
+                    extra=self.log_extra(protocol_run_id=run_id),
                 )
                 continue
 
+            steps = self.db.list_step_runs(run_id) if counts[StepStatus.PENDING] else []
             runnable = self._find_runnable_step(steps)
             if runnable and resume:
                 result = self.run_step(runnable.id)
                 recovered.append(
                     {
-                        "protocol_run_id": run.id,
+                        "protocol_run_id": run_id,
                         "action": "enqueued_step",
                         "step_run_id": runnable.id,
                         "success": result.success,
@@ -732,23 +733,23 @@ class OrchestratorService(Service):
                 self.logger.info(
                     "protocol_recovered_enqueued_step",
                     extra=self.log_extra(
-                        protocol_run_id=run.id,
+                        protocol_run_id=run_id,
                         step_run_id=runnable.id,
                         success=result.success,
                         error=result.error,
                     ),
                 )
                 if not result.success:
-                    self.db.update_protocol_status(run.id, ProtocolStatus.BLOCKED)
+                    self.db.update_protocol_status(run_id, ProtocolStatus.BLOCKED)
                 continue
 
-            self.db.update_protocol_status(run.id, ProtocolStatus.BLOCKED)
+            self.db.update_protocol_status(run_id, ProtocolStatus.BLOCKED)
             recovered.append(
-                {"protocol_run_id": run.id, "action": "blocked_no_runnable"}
+                {"protocol_run_id": run_id, "action": "blocked_no_runnable"}
             )
             self.logger.warning(
                 "protocol_recovered_blocked",
-                extra=self.log_extra(protocol_run_id=run.id, reason="no_runnable_steps"),
+                extra=self.log_extra(protocol_run_id=run_id, reason="no_runnable_steps"),
             )
 
         if recovered:
@@ -45,51 +45,19 @@ def _build_repo_snapshot(repo_root: Path, *, max_files: int = 50) -> str:
     Create a concise snapshot of the repository layout.
     
     Injected into planning prompts so the model can reference real paths.
+    Built from the cached tree index in `devgodzilla.services.repo_index`,
+    so tracked files only and free to rebuild for an already-seen commit.
     
     Args:
         repo_root: Repository root path
-        max_files: Maximum files to include per directory
+        max_files: Maximum root entries to include
         
     Returns:
         Markdown-formatted snapshot string
     """
-    lines = ["# Repository Structure", ""]
-    
-    # Key directories to scan
-    dirs_to_scan = ["src", "lib", "app", "tests", "scripts", "."]
-    
-    for dir_name in dirs_to_scan:
-        dir_path = repo_root / dir_name if dir_name != "." else repo_root
-        if not dir_path.exists():
-            continue
-        
-        # Get files
-        files = []
-        for item in sorted(dir_path.iterdir())[:max_files]:
-            if item.name.startswith(".") and item.name not in [".devgodzilla"]:
-                continue
-            if item.is_file():
-                files.append(item.name)
-            elif item.is_dir() and not item.name.startswith("__"):
-                files.append(f"{item.name}/")
-        
-        if files:
-            header = f"## {dir_name}/" if dir_name != "." else "## (root)"
-            lines.append(header)
-            for f in files:
-                lines.append(f"- {f}")
-            lines.append("")
-    
-    # Build commands from common files
-    lines.append("## Common Commands")
-    if (repo_root / "Makefile").exists():
-        lines.append("- `make` targets available")
-    if (repo_root / "package.json").exists():
-        lines.append("- `npm run` scripts available")
-    if (repo_root / "pyproject.toml").exists():
-        lines.append("- Python project (pyproject.toml)")
-    
-    return "\n".join(lines)
+    from devgodzilla.services.repo_index import build_repo_snapshot
+
+    return build_repo_snapshot(repo_root, max_entries=max_files)
 
 
 class PlanningService(Service):
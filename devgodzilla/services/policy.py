@@ -8,10 +8,14 @@ Policies define governance rules for projects, protocols, and steps.
 import hashlib
 import json
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
+from devgodzilla.db.database import add_change_listener, db_identity
 from devgodzilla.logging import get_logger
 from devgodzilla.services.base import Service, ServiceContext
 
@@ -89,6 +93,26 @@ def _stable_hash(payload: Dict[str, Any]) -> str:
     return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
 
 
+_REPO_LOCAL_POLICY_NAMES = ("policy.json", "policy.yaml", "policy.yml")
+
+
+def _repo_local_policy_signature(repo_root: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Cheap change signature for repo-local policy files: (name, mtime_ns, size).
+    
+    Costs one stat per candidate file instead of a read + parse.
+    """
+    signature = []
+    policy_dir = repo_root / ".devgodzilla"
+    for name in _REPO_LOCAL_POLICY_NAMES:
+        try:
+            st = (policy_dir / name).stat()
+        except OSError:
+            continue
+        signature.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
 def _load_repo_local_policy(repo_root: Path) -> Optional[Dict[str, Any]]:
     """
     Best-effort loader for repo-local override policy.
@@ -150,6 +174,147 @@ def _policy_block_codes(policy: Dict[str, Any]) -> set:
     return _DEFAULT_BLOCK_CODES
 
 
+@dataclass(frozen=True)
+class _CachedPolicy:
+    """
+    Cache entry for a resolved policy, stored serialized.
+    
+    Serializing once on a miss lets every hit hand out a private copy with a
+    single ``json.loads`` instead of deep-copying the policy tree.
+    """
+    effective_hash: str
+    pack_key: str
+    pack_version: str
+    payload: str
+
+    @classmethod
+    def freeze(cls, effective: EffectivePolicy) -> "_CachedPolicy":
+        return cls(
+            effective_hash=effective.effective_hash,
+            pack_key=effective.pack_key,
+            pack_version=effective.pack_version,
+            payload=json.dumps({"policy": effective.policy, "sources": effective.sources}),
+        )
+
+    def thaw(self) -> EffectivePolicy:
+        data = json.loads(self.payload)
+        return EffectivePolicy(
+            policy=data["policy"],
+            effective_hash=self.effective_hash,
+            pack_key=self.pack_key,
+            pack_version=self.pack_version,
+            sources=data["sources"],
+        )
+
+
+class PolicyResolutionCache:
+    """
+    Process-wide memo of resolved effective policies.
+    
+    Keys capture every input of the resolution: database identity, project id,
+    pack key/version, the project's ``updated_at`` revision, and the
+    repo-local policy file signature. Entries are invalidated explicitly when
+    a project policy or policy pack is written (via DB change listeners) and
+    expire after ``ttl_seconds`` to bound staleness from writes made by other
+    processes.
+    """
+
+    def __init__(self, *, max_entries: int = 512, ttl_seconds: float = 60.0) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, _CachedPolicy]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[_CachedPolicy]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] > self._ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: _CachedPolicy) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        pack_key: Optional[str] = None,
+        pack_version: Optional[str] = None,
+    ) -> int:
+        """
+        Drop entries matching a project and/or pack. No filters clears everything.
+        
+        Returns the number of entries removed.
+        """
+        with self._lock:
+            if project_id is None and pack_key is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                doomed = [
+                    key for key, (_, value) in self._entries.items()
+                    if (project_id is not None and key[1] == project_id)
+                    or (
+                        pack_key is not None
+                        and value.pack_key == pack_key
+                        and (pack_version is None or value.pack_version == pack_version)
+                    )
+                ]
+                for key in doomed:
+                    del self._entries[key]
+                removed = len(doomed)
+            self._invalidations += 1
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+            }
+
+
+_policy_cache = PolicyResolutionCache()
+
+
+def get_policy_cache() -> PolicyResolutionCache:
+    """Get the process-wide policy resolution cache."""
+    return _policy_cache
+
+
+def _on_db_change(entity: str, keys: Dict[str, Any]) -> None:
+    if entity == "project_policy":
+        _policy_cache.invalidate(project_id=keys.get("project_id"))
+    elif entity == "policy_pack":
+        _policy_cache.invalidate(pack_key=keys.get("key"), pack_version=keys.get("version"))
+
+
+add_change_listener(_on_db_change)
+
+
 class PolicyService(Service):
     """
     Service for policy management and evaluation.
@@ -177,9 +342,16 @@ class PolicyService(Service):
             return "Blocked by policy"
     """
 
-    def __init__(self, context: ServiceContext, db) -> None:
+    def __init__(
+        self,
+        context: ServiceContext,
+        db,
+        *,
+        cache: Optional[PolicyResolutionCache] = None,
+    ) -> None:
         super().__init__(context)
         self.db = db
+        self.cache = cache if cache is not None else _policy_cache
 
     def resolve_effective_policy(
         self,
@@ -196,6 +368,9 @@ class PolicyService(Service):
         2. Project-level overrides (from project.policy_overrides)
         3. Repo-local overrides (from .devgodzilla/policy.json) if enabled
         
+        Results are memoized in the policy resolution cache; a hit costs one
+        project lookup, a few stat calls and one ``json.loads``.
+        
         Args:
             project_id: Project ID
             repo_root: Optional repo root for loading repo-local policy
@@ -206,10 +381,35 @@ class PolicyService(Service):
         """
         project = self.db.get_project(project_id)
         
-        # Load base policy pack
         pack_key = project.policy_pack_key or "default"
         pack_version = project.policy_pack_version or "1.0"
-        
+        use_repo_local = bool(include_repo_local and project.policy_repo_local_enabled and repo_root)
+        cache_key = (
+            db_identity(self.db),
+            project_id,
+            pack_key,
+            pack_version,
+            # Every project write bumps updated_at, so it stands in for the
+            # overrides without serializing them on each lookup.
+            project.updated_at,
+            str(repo_root) if use_repo_local else None,
+            _repo_local_policy_signature(Path(repo_root)) if use_repo_local else None,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            effective = self._resolve_uncached(project, pack_key, pack_version, repo_root if use_repo_local else None)
+            cached = _CachedPolicy.freeze(effective)
+            self.cache.put(cache_key, cached)
+        return cached.thaw()
+
+    def _resolve_uncached(
+        self,
+        project,
+        pack_key: str,
+        pack_version: str,
+        repo_root: Optional[Path],
+    ) -> EffectivePolicy:
+        """Load the pack, merge overrides and hash the result."""
         try:
             pack = self.db.get_policy_pack(key=pack_key, version=pack_version)
             base_policy = pack.pack
@@ -227,7 +427,7 @@ class PolicyService(Service):
             sources["project_overrides"] = True
         
         # Apply repo-local overrides
-        if include_repo_local and project.policy_repo_local_enabled and repo_root:
+        if repo_root:
             repo_local = _load_repo_local_policy(repo_root)
             if repo_local:
                 sanitized = _sanitize_policy_override(repo_local)
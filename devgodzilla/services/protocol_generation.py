@@ -34,11 +34,19 @@ class ProtocolGenerationResult:
     error: Optional[str] = None
 
 
-def _render_prompt(template: str, *, protocol_name: str, description: str, step_count: int) -> str:
+def _render_prompt(
+    template: str,
+    *,
+    protocol_name: str,
+    description: str,
+    step_count: int,
+    repo_snapshot: str = "",
+) -> str:
     return (
         template.replace("{{PROTOCOL_NAME}}", protocol_name)
         .replace("{{PROTOCOL_DESCRIPTION}}", description)
         .replace("{{STEP_COUNT}}", str(step_count))
+        .replace("{{REPO_SNAPSHOT}}", repo_snapshot)
     )
 
 
@@ -134,11 +142,20 @@ class ProtocolGenerationService(Service):
         run_model = model or env_model or resolved_agent_model or engine.metadata.default_model
 
         template = prompt_path.read_text(encoding="utf-8")
+        repo_snapshot = ""
+        if "{{REPO_SNAPSHOT}}" in template:
+            try:
+                from devgodzilla.services.repo_index import build_repo_snapshot
+
+                repo_snapshot = build_repo_snapshot(worktree_root)
+            except Exception as e:
+                logger.warning("repo_snapshot_failed", extra={"worktree_root": str(worktree_root), "error": str(e)})
         prompt_text = _render_prompt(
             template,
             protocol_name=protocol_name,
             description=description,
             step_count=max(1, int(step_count)),
+            repo_snapshot=repo_snapshot,
         )
 
         req = EngineRequest(
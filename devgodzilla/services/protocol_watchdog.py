@@ -0,0 +1,111 @@
+"""
+DevGodzilla Protocol Recovery Watchdog
+
+Periodically runs ``OrchestratorService.recover_stuck_protocols``. Each pass
+first takes the ``protocol_recovery`` lease in the database, so with several
+API or worker replicas only one of them recovers protocols at a time; the
+lease is renewed every pass and expires if its holder dies.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from devgodzilla.logging import get_logger
+
+logger = get_logger(__name__)
+
+RECOVERY_LEASE = "protocol_recovery"
+
+# A lease outlives a few missed passes before another replica may take over.
+_LEASE_INTERVALS = 3
+_MIN_LEASE_SECONDS = 30.0
+
+
+def lease_holder_id() -> str:
+    """Identity of this process for lease ownership."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def run_protocol_recovery(
+    orchestrator: Any,
+    *,
+    holder: str,
+    lease_seconds: float,
+    stale_after_seconds: Optional[float] = None,
+    limit: int = 200,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Run one recovery pass if this process holds the recovery lease.
+
+    Returns the recovery actions, or None when another holder has the lease.
+    """
+    if not orchestrator.db.acquire_lease(RECOVERY_LEASE, holder, lease_seconds):
+        logger.debug("protocol_recovery_lease_busy", extra={"holder": holder})
+        return None
+    recovered = orchestrator.recover_stuck_protocols(limit=limit, stale_after_seconds=stale_after_seconds)
+    if recovered:
+        logger.warning("protocol_recovery_actions", extra={"recovered_count": len(recovered)})
+    return recovered
+
+
+class ProtocolWatchdog:
+    """Daemon thread that recovers stuck protocols at startup and every ``interval_seconds``."""
+
+    def __init__(
+        self,
+        orchestrator_factory: Callable[[], Any],
+        *,
+        interval_seconds: float,
+        stale_after_seconds: Optional[float] = None,
+        holder: Optional[str] = None,
+    ) -> None:
+        self._orchestrator_factory = orchestrator_factory
+        self._interval = max(1.0, float(interval_seconds))
+        self._stale_after = stale_after_seconds
+        self._lease_seconds = max(_MIN_LEASE_SECONDS, self._interval * _LEASE_INTERVALS)
+        self.holder = holder or lease_holder_id()
+        self._orchestrator: Optional[Any] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> Optional[List[Dict[str, Any]]]:
+        if self._orchestrator is None:
+            self._orchestrator = self._orchestrator_factory()
+        return run_protocol_recovery(
+            self._orchestrator,
+            holder=self.holder,
+            lease_seconds=self._lease_seconds,
+            stale_after_seconds=self._stale_after,
+        )
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="devgodzilla-protocol-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._orchestrator is not None:
+            try:
+                self._orchestrator.db.release_lease(RECOVERY_LEASE, self.holder)
+            except Exception as exc:
+                logger.warning("protocol_recovery_lease_release_failed", extra={"error": str(exc)})
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                self.run_once()
+            except Exception as exc:
+                logger.error("protocol_recovery_failed", extra={"error": str(exc)})
+            if self._stop.wait(self._interval):
+                return
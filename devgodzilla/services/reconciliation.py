@@ -6,11 +6,13 @@ Detects and resolves drift between local database state and Windmill's
 actual job execution state.
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from devgodzilla.db.async_database import AsyncDatabase, get_async_database
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import (
     ProtocolRun,
@@ -122,8 +124,8 @@ class ReconciliationService(Service):
     - Providing audit trail of all reconciliation actions
     
     Example:
-        service = ReconciliationService(context, db, windmill_client)
-        report = await service.reconcile_runs()
+        async with ReconciliationService(context, db, windmill_client) as service:
+            report = await service.reconcile_runs()
         print(f"Checked {report.total_checked}, fixed {report.auto_fixed}")
     """
 
@@ -134,9 +136,27 @@ class ReconciliationService(Service):
         windmill: Optional[WindmillClient] = None,
     ) -> None:
         super().__init__(context)
-        self.db = db
+        # All DB access here happens on the event loop, so it goes through
+        # the async facade; self.db stays the synchronous database. The API
+        # passes its shared facade; a facade built here for a plain Database
+        # is owned by this service and released by close().
+        self._owns_adb = not isinstance(db, AsyncDatabase)
+        self.adb = get_async_database(db)
+        self.db = self.adb.sync
         self.windmill = windmill
 
+    async def close(self) -> None:
+        """Release the async facade if this service created it."""
+        if self._owns_adb:
+            self._owns_adb = False
+            await self.adb.close()
+
+    async def __aenter__(self) -> "ReconciliationService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
     async def reconcile_runs(
         self,
         *,
@@ -156,7 +176,7 @@ class ReconciliationService(Service):
         start_time = datetime.now(timezone.utc)
         
         # Get all active (non-terminal) step runs
-        active_steps = self._get_active_step_runs(protocol_run_id)
+        active_steps = await self._get_active_step_runs(protocol_run_id)
         
         details: List[ReconciliationDetail] = []
         mismatches = 0
@@ -220,8 +240,8 @@ class ReconciliationService(Service):
         Returns:
             ProtocolReconciliation with per-protocol details
         """
-        protocol = self.db.get_protocol_run(protocol_run_id)
-        steps = self.db.list_step_runs(protocol_run_id)
+        protocol = await self.adb.get_protocol_run(protocol_run_id)
+        steps = await self.adb.list_step_runs(protocol_run_id)
         
         # Filter to active steps only
         active_steps = [s for s in steps if s.status not in STEP_TERMINAL_STATUSES]
@@ -269,7 +289,7 @@ class ReconciliationService(Service):
         Returns:
             StepReconciliation with details
         """
-        step = self.db.get_step_run(step_run_id)
+        step = await self.adb.get_step_run(step_run_id)
         detail = await self._reconcile_step(step, dry_run=dry_run)
         
         return StepReconciliation(
@@ -329,7 +349,7 @@ class ReconciliationService(Service):
         
         # Query Windmill for job status
         try:
-            job_info = self.windmill.get_job(windmill_job_id)
+            job_info = await asyncio.to_thread(self.windmill.get_job, windmill_job_id)
             windmill_status = job_info.status.value
         except Exception as e:
             self.logger.error(
@@ -383,10 +403,10 @@ class ReconciliationService(Service):
         if can_auto_fix and not dry_run:
             # Apply fix
             try:
-                self.db.update_step_status(step.id, mapped_status)
+                await self.adb.update_step_status(step.id, mapped_status)
                 
                 # Log the reconciliation action
-                self.db.append_event(
+                await self.adb.append_event(
                     protocol_run_id=step.protocol_run_id,
                     step_run_id=step.id,
                     event_type="reconciliation_auto_fix",
@@ -468,7 +488,7 @@ class ReconciliationService(Service):
         Looks up job_runs table by step_run_id with windmill_job_id.
         """
         try:
-            job_runs = self.db.list_job_runs(step_run_id=step.id, limit=1)
+            job_runs = await self.adb.list_job_runs(step_run_id=step.id, limit=1)
             if job_runs and job_runs[0].windmill_job_id:
                 return job_runs[0].windmill_job_id
         except Exception as e:
@@ -481,7 +501,7 @@ class ReconciliationService(Service):
             )
         return None
 
-    def _get_active_step_runs(
+    async def _get_active_step_runs(
         self,
         protocol_run_id: Optional[int] = None,
     ) -> List[StepRun]:
@@ -495,11 +515,11 @@ class ReconciliationService(Service):
             List of active StepRun objects
         """
         if protocol_run_id:
-            steps = self.db.list_step_runs(protocol_run_id)
+            steps = await self.adb.list_step_runs(protocol_run_id)
             return [s for s in steps if s.status not in STEP_TERMINAL_STATUSES]
         
         # Get all protocols and their steps
-        protocols = self.db.list_all_protocol_runs(limit=500)
+        protocols = await self.adb.list_all_protocol_runs(limit=500)
         active_steps: List[StepRun] = []
         
         for protocol in protocols:
@@ -511,7 +531,7 @@ class ReconciliationService(Service):
             ):
                 continue
             
-            steps = self.db.list_step_runs(protocol.id)
+            steps = await self.adb.list_step_runs(protocol.id)
             active_steps.extend(
                 s for s in steps if s.status not in STEP_TERMINAL_STATUSES
             )
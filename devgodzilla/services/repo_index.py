@@ -0,0 +1,486 @@
+"""
+DevGodzilla Repository Index
+
+File-tree index used to build the repository snapshot injected into planning
+prompts. The index is built from the committed tree (`git ls-tree`), so ignored
+and untracked files never show up, and it is keyed by the tree sha:
+
+- the rendered snapshot for a tree is memoized in-process, so repeat plans of
+  the same commit cost nothing;
+- the index itself always covers the whole tree, is persisted under the git
+  common dir (shared by every worktree of the repository) and moved to a new
+  commit by applying `git diff-tree` instead of re-listing the whole tree.
+
+A repo_root below the top level of its repository sees the part of the index
+under its prefix, with paths relative to it.
+
+Directories that are not git repositories fall back to a bounded filesystem
+walk, skipping dot-files and dot-directories, that is never cached.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from devgodzilla.logging import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+# Diffs touching more paths than this are cheaper to replace with a full listing.
+MAX_INCREMENTAL_CHANGES = 5000
+# Bound for the non-git walk so a stray home directory can't stall planning.
+MAX_WALK_FILES = 20000
+DIRECTORY_DEPTH = 2
+_SNAPSHOT_CACHE_SIZE = 32
+
+LANGUAGES: Dict[str, str] = {
+    ".py": "Python",
+    ".pyi": "Python",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".c": "C",
+    ".h": "C",
+    ".cc": "C++",
+    ".cpp": "C++",
+    ".hpp": "C++",
+    ".cs": "C#",
+    ".swift": "Swift",
+    ".scala": "Scala",
+    ".sh": "Shell",
+    ".bash": "Shell",
+    ".sql": "SQL",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".scss": "CSS",
+    ".vue": "Vue",
+    ".svelte": "Svelte",
+    ".md": "Markdown",
+    ".rst": "reStructuredText",
+    ".yaml": "YAML",
+    ".yml": "YAML",
+    ".toml": "TOML",
+    ".json": "JSON",
+    ".tf": "Terraform",
+}
+
+_WALK_SKIP_DIRS = {
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    "dist",
+    "build",
+    ".tox",
+}
+
+
+def language_for(path: str) -> Optional[str]:
+    """Language name for a path, by extension."""
+    name = path.rsplit("/", 1)[-1]
+    if name == "Dockerfile" or name.startswith("Dockerfile."):
+        return "Dockerfile"
+    if name == "Makefile":
+        return "Makefile"
+    dot = name.rfind(".")
+    if dot <= 0:
+        return None
+    return LANGUAGES.get(name[dot:].lower())
+
+
+@dataclass
+class DirectoryStats:
+    """Recursive totals for one directory of the index."""
+    path: str
+    files: int = 0
+    size: int = 0
+    languages: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class RepoIndex:
+    """Every tracked file of one tree, with its blob size."""
+    tree: Optional[str]
+    head: Optional[str]
+    files: Dict[str, int]
+
+    @property
+    def total_size(self) -> int:
+        return sum(self.files.values())
+
+    def languages(self) -> Dict[str, Tuple[int, int]]:
+        """Language -> (file count, bytes), largest first."""
+        totals: Dict[str, List[int]] = {}
+        for path, size in self.files.items():
+            language = language_for(path)
+            if language is None:
+                continue
+            entry = totals.setdefault(language, [0, 0])
+            entry[0] += 1
+            entry[1] += size
+        ordered = sorted(totals.items(), key=lambda item: (-item[1][0], item[0]))
+        return {name: (count, size) for name, (count, size) in ordered}
+
+    def directories(self, depth: int = DIRECTORY_DEPTH) -> Dict[str, DirectoryStats]:
+        """Per-directory totals for directories up to `depth` levels deep."""
+        stats: Dict[str, DirectoryStats] = {}
+        for path, size in self.files.items():
+            parts = path.split("/")[:-1]
+            language = language_for(path)
+            for level in range(1, min(len(parts), depth) + 1):
+                prefix = "/".join(parts[:level])
+                entry = stats.get(prefix)
+                if entry is None:
+                    entry = stats[prefix] = DirectoryStats(path=prefix)
+                entry.files += 1
+                entry.size += size
+                if language is not None:
+                    entry.languages[language] = entry.languages.get(language, 0) + 1
+        return stats
+
+    def subtree(self, prefix: str) -> "RepoIndex":
+        """The files under `prefix` (``"dir/"``), with paths relative to it."""
+        if not prefix:
+            return self
+        files = {path[len(prefix):]: size for path, size in self.files.items() if path.startswith(prefix)}
+        return RepoIndex(tree=self.tree, head=self.head, files=files)
+
+    def root_entries(self) -> List[str]:
+        """Top-level files and directories (directories end with `/`)."""
+        entries = set()
+        for path in self.files:
+            head, sep, _ = path.partition("/")
+            entries.add(f"{head}/" if sep else head)
+        return sorted(entries)
+
+    def to_dict(self) -> dict:
+        return {"version": INDEX_VERSION, "tree": self.tree, "head": self.head, "files": self.files}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["RepoIndex"]:
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        files = data.get("files")
+        tree = data.get("tree")
+        if not isinstance(files, dict) or not isinstance(tree, str):
+            return None
+        return cls(tree=tree, head=data.get("head"), files={str(k): int(v) for k, v in files.items()})
+
+
+def _git(repo_root: Path, *args: str, input: Optional[str] = None) -> Optional[str]:
+    from devgodzilla.services.git import run_process
+
+    try:
+        result = run_process(
+            ["git", *args],
+            cwd=repo_root,
+            check=False,
+            input=input,
+            encoding="utf-8",
+            errors="surrogateescape",
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _resolve_head(repo_root: Path) -> Optional[Tuple[str, str, Path, str]]:
+    """
+    (HEAD sha, tree sha, git common dir, prefix of repo_root within the
+    repository), or None outside a repository with commits.
+    """
+    out = _git(repo_root, "rev-parse", "HEAD", "HEAD^{tree}", "--git-common-dir", "--show-prefix")
+    if out is None:
+        return None
+    lines = out.splitlines()
+    if len(lines) < 3:
+        return None
+    common_dir = Path(lines[2])
+    if not common_dir.is_absolute():
+        common_dir = repo_root / common_dir
+    prefix = lines[3].strip() if len(lines) > 3 else ""
+    return lines[0].strip(), lines[1].strip(), common_dir.resolve(), prefix
+
+
+def _list_tree(repo_root: Path, tree: str) -> Optional[Dict[str, int]]:
+    # --full-tree: paths from the top level, like diff-tree, whatever the cwd.
+    out = _git(repo_root, "ls-tree", "-r", "-l", "-z", "--full-tree", tree)
+    if out is None:
+        return None
+    files: Dict[str, int] = {}
+    for record in out.split("\0"):
+        if not record:
+            continue
+        meta, _, path = record.partition("\t")
+        parts = meta.split()
+        # Submodules are listed as `commit` entries without a size.
+        if len(parts) != 4 or parts[1] != "blob":
+            continue
+        try:
+            files[path] = int(parts[3])
+        except ValueError:
+            continue
+    return files
+
+
+def _blob_sizes(repo_root: Path, shas: List[str]) -> Optional[Dict[str, int]]:
+    if not shas:
+        return {}
+    out = _git(
+        repo_root,
+        "cat-file",
+        "--batch-check=%(objectname) %(objectsize)",
+        input="\n".join(shas) + "\n",
+    )
+    if out is None:
+        return None
+    sizes: Dict[str, int] = {}
+    for line in out.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1].isdigit():
+            sizes[parts[0]] = int(parts[1])
+    return sizes
+
+
+def _apply_diff(repo_root: Path, base: RepoIndex, tree: str, head: str) -> Optional[RepoIndex]:
+    """Move `base` to `tree` using `git diff-tree`; None when a full listing is needed."""
+    out = _git(repo_root, "diff-tree", "-r", "-z", "--no-renames", base.tree or "", tree)
+    if out is None:
+        return None
+    tokens = out.split("\0")
+    removed: List[str] = []
+    changed: Dict[str, str] = {}
+    i = 0
+    while i + 1 < len(tokens):
+        meta, path = tokens[i], tokens[i + 1]
+        i += 2
+        parts = meta.lstrip(":").split()
+        if len(parts) != 5:
+            return None
+        new_mode, new_sha, status = parts[1], parts[3], parts[4]
+        if status == "D" or new_mode == "160000":
+            removed.append(path)
+        else:
+            changed[path] = new_sha
+        if len(removed) + len(changed) > MAX_INCREMENTAL_CHANGES:
+            return None
+
+    sizes = _blob_sizes(repo_root, sorted(set(changed.values())))
+    if sizes is None:
+        return None
+    files = dict(base.files)
+    for path in removed:
+        files.pop(path, None)
+    for path, sha in changed.items():
+        if sha not in sizes:
+            return None
+        files[path] = sizes[sha]
+    return RepoIndex(tree=tree, head=head, files=files)
+
+
+def _walk_index(repo_root: Path) -> RepoIndex:
+    files: Dict[str, int] = {}
+    for dirpath, dirnames, filenames in os.walk(repo_root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in _WALK_SKIP_DIRS)
+        rel_dir = Path(dirpath).relative_to(repo_root).as_posix()
+        for name in sorted(f for f in filenames if not f.startswith(".")):
+            rel = name if rel_dir == "." else f"{rel_dir}/{name}"
+            try:
+                files[rel] = os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            if len(files) >= MAX_WALK_FILES:
+                return RepoIndex(tree=None, head=None, files=files)
+    return RepoIndex(tree=None, head=None, files=files)
+
+
+class RepoIndexStore:
+    """
+    Persisted index for one repository, updated incrementally between commits.
+
+    Shared by every worktree of the repository; git runs in the worktree of
+    the caller, since any other one may have been removed since.
+    """
+
+    def __init__(self, common_dir: Path) -> None:
+        self.common_dir = common_dir
+        self._lock = threading.Lock()
+        self._index: Optional[RepoIndex] = None
+
+    @staticmethod
+    def cache_path(common_dir: Path) -> Path:
+        return common_dir / "devgodzilla" / "repo-index.json"
+
+    def _load(self, path: Path) -> Optional[RepoIndex]:
+        try:
+            return RepoIndex.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _store(self, path: Path, index: RepoIndex) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(index.to_dict()), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug("repo_index_store_failed", extra={"path": str(path), "error": str(e)})
+
+    def get(self, repo_root: Path, *, head: str, tree: str) -> Optional[RepoIndex]:
+        with self._lock:
+            if self._index is not None and self._index.tree == tree:
+                return self._index
+            path = self.cache_path(self.common_dir)
+            base = self._index or self._load(path)
+            if base is not None and base.tree == tree:
+                self._index = base
+                return base
+
+            index = _apply_diff(repo_root, base, tree, head) if base is not None else None
+            mode = "incremental"
+            if index is None:
+                files = _list_tree(repo_root, tree)
+                if files is None:
+                    return None
+                index = RepoIndex(tree=tree, head=head, files=files)
+                mode = "full"
+            logger.debug(
+                "repo_index_built",
+                extra={"repo_root": str(repo_root), "tree": tree, "mode": mode, "files": len(index.files)},
+            )
+            self._store(path, index)
+            self._index = index
+            return index
+
+
+_stores: Dict[Path, RepoIndexStore] = {}
+_snapshots: "OrderedDict[tuple, str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load_repo_index(repo_root: Path) -> RepoIndex:
+    """
+    Index of the committed tree at HEAD under repo_root, or a filesystem walk
+    outside git.
+    """
+    repo_root = Path(repo_root).expanduser().resolve()
+    return _load_index(repo_root, _resolve_head(repo_root))
+
+
+def _load_index(repo_root: Path, resolved: Optional[Tuple[str, str, Path, str]]) -> RepoIndex:
+    if resolved is None:
+        return _walk_index(repo_root)
+    head, tree, common_dir, prefix = resolved
+    with _cache_lock:
+        store = _stores.get(common_dir)
+        if store is None:
+            store = _stores[common_dir] = RepoIndexStore(common_dir)
+    index = store.get(repo_root, head=head, tree=tree)
+    return index.subtree(prefix) if index is not None else _walk_index(repo_root)
+
+
+def _format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{int(value)} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{size} B"
+
+
+def render_snapshot(index: RepoIndex, *, max_dirs: int = 40, max_entries: int = 50, max_languages: int = 8) -> str:
+    """Bounded markdown summary of an index."""
+    lines = ["# Repository Structure", ""]
+    summary = f"{len(index.files)} files, {_format_size(index.total_size)}"
+    if index.head:
+        summary = f"Commit `{index.head[:12]}`: {summary}"
+    lines.append(summary)
+
+    languages = index.languages()
+    if languages:
+        counted = sum(count for count, _ in languages.values()) or 1
+        shown = [
+            f"{name} {count} files ({count * 100 // counted}%)"
+            for name, (count, _) in list(languages.items())[:max_languages]
+        ]
+        lines.append(f"Languages: {', '.join(shown)}")
+    lines.append("")
+
+    directories = index.directories()
+    if directories:
+        picked = sorted(directories.values(), key=lambda d: (-d.files, d.path))[:max_dirs]
+        lines.append("## Directories")
+        lines.append("| Path | Files | Size | Languages |")
+        lines.append("|---|---|---|---|")
+        for stats in sorted(picked, key=lambda d: d.path):
+            top = sorted(stats.languages.items(), key=lambda item: (-item[1], item[0]))[:3]
+            langs = ", ".join(name for name, _ in top) or "-"
+            lines.append(f"| {stats.path}/ | {stats.files} | {_format_size(stats.size)} | {langs} |")
+        if len(directories) > len(picked):
+            lines.append(f"- ... {len(directories) - len(picked)} more directories")
+        lines.append("")
+
+    entries = index.root_entries()
+    if entries:
+        lines.append("## (root)")
+        for entry in entries[:max_entries]:
+            lines.append(f"- {entry}")
+        if len(entries) > max_entries:
+            lines.append(f"- ... {len(entries) - max_entries} more")
+        lines.append("")
+
+    lines.append("## Common Commands")
+    if "Makefile" in index.files:
+        lines.append("- `make` targets available")
+    if "package.json" in index.files:
+        lines.append("- `npm run` scripts available")
+    if "pyproject.toml" in index.files:
+        lines.append("- Python project (pyproject.toml)")
+
+    return "\n".join(lines)
+
+
+def build_repo_snapshot(repo_root: Path, *, max_dirs: int = 40, max_entries: int = 50) -> str:
+    """
+    Markdown snapshot of the repository at HEAD for prompt injection.
+
+    Snapshots of git repositories are memoized per (repository, tree, prefix),
+    so rebuilding one for a commit that was already planned is a dictionary
+    lookup.
+    """
+    repo_root = Path(repo_root).expanduser().resolve()
+    resolved = _resolve_head(repo_root)
+    key = None
+    if resolved is not None:
+        key = (str(resolved[2]), resolved[1], resolved[3], max_dirs, max_entries)
+        with _cache_lock:
+            cached = _snapshots.get(key)
+            if cached is not None:
+                _snapshots.move_to_end(key)
+                return cached
+
+    snapshot = render_snapshot(_load_index(repo_root, resolved), max_dirs=max_dirs, max_entries=max_entries)
+    if key is not None:
+        with _cache_lock:
+            _snapshots[key] = snapshot
+            while len(_snapshots) > _SNAPSHOT_CACHE_SIZE:
+                _snapshots.popitem(last=False)
+    return snapshot
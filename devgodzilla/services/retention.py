@@ -0,0 +1,396 @@
+"""
+DevGodzilla Retention Service
+
+Keeps the high-churn history tables (events, job_runs, run_artifacts,
+feedback_events, qa_results) at a bounded size.
+
+Expired rows are deleted in small batches, one short transaction per batch, so
+retention never holds long locks. Rows are archived first (when an archive
+directory is configured) to gzip-compressed JSONL segment files with a
+per-table manifest, which ArchiveStore reads back for history lookups. On
+PostgreSQL with a partitioned ``events`` table, whole expired monthly
+partitions are archived and dropped instead of deleted row by row.
+
+Each pass also garbage-collects the artifact store: step artifact manifests
+older than the ``run_artifacts`` TTL are expired and blobs no manifest
+references are removed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from devgodzilla.db.database import RETENTION_TABLES
+from devgodzilla.engines.artifact_store import ArtifactStore, get_artifact_store
+from devgodzilla.events_catalog import infer_event_category, normalize_event_type
+from devgodzilla.logging import get_logger
+from devgodzilla.models.domain import Event, JobRunStatus
+from devgodzilla.services.base import Service, ServiceContext
+
+logger = get_logger(__name__)
+
+# Only finished jobs are pruned; queued/running rows are live state.
+_TERMINAL_JOB_STATUSES = [
+    JobRunStatus.SUCCEEDED,
+    JobRunStatus.FAILED,
+    JobRunStatus.CANCELLED,
+]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _parse_ts(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None) if value.tzinfo is None else value.astimezone(timezone.utc).replace(tzinfo=None)
+    if isinstance(value, str) and value.strip():
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    return None
+
+
+# =============================================================================
+# Archive store
+# =============================================================================
+
+class ArchiveStore:
+    """
+    Append-only archive of expired rows.
+
+    Layout::
+
+        <root>/<table>/<table>-<utc stamp>-<n>.jsonl.gz   one segment per batch
+        <root>/<table>/manifest.jsonl                     one line per segment
+
+    Manifest entries carry the segment's row count and created_at range so
+    reads only open segments that can match.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._counter = 0
+
+    def _table_dir(self, table: str) -> Path:
+        if table not in RETENTION_TABLES:
+            raise ValueError(f"Table not eligible for retention: {table}")
+        return self.root / table
+
+    def write_segment(self, table: str, rows: List[Dict[str, Any]]) -> Optional[Path]:
+        """Write rows to a new segment and record it in the manifest (fsync'd)."""
+        if not rows:
+            return None
+        directory = self._table_dir(table)
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._counter += 1
+            name = f"{table}-{_utcnow():%Y%m%dT%H%M%S%f}-{self._counter}.jsonl.gz"
+        path = directory / name
+        tmp = path.with_suffix(path.suffix + ".tmp")
+
+        stamps = [ts for ts in (_parse_ts(row.get("created_at")) for row in rows) if ts]
+        with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+            for row in rows:
+                fh.write(json.dumps(row, default=str, sort_keys=True))
+                fh.write("\n")
+        with open(tmp, "rb") as fh:
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+
+        entry = {
+            "file": name,
+            "rows": len(rows),
+            "min_created_at": min(stamps).isoformat() if stamps else None,
+            "max_created_at": max(stamps).isoformat() if stamps else None,
+        }
+        with self._lock:
+            with open(directory / "manifest.jsonl", "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry) + "\n")
+                fh.flush()
+                os.fsync(fh.fileno())
+        return path
+
+    def segments(self, table: str) -> List[Dict[str, Any]]:
+        manifest = self._table_dir(table) / "manifest.jsonl"
+        if not manifest.exists():
+            return []
+        entries = []
+        for line in manifest.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                entries.append(json.loads(line))
+        return entries
+
+    def read(
+        self,
+        table: str,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield archived rows, oldest segment first.
+
+        ``since``/``until`` bound created_at (segments outside the range are
+        skipped unopened); ``where`` matches columns by equality. A row
+        archived twice (e.g. a batch retried after a failed delete) is
+        yielded once.
+        """
+        key = RETENTION_TABLES[table]
+        directory = self._table_dir(table)
+        seen = set()
+        for entry in self.segments(table):
+            lo = _parse_ts(entry.get("min_created_at"))
+            hi = _parse_ts(entry.get("max_created_at"))
+            if since and hi and hi < since:
+                continue
+            if until and lo and lo >= until:
+                continue
+            path = directory / entry["file"]
+            if not path.exists():
+                continue
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                for line in fh:
+                    row = json.loads(line)
+                    if where and any(row.get(k) != v for k, v in where.items()):
+                        continue
+                    ts = _parse_ts(row.get("created_at"))
+                    if since and ts and ts < since:
+                        continue
+                    if until and ts and ts >= until:
+                        continue
+                    marker = row.get(key)
+                    if marker in seen:
+                        continue
+                    seen.add(marker)
+                    yield row
+
+
+def archived_row_to_event(row: Dict[str, Any]) -> Event:
+    """Rebuild an Event from an archived ``events`` row."""
+    metadata = row.get("metadata")
+    if isinstance(metadata, str):
+        try:
+            metadata = json.loads(metadata)
+        except ValueError:
+            metadata = None
+    event_type = normalize_event_type(row["event_type"])
+    created = _parse_ts(row.get("created_at"))
+    return Event(
+        id=row["id"],
+        protocol_run_id=row.get("protocol_run_id"),
+        step_run_id=row.get("step_run_id"),
+        event_type=event_type,
+        message=row.get("message") or "",
+        metadata=metadata if isinstance(metadata, dict) else None,
+        created_at=created.replace(tzinfo=timezone.utc).isoformat() if created else str(row.get("created_at") or ""),
+        event_category=infer_event_category(event_type),
+        project_id=row.get("project_id"),
+    )
+
+
+# =============================================================================
+# Retention service
+# =============================================================================
+
+@dataclass
+class RetentionResult:
+    """Outcome of one retention pass over one table."""
+    table: str
+    cutoff: Optional[datetime] = None
+    deleted: int = 0
+    archived: int = 0
+    batches: int = 0
+    partitions_dropped: List[str] = field(default_factory=list)
+    skipped: Optional[str] = None
+
+
+class RetentionService(Service):
+    """
+    Applies per-table TTLs from config (``retention_ttl_days``).
+
+    Example:
+        service = RetentionService(context, db)
+        results = service.run()
+    """
+
+    def __init__(
+        self,
+        context: ServiceContext,
+        db,
+        *,
+        archive: Optional[ArchiveStore] = None,
+        artifact_store: Optional[ArtifactStore] = None,
+        batch_pause_seconds: float = 0.05,
+        blob_grace_seconds: float = 3600.0,
+    ) -> None:
+        super().__init__(context)
+        self.db = db
+        archive_dir = getattr(self.config, "retention_archive_dir", None)
+        self.archive = archive if archive is not None else (ArchiveStore(archive_dir) if archive_dir else None)
+        self.artifact_store = artifact_store if artifact_store is not None else get_artifact_store(self.config)
+        self.blob_grace_seconds = blob_grace_seconds
+        self.batch_size = max(1, int(getattr(self.config, "retention_batch_size", 500) or 500))
+        self.batch_pause_seconds = batch_pause_seconds
+
+    def run(self, *, now: Optional[datetime] = None, dry_run: bool = False) -> List[RetentionResult]:
+        """Apply retention to every configured table."""
+        now = now or _utcnow()
+        ttls: Dict[str, int] = dict(getattr(self.config, "retention_ttl_days", {}) or {})
+        results = []
+        for table in RETENTION_TABLES:
+            days = int(ttls.get(table, 0) or 0)
+            if days <= 0:
+                results.append(RetentionResult(table=table, skipped="no ttl"))
+                continue
+            results.append(self.prune_table(table, cutoff=now - timedelta(days=days), dry_run=dry_run))
+        if self.artifact_store is not None:
+            days = int(ttls.get("run_artifacts", 0) or 0)
+            results.append(
+                self.collect_artifact_blobs(cutoff=now - timedelta(days=days) if days > 0 else None, dry_run=dry_run)
+            )
+        if not dry_run:
+            try:
+                self.db.ensure_event_partitions()
+            except Exception as exc:
+                self.logger.warning("event_partitions_ensure_failed", extra=self.log_extra(error=str(exc)))
+        return results
+
+    def prune_table(self, table: str, *, cutoff: datetime, dry_run: bool = False) -> RetentionResult:
+        """Archive and delete rows of ``table`` created before ``cutoff``."""
+        result = RetentionResult(table=table, cutoff=cutoff)
+        statuses = _TERMINAL_JOB_STATUSES if table == "job_runs" else None
+
+        if dry_run:
+            rows = self.db.fetch_expired_rows(table, before=cutoff, limit=self.batch_size, statuses=statuses)
+            result.deleted = len(rows)
+            return result
+
+        if table == "events" and self.db.events_partitioned():
+            self._drop_expired_partitions(cutoff, result)
+
+        while True:
+            rows = self.db.fetch_expired_rows(table, before=cutoff, limit=self.batch_size, statuses=statuses)
+            if not rows:
+                break
+            if self.archive is not None:
+                self.archive.write_segment(table, rows)
+                result.archived += len(rows)
+            key = RETENTION_TABLES[table]
+            result.deleted += self.db.delete_rows(table, [row[key] for row in rows])
+            result.batches += 1
+            if len(rows) < self.batch_size:
+                break
+            # Let writers in between batches.
+            if self.batch_pause_seconds:
+                time.sleep(self.batch_pause_seconds)
+
+        self.logger.info(
+            "retention_table_pruned",
+            extra=self.log_extra(
+                table=table,
+                cutoff=cutoff.isoformat(),
+                deleted=result.deleted,
+                archived=result.archived,
+                batches=result.batches,
+                partitions_dropped=len(result.partitions_dropped),
+            ),
+        )
+        return result
+
+    def collect_artifact_blobs(self, *, cutoff: Optional[datetime] = None, dry_run: bool = False) -> RetentionResult:
+        """Expire artifact manifests older than ``cutoff`` and remove unreferenced blobs."""
+        result = RetentionResult(table="artifact_blobs", cutoff=cutoff)
+        if dry_run:
+            result.skipped = "dry run"
+            return result
+        expire_before = cutoff.replace(tzinfo=timezone.utc).timestamp() if cutoff is not None else None
+        gc = self.artifact_store.gc(
+            grace_seconds=self.blob_grace_seconds,
+            expire_manifests_before=expire_before,
+        )
+        result.deleted = gc.blobs_removed
+        self.logger.info(
+            "retention_artifact_blobs_collected",
+            extra=self.log_extra(
+                blobs_removed=gc.blobs_removed,
+                bytes_freed=gc.bytes_freed,
+                manifests_expired=gc.manifests_expired,
+            ),
+        )
+        return result
+
+    def _drop_expired_partitions(self, cutoff: datetime, result: RetentionResult) -> None:
+        """Archive then drop monthly events partitions entirely older than cutoff."""
+        for partition in self.db.list_event_partitions():
+            if partition["end"] > cutoff:
+                continue
+            name = partition["name"]
+            if self.archive is not None:
+                after = None
+                while True:
+                    rows = self.db.fetch_expired_rows(
+                        name, before=partition["end"], limit=self.batch_size, after_key=after
+                    )
+                    if not rows:
+                        break
+                    self.archive.write_segment("events", rows)
+                    result.archived += len(rows)
+                    after = rows[-1]["id"]
+            if self.db.drop_event_partition(name):
+                result.partitions_dropped.append(name)
+
+    def list_archived_events(self, protocol_run_id: int) -> List[Event]:
+        """Archived events for a protocol run, oldest first."""
+        if self.archive is None:
+            return []
+        rows = self.archive.read("events", where={"protocol_run_id": protocol_run_id})
+        return sorted((archived_row_to_event(r) for r in rows), key=lambda e: e.id)
+
+
+# =============================================================================
+# Background worker
+# =============================================================================
+
+class RetentionWorker:
+    """Daemon thread that runs RetentionService every ``interval_seconds``."""
+
+    def __init__(self, service_factory, *, interval_seconds: float) -> None:
+        self._service_factory = service_factory
+        self._interval = max(1.0, float(interval_seconds))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="devgodzilla-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self._service_factory().run()
+            except Exception as exc:
+                logger.error("retention_run_failed", extra={"error": str(exc)})
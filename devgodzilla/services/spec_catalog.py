@@ -0,0 +1,108 @@
+"""
+DevGodzilla Specification Catalog Reconciler
+
+Rebuilds ``spec_catalog`` rows from what ``SpecificationService.list_specs``
+sees (spec runs, or the specs folders of projects without runs). Spec run
+writes already keep their rows current; the reconciler picks up folders
+edited outside DevGodzilla and repairs anything a failed write missed.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+from devgodzilla.db.spec_catalog import catalog_entry
+from devgodzilla.logging import get_logger
+from devgodzilla.models.domain import Project
+from devgodzilla.services.base import Service, ServiceContext
+from devgodzilla.services.specification import SpecificationService
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SpecCatalogResult:
+    """Outcome of reconciling one project."""
+    project_id: int
+    entries: int
+    error: Optional[str] = None
+
+
+class SpecCatalogService(Service):
+    """
+    Reconciles the specification catalog with spec runs and the filesystem.
+
+    Example:
+        service = SpecCatalogService(context, db)
+        results = service.reconcile_all()
+    """
+
+    def __init__(self, context: ServiceContext, db, *, specs: Optional[SpecificationService] = None) -> None:
+        super().__init__(context)
+        self.db = db
+        self.specs = specs or SpecificationService(context, db)
+
+    def reconcile_project(self, project: Project) -> SpecCatalogResult:
+        """Replace a project's catalog rows with its current specs."""
+        if not project.local_path:
+            self.db.upsert_spec_catalog_entries(project.id, [], replace=True)
+            return SpecCatalogResult(project_id=project.id, entries=0)
+        specs = self.specs.list_specs(project.local_path, project_id=project.id)
+        entries = [catalog_entry(spec, project_path=project.local_path) for spec in specs]
+        written = self.db.upsert_spec_catalog_entries(project.id, entries, replace=True)
+        return SpecCatalogResult(project_id=project.id, entries=written)
+
+    def reconcile_all(self) -> List[SpecCatalogResult]:
+        """Reconcile every project; one failing project does not stop the rest."""
+        results = []
+        for project in self.db.list_projects():
+            try:
+                results.append(self.reconcile_project(project))
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "spec_catalog_reconcile_failed",
+                    extra={"project_id": project.id, "error": str(exc)},
+                )
+                results.append(SpecCatalogResult(project_id=project.id, entries=0, error=str(exc)))
+        logger.info(
+            "spec_catalog_reconciled",
+            extra={"projects": len(results), "entries": sum(r.entries for r in results)},
+        )
+        return results
+
+    def run(self) -> List[SpecCatalogResult]:
+        return self.reconcile_all()
+
+
+class SpecCatalogWorker:
+    """Daemon thread that reconciles the catalog at startup and every ``interval_seconds``."""
+
+    def __init__(self, service_factory, *, interval_seconds: float) -> None:
+        self._service_factory = service_factory
+        self._interval = max(1.0, float(interval_seconds))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="devgodzilla-spec-catalog", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                self._service_factory().run()
+            except Exception as exc:
+                logger.error("spec_catalog_run_failed", extra={"error": str(exc)})
+            if self._stop.wait(self._interval):
+                return
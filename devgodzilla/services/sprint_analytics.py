@@ -0,0 +1,140 @@
+"""
+Sprint Analytics Service
+
+Velocity, completion and story-point aggregates computed in SQL, plus
+burndown/burnup series read from the daily ``sprint_burndown`` snapshots that
+task writes keep current. Nothing here loads a sprint's tasks.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from devgodzilla.db.database import Database
+from devgodzilla.logging import get_logger
+from devgodzilla.models.domain import Sprint
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SprintStats:
+    """Task and story-point totals for one sprint."""
+    sprint_id: int
+    total_tasks: int = 0
+    completed_tasks: int = 0
+    total_points: int = 0
+    completed_points: int = 0
+
+    @property
+    def remaining_points(self) -> int:
+        return self.total_points - self.completed_points
+
+    @property
+    def completion_rate(self) -> float:
+        return self.completed_points / self.total_points if self.total_points > 0 else 0.0
+
+
+@dataclass
+class BurndownPoint:
+    """One day of a sprint's burndown (remaining) and burnup (completed vs scope)."""
+    date: str
+    ideal: float
+    remaining: Optional[float] = None
+    completed: Optional[float] = None
+    scope: Optional[float] = None
+
+
+def _parse_day(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+class SprintAnalyticsService:
+    """Service for sprint velocity and burndown analytics."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def stats(self, sprint_id: int) -> SprintStats:
+        return SprintStats(sprint_id=sprint_id, **self.db.get_sprint_stats(sprint_id))
+
+    def refresh_velocity(self, sprint_id: int) -> int:
+        """Store completed story points as the sprint's actual velocity."""
+        completed_points = self.stats(sprint_id).completed_points
+        self.db.update_sprint(sprint_id, velocity_actual=completed_points)
+        logger.info(
+            f"Updated sprint {sprint_id} velocity to {completed_points}",
+            extra={"sprint_id": sprint_id, "velocity_actual": completed_points},
+        )
+        return completed_points
+
+    def velocity_trend(self, project_id: int, current_sprint_id: int, count: int = 5) -> List[int]:
+        """
+        Completed points of the first ``count`` completed sprints in the
+        project (oldest first, excluding the current one), left-padded with
+        zeros to ``count`` entries.
+        """
+        velocities = self.db.list_sprint_velocities(
+            project_id,
+            status="completed",
+            exclude_sprint_id=current_sprint_id,
+            limit=count,
+        )
+        trend = [v["completed_points"] for v in velocities]
+        return [0] * (count - len(trend)) + trend
+
+    def burndown(
+        self,
+        sprint: Sprint,
+        stats: Optional[SprintStats] = None,
+        *,
+        today: Optional[date] = None,
+    ) -> List[BurndownPoint]:
+        """
+        Daily series from the sprint's start to end date, inclusive.
+
+        Each day takes the latest snapshot on or before it (days before the
+        first snapshot take the first one); today always reflects live
+        totals. Days after today only carry the ideal line. Sprints without
+        dates or story points have no series.
+        """
+        start, end = _parse_day(sprint.start_date), _parse_day(sprint.end_date)
+        if start is None or end is None or end <= start:
+            return []
+        stats = stats or self.stats(sprint.id)
+        if stats.total_points == 0:
+            return []
+        today = today or datetime.now(timezone.utc).date()
+
+        snapshots: Dict[str, Dict[str, int]] = {
+            str(row["day"]): row for row in self.db.list_sprint_snapshots(sprint.id)
+        }
+        snapshots[today.isoformat()] = {
+            "total_points": stats.total_points,
+            "completed_points": stats.completed_points,
+        }
+        ordered = sorted(snapshots)
+        first = snapshots[ordered[0]]
+
+        sprint_days = (end - start).days
+        daily_ideal_burn = stats.total_points / sprint_days
+        points: List[BurndownPoint] = []
+        cursor, latest = 0, first
+        for offset in range(sprint_days + 1):
+            day = start + timedelta(days=offset)
+            key = day.isoformat()
+            while cursor < len(ordered) and ordered[cursor] <= key:
+                latest = snapshots[ordered[cursor]]
+                cursor += 1
+            point = BurndownPoint(date=key, ideal=max(0, stats.total_points - offset * daily_ideal_burn))
+            if day <= today:
+                point.scope = latest["total_points"]
+                point.completed = latest["completed_points"]
+                point.remaining = latest["total_points"] - latest["completed_points"]
+            points.append(point)
+        return points
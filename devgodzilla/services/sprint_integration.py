@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Any
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import AgileTask, ProtocolRun, Sprint, StepRun
+from devgodzilla.services.sprint_analytics import SprintAnalyticsService
 
 logger = get_logger(__name__)
 
@@ -118,55 +119,27 @@ class SprintIntegrationService:
 
         step_runs = self.db.list_step_runs(protocol_run_id)
 
-        tasks: List[AgileTask] = []
-
-        for step in step_runs:
-            existing_tasks = self.db.list_tasks(
-                step_run_id=step.id,
-                limit=1,
-            )
-
-            if existing_tasks:
-                task = existing_tasks[0]
-                task = self.db.update_task(
-                    task.id,
-                    sprint_id=sprint_id,
-                    protocol_run_id=protocol_run_id,
-                    board_status=self._map_step_status_to_board_status(step.status),
-                )
-                logger.info(
-                    f"Updated existing task {task.id} for step {step.id}",
-                    extra={
-                        "task_id": task.id,
-                        "step_run_id": step.id,
-                        "sprint_id": sprint_id,
-                    },
-                )
-            elif create_missing_tasks:
-                task = self.db.create_task(
-                    project_id=protocol_run.project_id,
-                    sprint_id=sprint_id,
-                    protocol_run_id=protocol_run_id,
-                    step_run_id=step.id,
-                    title=step.step_name,
-                    description=f"Protocol: {protocol_run.protocol_name}\nStep: {step.step_name}",
-                    task_type="task",
-                    priority=self._determine_priority(step.step_index),
-                    board_status=self._map_step_status_to_board_status(step.status),
-                    story_points=self._estimate_story_points(step),
-                )
-                logger.info(
-                    f"Created task {task.id} for step {step.id}",
-                    extra={
-                        "task_id": task.id,
-                        "step_run_id": step.id,
-                        "sprint_id": sprint_id,
-                    },
-                )
-            else:
-                continue
-
-            tasks.append(task)
+        # Steps that already have a task are moved into the sprint; the rest
+        # get a task created, all in one bulk upsert keyed on step_run_id.
+        tasks = self.db.bulk_upsert_tasks_by_step(
+            [
+                {
+                    "project_id": protocol_run.project_id,
+                    "sprint_id": sprint_id,
+                    "protocol_run_id": protocol_run_id,
+                    "step_run_id": step.id,
+                    "title": step.step_name,
+                    "description": f"Protocol: {protocol_run.protocol_name}\nStep: {step.step_name}",
+                    "task_type": "task",
+                    "priority": self._determine_priority(step.step_index),
+                    "board_status": self._map_step_status_to_board_status(step.status),
+                    "story_points": self._estimate_story_points(step),
+                }
+                for step in step_runs
+            ],
+            update_fields=("sprint_id", "protocol_run_id", "board_status"),
+            create_missing=create_missing_tasks,
+        )
 
         logger.info(
             f"Synced {len(tasks)} tasks from protocol {protocol_run_id} to sprint {sprint_id}",
@@ -237,26 +210,8 @@ class SprintIntegrationService:
         Returns:
             Actual velocity (completed story points)
         """
-        sprint = self.db.get_sprint(sprint_id)
-        tasks = self.db.list_tasks(sprint_id=sprint_id)
-
-        completed_points = sum(
-            task.story_points or 0
-            for task in tasks
-            if task.board_status == "done"
-        )
-
-        self.db.update_sprint(sprint_id, velocity_actual=completed_points)
-
-        logger.info(
-            f"Updated sprint {sprint_id} velocity to {completed_points}",
-            extra={
-                "sprint_id": sprint_id,
-                "velocity_actual": completed_points,
-            },
-        )
-
-        return completed_points
+        self.db.get_sprint(sprint_id)
+        return SprintAnalyticsService(self.db).refresh_velocity(sprint_id)
 
     async def link_protocol_to_sprint(
         self,
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import AgileTask
+from devgodzilla.services.sprint_analytics import SprintAnalyticsService
 
 logger = get_logger(__name__)
 
@@ -56,40 +57,30 @@ class TaskSyncService:
             spec_label = None
 
         if overwrite_existing:
-            # Delete existing tasks in the sprint
-            existing_tasks = self.db.list_tasks(sprint_id=sprint_id)
-            for task in existing_tasks:
-                # Only delete tasks that look like they came from import (optional check?)
-                # For now, simplistic approach: wipe the sprint if overwrite requested
-                self.db.delete_task(task.id)
+            # Wipe the whole sprint in one statement (no list_tasks page limit).
+            deleted = self.db.delete_sprint_tasks(sprint_id)
             logger.info(
-                f"Deleted {len(existing_tasks)} tasks from sprint {sprint_id} (overwrite=True)",
+                f"Deleted {deleted} tasks from sprint {sprint_id} (overwrite=True)",
                 extra={"sprint_id": sprint_id},
             )
 
-        created_tasks: List[AgileTask] = []
-
-        for item in parsed_tasks:
-            
-            # Check for duplicates if not overwriting
-            if not overwrite_existing:
-                existing = self.db.list_tasks(sprint_id=sprint_id)
-                if any(t.title == item["title"] for t in existing):
-                    continue
-
-            labels = [label for label in [spec_label, "speckit"] if label]
-            task = self.db.create_task(
-                project_id=project_id,
-                sprint_id=sprint_id,
-                title=item["title"],
-                description=item.get("description"),
-                task_type="story",
-                priority="medium",
-                board_status=item["board_status"],
-                story_points=item.get("story_points"),
-                labels=labels,
-            )
-            created_tasks.append(task)
+        # One bulk insert; rows whose title already exists in the sprint
+        # (or earlier in the file) are skipped in SQL.
+        labels = [label for label in [spec_label, "speckit"] if label]
+        created_tasks: List[AgileTask] = self.db.bulk_create_tasks([
+            {
+                "project_id": project_id,
+                "sprint_id": sprint_id,
+                "title": item["title"],
+                "description": item.get("description"),
+                "task_type": "story",
+                "priority": "medium",
+                "board_status": item["board_status"],
+                "story_points": item.get("story_points"),
+                "labels": labels,
+            }
+            for item in parsed_tasks
+        ])
 
         logger.info(
             f"Imported {len(created_tasks)} tasks to sprint {sprint_id} from {spec_path}",
@@ -149,13 +140,5 @@ class TaskSyncService:
 
     def _update_sprint_velocity(self, sprint_id: int):
         """Recalculate velocity for the sprint."""
-        sprint = self.db.get_sprint(sprint_id)
-        tasks = self.db.list_tasks(sprint_id=sprint_id)
-        
-        completed_points = sum(
-            t.story_points or 0 
-            for t in tasks 
-            if t.board_status == "done"
-        )
-        
-        self.db.update_sprint(sprint_id, velocity_actual=completed_points)
+        self.db.get_sprint(sprint_id)
+        SprintAnalyticsService(self.db).refresh_velocity(sprint_id)
@@ -145,7 +145,7 @@ def create_steps_from_spec(
     """
     Materialize StepRun rows from a ProtocolSpec.
     
-    Skips already-present steps.
+    Skips already-present steps. All rows are inserted in one bulk write.
     
     Args:
         db: Database instance
@@ -158,29 +158,26 @@ def create_steps_from_spec(
     """
     existing = existing_names or set()
     steps = spec.get("steps", [])
-    created_ids = []
+    rows = []
     
     for i, step_spec in enumerate(steps):
         name = step_spec.get("name", f"step-{i:02d}")
         if name in existing:
             continue
         
-        step_type = step_spec.get("type") or infer_step_type_from_name(name)
-        depends_on = step_spec.get("depends_on", [])
-        parallel_group = step_spec.get("parallel_group")
-        assigned_agent = step_spec.get("engine_id") or step_spec.get("agent")
-        
-        step = db.create_step_run(
-            protocol_run_id=protocol_run_id,
-            step_index=i,
-            step_name=name,
-            step_type=step_type,
-            status=StepStatus.PENDING,
-            depends_on=depends_on,
-            parallel_group=parallel_group,
-            assigned_agent=assigned_agent,
-        )
-        created_ids.append(step.id)
+        rows.append({
+            "protocol_run_id": protocol_run_id,
+            "step_index": i,
+            "step_name": name,
+            "step_type": step_spec.get("type") or infer_step_type_from_name(name),
+            "status": StepStatus.PENDING,
+            "depends_on": step_spec.get("depends_on", []),
+            "parallel_group": step_spec.get("parallel_group"),
+            "assigned_agent": step_spec.get("engine_id") or step_spec.get("agent"),
+        })
+    
+    created = db.bulk_create_step_runs(rows) if rows else []
+    created_ids = [step.id for step in sorted(created, key=lambda s: s.step_index)]
     
     return created_ids
 
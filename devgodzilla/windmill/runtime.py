@@ -0,0 +1,320 @@
+"""
+DevGodzilla Worker Runtime
+
+Warm, process-wide state for the Windmill job entry points in
+``devgodzilla.windmill.worker``. Loading the config, building the database
+(and its Postgres connection pool) and bootstrapping the engine registry
+happen once per process instead of once per job.
+
+Windmill starts a fresh Python process for every job, so the runtime is also
+served from a resident process over a Unix socket (``python -m
+devgodzilla.windmill.worker serve``). Windmill scripts call :func:`dispatch`,
+which hands the job to that process when ``DEVGODZILLA_WORKER_SOCKET`` points
+at one and runs it in-process otherwise.
+
+Isolation: each job runs on its own thread with its own ServiceContext and
+service instances; only the config, database pool and engine registry are
+shared. A failing job is reported back as ``{"success": False, "error": ...}``
+without affecting other jobs, concurrency is capped at the configured number
+of slots, and ``max_jobs`` recycles the process after that many jobs: later
+requests are turned away (and run in the caller's process instead) while the
+jobs already running drain, then the server exits.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from devgodzilla.config import Config, get_config
+from devgodzilla.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class WorkerRuntime:
+    """Config, database and engine registry shared by the jobs of one process."""
+
+    def __init__(self, *, config: Optional[Config] = None, db: Any = None) -> None:
+        self._config = config
+        self._db = db
+        self._engines_ready = False
+        self._lock = threading.Lock()
+        self.setup_seconds = 0.0
+
+    @property
+    def config(self) -> Config:
+        if self._config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = get_config()
+        return self._config
+
+    @property
+    def db(self) -> Any:
+        if self._db is None:
+            with self._lock:
+                if self._db is None:
+                    from devgodzilla.db import get_database
+
+                    config = self.config
+                    self._db = get_database(
+                        db_url=config.db_url,
+                        db_path=Path(config.db_path) if config.db_path else None,
+                        pool_size=config.db_pool_size,
+                    )
+        return self._db
+
+    def context(self, **metadata: Any):
+        """A fresh ServiceContext for one job."""
+        from devgodzilla.services.base import ServiceContext
+
+        return ServiceContext(config=self.config, metadata=dict(metadata))
+
+    def ensure_engines(self) -> None:
+        """Register the default engines once per process."""
+        if self._engines_ready:
+            return
+        with self._lock:
+            if self._engines_ready:
+                return
+            from devgodzilla.engines.bootstrap import bootstrap_default_engines
+
+            bootstrap_default_engines(replace=False)
+            self._engines_ready = True
+
+    def warm(self) -> float:
+        """Build everything up front; returns the seconds it took."""
+        started = time.perf_counter()
+        _ = self.config
+        _ = self.db
+        self.ensure_engines()
+        self.setup_seconds = time.perf_counter() - started
+        return self.setup_seconds
+
+
+_runtime: Optional[WorkerRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> WorkerRuntime:
+    """Get or create the process-wide worker runtime."""
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                _runtime = WorkerRuntime()
+    return _runtime
+
+
+def _reset_runtime_for_tests() -> None:
+    global _runtime
+    with _runtime_lock:
+        _runtime = None
+
+
+# =============================================================================
+# Resident server
+# =============================================================================
+
+def _read_message(sock: socket.socket) -> Dict[str, Any]:
+    chunks = []
+    size = 0
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if chunk.endswith(b"\n"):
+            break
+        if size > _MAX_MESSAGE_BYTES:
+            raise ValueError("worker message too large")
+    if not chunks:
+        raise ConnectionError("worker connection closed")
+    return json.loads(b"".join(chunks))
+
+
+def _write_message(sock: socket.socket, payload: Dict[str, Any]) -> None:
+    sock.sendall(json.dumps(payload, default=str).encode("utf-8") + b"\n")
+
+
+class _JobHandler(socketserver.BaseRequestHandler):
+    server: "WorkerServer"
+
+    def handle(self) -> None:
+        try:
+            request = _read_message(self.request)
+        except (ConnectionError, ValueError) as exc:
+            logger.warning("worker_bad_request", extra={"error": str(exc)})
+            return
+        _write_message(self.request, self.server.run_job(request))
+
+
+class WorkerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serves jobs from a warm runtime over a Unix socket.
+
+    Each connection carries one JSON request line,
+    ``{"command": ..., "kwargs": {...}}``, and gets one JSON result line back.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Path,
+        jobs: Mapping[str, Callable[..., Dict[str, Any]]],
+        *,
+        slots: int = 8,
+        max_jobs: int = 0,
+    ) -> None:
+        self.socket_path = Path(socket_path)
+        self.jobs = dict(jobs)
+        self.max_jobs = max_jobs
+        self._slots = threading.BoundedSemaphore(max(1, slots))
+        self._count_lock = threading.Lock()
+        self._idle = threading.Condition(self._count_lock)
+        self._in_flight = 0
+        self.accepting = True
+        self.jobs_started = 0
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(self.socket_path), _JobHandler)
+
+    def run_job(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        command = request.get("command")
+        job = self.jobs.get(command) if isinstance(command, str) else None
+        if job is None:
+            return {"success": False, "error": f"Unknown worker command: {command}"}
+        with self._count_lock:
+            if not self.accepting:
+                return {"success": False, "error": "Worker is recycling", "recycling": True}
+            self.jobs_started += 1
+            self._in_flight += 1
+            if self.max_jobs > 0 and self.jobs_started >= self.max_jobs:
+                self.accepting = False
+                logger.info("worker_recycling", extra={"jobs_started": self.jobs_started})
+        started = time.perf_counter()
+        try:
+            with self._slots:
+                result = job(**(request.get("kwargs") or {}))
+        except Exception as exc:
+            logger.error("worker_job_failed", extra={"command": command, "error": str(exc)})
+            result = {"success": False, "error": str(exc)}
+        finally:
+            with self._count_lock:
+                self._in_flight -= 1
+                drained = self._in_flight == 0
+                if drained:
+                    self._idle.notify_all()
+                recycle = drained and not self.accepting
+            if recycle:
+                # The last in-flight job after the threshold stops the server.
+                threading.Thread(target=self.shutdown, daemon=True).start()
+        logger.info(
+            "worker_job_finished",
+            extra={"command": command, "duration_ms": round((time.perf_counter() - started) * 1000, 1)},
+        )
+        return result
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no job is running; returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def serve(
+    socket_path: Path,
+    jobs: Mapping[str, Callable[..., Dict[str, Any]]],
+    *,
+    slots: int = 8,
+    max_jobs: int = 0,
+) -> None:
+    """Warm the runtime, then serve jobs until shut down or recycled."""
+    setup = get_runtime().warm()
+    server = WorkerServer(socket_path, jobs, slots=slots, max_jobs=max_jobs)
+    logger.info(
+        "worker_runtime_serving",
+        extra={"socket": str(socket_path), "slots": slots, "setup_ms": round(setup * 1000, 1)},
+    )
+    try:
+        server.serve_forever()
+    finally:
+        # Handler threads are daemons; never exit under a running job.
+        server.accepting = False
+        server.drain()
+        server.server_close()
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+def worker_socket_path() -> Optional[Path]:
+    """The resident worker socket from ``DEVGODZILLA_WORKER_SOCKET``, if set."""
+    value = (os.environ.get("DEVGODZILLA_WORKER_SOCKET") or "").strip()
+    return Path(value).expanduser() if value else None
+
+
+def submit(
+    socket_path: Path,
+    command: str,
+    kwargs: Optional[Dict[str, Any]] = None,
+    *,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Run ``command`` on the resident worker at ``socket_path``."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        _write_message(sock, {"command": command, "kwargs": kwargs or {}})
+        return _read_message(sock)
+
+
+def dispatch(command: str, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Run a worker job, on the resident worker when one is listening.
+
+    Falls back to running the job in this process when no socket is
+    configured, nothing is listening on it, or the worker is recycling. A
+    connection lost after the request was sent is reported as a failed job
+    rather than retried, since the job may already have run.
+    """
+    path = worker_socket_path()
+    if path is not None:
+        try:
+            result = submit(path, command, kwargs)
+        except (ConnectionRefusedError, FileNotFoundError) as exc:
+            logger.warning("worker_socket_unavailable", extra={"socket": str(path), "error": str(exc)})
+        except ConnectionError as exc:
+            # Reset, broken pipe or EOF: the resident worker died mid-job.
+            logger.error("worker_connection_lost", extra={"socket": str(path), "error": str(exc)})
+            return {"success": False, "error": f"Resident worker connection lost: {exc}"}
+        else:
+            if not result.get("recycling"):
+                return result
+            logger.info("worker_recycling_fallback", extra={"socket": str(path), "command": command})
+
+    from devgodzilla.windmill.worker import JOBS
+
+    job = JOBS.get(command)
+    if job is None:
+        return {"success": False, "error": f"Unknown worker command: {command}"}
+    return job(**kwargs)
@@ -2,7 +2,10 @@
 DevGodzilla Worker Entry Point
 
 Windmill worker script entry point for executing DevGodzilla jobs.
-This module provides the functions that Windmill scripts call.
+This module provides the functions that Windmill scripts call. Config, the
+database and the engine registry come from the process-wide WorkerRuntime
+(see runtime.py), so only the first job in a process pays for them; run
+``python -m devgodzilla.windmill.worker serve`` to keep one process warm.
 """
 
 import os
@@ -13,28 +16,26 @@ from typing import Any, Dict, Optional
 # Ensure devgodzilla is in the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from devgodzilla.config import get_config
-from devgodzilla.db import get_database
 from devgodzilla.logging import get_logger
 from devgodzilla.services.base import ServiceContext
-from devgodzilla.engines.bootstrap import bootstrap_default_engines
+from devgodzilla.windmill.runtime import get_runtime
 
 logger = get_logger(__name__)
 
 
 def get_context() -> ServiceContext:
-    """Get service context for worker jobs."""
-    config = get_config()
-    return ServiceContext(config=config)
+    """Get a fresh service context for a worker job."""
+    return get_runtime().context()
 
 
 def get_db():
-    """Get database instance for worker jobs."""
-    config = get_config()
-    return get_database(
-        db_url=config.database.url if config.database.url else None,
-        db_path=Path(config.database.path) if config.database.path else None,
-    )
+    """Get the process-wide database instance for worker jobs."""
+    return get_runtime().db
+
+
+def ensure_engines() -> None:
+    """Register the default engines if this process has not yet."""
+    get_runtime().ensure_engines()
 
 
 def plan_protocol(protocol_run_id: int) -> Dict[str, Any]:
@@ -53,7 +54,7 @@ def plan_protocol(protocol_run_id: int) -> Dict[str, Any]:
     
     context = get_context()
     db = get_db()
-    bootstrap_default_engines(replace=False)
+    ensure_engines()
     
     planning = PlanningService(context, db)
     result = planning.plan_protocol(protocol_run_id)
@@ -71,6 +72,7 @@ def execute_step(
     step_run_id: int,
     agent_id: str = "opencode",
     protocol_run_id: Optional[int] = None,
+    job_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Execute a step using the specified agent.
@@ -81,13 +83,14 @@ def execute_step(
         step_run_id: Step run ID
         agent_id: Agent to use for execution
         protocol_run_id: Optional protocol run ID (for context)
+        job_id: Optional Windmill job ID recorded on the run
         
     Returns:
         Dict with execution result
     """
     context = get_context()
     db = get_db()
-    bootstrap_default_engines(replace=False)
+    ensure_engines()
     
     logger.info(
         "execute_step_started",
@@ -101,7 +104,7 @@ def execute_step(
         from devgodzilla.services.execution import ExecutionService
 
         service = ExecutionService(context, db)
-        result = service.execute_step(step_run_id, engine_id=agent_id)
+        result = service.execute_step(step_run_id, engine_id=agent_id, job_id=job_id)
         step = db.get_step_run(step_run_id)
 
         return {
@@ -112,6 +115,9 @@ def execute_step(
             "status": step.status,
             "stdout": result.stdout,
             "stderr": result.stderr,
+            "error": result.error,
+            "duration_seconds": result.duration_seconds,
+            "artifacts": [str(p) for p in result.outputs_written.values()],
         }
     except Exception as e:
         try:
@@ -154,7 +160,7 @@ def run_qa(
     """
     context = get_context()
     db = get_db()
-    bootstrap_default_engines(replace=False)
+    ensure_engines()
     
     logger.info(
         "run_qa_started",
@@ -261,19 +267,36 @@ def open_pr(protocol_run_id: int) -> Dict[str, Any]:
         }
 
 
+# Jobs the resident worker accepts (see runtime.dispatch)
+JOBS = {
+    "plan_protocol": plan_protocol,
+    "execute_step": execute_step,
+    "run_qa": run_qa,
+    "open_pr": open_pr,
+}
+
+
 # CLI entry point for testing
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="DevGodzilla Worker")
-    parser.add_argument("command", choices=["plan", "execute", "qa", "pr"])
+    parser.add_argument("command", choices=["plan", "execute", "qa", "pr", "serve"])
     parser.add_argument("--protocol-run-id", type=int)
     parser.add_argument("--step-run-id", type=int)
     parser.add_argument("--agent-id", default="codex")
+    parser.add_argument("--socket", default=os.environ.get("DEVGODZILLA_WORKER_SOCKET", "/tmp/devgodzilla-worker.sock"))
+    parser.add_argument("--slots", type=int, default=int(os.environ.get("DEVGODZILLA_WORKER_SLOTS", "8")))
+    parser.add_argument("--max-jobs", type=int, default=int(os.environ.get("DEVGODZILLA_WORKER_MAX_JOBS", "0")))
     
     args = parser.parse_args()
     
-    if args.command == "plan":
+    if args.command == "serve":
+        from devgodzilla.windmill.runtime import serve
+
+        serve(Path(args.socket), JOBS, slots=args.slots, max_jobs=args.max_jobs)
+        sys.exit(0)
+    elif args.command == "plan":
         result = plan_protocol(args.protocol_run_id)
     elif args.command == "execute":
         result = execute_step(args.step_run_id, args.agent_id)
@@ -247,6 +247,8 @@ export interface ArtifactContent {
   type: string;
   content: string;
   truncated: boolean;
+  offset?: number; // byte offset of content within the artifact
+  size?: number | null; // total artifact size in bytes
 }
 
 export interface DiffHunk {
@@ -446,6 +448,8 @@ export interface OpenPRResponse {
 export interface HealthResponse {
   status: "ok" | "degraded" | "down";
   version?: string;
+  stale?: boolean;
+  checked_at?: string | null;
 }
 
 // =============================================================================
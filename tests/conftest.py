@@ -3,6 +3,8 @@ from pathlib import Path
 
 import pytest
 
+from devgodzilla.db.database import SQLiteDatabase
+
 # Ensure repository root is on sys.path so in-tree packages and demo modules import cleanly.
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -13,3 +15,27 @@ if str(ROOT) not in sys.path:
 def _default_sqlite_env(monkeypatch: pytest.MonkeyPatch) -> None:
     # Prevent .env-provided Postgres URLs from leaking into SQLite-based tests.
     monkeypatch.setenv("DEVGODZILLA_DB_URL", "")
+
+
+class CountingDatabase(SQLiteDatabase):
+    """SQLite database that counts round trips (connections) and SQL statements."""
+
+    connects = 0
+    statements = 0
+
+    def _connect(self):
+        self.connects += 1
+        conn = super()._connect()
+
+        def trace(_sql):
+            self.statements += 1
+
+        conn.set_trace_callback(trace)
+        return conn
+
+
+@pytest.fixture
+def counting_db(tmp_path: Path) -> CountingDatabase:
+    database = CountingDatabase(tmp_path / "counting.sqlite")
+    database.init_schema()
+    return database
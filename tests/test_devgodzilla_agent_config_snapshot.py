@@ -0,0 +1,120 @@
+"""
+Tests for the process-wide agent configuration snapshot and cached views.
+"""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.services.agent_config import AgentConfigService, get_agent_config_store
+from devgodzilla.services.base import ServiceContext
+
+
+AGENTS_YAML = """
+agents:
+  codex:
+    name: Codex
+    kind: cli
+    command: codex
+  opencode:
+    name: OpenCode
+    kind: cli
+    command: opencode
+defaults:
+  code_gen: opencode
+prompts:
+  exec-template:
+    path: prompts/exec.prompt.md
+"""
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    path = tmp_path / "agents.yaml"
+    path.write_text(AGENTS_YAML, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> SQLiteDatabase:
+    database = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    database.init_schema()
+    return database
+
+
+def _service(config_path: Path, db=None) -> AgentConfigService:
+    context = ServiceContext(config=SimpleNamespace(agent_config_path=config_path))
+    return AgentConfigService(context, db=db)
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_snapshot_is_shared_across_instances(config_path):
+    store = get_agent_config_store()
+    first = _service(config_path)
+    first.load_config()
+    reloads = store.stats()["reloads"]
+
+    second = _service(config_path)
+    second.load_config()
+
+    assert store.stats()["reloads"] == reloads
+    assert first._snapshot is second._snapshot
+    assert [a.id for a in second.list_agents()] == ["codex", "opencode"]
+
+
+def test_snapshot_reloads_when_file_changes(config_path, db):
+    service = _service(config_path, db=db)
+    assert service.get_default_engine_id("code_gen") == "opencode"
+
+    config_path.write_text(AGENTS_YAML.replace("code_gen: opencode", "code_gen: codex"), encoding="utf-8")
+    _bump_mtime(config_path)
+
+    assert _service(config_path, db=db).get_default_engine_id("code_gen") == "codex"
+    assert service.get_default_engine_id("code_gen") == "codex"
+
+
+def test_resolved_views_are_copies(config_path):
+    service = _service(config_path)
+    agent = service.get_agent("codex")
+    agent.name = "mutated"
+    prompts = service._resolve_prompts_map(None)
+    prompts["exec-template"]["path"] = "mutated"
+
+    other = _service(config_path)
+    assert other.get_agent("codex").name == "Codex"
+    assert other.get_prompt("exec-template")["path"] == "prompts/exec.prompt.md"
+
+
+def test_project_views_are_cached_and_invalidated_by_overrides(config_path, db):
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    store = get_agent_config_store()
+    service = _service(config_path, db=db)
+
+    assert service.get_agent("codex", project_id=project.id).default_model is None
+    hits = store.stats()["view_hits"]
+    service.get_agent("codex", project_id=project.id)
+    assert store.stats()["view_hits"] == hits + 1
+
+    db.upsert_agent_override(project.id, "codex", {"default_model": "gpt-5"})
+
+    assert _service(config_path, db=db).get_agent("codex", project_id=project.id).default_model == "gpt-5"
+
+
+def test_assignment_upsert_invalidates_views(config_path, db):
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    service = _service(config_path, db=db)
+
+    assert service.get_default_engine_id("exec", project_id=project.id) == "opencode"
+
+    db.upsert_agent_assignment(None, "execution", {"agent_id": "codex"})
+    assert service.get_default_engine_id("exec", project_id=project.id) == "codex"
+
+    db.upsert_agent_assignment(project.id, "execution", {"agent_id": "claude-code"})
+    assert service.get_default_engine_id("exec", project_id=project.id) == "claude-code"
@@ -80,6 +80,12 @@ def test_step_artifacts_list_and_content(monkeypatch: pytest.MonkeyPatch) -> Non
         artifacts_dir.mkdir(parents=True, exist_ok=True)
         (artifacts_dir / "execution.log").write_text("hello from log\n", encoding="utf-8")
         (artifacts_dir / "changes.diff").write_text("diff --git a/README.md b/README.md\n", encoding="utf-8")
+        from devgodzilla.engines.artifact_store import ArtifactStore
+        from devgodzilla.engines.artifacts import ArtifactWriter
+
+        ArtifactWriter(artifacts_dir, store=ArtifactStore(tmp / "store")).write_text(
+            "stdout", "stored output\n" * 100, kind="log", extension=".log"
+        )
         from devgodzilla.api.dependencies import get_db
 
         app.dependency_overrides[get_db] = lambda: db
@@ -90,6 +96,10 @@ def test_step_artifacts_list_and_content(monkeypatch: pytest.MonkeyPatch) -> Non
                 artifacts = listed.json()
                 assert any(a["name"] == "execution.log" for a in artifacts)
                 assert any(a["name"] == "changes.diff" for a in artifacts)
+                assert {"name": "stdout.log", "size": 1400}.items() <= next(
+                    a for a in artifacts if a["name"] == "stdout.log"
+                ).items()
+                assert all(not a["name"].startswith(".") for a in artifacts)
 
                 content = client.get(f"/steps/{step.id}/artifacts/execution.log/content")
                 assert content.status_code == 200
@@ -100,5 +110,61 @@ def test_step_artifacts_list_and_content(monkeypatch: pytest.MonkeyPatch) -> Non
                 download = client.get(f"/steps/{step.id}/artifacts/execution.log/download")
                 assert download.status_code == 200
                 assert b"hello from log" in download.content
+
+                stored = client.get(f"/steps/{step.id}/artifacts/stdout.log/download")
+                assert stored.status_code == 200
+                assert stored.content == b"stored output\n" * 100
+                preview = client.get(f"/steps/{step.id}/artifacts/stdout.log/content?max_bytes=14").json()
+                assert preview["content"] == "stored output\n"
+                assert preview["truncated"] is True
         finally:
             app.dependency_overrides.clear()
+
+
+@pytest.mark.skipif(TestClient is None, reason="fastapi not installed")
+def test_execute_action_stores_artifacts_through_the_writer(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from devgodzilla.api.dependencies import get_db, get_service_context
+    from devgodzilla.config import load_config
+    from devgodzilla.db.database import SQLiteDatabase
+    from devgodzilla.engines.artifact_store import load_manifest
+    from devgodzilla.services.base import ServiceContext
+    from devgodzilla.services.execution import ExecutionResult, ExecutionService
+
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    (repo / "README.md").write_text("changed", encoding="utf-8")
+    monkeypatch.delenv("DEVGODZILLA_API_TOKEN", raising=False)
+
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url=str(repo), base_branch="main", local_path=str(repo))
+    run = db.create_protocol_run(
+        project_id=project.id,
+        protocol_name="demo-proto",
+        status="running",
+        base_branch="main",
+        worktree_path=str(repo),
+        protocol_root=str(repo / ".protocols" / "demo-proto"),
+    )
+    step = db.create_step_run(run.id, 1, "01-demo", "exec", "pending")
+    monkeypatch.setattr(
+        ExecutionService,
+        "execute_step",
+        lambda self, step_id: ExecutionResult(success=True, step_run_id=step_id, engine_id="dummy", stdout="out\n"),
+    )
+
+    config = load_config().model_copy(update={"artifact_store_dir": tmp_path / "store"})
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_service_context] = lambda: ServiceContext(config=config)
+    try:
+        with TestClient(app) as client:  # type: ignore[arg-type]
+            assert client.post(f"/steps/{step.id}/actions/execute", json={}).status_code == 200
+            artifacts_dir = repo / ".protocols" / "demo-proto" / ".devgodzilla" / "steps" / str(step.id) / "artifacts"
+            stored = load_manifest(artifacts_dir)["artifacts"]
+            assert set(stored) == {"execution.log", "execution.stderr.log", "execution.meta.json", "changes.diff"}
+            assert not (artifacts_dir / "execution.log").exists()
+
+            content = client.get(f"/steps/{step.id}/artifacts/changes.diff/content").json()
+            assert "README.md" in content["content"]
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,162 @@
+"""
+Tests for ranged, conditional and compressed artifact delivery.
+"""
+
+import gzip
+
+import pytest
+
+try:
+    from fastapi.testclient import TestClient  # type: ignore
+    from devgodzilla.api.app import app
+except ImportError:  # pragma: no cover
+    TestClient = None  # type: ignore
+    app = None  # type: ignore
+
+from devgodzilla.api.artifact_delivery import parse_byte_range
+from devgodzilla.engines.artifact_store import ArtifactStore
+from devgodzilla.engines.artifacts import ArtifactWriter
+
+LOG = b"".join(b"line %05d\n" % i for i in range(5000))  # 55,000 bytes
+
+
+def test_parse_byte_range():
+    assert parse_byte_range("bytes=0-9", 100) == (0, 9)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=-10", 100) == (90, 99)
+    assert parse_byte_range("bytes=95-500", 100) == (95, 99)
+    assert parse_byte_range("bytes=100-", 100) is None
+    for header in ("bytes=0-1,5-6", "items=0-1", "bytes=5-1", "bytes=a-"):
+        with pytest.raises(ValueError):
+            parse_byte_range(header, 100)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    if TestClient is None:
+        pytest.skip("fastapi not installed")
+    from devgodzilla.api.dependencies import get_db
+    from devgodzilla.db.database import SQLiteDatabase
+
+    monkeypatch.delenv("DEVGODZILLA_API_TOKEN", raising=False)
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    repo = tmp_path / "repo"
+    protocol_root = repo / "specs" / "demo"
+    protocol_root.mkdir(parents=True)
+    project = db.create_project(name="demo", git_url=str(repo), base_branch="main", local_path=str(repo))
+    run = db.create_protocol_run(
+        project_id=project.id,
+        protocol_name="demo",
+        status="running",
+        base_branch="main",
+        worktree_path=str(repo),
+        protocol_root=str(protocol_root),
+    )
+    step = db.create_step_run(
+        protocol_run_id=run.id, step_index=1, step_name="01", step_type="exec", status="running"
+    )
+    artifacts_dir = protocol_root / ".devgodzilla" / "steps" / str(step.id) / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+    (artifacts_dir / "plain.log").write_bytes(LOG)
+    ArtifactWriter(artifacts_dir, store=ArtifactStore(tmp_path / "store")).write_bytes(
+        "stored", LOG, kind="output", extension=".log"
+    )
+
+    log_path = tmp_path / "job.log"
+    log_path.write_bytes(LOG)
+    db.create_job_run("job-1", "execute", "running", protocol_run_id=run.id, log_path=str(log_path))
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        with TestClient(app) as test_client:  # type: ignore[arg-type]
+            test_client.step_id = step.id
+            yield test_client
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("name", ["plain.log", "stored.log"])
+def test_preview_windows_and_conditional_get(client, name):
+    base = f"/steps/{client.step_id}/artifacts/{name}/content"
+
+    head = client.get(base, params={"max_bytes": 20})
+    assert head.json()["content"] == "line 00000\nline 0000"
+    assert (head.json()["offset"], head.json()["size"], head.json()["truncated"]) == (0, len(LOG), True)
+
+    page = client.get(base, params={"max_bytes": 11, "offset": 11 * 42}).json()
+    assert page["content"] == "line 00042\n"
+
+    tail = client.get(base, params={"max_bytes": 22, "tail": True}).json()
+    assert tail["content"] == "line 04998\nline 04999\n"
+    assert tail["offset"] == len(LOG) - 22
+
+    etag = head.headers["etag"]
+    assert client.get(base, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(base, headers={"If-Modified-Since": head.headers["last-modified"]}).status_code == 304
+    assert client.get(base, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+@pytest.mark.parametrize("name", ["plain.log", "stored.log"])
+def test_download_ranges_and_gzip(client, name):
+    url = f"/steps/{client.step_id}/artifacts/{name}/download"
+
+    ranged = client.get(url, headers={"Range": "bytes=11-21", "Accept-Encoding": "identity"})
+    assert ranged.status_code == 206
+    assert ranged.content == b"line 00001\n"
+    assert ranged.headers["content-range"] == f"bytes 11-21/{len(LOG)}"
+
+    assert client.get(url, headers={"Range": f"bytes={len(LOG)}-"}).status_code == 416
+
+    stale = client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"stale"', "Accept-Encoding": "identity"})
+    assert stale.status_code == 200 and stale.content == LOG
+
+    compressed = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.num_bytes_downloaded < len(LOG) // 4
+    assert compressed.content == LOG
+    assert client.get(url, headers={"If-None-Match": compressed.headers["etag"]}).status_code == 304
+
+
+def test_run_logs_tail_and_download(client):
+    tail = client.get("/runs/job-1/logs", params={"tail": True, "max_bytes": 11}).json()
+    assert tail["content"] == "line 04999\n"
+
+    ranged = client.get("/runs/job-1/logs/download", headers={"Range": "bytes=-11"})
+    assert ranged.status_code == 206
+    assert ranged.content == b"line 04999\n"
+
+
+def test_stored_gzip_blob_is_sent_as_stored(tmp_path):
+    if TestClient is None:
+        pytest.skip("fastapi not installed")
+    from fastapi import FastAPI, Request
+
+    from devgodzilla.api.artifact_delivery import download_response
+    from devgodzilla.engines.artifact_store import open_stored_artifact
+
+    store = ArtifactStore(tmp_path / "store", compression="gzip")
+    ref = ArtifactWriter(tmp_path / "a", store=store).write_text("out", "x" * 10_000, kind="output", extension=".log")
+    blob = store.locate(ref.blob)
+    demo = FastAPI()
+
+    @demo.get("/d")
+    def _download(request: Request):
+        return download_response(request, open_stored_artifact(tmp_path / "a", "out.log"))
+
+    raw = TestClient(demo).get("/d", headers={"Accept-Encoding": "gzip"})
+    assert raw.headers["content-length"] == str(blob.stat().st_size)
+    assert gzip.decompress(blob.read_bytes()) == raw.content == b"x" * 10_000
+
+
+def test_logs_are_stored_uncompressed_so_tail_seeks(tmp_path):
+    from devgodzilla.api.artifact_delivery import read_window
+    from devgodzilla.engines.artifact_store import open_stored_artifact
+
+    store = ArtifactStore(tmp_path / "store", compression="gzip")
+    ArtifactWriter(tmp_path / "a", store=store).write_bytes("run", LOG, kind="log", extension=".log")
+    artifact = open_stored_artifact(tmp_path / "a", "run.log")
+
+    assert artifact.encoding == "identity"
+    assert artifact.stored_path().read_bytes() == LOG
+    assert read_window(artifact, max_bytes=11, tail=True) == (b"line 04999\n", len(LOG) - 11)
@@ -0,0 +1,146 @@
+"""
+Tests for the content-addressed artifact store.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from devgodzilla.config import DEFAULT_RETENTION_TTL_DAYS
+from devgodzilla.engines.artifact_store import (
+    MANIFEST_NAME,
+    ArtifactStore,
+    list_stored_artifacts,
+    open_stored_artifact,
+)
+from devgodzilla.engines.artifacts import ArtifactWriter
+
+
+def _blobs(store):
+    return sorted(p for p in (store.root / "blobs").rglob("*") if p.is_file())
+
+
+def _age(path, seconds):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(tmp_path / "store")
+
+
+def test_identical_content_is_stored_once(store, tmp_path):
+    log = "step output line\n" * 500
+    first = ArtifactWriter(tmp_path / "steps" / "1", store=store)
+    retry = ArtifactWriter(tmp_path / "steps" / "2", store=store)
+
+    a = first.write_text("stdout", log, kind="output", extension=".log")
+    b = retry.write_text("stdout", log, kind="output", extension=".log")
+
+    assert a.blob == b.blob
+    assert len(_blobs(store)) == 1
+    assert a.path.exists() and a.path.name.startswith(a.blob)
+    assert not (tmp_path / "steps" / "1" / "stdout.log").exists()
+    manifest = json.loads((tmp_path / "steps" / "1" / MANIFEST_NAME).read_text())
+    entry = manifest["artifacts"]["stdout.log"]
+    assert entry["encoding"] == store.compression
+    assert entry["stored_size"] < entry["size"] == len(log)
+    assert store.read_bytes(a.blob).decode() == log
+
+
+def test_binary_kinds_are_stored_uncompressed(store, tmp_path):
+    writer = ArtifactWriter(tmp_path / "steps" / "1", store=store)
+    artifact = writer.write_bytes("screenshot", b"\x89PNG" * 200, kind="screenshot", extension=".png")
+
+    [blob] = _blobs(store)
+    assert blob.name == artifact.blob
+    assert blob.read_bytes() == b"\x89PNG" * 200
+
+
+def test_readers_merge_manifest_and_plain_files(store, tmp_path):
+    artifacts_dir = tmp_path / "steps" / "1"
+    writer = ArtifactWriter(artifacts_dir, store=store)
+    writer.write_json("execution", {"ok": True}, kind="meta")
+    writer.write_stream("changes", [b"line\n"] * 100, kind="diff", extension=".diff", max_bytes=50)
+    (artifacts_dir / "execution.log").write_text("plain\n")
+
+    listed = {a.name: a for a in list_stored_artifacts(artifacts_dir)}
+    assert set(listed) == {"execution.json", "changes.diff", "execution.log"}
+    assert listed["execution.log"].path is not None and listed["execution.json"].blob
+
+    diff = open_stored_artifact(artifacts_dir, "changes.diff")
+    assert diff.read().endswith(b"... truncated at 50 bytes ...\n")
+    assert diff.metadata["truncated"] is True
+    assert b"".join(diff.iter_chunks(chunk_size=7)) == diff.read()
+    assert json.loads(open_stored_artifact(artifacts_dir, "execution.json").read()) == {"ok": True}
+    assert open_stored_artifact(artifacts_dir, "missing.txt") is None
+
+
+def test_gc_keeps_referenced_blobs_and_expires_old_manifests(store, tmp_path):
+    old = ArtifactWriter(tmp_path / "steps" / "1", store=store)
+    new = ArtifactWriter(tmp_path / "steps" / "2", store=store)
+    old.write_text("stdout", "old run\n", kind="log", extension=".log")
+    kept = new.write_text("stdout", "new run\n", kind="log", extension=".log")
+    orphan = store.put_bytes(b"nobody refers to me")
+    for blob in _blobs(store):
+        _age(blob, 7200)
+    _age(tmp_path / "steps" / "1" / MANIFEST_NAME, 10 * 86400)
+
+    result = store.gc(grace_seconds=3600, expire_manifests_before=time.time() - 86400)
+
+    assert result.manifests_expired == 1
+    assert result.blobs_removed == 2
+    assert [b.name.split(".")[0] for b in _blobs(store)] == [kept.blob]
+    assert not store.exists(orphan.digest)
+    assert list_stored_artifacts(tmp_path / "steps" / "1") == []
+
+
+def test_gc_spares_blobs_inside_the_grace_period(store):
+    ref = store.put_bytes(b"being written right now")
+    assert store.gc(grace_seconds=3600).blobs_removed == 0
+    assert store.exists(ref.digest)
+
+
+def test_retention_collects_artifact_blobs(store, tmp_path):
+    from devgodzilla.db.database import SQLiteDatabase
+    from devgodzilla.services.base import ServiceContext
+    from devgodzilla.services.retention import RetentionService
+
+    store.put_bytes(b"orphan")
+    for blob in _blobs(store):
+        _age(blob, 7200)
+    config = SimpleNamespace(
+        retention_ttl_days={**{t: 0 for t in DEFAULT_RETENTION_TTL_DAYS}, "run_artifacts": 30},
+        retention_batch_size=2,
+        retention_archive_dir=None,
+    )
+    db = SQLiteDatabase(tmp_path / "retention.sqlite")
+    db.init_schema()
+    service = RetentionService(ServiceContext(config=config), db, artifact_store=store)
+
+    results = {r.table: r for r in service.run(now=datetime.utcnow())}
+
+    assert results["artifact_blobs"].deleted == 1
+    assert results["artifact_blobs"].cutoff < datetime.utcnow() - timedelta(days=29)
+    assert _blobs(store) == []
+
+
+def test_relative_store_dir_follows_the_projects_root(tmp_path, monkeypatch):
+    from devgodzilla.engines.artifact_store import get_artifact_store
+
+    config = SimpleNamespace(
+        artifact_store_dir="store",
+        projects_root=tmp_path / "data",
+        db_path=tmp_path / "db" / "dg.sqlite",
+    )
+    monkeypatch.chdir(tmp_path)
+    api = get_artifact_store(config)
+    (tmp_path / "worker").mkdir()
+    monkeypatch.chdir(tmp_path / "worker")
+    assert get_artifact_store(config) is api
+    assert api.root == tmp_path / "data" / "store"
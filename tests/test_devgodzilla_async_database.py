@@ -0,0 +1,107 @@
+"""
+Tests for the async database facade and event loop lag monitoring.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from devgodzilla.db.async_database import (
+    AsyncDatabase,
+    LoopLagMonitor,
+    get_async_database,
+)
+from devgodzilla.db.database import PostgresDatabase, SQLiteDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SQLiteDatabase(tmp_path / "async.sqlite")
+    database.init_schema()
+    return database
+
+
+@pytest.mark.asyncio
+async def test_facade_mirrors_sync_methods_on_db_threads(db):
+    adb = get_async_database(db, max_workers=2)
+    try:
+        project = await adb.create_project(name="p", git_url="https://example.com/p.git", base_branch="main")
+        run = await adb.create_protocol_run(project.id, "proto", "running", "main")
+        await adb.append_event(run.id, "step_started", "hello")
+
+        events = await adb.list_events_since_id(since_id=0, protocol_run_id=run.id)
+        assert [e.message for e in events] == ["hello"]
+
+        thread_name = await adb.run(lambda: threading.current_thread().name)
+        assert thread_name.startswith("devgodzilla-db")
+        assert get_async_database(adb) is adb
+        with pytest.raises(KeyError):
+            await adb.get_protocol_run(999)
+    finally:
+        await adb.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_query_does_not_block_loop(db):
+    adb = AsyncDatabase(db, max_workers=1)
+    monitor = LoopLagMonitor(interval_seconds=0.01, warn_ms=100)
+    monitor.start()
+    try:
+        await adb.run(time.sleep, 0.3)
+    finally:
+        await monitor.stop()
+        await adb.close()
+    assert monitor.samples >= 5
+    assert monitor.stalls == 0
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_flags_blocking_call():
+    monitor = LoopLagMonitor(interval_seconds=0.01, warn_ms=50)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.15)  # deliberately block the loop
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    stats = monitor.stats()
+    assert stats["stalls"] >= 1
+    assert stats["max_ms"] >= 50
+
+
+@pytest.mark.asyncio
+async def test_swapping_the_database_closes_the_old_facade(db, tmp_path, monkeypatch):
+    from devgodzilla.api import dependencies
+
+    closed = []
+
+    class RecordingDatabase(AsyncDatabase):
+        async def close(self) -> None:
+            closed.append(self.sync)
+            await super().close()
+
+    monkeypatch.setattr(dependencies, "_ASYNC_DB", None)
+    monkeypatch.setattr(dependencies, "get_async_database", lambda d, **kwargs: RecordingDatabase(d, max_workers=1))
+    other = SQLiteDatabase(tmp_path / "other.sqlite")
+
+    first = await dependencies.get_async_db(db)
+    assert await dependencies.get_async_db(db) is first
+    second = await dependencies.get_async_db(other)
+    assert second is not first
+
+    await dependencies.close_async_db()
+    assert len(closed) == 2 and db in closed and other in closed
+    assert dependencies._ASYNC_DB is None
+
+
+def test_postgres_events_query_shared_by_sync_and_async_paths():
+    sql, params = PostgresDatabase._events_query(
+        limit=1000, since_id=5, protocol_run_id=3, event_types=["step_started"]
+    )
+    assert "e.id > %s" in sql and sql.rstrip().endswith("ORDER BY e.id ASC LIMIT %s")
+    assert params[0] == 5 and params[1] == 3 and params[-1] == 500
+
+    sql, params = PostgresDatabase._events_query(limit=10)
+    assert "WHERE" not in sql and "ORDER BY e.id DESC" in sql
+    assert params == [10]
@@ -0,0 +1,110 @@
+"""
+Tests for bulk task and step-run writes in SQLiteDatabase.
+"""
+
+import pytest
+
+from devgodzilla.services.sprint_integration import SprintIntegrationService
+from devgodzilla.services.task_sync import TaskSyncService
+from devgodzilla.spec import create_steps_from_spec
+
+
+@pytest.fixture
+def project(counting_db):
+    return counting_db.create_project(name="p", git_url="https://example.com/p.git", base_branch="main")
+
+
+@pytest.mark.asyncio
+async def test_import_of_300_tasks_uses_few_statements(counting_db, project, tmp_path):
+    sprint = counting_db.create_sprint(project_id=project.id, name="S1", status="active")
+    tasks_md = tmp_path / "feature" / "tasks.md"
+    tasks_md.parent.mkdir()
+    lines = [f"- [{'x' if i % 3 == 0 else ' '}] Task {i} (2 pts)" for i in range(300)]
+    tasks_md.write_text("\n".join(lines + ["- [ ] Task 7"]), encoding="utf-8")
+
+    counting_db.statements = 0
+    created = await TaskSyncService(counting_db).import_speckit_tasks(project.id, str(tasks_md), sprint.id)
+
+    assert len(created) == 300
+    assert created[0].labels == ["spec:feature", "speckit"]
+    # Bulk insert + velocity read/update, each with its BEGIN/COMMIT.
+    assert counting_db.statements < 20
+    assert counting_db.get_sprint(sprint.id).velocity_actual == 200
+
+    again = await TaskSyncService(counting_db).import_speckit_tasks(project.id, str(tasks_md), sprint.id)
+    assert again == []
+
+    counting_db.statements = 0
+    service = TaskSyncService(counting_db)
+    replaced = await service.import_speckit_tasks(project.id, str(tasks_md), sprint.id, overwrite_existing=True)
+    assert len(replaced) == 300
+    assert len(counting_db.list_tasks(sprint_id=sprint.id, limit=1000)) == 300
+    assert counting_db.statements < 30
+
+
+def test_bulk_create_tasks_dedupes_per_sprint(counting_db, project):
+    sprint = counting_db.create_sprint(project_id=project.id, name="S1", status="active")
+    counting_db.create_task(project_id=project.id, title="existing", sprint_id=sprint.id)
+
+    created = counting_db.bulk_create_tasks([
+        {"project_id": project.id, "sprint_id": sprint.id, "title": "existing"},
+        {"project_id": project.id, "sprint_id": sprint.id, "title": "new", "labels": ["a"]},
+        {"project_id": project.id, "sprint_id": sprint.id, "title": "new"},
+        {"project_id": project.id, "title": "existing"},
+    ])
+
+    assert [(t.title, t.sprint_id) for t in created] == [("new", sprint.id), ("existing", None)]
+    assert created[0].labels == ["a"] and created[0].board_status == "backlog"
+
+
+@pytest.mark.asyncio
+async def test_sync_protocol_to_sprint_upserts_by_step(counting_db, project):
+    sprint = counting_db.create_sprint(project_id=project.id, name="S1", status="active")
+    run = counting_db.create_protocol_run(project.id, "proto", "running", "main")
+    steps = counting_db.bulk_create_step_runs([
+        {"protocol_run_id": run.id, "step_index": i, "step_name": f"s{i}",
+         "step_type": "execute", "status": "pending"}
+        for i in range(3)
+    ])
+    linked = counting_db.create_task(project_id=project.id, title="hand-made", step_run_id=steps[1].id)
+    counting_db.update_step_status(steps[1].id, "completed")
+
+    tasks = await SprintIntegrationService(counting_db).sync_protocol_to_sprint(run.id, sprint.id)
+
+    assert [t.step_run_id for t in tasks] == [s.id for s in steps]
+    assert tasks[1].id == linked.id and tasks[1].title == "hand-made"
+    assert tasks[1].board_status == "done"
+    assert {t.sprint_id for t in tasks} == {sprint.id}
+
+    tasks = await SprintIntegrationService(counting_db).sync_protocol_to_sprint(run.id, sprint.id)
+    assert len(tasks) == 3
+    assert len(counting_db.list_tasks(sprint_id=sprint.id)) == 3
+
+
+def test_create_steps_from_spec_skips_existing_names(counting_db, project):
+    run = counting_db.create_protocol_run(project.id, "proto", "pending", "main")
+    spec = {"steps": [{"name": "plan"}, {"name": "build", "depends_on": ["plan"]}, {"name": "qa"}]}
+
+    first = create_steps_from_spec(counting_db, run.id, spec, existing_names={"qa"})
+    second = create_steps_from_spec(counting_db, run.id, spec)
+
+    steps = counting_db.list_step_runs(run.id)
+    assert [s.step_name for s in steps] == ["plan", "build", "qa"]
+    assert first == [steps[0].id, steps[1].id] and second == [steps[2].id]
+    assert steps[1].depends_on == ["plan"]
+
+
+def test_bulk_upsert_rejects_unknown_fields(counting_db):
+    with pytest.raises(ValueError):
+        counting_db.bulk_upsert_tasks_by_step([], update_fields=("id",))
+
+
+def test_bulk_create_step_runs_rejects_duplicate_names(counting_db, project):
+    run = counting_db.create_protocol_run(project.id, "proto", "pending", "main")
+    with pytest.raises(ValueError, match="plan"):
+        counting_db.bulk_create_step_runs([
+            {"protocol_run_id": run.id, "step_index": i, "step_name": "plan",
+             "step_type": "plan", "status": "pending"}
+            for i in range(2)
+        ])
+    assert counting_db.list_step_runs(run.id) == []
@@ -0,0 +1,137 @@
+"""
+Tests for single-pass streaming git change capture.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.engines.artifacts import ArtifactWriter
+from devgodzilla.errors import GitCommandError
+from devgodzilla.services.change_capture import capture_changes
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    (root / "a.txt").write_text("a\n")
+    (root / "logo.bin").write_bytes(b"\x00\x01\x02")
+    (root / "keep.txt").write_text("one\ntwo\nthree\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-qm", "init")
+
+    _git(root, "mv", "a.txt", "renamed.txt")
+    (root / "renamed.txt").write_text("a\nb\n")
+    (root / "logo.bin").write_bytes(b"\x00\x09")
+    (root / "keep.txt").write_text("one\nthree\nfour\nfive\n")
+    _git(root, "add", "keep.txt")
+    (root / "keep.txt").write_text("zero\none\nthree\nfour\nfive\n")
+    (root / "new file.txt").write_text("untracked\n")
+    return root
+
+
+def test_capture_writes_status_diffs_and_changed_files(repo, tmp_path):
+    writer = ArtifactWriter(tmp_path / "artifacts")
+    capture = capture_changes(repo, writer)
+
+    assert Path(capture.artifacts["git_status"]).read_text() == _git(repo, "status", "--porcelain=v1").replace(
+        '"new file.txt"', "new file.txt"
+    )
+    assert Path(capture.artifacts["git_diff"]).read_text() == _git(repo, "diff")
+    assert Path(capture.artifacts["git_diff_cached"]).read_text() == _git(repo, "diff", "--cached")
+    assert capture.truncated == {"git_diff": False, "git_diff_cached": False}
+
+    files = {f.path: f for f in capture.files}
+    assert files["renamed.txt"].old_path == "a.txt"
+    assert files["renamed.txt"].unstaged.added == 1
+    assert files["logo.bin"].binary and files["logo.bin"].unstaged.added is None
+    assert (files["keep.txt"].staged.added, files["keep.txt"].staged.deleted) == (2, 1)
+    assert (files["keep.txt"].unstaged.added, files["keep.txt"].unstaged.deleted) == (1, 0)
+    assert files["new file.txt"].untracked
+
+    persisted = json.loads(Path(capture.artifacts["changed_files"]).read_text())
+    assert persisted["totals"] == capture.totals()
+    assert persisted["totals"]["binary"] == 1 and persisted["totals"]["untracked"] == 1
+    assert {f["path"] for f in persisted["files"]} == set(files)
+
+
+def test_large_diff_is_capped_and_numstat_stays_complete(repo, tmp_path):
+    for index in range(20):
+        (repo / f"big{index}.txt").write_text("x\n" * 2000)
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "big")
+    for index in range(20):
+        (repo / f"big{index}.txt").write_text("y\n" * 2000)
+
+    capture = capture_changes(repo, ArtifactWriter(tmp_path / "artifacts"), max_diff_bytes=4096)
+
+    diff = Path(capture.artifacts["git_diff"]).read_bytes()
+    assert capture.truncated["git_diff"]
+    assert len(diff) < 4096 + 100
+    assert diff.endswith(b"... truncated at 4096 bytes ...\n")
+    big = [f for f in capture.files if f.path.startswith("big")]
+    assert len(big) == 20
+    assert all(f.unstaged.added == 2000 for f in big)
+
+
+def test_capture_raises_when_git_fails(tmp_path):
+    with pytest.raises(GitCommandError):
+        capture_changes(tmp_path, ArtifactWriter(tmp_path / "artifacts"))
+
+
+def test_execution_artifacts_record_changes_on_the_step(repo, tmp_path, monkeypatch):
+    from unittest.mock import MagicMock
+
+    from devgodzilla.config import load_config
+    from devgodzilla.engines import EngineResult
+    from devgodzilla.engines.sandbox import SandboxType
+    from devgodzilla.services.base import ServiceContext
+    from devgodzilla.services.execution import ExecutionService, StepResolution
+
+    monkeypatch.setenv("DEVGODZILLA_ARTIFACT_STORE_DIR", str(tmp_path / "store"))
+    db = MagicMock()
+    db.get_step_run.return_value = MagicMock(runtime_state={"qa_verdict": "pass"})
+    service = ExecutionService(ServiceContext(config=load_config()), db, sandbox_type=SandboxType.NONE)
+    engine = MagicMock()
+    engine.metadata.id = "dummy"
+    resolution = StepResolution(
+        engine_id="dummy",
+        model=None,
+        prompt_text="",
+        prompt_path=None,
+        prompt_version=None,
+        workdir=repo,
+        protocol_root=tmp_path / "protocol",
+        workspace_root=repo,
+    )
+
+    outputs = service._write_execution_artifacts(
+        step=MagicMock(id=7, step_name="s"),
+        run=MagicMock(id=3),
+        engine=engine,
+        engine_result=EngineResult(success=True, stdout="done"),
+        resolution=resolution,
+    )
+
+    assert {"git_status", "git_diff", "git_diff_cached", "changed_files"} <= set(outputs)
+    _, kwargs = db.update_step_run.call_args
+    state = kwargs["runtime_state"]
+    assert state["qa_verdict"] == "pass"
+    assert state["changes"]["files"] == 4
+    assert {f["path"] for f in state["changes"]["changed_files"]} == {
+        "renamed.txt", "logo.bin", "keep.txt", "new file.txt",
+    }
@@ -9,6 +9,8 @@ from pathlib import Path
 
 import pytest
 
+from devgodzilla.engines.artifact_store import open_stored_artifact
+
 
 def _run_cli(*args: str, cwd: Path, env: dict[str, str]) -> str:
     cmd = [sys.executable, "-m", "devgodzilla.cli.main", *args]
@@ -257,8 +259,8 @@ sys.exit(0)
     # Validate DevGodzilla wrote execution artifacts (no manual file creation).
     artifacts_dir = Path(run.protocol_root) / ".devgodzilla" / "steps" / str(steps[0].id) / "artifacts"
     assert artifacts_dir.exists()
-    assert (artifacts_dir / "execution.json").exists()
-    assert (artifacts_dir / "stdout.log").exists()
+    assert open_stored_artifact(artifacts_dir, "execution.json") is not None
+    assert open_stored_artifact(artifacts_dir, "stdout.log") is not None
 
     assert opencode_log.exists() and opencode_log.stat().st_size > 0
     logged = [json.loads(line) for line in opencode_log.read_text(encoding="utf-8").splitlines() if line.strip()]
@@ -0,0 +1,105 @@
+"""
+Tests for the cached config snapshot used on the API request path.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from devgodzilla import config as config_module
+from devgodzilla.api.dependencies import require_api_token
+from devgodzilla.config import (
+    Config,
+    _reset_config_for_tests,
+    get_cached_config,
+    get_config_snapshot,
+    reload_config,
+    token_matches,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_snapshot(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    _reset_config_for_tests()
+    yield
+    _reset_config_for_tests()
+
+
+def test_snapshot_is_reused_until_env_changes(monkeypatch):
+    monkeypatch.setenv("DEVGODZILLA_API_TOKEN", "one")
+    first = get_config_snapshot()
+    assert get_config_snapshot() is first
+
+    monkeypatch.setenv("DEVGODZILLA_API_TOKEN", "two")
+    second = get_config_snapshot()
+    assert second is not first
+    assert second.config.api_token == "two"
+
+
+def test_snapshot_config_is_frozen():
+    cfg = get_cached_config()
+    assert isinstance(cfg, Config)
+    with pytest.raises(Exception):
+        cfg.api_token = "mutated"
+
+
+def test_snapshot_reloads_when_env_file_changes(monkeypatch, tmp_path):
+    monkeypatch.setattr(config_module, "_FILE_CHECK_INTERVAL_SECONDS", 0.0)
+    first = get_config_snapshot()
+    (tmp_path / ".env").write_text("UNRELATED=1\n", encoding="utf-8")
+    assert get_config_snapshot() is not first
+
+
+def test_reload_config_forces_rebuild():
+    first = get_config_snapshot()
+    assert reload_config() is not first
+
+
+def test_reload_picks_up_rewritten_env_file(monkeypatch, tmp_path):
+    pytest.importorskip("dotenv")
+    monkeypatch.delenv("DEVGODZILLA_API_TOKEN", raising=False)
+    monkeypatch.setenv("DEVGODZILLA_WEBHOOK_TOKEN", "from-process")
+    env_file = tmp_path / ".env"
+    env_file.write_text("DEVGODZILLA_API_TOKEN=old\nDEVGODZILLA_WEBHOOK_TOKEN=from-file\n", encoding="utf-8")
+    assert get_cached_config().api_token == "old"
+
+    env_file.write_text("DEVGODZILLA_API_TOKEN=rotated\nDEVGODZILLA_WEBHOOK_TOKEN=from-file\n", encoding="utf-8")
+    snap = reload_config()
+    assert snap.config.api_token == "rotated"
+    assert snap.config.webhook_token == "from-process"
+
+    env_file.write_text("", encoding="utf-8")
+    assert reload_config().config.api_token is None
+
+
+def test_sighup_only_flags_a_reload(monkeypatch):
+    monkeypatch.setenv("DEVGODZILLA_API_TOKEN", "one")
+    first = get_config_snapshot()
+    with config_module._snapshot_lock:
+        # Must not block even while the snapshot lock is held.
+        config_module._request_reload()
+    second = get_config_snapshot()
+    assert second is not first
+    assert get_config_snapshot() is second
+
+
+def test_token_matches_uses_precomputed_digest(monkeypatch):
+    monkeypatch.setenv("DEVGODZILLA_API_TOKEN", "secret")
+    digest = get_config_snapshot().api_token_digest
+    assert token_matches("secret", digest)
+    assert not token_matches("secret-but-longer", digest)
+    assert not token_matches(None, digest)
+    assert not token_matches("secret", None)
+
+
+def test_require_api_token(monkeypatch):
+    monkeypatch.setenv("DEVGODZILLA_API_TOKEN", "secret")
+    require_api_token(authorization="Bearer secret", x_devgodzilla_token=None, token=None)
+    require_api_token(authorization=None, x_devgodzilla_token="secret", token=None)
+    require_api_token(authorization=None, x_devgodzilla_token=None, token="secret")
+    with pytest.raises(HTTPException) as exc:
+        require_api_token(authorization="Bearer wrong", x_devgodzilla_token=None, token=None)
+    assert exc.value.status_code == 401
+
+    monkeypatch.delenv("DEVGODZILLA_API_TOKEN")
+    require_api_token(authorization=None, x_devgodzilla_token=None, token=None)
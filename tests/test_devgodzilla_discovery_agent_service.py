@@ -533,3 +533,108 @@ defaults:
         assert runtime_dir.name == "_runtime"
         assert "specs" in str(runtime_dir)
         assert "discovery" in str(runtime_dir)
+
+
+class TestDiscoveryPipelineScheduling:
+    """Stage dependencies, concurrency and HEAD-keyed caching."""
+
+    OUTPUTS = {
+        "discovery-inventory.prompt.md": ("DISCOVERY.md", "DISCOVERY_SUMMARY.json"),
+        "discovery-architecture.prompt.md": ("ARCHITECTURE.md",),
+        "discovery-api-reference.prompt.md": ("API_REFERENCE.md",),
+        "discovery-ci-notes.prompt.md": ("CI_NOTES.md",),
+    }
+
+    @pytest.fixture
+    def discovery_service(self):
+        return DiscoveryAgentService(ServiceContext(config=load_config()))
+
+    @pytest.fixture
+    def git_repo(self, tmp_path: Path) -> Path:
+        import shutil
+        import subprocess
+
+        if shutil.which("git") is None:
+            pytest.skip("git not installed")
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "README.md").write_text("demo\n", encoding="utf-8")
+        for cmd in (
+            ["git", "init", "-q"],
+            ["git", "add", "README.md"],
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init"],
+        ):
+            subprocess.run(cmd, cwd=repo, check=True)
+        return repo
+
+    @pytest.fixture
+    def engine(self):
+        import threading
+        import time as _time
+
+        state = {"calls": [], "active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def _execute(req):
+            prompt = Path(req.prompt_files[0]).name
+            with lock:
+                state["calls"].append(prompt)
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            _time.sleep(0.1)
+            runtime = Path(req.working_dir) / "specs" / "discovery" / "_runtime"
+            if prompt != "discovery-inventory.prompt.md":
+                assert (runtime / "DISCOVERY_SUMMARY.json").exists(), "ran before inventory"
+            for name in self.OUTPUTS[prompt]:
+                (runtime / name).write_text("{}" if name.endswith(".json") else f"# {name}\n", encoding="utf-8")
+            with lock:
+                state["active"] -= 1
+            return MagicMock(success=True, stdout=f"done {prompt}", stderr="", error=None)
+
+        mock_engine = MagicMock()
+        mock_engine.check_availability.return_value = True
+        mock_engine.metadata.id = "opencode"
+        mock_engine.metadata.default_model = "test-model"
+        mock_engine.execute.side_effect = _execute
+        mock_engine.state = state
+        return mock_engine
+
+    def _run(self, service, repo, engine):
+        with patch.object(EngineRegistry, "get", return_value=engine):
+            return service.run_discovery(repo_root=repo, engine_id="opencode", pipeline=True)
+
+    def test_independent_stages_run_concurrently_after_inventory(self, discovery_service, git_repo, engine):
+        result = self._run(discovery_service, git_repo, engine)
+
+        assert result.success is True, result.error
+        assert engine.state["calls"][0] == "discovery-inventory.prompt.md"
+        assert engine.state["peak"] == 3
+        assert [s.stage for s in result.stages] == ["inventory", "architecture", "api_reference", "ci_notes"]
+        assert all(t["duration_ms"] >= 100 and not t["cached"] for t in result.stage_timings())
+
+    def test_unchanged_head_restores_cached_outputs(self, discovery_service, git_repo, engine):
+        import subprocess
+
+        assert self._run(discovery_service, git_repo, engine).success
+        runtime = git_repo / "specs" / "discovery" / "_runtime"
+        (runtime / "ARCHITECTURE.md").unlink()
+
+        retry = self._run(discovery_service, git_repo, engine)
+        assert retry.success is True
+        assert all(s.cached for s in retry.stages)
+        assert len(engine.state["calls"]) == 4
+        assert (runtime / "ARCHITECTURE.md").read_text(encoding="utf-8") == "# ARCHITECTURE.md\n"
+
+        # A new commit invalidates every stage; an uncommitted edit disables the cache.
+        (git_repo / "app.py").write_text("print('hi')\n", encoding="utf-8")
+        assert self._run(discovery_service, git_repo, engine).success
+        assert len(engine.state["calls"]) == 8
+        subprocess.run(["git", "add", "app.py"], cwd=git_repo, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "app"],
+            cwd=git_repo,
+            check=True,
+        )
+        assert self._run(discovery_service, git_repo, engine).success
+        assert len(engine.state["calls"]) == 12
+        assert all(s.cached for s in self._run(discovery_service, git_repo, engine).stages)
@@ -0,0 +1,106 @@
+"""
+Import-time budget for the CLI, engine registry and API entry points.
+
+Runs ``python -X importtime`` in a subprocess so each check sees a cold
+interpreter, and asserts on which modules get imported rather than on wall
+time, except for a generous ceiling on ``python -m devgodzilla --version``.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+ENGINE_MODULES = (
+    "devgodzilla.engines.opencode",
+    "devgodzilla.engines.codex",
+    "devgodzilla.engines.claude_code",
+    "devgodzilla.engines.dummy",
+)
+
+
+def _import_times(*args: str) -> dict:
+    """Run python with ``-X importtime`` and return {module: cumulative_us}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header line
+    return times
+
+
+def test_version_fast_path_skips_click_and_config():
+    times = _import_times("-m", "devgodzilla", "--version")
+    assert "click" not in times
+    assert "devgodzilla.config" not in times
+    assert "devgodzilla.cli.main" not in times
+    assert times["devgodzilla"] < 100_000
+
+
+def test_cli_import_defers_subcommands_and_services():
+    times = _import_times("-c", "import devgodzilla.cli.main")
+    for module in (
+        "devgodzilla.cli.projects",
+        "devgodzilla.cli.agents",
+        "devgodzilla.cli.speckit",
+        "devgodzilla.services.path_contract",
+    ):
+        assert module not in times
+
+
+def test_engine_bootstrap_registers_descriptors_without_importing_engines():
+    times = _import_times(
+        "-c",
+        "from devgodzilla.engines.bootstrap import bootstrap_default_engines; bootstrap_default_engines()",
+    )
+    for module in ENGINE_MODULES:
+        assert module not in times
+
+
+def test_api_import_defers_route_modules():
+    times = _import_times("-c", "import devgodzilla.api.app")
+    assert not [m for m in times if m.startswith("devgodzilla.api.routes")]
+    assert "devgodzilla.services.orchestrator" not in times
+
+
+def test_lazy_registry_resolves_on_first_use():
+    from devgodzilla.engines import EngineDescriptor
+    from devgodzilla.engines.registry import EngineRegistry
+
+    registry = EngineRegistry()
+    registry.register_lazy(EngineDescriptor("dummy", "devgodzilla.engines.dummy:DummyEngine"), default=True)
+
+    assert registry.has("dummy")
+    assert registry.list_ids() == ["dummy"]
+    assert registry.default_id == "dummy"
+    assert not registry.is_loaded("dummy")
+
+    engine = registry.get_default()
+    assert engine.metadata.id == "dummy"
+    assert registry.is_loaded("dummy")
+    assert registry.get("dummy") is engine
+
+
+def test_api_mounts_routers_on_first_use():
+    from devgodzilla.api.app import DevGodzillaAPI
+
+    api = DevGodzillaAPI()
+    assert not api._routers_mounted
+    routes = list(api.routes)
+    assert api._routers_mounted
+    assert "/projects" in {route.path for route in routes}
+    api.mount_routers()
+    assert len(api.routes) == len(routes)
@@ -0,0 +1,146 @@
+"""
+Tests for memoized effective-policy resolution.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.services.base import ServiceContext
+from devgodzilla.services.policy import PolicyResolutionCache, PolicyService, get_policy_cache
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> SQLiteDatabase:
+    database = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    database.init_schema()
+    return database
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    path = tmp_path / "repo"
+    path.mkdir()
+    return path
+
+
+def _service(db: SQLiteDatabase, cache: PolicyResolutionCache) -> PolicyService:
+    return PolicyService(ServiceContext(config=None), db, cache=cache)
+
+
+def _project(db: SQLiteDatabase, repo: Path):
+    db.upsert_policy_pack(key="team", version="1", name="Team", pack={"defaults": {"ci": {"required_checks": ["lint"]}}})
+    project = db.create_project(name="demo", git_url=str(repo), base_branch="main", local_path=str(repo))
+    return db.update_project_policy(project.id, policy_pack_key="team", policy_pack_version="1")
+
+
+def test_repeat_resolution_hits_cache(db, repo):
+    cache = PolicyResolutionCache()
+    project = _project(db, repo)
+    service = _service(db, cache)
+
+    first = service.resolve_effective_policy(project.id)
+    second = service.resolve_effective_policy(project.id)
+
+    assert first.effective_hash == second.effective_hash
+    assert first.policy == {"defaults": {"ci": {"required_checks": ["lint"]}}}
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_cached_policy_is_not_shared_mutable_state(db, repo):
+    cache = PolicyResolutionCache()
+    project = _project(db, repo)
+    service = _service(db, cache)
+
+    first = service.resolve_effective_policy(project.id)
+    first.policy["defaults"]["ci"]["required_checks"].append("mutated")
+
+    second = service.resolve_effective_policy(project.id)
+    assert second.policy["defaults"]["ci"]["required_checks"] == ["lint"]
+
+
+def test_cache_hit_serializes_nothing(db, repo, monkeypatch):
+    from devgodzilla.services import policy as policy_module
+
+    cache = PolicyResolutionCache()
+    project = _project(db, repo)
+    service = _service(db, cache)
+    first = service.resolve_effective_policy(project.id)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit re-serialized the policy")
+
+    monkeypatch.setattr(policy_module._CachedPolicy, "freeze", fail)
+    monkeypatch.setattr(policy_module, "_stable_hash", fail)
+    second = service.resolve_effective_policy(project.id)
+
+    assert second.policy == first.policy
+    assert second.policy is not first.policy
+
+
+def test_update_project_policy_invalidates(db, repo):
+    cache = get_policy_cache()
+    cache.clear()
+    project = _project(db, repo)
+    service = _service(db, cache)
+
+    before = service.resolve_effective_policy(project.id)
+    db.update_project_policy(project.id, policy_overrides={"defaults": {"ci": {"required_checks": ["test"]}}})
+    after = service.resolve_effective_policy(project.id)
+
+    assert after.effective_hash != before.effective_hash
+    assert after.policy["defaults"]["ci"]["required_checks"] == ["test"]
+    assert cache.stats()["invalidations"] >= 1
+
+
+def test_upsert_policy_pack_invalidates(db, repo):
+    cache = get_policy_cache()
+    cache.clear()
+    project = _project(db, repo)
+    service = _service(db, cache)
+
+    service.resolve_effective_policy(project.id)
+    db.upsert_policy_pack(key="team", version="1", name="Team", pack={"defaults": {"ci": {"required_checks": ["build"]}}})
+    after = service.resolve_effective_policy(project.id)
+
+    assert after.policy["defaults"]["ci"]["required_checks"] == ["build"]
+    assert cache.stats()["hits"] == 0
+
+
+def test_repo_local_policy_change_is_detected(db, repo):
+    cache = PolicyResolutionCache()
+    project = _project(db, repo)
+    db.update_project_policy(project.id, policy_repo_local_enabled=True)
+    service = _service(db, cache)
+    policy_file = repo / ".devgodzilla" / "policy.json"
+    policy_file.parent.mkdir()
+    policy_file.write_text(json.dumps({"enforcement": {"mode": "warn"}}))
+
+    first = service.resolve_effective_policy(project.id, repo_root=repo)
+    assert first.policy["enforcement"] == {"mode": "warn"}
+    assert service.resolve_effective_policy(project.id, repo_root=repo).effective_hash == first.effective_hash
+
+    policy_file.write_text(json.dumps({"enforcement": {"mode": "block"}}))
+    stat = policy_file.stat()
+    os.utime(policy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = service.resolve_effective_policy(project.id, repo_root=repo)
+    assert second.policy["enforcement"] == {"mode": "block"}
+    assert cache.stats()["hits"] == 1
+
+
+def test_ttl_expiry(db, repo):
+    cache = PolicyResolutionCache(ttl_seconds=0)
+    project = _project(db, repo)
+    service = _service(db, cache)
+
+    service.resolve_effective_policy(project.id)
+    service.resolve_effective_policy(project.id)
+
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,111 @@
+"""
+Tests for the shared prompt file cache and cached step prompt assembly.
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from devgodzilla.prompt_utils import PromptFileCache, fingerprint_file, fingerprint_text
+from devgodzilla.services.base import ServiceContext
+from devgodzilla.services.execution import ExecutionService
+
+
+def _bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_cache_reuses_unchanged_file_and_rereads_on_change(tmp_path):
+    cache = PromptFileCache()
+    path = tmp_path / "plan.md"
+    path.write_text("v1", encoding="utf-8")
+
+    first = cache.read(path)
+    assert cache.read(path) is first
+    assert cache.stats()["hits"] == 1
+
+    path.write_text("v2 longer", encoding="utf-8")
+    _bump_mtime(path)
+    second = cache.read(path)
+    assert second.text == "v2 longer"
+    assert second.fingerprint != first.fingerprint
+    assert cache.read(tmp_path / "missing.md") is None
+
+
+def test_cache_evicts_by_total_bytes(tmp_path):
+    cache = PromptFileCache(max_bytes=10)
+    a = tmp_path / "a.md"
+    b = tmp_path / "b.md"
+    a.write_text("123456", encoding="utf-8")
+    b.write_text("abcdef", encoding="utf-8")
+    cache.read(a)
+    cache.read(b)
+    stats = cache.stats()
+    assert stats["files"] == 1
+    assert stats["bytes"] == 6
+
+
+def test_join_prefix_is_shared():
+    cache = PromptFileCache()
+    sections = [("t:1", "TEMPLATE"), ("p:2", "PLAN")]
+    first = cache.join_prefix(sections)
+    assert first == "TEMPLATE\n\n---\n\nPLAN"
+    assert cache.join_prefix(list(sections)) is first
+
+
+def test_fingerprint_file_matches_text_fingerprint(tmp_path):
+    path = tmp_path / "prompt.md"
+    path.write_text("hello", encoding="utf-8")
+    assert fingerprint_file(path) == fingerprint_text("hello")
+    assert fingerprint_file(tmp_path / "nope.md") == "missing"
+
+
+def test_fingerprint_file_accepts_non_utf8_bytes(tmp_path):
+    import hashlib
+
+    prompt = tmp_path / "latin1.md"
+    data = "caf\u00e9\n".encode("latin-1")
+    prompt.write_bytes(data)
+
+    assert fingerprint_file(prompt, short=False) == hashlib.sha256(data).hexdigest()
+    assert PromptFileCache().read(prompt).text == "caf\ufffd\n"
+
+
+def test_build_prompt_output_and_resolution_metadata(tmp_path):
+    protocol_root = tmp_path / ".protocols" / "demo"
+    protocol_root.mkdir(parents=True)
+    (protocol_root / "plan.md").write_text("PLAN BODY", encoding="utf-8")
+    (protocol_root / "step-01.md").write_text("STEP ONE", encoding="utf-8")
+    (protocol_root / "step-02.md").write_text("STEP TWO", encoding="utf-8")
+
+    config = SimpleNamespace(
+        agent_config_path=tmp_path / "agents.yaml",
+        engine_defaults={},
+    )
+    service = ExecutionService(context=ServiceContext(config=config), db=Mock())
+
+    run = Mock()
+    run.protocol_name = "demo"
+    run.worktree_path = None
+    run.protocol_root = None
+    run.template_config = None
+    project = Mock()
+    project.id = 1
+    project.local_path = str(tmp_path)
+
+    resolutions = []
+    for name in ("step-01", "step-02"):
+        step = Mock()
+        step.id = 7
+        step.step_name = name
+        step.summary = None
+        step.model = None
+        step.assigned_agent = None
+        resolutions.append(service._resolve_step(step, run, project, engine_id=None, model=None))
+
+    first, second = resolutions
+    assert first.prompt_text == "# Plan\n\nPLAN BODY\n\n---\n\n# Task\n\nSTEP ONE"
+    assert second.prompt_text.endswith("# Task\n\nSTEP TWO")
+    assert first.prompt_version == fingerprint_text(first.prompt_text)
+    assert first.prompt_bytes == len(first.prompt_text.encode("utf-8"))
@@ -0,0 +1,127 @@
+"""
+Tests for the stuck-protocol recovery query, worker leases and the watchdog.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from devgodzilla.models.domain import ProtocolStatus, StepStatus
+from devgodzilla.services.protocol_watchdog import (
+    RECOVERY_LEASE,
+    ProtocolWatchdog,
+    run_protocol_recovery,
+)
+
+
+@pytest.fixture
+def project(counting_db, tmp_path):
+    return counting_db.create_project(name="watchdog", git_url="", base_branch="main", local_path=str(tmp_path))
+
+
+def _orchestrator(db):
+    from devgodzilla.config import load_config
+    from devgodzilla.services.base import ServiceContext
+    from devgodzilla.services.orchestrator import OrchestratorMode, OrchestratorService
+
+    return OrchestratorService(context=ServiceContext(config=load_config()), db=db, mode=OrchestratorMode.LOCAL)
+
+
+def _protocol(db, project, statuses, *, status=ProtocolStatus.RUNNING):
+    run = db.create_protocol_run(
+        project_id=project.id,
+        protocol_name="p",
+        status=status,
+        base_branch="main",
+        worktree_path=project.local_path,
+        protocol_root=project.local_path,
+    )
+    for index, step_status in enumerate(statuses):
+        db.create_step_run(
+            protocol_run_id=run.id,
+            step_index=index,
+            step_name=f"S{index}",
+            step_type="exec",
+            status=step_status,
+        )
+    return run
+
+
+def _age_steps(db, run_id, seconds):
+    stamp = (datetime.now(timezone.utc) - timedelta(seconds=seconds)).strftime("%Y-%m-%d %H:%M:%S")
+    with db._transaction() as conn:
+        conn.execute("UPDATE step_runs SET updated_at = ? WHERE protocol_run_id = ?", (stamp, run_id))
+
+
+def test_candidates_come_from_one_aggregate_query(counting_db, project):
+    stuck = _protocol(counting_db, project, [StepStatus.COMPLETED, StepStatus.FAILED, StepStatus.PENDING])
+    _protocol(counting_db, project, [StepStatus.COMPLETED, StepStatus.RUNNING])
+    _protocol(counting_db, project, [StepStatus.NEEDS_QA])
+    _protocol(counting_db, project, [StepStatus.PENDING], status=ProtocolStatus.PAUSED)
+    _protocol(counting_db, project, [])
+
+    counting_db.connects = 0
+    [row] = counting_db.list_stuck_protocol_candidates()
+    assert counting_db.connects == 1
+    assert row["protocol_run_id"] == stuck.id
+    assert row["total_steps"] == 3
+    assert row["counts"]["completed"] == 1
+    assert row["counts"]["failed"] == 1
+    assert row["counts"]["pending"] == 1
+    assert row["counts"]["running"] == 0
+
+
+def test_stale_filter_skips_recently_updated_protocols(counting_db, project):
+    fresh = _protocol(counting_db, project, [StepStatus.PENDING])
+    old = _protocol(counting_db, project, [StepStatus.PENDING])
+    _age_steps(counting_db, old.id, 3600)
+
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=5)
+    candidates = counting_db.list_stuck_protocol_candidates(stale_before=cutoff)
+    assert [r["protocol_run_id"] for r in candidates] == [old.id]
+
+    recovered = _orchestrator(counting_db).recover_stuck_protocols(stale_after_seconds=300)
+    assert [r["protocol_run_id"] for r in recovered] == [old.id]
+    assert counting_db.get_protocol_run(fresh.id).status == ProtocolStatus.RUNNING
+
+
+def test_lease_is_exclusive_until_expiry_or_release(counting_db):
+    assert counting_db.acquire_lease("job", "a", 60)
+    assert not counting_db.acquire_lease("job", "b", 60)
+    assert counting_db.acquire_lease("job", "a", 60)
+
+    counting_db.release_lease("job", "b")
+    assert not counting_db.acquire_lease("job", "b", 60)
+    counting_db.release_lease("job", "a")
+    assert counting_db.acquire_lease("job", "b", 60)
+
+    assert counting_db.acquire_lease("short", "a", -1)
+    assert counting_db.acquire_lease("short", "b", 60)
+
+
+def test_recovery_pass_requires_the_lease(counting_db, project):
+    run = _protocol(counting_db, project, [StepStatus.COMPLETED, StepStatus.COMPLETED])
+    orchestrator = _orchestrator(counting_db)
+    counting_db.acquire_lease(RECOVERY_LEASE, "other-replica", 60)
+
+    assert run_protocol_recovery(orchestrator, holder="me", lease_seconds=60) is None
+    assert counting_db.get_protocol_run(run.id).status == ProtocolStatus.RUNNING
+
+    counting_db.release_lease(RECOVERY_LEASE, "other-replica")
+    recovered = run_protocol_recovery(orchestrator, holder="me", lease_seconds=60)
+    assert [r["action"] for r in recovered] == ["completed"]
+
+
+def test_watchdog_runs_at_start_and_releases_lease_on_stop(counting_db, project):
+    run = _protocol(counting_db, project, [StepStatus.COMPLETED])
+    watchdog = ProtocolWatchdog(lambda: _orchestrator(counting_db), interval_seconds=3600, holder="me")
+    watchdog.start()
+    try:
+        deadline = time.monotonic() + 5
+        while counting_db.get_protocol_run(run.id).status == ProtocolStatus.RUNNING and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert counting_db.get_protocol_run(run.id).status == ProtocolStatus.COMPLETED
+    finally:
+        watchdog.stop()
+    assert counting_db.acquire_lease(RECOVERY_LEASE, "someone-else", 60)
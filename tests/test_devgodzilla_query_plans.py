@@ -0,0 +1,56 @@
+"""
+Tests for the EXPLAIN-based query plan harness and the indexes it verifies.
+"""
+
+from devgodzilla.db.query_plans import (
+    QueryPlan,
+    QueryPlanReport,
+    load_baseline,
+    normalize_sql,
+    run_sqlite_harness,
+    sqlite_full_scans,
+)
+
+
+def test_sqlite_workload_has_no_plan_regressions():
+    report = run_sqlite_harness(projects=2, runs_per_project=2, steps_per_run=2)
+    regressions = report.regressions(load_baseline())
+    assert not regressions, [(p.key, p.full_scans) for p in regressions]
+
+
+def test_hot_lookups_use_indexes():
+    report = run_sqlite_harness(projects=2, runs_per_project=2, steps_per_run=2)
+    by_label = {}
+    for plan in report.plans:
+        for label in plan.labels:
+            by_label.setdefault(label, []).append(plan)
+    for label in ("list_step_runs", "list_protocol_runs", "list_all_protocol_runs", "delete_project"):
+        assert label in by_label
+        assert all(not p.full_scans for p in by_label[label]), label
+    step_plans = " ".join(" ".join(p.detail) for p in by_label["list_step_runs"])
+    assert "idx_step_runs_protocol" in step_plans
+
+
+def test_sqlite_full_scan_detection():
+    detail = [
+        "SCAN step_runs",
+        "SCAN protocol_runs USING INDEX idx_protocol_runs_created",
+        "SEARCH tasks USING INDEX idx_tasks_project (project_id=?)",
+        "SCAN CONSTANT ROW",
+    ]
+    assert sqlite_full_scans(detail) == ["step_runs"]
+
+
+def test_normalize_sql_collapses_literals():
+    a = normalize_sql("SELECT * FROM t WHERE id = 12 AND name = 'x''y' AND s IN ('a', 'b')")
+    b = normalize_sql("SELECT *   FROM t WHERE id = %s AND name = %s AND s IN (%s)")
+    assert a == b == "SELECT * FROM t WHERE id = ? AND name = ? AND s IN (?)"
+
+
+def test_regressions_respect_baseline():
+    report = QueryPlanReport(
+        backend="sqlite",
+        plans=[QueryPlan("sqlite", "SELECT * FROM projects", ["list_projects"], ["projects"])],
+    )
+    assert report.regressions({}) == report.plans
+    assert report.regressions({"sqlite": {"SELECT * FROM projects": ["projects"]}}) == []
@@ -0,0 +1,158 @@
+"""Tests for the git-tree repository index behind planning snapshots."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.services import repo_index
+from devgodzilla.services.planning import _build_repo_snapshot
+from devgodzilla.services.protocol_generation import _render_prompt
+from devgodzilla.services.repo_index import build_repo_snapshot, load_repo_index
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+    )
+
+
+def _commit(repo: Path, message: str) -> None:
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    repo = tmp_path / "repo"
+    (repo / "src" / "pkg").mkdir(parents=True)
+    (repo / "tests").mkdir()
+    (repo / "src" / "pkg" / "core.py").write_text("x = 1\n", encoding="utf-8")
+    (repo / "src" / "pkg" / "util.ts").write_text("export {}\n", encoding="utf-8")
+    (repo / "tests" / "test_core.py").write_text("def test(): pass\n", encoding="utf-8")
+    (repo / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+    (repo / ".gitignore").write_text("build/\n", encoding="utf-8")
+    (repo / "build").mkdir()
+    (repo / "build" / "out.py").write_text("ignored\n", encoding="utf-8")
+    _git(repo, "init", "-q")
+    _commit(repo, "init")
+    return repo
+
+
+class TestRepoIndex:
+    def test_index_counts_tracked_files_only(self, git_repo):
+        index = load_repo_index(git_repo)
+
+        assert "build/out.py" not in index.files
+        assert index.files["src/pkg/core.py"] == len("x = 1\n")
+        dirs = index.directories()
+        assert dirs["src"].files == 2
+        assert dirs["src/pkg"].languages == {"Python": 1, "TypeScript": 1}
+        assert index.languages()["Python"][0] == 2
+
+        snapshot = _build_repo_snapshot(git_repo)
+        assert snapshot.startswith("# Repository Structure")
+        assert "| src/pkg/ | 2 |" in snapshot
+        assert "- Python project (pyproject.toml)" in snapshot
+        assert "build/" not in snapshot
+
+    def test_snapshot_is_reused_for_the_same_tree(self, git_repo, monkeypatch):
+        first = build_repo_snapshot(git_repo)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("index rebuilt for an unchanged tree")
+
+        monkeypatch.setattr(repo_index, "_list_tree", fail)
+        monkeypatch.setattr(repo_index, "_apply_diff", fail)
+        assert build_repo_snapshot(git_repo) == first
+
+    def test_new_commit_updates_index_from_diff(self, git_repo, monkeypatch):
+        before = load_repo_index(git_repo)
+        cache_file = git_repo / ".git" / "devgodzilla" / "repo-index.json"
+        assert cache_file.is_file()
+
+        (git_repo / "tests" / "test_core.py").unlink()
+        (git_repo / "src" / "pkg" / "core.py").write_text("x = 12345\n", encoding="utf-8")
+        (git_repo / "docs").mkdir()
+        (git_repo / "docs" / "guide.md").write_text("# Guide\n", encoding="utf-8")
+        _commit(git_repo, "update")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("full listing used for a small diff")
+
+        monkeypatch.setattr(repo_index, "_list_tree", fail)
+        monkeypatch.setattr(repo_index, "_stores", {})  # force the on-disk index to be the base
+        after = load_repo_index(git_repo)
+
+        assert after.tree != before.tree
+        assert "tests/test_core.py" not in after.files
+        assert after.files["src/pkg/core.py"] == len("x = 12345\n")
+        assert after.files["docs/guide.md"] == len("# Guide\n")
+        assert "docs/" in build_repo_snapshot(git_repo)
+
+    def test_index_survives_removal_of_the_first_worktree(self, git_repo, tmp_path, monkeypatch):
+        monkeypatch.setattr(repo_index, "_stores", {})
+        first, second = tmp_path / "wt-a", tmp_path / "wt-b"
+        _git(git_repo, "worktree", "add", "-q", str(first))
+        _git(git_repo, "worktree", "add", "-q", str(second))
+        assert load_repo_index(first).tree is not None
+
+        _git(git_repo, "worktree", "remove", str(first))
+        (second / "docs").mkdir()
+        (second / "docs" / "new.md").write_text("# New\n", encoding="utf-8")
+        _commit(second, "docs")
+        (second / "junk.log").write_text("untracked\n", encoding="utf-8")
+
+        index = load_repo_index(second)
+        assert index.tree is not None
+        assert "docs/new.md" in index.files
+        assert "junk.log" not in index.files and ".git" not in index.files
+
+    def test_subdirectory_sees_its_part_of_the_whole_tree_index(self, git_repo, monkeypatch):
+        monkeypatch.setattr(repo_index, "_stores", {})
+        sub = load_repo_index(git_repo / "src")
+        assert set(sub.files) == {"pkg/core.py", "pkg/util.ts"}
+        assert "pkg/" in build_repo_snapshot(git_repo / "src")
+
+        whole = load_repo_index(git_repo)
+        assert set(whole.files) == {
+            ".gitignore",
+            "pyproject.toml",
+            "src/pkg/core.py",
+            "src/pkg/util.ts",
+            "tests/test_core.py",
+        }
+        assert "tests/" in build_repo_snapshot(git_repo)
+
+        (git_repo / "src" / "pkg" / "core.py").write_text("x = 2\n# more\n", encoding="utf-8")
+        _commit(git_repo, "edit")
+        assert load_repo_index(git_repo / "src").files["pkg/core.py"] == len("x = 2\n# more\n")
+        assert load_repo_index(git_repo).files["src/pkg/core.py"] == len("x = 2\n# more\n")
+        assert "core.py" not in load_repo_index(git_repo).files
+
+    def test_non_git_directory_falls_back_to_walk(self, tmp_path):
+        (tmp_path / "app").mkdir()
+        (tmp_path / "app" / "main.go").write_text("package main\n", encoding="utf-8")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("x\n", encoding="utf-8")
+        (tmp_path / ".git").write_text("gitdir: /nowhere\n", encoding="utf-8")
+
+        index = load_repo_index(tmp_path)
+
+        assert index.tree is None
+        assert set(index.files) == {"app/main.go"}
+
+    def test_render_prompt_injects_snapshot(self):
+        result = _render_prompt(
+            "{{PROTOCOL_NAME}}\n{{REPO_SNAPSHOT}}",
+            protocol_name="p",
+            description="d",
+            step_count=1,
+            repo_snapshot="# Repository Structure",
+        )
+        assert result == "p\n# Repository Structure"
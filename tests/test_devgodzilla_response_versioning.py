@@ -0,0 +1,114 @@
+"""
+Tests for trigger-maintained resource versions and conditional GET.
+"""
+
+import pytest
+
+try:
+    from fastapi.testclient import TestClient  # type: ignore
+    from devgodzilla.api.app import app
+except ImportError:  # pragma: no cover
+    TestClient = None  # type: ignore
+    app = None  # type: ignore
+
+from devgodzilla.db.database import SQLiteDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    database.init_schema()
+    return database
+
+
+def _seed(db, tmp_path):
+    project = db.create_project(name="demo", git_url=str(tmp_path), base_branch="main", local_path=str(tmp_path))
+    run = db.create_protocol_run(
+        project_id=project.id, protocol_name="demo", status="running", base_branch="main"
+    )
+    step = db.create_step_run(protocol_run_id=run.id, step_index=1, step_name="01", step_type="exec", status="pending")
+    return project, run, step
+
+
+def test_writes_bump_scoped_versions(db, tmp_path):
+    assert db.get_resource_versions(["projects", "queue:*"]) == {"projects": 0, "queue:*": 0}
+    project, run, step = _seed(db, tmp_path)
+    other = db.create_protocol_run(project_id=project.id, protocol_name="other", status="pending", base_branch="main")
+    scope = f"protocol:{run.id}"
+    before = db.get_resource_versions(["projects", scope, f"protocol:{other.id}"])
+    assert before["projects"] >= 1 and before[scope] >= 2
+
+    db.update_step_status(step.id, "running")
+    after = db.get_resource_versions(["projects", scope, f"protocol:{other.id}"])
+    assert after[scope] == before[scope] + 1
+    assert after["projects"] == before["projects"]
+    assert after[f"protocol:{other.id}"] == before[f"protocol:{other.id}"]
+
+    db.create_job_run("job-1", "execute", "queued", protocol_run_id=run.id)
+    assert db.get_resource_versions(["queue:*"])["queue:*"] == 1
+
+
+def test_job_runs_bump_per_run_queue_scopes(db, tmp_path):
+    project, run, _ = _seed(db, tmp_path)
+    other = db.create_protocol_run(project_id=project.id, protocol_name="other", status="pending", base_branch="main")
+    db.create_job_run("job-1", "execute", "queued", protocol_run_id=run.id)
+    db.create_job_run("job-2", "execute", "queued", protocol_run_id=other.id)
+    db.create_job_run("job-3", "discover", "queued", project_id=project.id)
+    db.update_job_run("job-1", status="running")
+
+    scopes = [f"queue:run:{run.id}", f"queue:run:{other.id}", f"queue:project:{project.id}", "queue:*"]
+    assert db.get_resource_versions(scopes) == dict(zip(scopes, [2, 1, 1, 4]))
+    assert db.get_resource_versions(["queue"]) == {"queue": 0}
+
+
+@pytest.fixture
+def client(db):
+    if TestClient is None:
+        pytest.skip("fastapi not installed")
+    from devgodzilla.api.dependencies import get_db
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        with TestClient(app) as test_client:  # type: ignore[arg-type]
+            yield test_client
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_unchanged_poll_is_not_modified(client, db, tmp_path):
+    from devgodzilla.api.versioning import response_cache
+
+    _project, run, step = _seed(db, tmp_path)
+    url = f"/protocols/{run.id}/steps"
+    first = client.get(url)
+    assert first.status_code == 200
+    assert [s["status"] for s in first.json()] == ["pending"]
+    etag = first.headers["etag"]
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(url).content == first.content
+    assert response_cache(db).stats()["hits"] == 1
+
+    db.update_step_status(step.id, "completed")
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [s["status"] for s in changed.json()] == ["completed"]
+
+    # Query parameters are part of the version key.
+    assert client.get("/projects").headers["etag"] != client.get("/projects", params={"status": "x"}).headers["etag"]
+
+
+def test_versioned_routes_match_schemas(client, db, tmp_path):
+    project, run, _step = _seed(db, tmp_path)
+    db.create_job_run("job-1", "execute", "queued", protocol_run_id=run.id)
+
+    assert [p["id"] for p in client.get("/projects").json()] == [project.id]
+    assert client.get(f"/protocols/{run.id}").json()["protocol_name"] == "demo"
+    assert client.get(f"/protocols/{run.id}/quality").json()["protocol_run_id"] == run.id
+    assert client.get("/queues").json() == client.get("/queues/stats").json()
+    assert [j["job_id"] for j in client.get("/queues/jobs", params={"status": "queued"}).json()] == ["job-1"]
+
+    missing = client.get("/protocols/9999")
+    assert missing.status_code == 404
+    assert "etag" not in missing.headers
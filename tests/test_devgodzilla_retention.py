@@ -0,0 +1,115 @@
+"""
+Tests for batched retention, archival and archive read-through.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from devgodzilla.config import DEFAULT_RETENTION_TTL_DAYS, _parse_ttl_days
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.services.base import ServiceContext
+from devgodzilla.services.retention import ArchiveStore, RetentionService
+
+
+def _config(**ttls):
+    return SimpleNamespace(
+        retention_ttl_days={**{t: 0 for t in DEFAULT_RETENTION_TTL_DAYS}, **ttls},
+        retention_batch_size=2,
+        retention_archive_dir=None,
+    )
+
+
+def _age(db, table, days):
+    stamp = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+    with db._transaction() as conn:
+        conn.execute(f"UPDATE {table} SET created_at = ?", (stamp,))
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SQLiteDatabase(tmp_path / "retention.sqlite")
+    database.init_schema()
+    return database
+
+
+@pytest.fixture
+def run(db):
+    project = db.create_project(name="p", git_url="https://example.com/p.git", base_branch="main")
+    return db.create_protocol_run(project.id, "proto", "running", "main")
+
+
+def test_prune_archives_then_deletes_in_batches(db, run, tmp_path):
+    for i in range(5):
+        db.append_event(run.id, "step_started", f"old {i}")
+    _age(db, "events", 60)
+    db.append_event(run.id, "step_started", "fresh")
+
+    archive = ArchiveStore(tmp_path / "archive")
+    service = RetentionService(
+        ServiceContext(config=_config(events=30)), db, archive=archive, batch_pause_seconds=0
+    )
+    results = {r.table: r for r in service.run()}
+
+    assert results["events"].deleted == 5
+    assert results["events"].archived == 5
+    assert results["events"].batches == 3
+    assert [e.message for e in db.list_events(run.id)] == ["fresh"]
+    assert len(archive.segments("events")) == 3
+
+    archived = service.list_archived_events(run.id)
+    assert [e.message for e in archived] == [f"old {i}" for i in range(5)]
+    assert archived[0].event_type == "step_started"
+
+
+def test_job_runs_keep_non_terminal_rows(db, run):
+    db.create_job_run("done", "execute", "succeeded", protocol_run_id=run.id)
+    db.create_job_run("live", "execute", "running", protocol_run_id=run.id)
+    _age(db, "job_runs", 200)
+
+    service = RetentionService(ServiceContext(config=_config(job_runs=90)), db, batch_pause_seconds=0)
+    results = {r.table: r for r in service.run()}
+
+    assert results["job_runs"].deleted == 1
+    assert [j.run_id for j in db.list_job_runs(protocol_run_id=run.id)] == ["live"]
+
+
+def test_zero_ttl_and_dry_run_delete_nothing(db, run):
+    db.append_event(run.id, "step_started", "old")
+    _age(db, "events", 60)
+
+    results = {r.table: r for r in RetentionService(ServiceContext(config=_config()), db).run()}
+    assert results["events"].skipped == "no ttl"
+
+    service = RetentionService(ServiceContext(config=_config(events=30)), db)
+    results = {r.table: r for r in service.run(dry_run=True)}
+    assert results["events"].deleted == 1
+    assert len(db.list_events(run.id)) == 1
+
+
+def test_archive_read_filters_by_time_and_dedupes(tmp_path):
+    archive = ArchiveStore(tmp_path)
+    rows = [
+        {"id": 1, "created_at": "2026-01-01 00:00:00", "protocol_run_id": 7},
+        {"id": 2, "created_at": "2026-03-01 00:00:00", "protocol_run_id": 7},
+    ]
+    archive.write_segment("events", rows)
+    archive.write_segment("events", rows[:1])
+
+    assert [r["id"] for r in archive.read("events")] == [1, 2]
+    assert [r["id"] for r in archive.read("events", since=datetime(2026, 2, 1))] == [2]
+    with pytest.raises(ValueError):
+        archive.write_segment("projects", rows)
+
+
+def test_parse_ttl_days_overrides_defaults():
+    ttls = _parse_ttl_days("events=7, qa_results=0")
+    assert ttls["events"] == 7
+    assert ttls["qa_results"] == 0
+    assert ttls["job_runs"] == DEFAULT_RETENTION_TTL_DAYS["job_runs"]
+
+
+def test_sqlite_partition_drop_is_a_noop(db):
+    assert db.list_event_partitions() == []
+    assert db.drop_event_partition("events_p202401") is False
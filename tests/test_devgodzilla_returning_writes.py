@@ -0,0 +1,87 @@
+"""
+Tests for single-round-trip (RETURNING) writes in SQLiteDatabase.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def run(counting_db):
+    project = counting_db.create_project(name="p", git_url="https://example.com/p.git", base_branch="main")
+    return counting_db.create_protocol_run(project.id, "proto", "pending", "main")
+
+
+def _one_round_trip(write, *args, **kwargs):
+    db = write.__self__
+    db.connects = 0
+    result = write(*args, **kwargs)
+    assert db.connects == 1
+    return result
+
+
+def test_lifecycle_writes_use_one_connection(counting_db, run):
+    step = _one_round_trip(counting_db.create_step_run, run.id, 0, "s0", "execute", "pending")
+    assert step.protocol_run_id == run.id and step.depends_on == []
+
+    updated = _one_round_trip(counting_db.update_step_status, step.id, "running", retries=1, summary="go")
+    assert (updated.status, updated.retries, updated.summary) == ("running", 1, "go")
+
+    updated = _one_round_trip(counting_db.update_step_run, step.id, assigned_agent="codex")
+    assert updated.assigned_agent == "codex"
+
+    assert _one_round_trip(counting_db.update_protocol_status, run.id, "running").status == "running"
+
+    job = _one_round_trip(
+        counting_db.create_job_run, "job-1", "execute", "queued", step_run_id=step.id, windmill_job_id="wm-1"
+    )
+    assert job.windmill_job_id == "wm-1"
+    job = _one_round_trip(counting_db.update_job_run_by_windmill_id, "wm-1", status="succeeded", result={"ok": 1})
+    assert (job.run_id, job.status, job.result) == ("job-1", "succeeded", {"ok": 1})
+
+    artifact = _one_round_trip(counting_db.create_run_artifact, "job-1", "log", "text", "/tmp/log")
+    artifact = _one_round_trip(counting_db.create_run_artifact, "job-1", "log", "text", "/tmp/log2")
+    assert artifact.path == "/tmp/log2"
+
+
+def test_entity_writes_use_one_connection(counting_db):
+    project = _one_round_trip(counting_db.create_project, name="q", git_url="u", base_branch="main")
+    assert _one_round_trip(counting_db.update_project, project.id, name="q2").name == "q2"
+    assert _one_round_trip(counting_db.update_project_local_path, project.id, "/tmp/q").local_path == "/tmp/q"
+    pack = _one_round_trip(counting_db.upsert_policy_pack, key="k", version="1", name="K", pack={"a": 1})
+    assert pack.pack == {"a": 1}
+
+    sprint = _one_round_trip(counting_db.create_sprint, project_id=project.id, name="s1")
+    assert _one_round_trip(counting_db.update_sprint, sprint.id, goal="ship").goal == "ship"
+
+    task = _one_round_trip(counting_db.create_task, project_id=project.id, title="t")
+    assert _one_round_trip(counting_db.update_task, task.id, title="t2").title == "t2"
+
+    spec = _one_round_trip(counting_db.upsert_speckit_spec, project_id=project.id, name="001-x", has_spec=True)
+    assert spec.has_spec is True
+    clarification = _one_round_trip(
+        counting_db.upsert_clarification, scope="project", project_id=project.id, key="k", question="?"
+    )
+    assert clarification.question == "?"
+
+
+def test_append_event_resolves_project_in_same_statement(counting_db, run):
+    event = _one_round_trip(counting_db.append_event, run.id, "step_started", "hi", metadata={"a": 1})
+    assert event.project_id == run.project_id
+    assert event.metadata == {"a": 1}
+
+
+def test_missing_rows_raise_key_error(counting_db):
+    with pytest.raises(KeyError):
+        counting_db.update_step_status(999, "running")
+    with pytest.raises(KeyError):
+        counting_db.update_protocol_status(999, "running")
+    with pytest.raises(KeyError):
+        counting_db.update_job_run("nope", status="failed")
+    with pytest.raises(KeyError):
+        counting_db.update_job_run_by_windmill_id("nope", status="failed")
+    with pytest.raises(KeyError):
+        counting_db.update_project(999, name="x")
+    with pytest.raises(KeyError):
+        counting_db.update_task(999, title="x")
+    with pytest.raises(KeyError):
+        counting_db.update_sprint(999, goal="x")
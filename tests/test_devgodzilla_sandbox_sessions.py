@@ -0,0 +1,152 @@
+"""
+Tests for persistent sandbox sessions and the warm Docker container pool.
+
+Docker is not required: ``subprocess.run`` is replaced with a recorder that
+answers the handful of docker CLI calls a session makes.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from devgodzilla.engines import sandbox
+from devgodzilla.engines.sandbox import (
+    SandboxConfig,
+    SandboxSession,
+    SandboxSessionPool,
+    SandboxType,
+)
+
+
+class FakeDocker:
+    def __init__(self):
+        self.calls = []
+        self.containers = 0
+        self.running = set()
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(list(cmd))
+        stdout = ""
+        if cmd[:3] == ["docker", "run", "-d"]:
+            self.containers += 1
+            stdout = f"cid-{self.containers}\n"
+            self.running.add(f"cid-{self.containers}")
+        elif cmd[:2] == ["docker", "exec"]:
+            if kwargs.get("timeout") == 0:
+                raise subprocess.TimeoutExpired(cmd, 0)
+            stdout = "ok"
+        elif cmd[:2] == ["docker", "inspect"]:
+            stdout = "true" if cmd[-1] in self.running else "false"
+        elif cmd[:3] == ["docker", "rm", "-f"]:
+            self.running.discard(cmd[-1])
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    def count(self, *prefix):
+        return sum(1 for call in self.calls if call[: len(prefix)] == list(prefix))
+
+
+@pytest.fixture
+def docker(monkeypatch):
+    fake = FakeDocker()
+    monkeypatch.setattr(sandbox.subprocess, "run", fake)
+    return fake
+
+
+def _docker_session(tmp_path, pool, **config):
+    return SandboxSession(
+        SandboxConfig(sandbox_type=SandboxType.DOCKER, read_write_paths=[tmp_path], **config),
+        tmp_path,
+        pool=pool,
+    )
+
+
+def test_docker_session_starts_one_container_for_many_commands(docker, tmp_path):
+    (tmp_path / "sub").mkdir()
+    pool = SandboxSessionPool()
+
+    with _docker_session(tmp_path, pool, max_memory_mb=512) as session:
+        session.run(["git", "status"], cwd=tmp_path)
+        session.run(["git", "diff"], cwd=tmp_path / "sub", env={"A": "1"})
+        session.run(["git", "diff", "--cached"])
+
+    assert docker.count("docker", "run", "-d") == 1
+    assert docker.count("docker", "exec") == 3
+    [start] = [c for c in docker.calls if c[:3] == ["docker", "run", "-d"]]
+    assert start[start.index("--memory") + 1] == "512m"
+    assert "--network=none" in start
+    assert start[-3:] == ["python:3.12-slim", "sleep", "infinity"]
+
+    execs = [c for c in docker.calls if c[:2] == ["docker", "exec"]]
+    assert execs[0][execs[0].index("-w") + 1] == "/workspace"
+    assert execs[1][execs[1].index("-w") + 1] == "/workspace/sub"
+    assert ["-e", "A=1"] == execs[1][execs[1].index("-e"): execs[1].index("-e") + 2]
+    assert execs[2][-4:] == ["cid-1", "git", "diff", "--cached"]
+
+
+def test_closed_container_is_reused_for_the_same_worktree(docker, tmp_path):
+    pool = SandboxSessionPool(max_idle=1)
+
+    with _docker_session(tmp_path, pool) as first:
+        first.run(["true"])
+    with _docker_session(tmp_path, pool) as second:
+        second.run(["true"])
+        assert second.warm
+
+    assert docker.count("docker", "run", "-d") == 1
+    assert docker.count("docker", "rm", "-f") == 0
+    stats = pool.stats()
+    assert stats["idle_containers"] == 1
+    assert stats["backends"]["docker"]["sessions"] == 2
+    assert stats["backends"]["docker"]["warm"] == 1
+
+    pool.close_all()
+    assert docker.count("docker", "rm", "-f") == 1
+
+
+def test_acquire_takes_one_of_two_idle_containers(docker, tmp_path):
+    pool = SandboxSessionPool(max_idle=2)
+    key = ("image", str(tmp_path))
+    docker.running.update({"c1", "c2"})
+    pool.release(key, "c1")
+    pool.release(key, "c2")
+
+    assert pool.acquire(key) == "c2"
+    assert pool.stats()["idle_containers"] == 1
+    assert docker.count("docker", "rm", "-f") == 0
+
+    docker.running.discard("c1")
+    assert pool.acquire(key) is None
+    assert docker.calls[-1] == ["docker", "rm", "-f", "c1"]
+    assert pool.stats()["idle_containers"] == 0
+    assert pool.stats()["backends"]["docker"]["discarded"] == 1
+
+
+def test_pool_removes_containers_it_cannot_keep(docker, tmp_path):
+    pool = SandboxSessionPool(max_idle=0)
+    with _docker_session(tmp_path, pool) as session:
+        session.run(["true"])
+    assert docker.count("docker", "rm", "-f") == 1
+
+    pool = SandboxSessionPool(max_idle=2)
+    session = _docker_session(tmp_path, pool).start()
+    with pytest.raises(subprocess.TimeoutExpired):
+        session.run(["sleep", "60"], timeout=0)
+    session.close()
+    assert pool.stats()["idle_containers"] == 0
+    assert docker.count("docker", "rm", "-f") == 2
+
+    pool = SandboxSessionPool(idle_ttl_seconds=-1)
+    _docker_session(tmp_path, pool).start().close()
+    with _docker_session(tmp_path, pool) as session:
+        assert not session.warm
+    assert docker.count("docker", "run", "-d") == 4
+
+
+def test_unsandboxed_session_runs_commands_in_the_workspace(tmp_path):
+    pool = SandboxSessionPool()
+    with SandboxSession(SandboxConfig(), tmp_path, pool=pool) as session:
+        result = session.run([sys.executable, "-c", "import os; print(os.getcwd())"])
+    assert result.stdout.strip() == str(tmp_path.resolve())
+    assert session.commands_run == 1
+    assert pool.stats()["backends"]["none"]["sessions"] == 1
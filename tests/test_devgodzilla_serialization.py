@@ -0,0 +1,122 @@
+"""
+Tests for the trusted-output serialization path used by list and event endpoints.
+"""
+
+import json
+
+import pytest
+
+from devgodzilla.api import schemas
+from devgodzilla.api.serialization import (
+    FastJSONResponse,
+    dump_trusted,
+    dump_trusted_many,
+    dumps,
+    event_json,
+)
+from devgodzilla.db.database import SQLiteDatabase
+
+try:
+    from fastapi.testclient import TestClient  # type: ignore
+    from devgodzilla.api.app import app
+    from devgodzilla.api.dependencies import get_db
+except ImportError:  # pragma: no cover
+    TestClient = None  # type: ignore
+    app = None  # type: ignore
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SQLiteDatabase(tmp_path / "serialization.sqlite")
+    database.init_schema()
+    return database
+
+
+@pytest.fixture
+def run(db, tmp_path):
+    project = db.create_project(name="ser", git_url="", base_branch="main", local_path=str(tmp_path))
+    db.update_project_policy(project.id, policy_overrides={"gates": {"lint": True}}, policy_repo_local_enabled=True)
+    protocol = db.create_protocol_run(
+        project_id=project.id,
+        protocol_name="p",
+        status="running",
+        base_branch="main",
+        worktree_path=str(tmp_path),
+        protocol_root=str(tmp_path),
+    )
+    db.append_event(protocol.id, "protocol_started", "started", metadata={"n": 1, "nested": {"ü": [1, 2]}})
+    db.append_event(protocol.id, "step_completed", "done")
+    db.create_job_run("run-1", "execute", "succeeded", protocol_run_id=protocol.id, params={"a": 1})
+    return protocol
+
+
+def test_trusted_dump_matches_validated_dump(db, run):
+    cases = [
+        (schemas.ProjectOut, db.list_projects()),
+        (schemas.ProtocolOut, db.list_all_protocol_runs()),
+        (schemas.EventOut, db.list_events(run.id)),
+        (schemas.JobRunOut, db.list_job_runs(protocol_run_id=run.id)),
+    ]
+    for schema, objs in cases:
+        assert objs
+        assert dump_trusted_many(schema, objs) == [schema.model_validate(o).model_dump() for o in objs]
+
+
+def test_encoder_handles_non_json_types():
+    from datetime import datetime
+    from devgodzilla.models.domain import ProtocolStatus
+
+    body = json.loads(dumps({"when": datetime(2026, 1, 2, 3, 4, 5), 1: {"x"}, "status": ProtocolStatus.RUNNING}))
+    assert body == {"when": "2026-01-02T03:04:05", "1": ["x"], "status": "running"}
+    assert FastJSONResponse({"a": [1]}).body == b'{"a":[1]}'
+
+
+def test_event_json_is_encoded_once(db, run, monkeypatch):
+    from devgodzilla.api import serialization
+
+    event = db.list_events(run.id)[0]
+    first = event_json(event)
+    assert json.loads(first) == schemas.EventOut.model_validate(event).model_dump()
+
+    monkeypatch.setattr(serialization, "dumps_str", lambda value: pytest.fail("re-encoded"))
+    assert event_json(db.list_events(run.id)[0]) is first
+
+
+def test_event_json_does_not_mix_databases():
+    from devgodzilla.models.domain import Event
+
+    first = Event(id=1, protocol_run_id=1, event_type="a", message="one", created_at="2026-01-01 00:00:00")
+    second = Event(id=1, protocol_run_id=1, event_type="a", message="two", created_at="2026-01-02 00:00:00")
+    assert json.loads(event_json(first))["message"] == "one"
+    assert json.loads(event_json(second))["message"] == "two"
+
+
+def test_domain_models_use_slots(db, run):
+    event = db.list_events(run.id)[0]
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.unexpected = 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.skipif(TestClient is None, reason="fastapi not installed")
+def test_list_endpoints_return_schema_payloads(db, run):
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        with TestClient(app) as client:  # type: ignore[arg-type]
+            events = client.get(f"/protocols/{run.id}/events").json()
+            assert [e["event_type"] for e in events] == ["protocol_started", "step_completed"]
+            assert events[0]["metadata"] == {"n": 1, "nested": {"ü": [1, 2]}}
+            assert set(events[0]) == set(schemas.EventOut.model_fields)
+
+            [project] = client.get("/projects").json()
+            assert project["policy_overrides"] == {"gates": {"lint": True}}
+            assert project["policy_repo_local_enabled"] is True
+            assert set(project) == set(schemas.ProjectOut.model_fields)
+
+            [protocol] = client.get("/protocols").json()
+            assert protocol == json.loads(json.dumps(dump_trusted(schemas.ProtocolOut, db.get_protocol_run(run.id))))
+
+            [job] = client.get(f"/protocols/{run.id}/runs").json()
+            assert job["run_id"] == "run-1" and job["params"] == {"a": 1}
+    finally:
+        app.dependency_overrides.pop(get_db, None)
@@ -0,0 +1,136 @@
+"""
+Tests for SQL-side sprint analytics and burndown snapshots.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.services.sprint_analytics import SprintAnalyticsService
+
+try:
+    from fastapi.testclient import TestClient  # type: ignore
+    from devgodzilla.api.app import app
+    from devgodzilla.api.dependencies import get_db
+except ImportError:  # pragma: no cover
+    TestClient = None  # type: ignore
+    app = None  # type: ignore
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SQLiteDatabase(tmp_path / "analytics.sqlite")
+    database.init_schema()
+    return database
+
+
+@pytest.fixture
+def project(db):
+    return db.create_project(name="analytics", git_url="", base_branch="main")
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def test_stats_and_velocity_cover_sprints_past_the_list_cap(db, project):
+    sprint = db.create_sprint(project_id=project.id, name="Big")
+    db.bulk_create_tasks([
+        {"project_id": project.id, "title": f"t{i}", "sprint_id": sprint.id, "story_points": 2,
+         "board_status": "done" if i % 2 else "todo"}
+        for i in range(700)
+    ])
+
+    analytics = SprintAnalyticsService(db)
+    stats = analytics.stats(sprint.id)
+    assert (stats.total_tasks, stats.completed_tasks) == (700, 350)
+    assert (stats.total_points, stats.completed_points) == (1400, 700)
+    assert stats.completion_rate == 0.5
+    assert analytics.refresh_velocity(sprint.id) == 700
+    assert db.get_sprint(sprint.id).velocity_actual == 700
+
+
+def test_velocity_trend_is_oldest_first_and_padded(db, project):
+    current = db.create_sprint(project_id=project.id, name="current", status="active")
+    for points in (3, 0, 5):
+        done = db.create_sprint(project_id=project.id, name=f"done-{points}", status="completed")
+        if points:
+            db.create_task(project_id=project.id, title="x", sprint_id=done.id,
+                           story_points=points, board_status="done")
+    db.create_sprint(project_id=project.id, name="planned", status="planned")
+
+    assert SprintAnalyticsService(db).velocity_trend(project.id, current.id) == [0, 0, 3, 0, 5]
+
+
+def test_task_writes_maintain_daily_snapshots(db, project):
+    sprint = db.create_sprint(project_id=project.id, name="S")
+    other = db.create_sprint(project_id=project.id, name="T")
+    task = db.create_task(project_id=project.id, title="a", sprint_id=sprint.id, story_points=5)
+    db.create_task(project_id=project.id, title="b", sprint_id=sprint.id, story_points=3)
+
+    [row] = db.list_sprint_snapshots(sprint.id)
+    assert row["day"] == _today().isoformat()
+    assert (row["total_points"], row["completed_points"]) == (8, 0)
+
+    db.update_task(task.id, board_status="done")
+    assert db.list_sprint_snapshots(sprint.id)[0]["completed_points"] == 5
+
+    db.update_task(task.id, sprint_id=other.id)
+    assert db.list_sprint_snapshots(sprint.id)[0]["total_points"] == 3
+    assert db.list_sprint_snapshots(other.id)[0]["completed_points"] == 5
+
+    db.delete_task(task.id)
+    assert db.list_sprint_snapshots(other.id)[0]["total_tasks"] == 0
+
+    db.delete_sprint(other.id)
+    assert db.list_sprint_snapshots(other.id) == []
+
+
+def test_burndown_carries_snapshots_forward(db, project):
+    today = _today()
+    sprint = db.create_sprint(
+        project_id=project.id,
+        name="S",
+        start_date=(today - timedelta(days=2)).isoformat(),
+        end_date=(today + timedelta(days=2)).isoformat(),
+    )
+    task = db.create_task(project_id=project.id, title="a", sprint_id=sprint.id, story_points=4)
+    db.create_task(project_id=project.id, title="b", sprint_id=sprint.id, story_points=4)
+    db.record_sprint_snapshots([sprint.id], day=(today - timedelta(days=2)).isoformat())
+    db.update_task(task.id, board_status="done")
+
+    points = SprintAnalyticsService(db).burndown(db.get_sprint(sprint.id), today=today)
+    assert [p.ideal for p in points] == [8, 6, 4, 2, 0]
+    assert [p.remaining for p in points] == [8, 8, 4, None, None]
+    assert [p.completed for p in points] == [0, 0, 4, None, None]
+    assert points[2].scope == 8
+
+
+@pytest.mark.skipif(TestClient is None, reason="fastapi not installed")
+def test_sprint_burndown_and_metrics_endpoints(db, project):
+    today = _today()
+    sprint = db.create_sprint(
+        project_id=project.id,
+        name="S",
+        start_date=(today - timedelta(days=1)).isoformat(),
+        end_date=(today + timedelta(days=1)).isoformat(),
+    )
+    db.create_task(project_id=project.id, title="a", sprint_id=sprint.id, story_points=2, board_status="done")
+    db.create_task(project_id=project.id, title="b", sprint_id=sprint.id, story_points=2)
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        with TestClient(app) as client:  # type: ignore[arg-type]
+            body = client.get(f"/sprints/{sprint.id}/burndown").json()
+            assert (body["total_points"], body["completed_points"]) == (4, 2)
+            assert [p["remaining"] for p in body["points"]] == [2, 2, None]
+
+            metrics = client.get(f"/sprints/{sprint.id}/metrics").json()
+            assert metrics["total_tasks"] == 2 and metrics["completed_points"] == 2
+            assert [p["actual"] for p in metrics["burndown"]] == [2, 2, 2]
+            assert metrics["velocity_trend"] == [0, 0, 0, 0, 0]
+
+            assert client.get("/sprints/9999/burndown").status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_db, None)
@@ -0,0 +1,118 @@
+"""
+Tests for the task dependency graph and cycle checks.
+"""
+
+import pytest
+
+from devgodzilla.db.task_graph import TaskGraph, TaskNode
+
+try:
+    from fastapi.testclient import TestClient  # type: ignore
+    from devgodzilla.api.app import app
+    from devgodzilla.api.dependencies import get_db
+except ImportError:  # pragma: no cover
+    TestClient = None  # type: ignore
+    app = None  # type: ignore
+
+
+@pytest.fixture
+def project(counting_db, tmp_path):
+    return counting_db.create_project(name="deps", git_url="", base_branch="main", local_path=str(tmp_path))
+
+
+def _chain(db, project_id, length, **kwargs):
+    ids = []
+    for i in range(length):
+        task = db.create_task(
+            project_id=project_id,
+            title=f"t{i}",
+            blocked_by=[ids[-1]] if ids else None,
+            **kwargs,
+        )
+        ids.append(task.id)
+    return ids
+
+
+def test_cycle_check_rejects_new_edges_that_close_a_loop(counting_db, project):
+    a, b, c = _chain(counting_db, project.id, 3)  # c waits on b, b waits on a
+
+    with pytest.raises(ValueError, match=f"task {a} cannot be blocked by {c}"):
+        counting_db.update_task(a, blocked_by=[c])
+    with pytest.raises(ValueError, match=f"task {a} cannot be blocked by {a}"):
+        counting_db.update_task(a, blocked_by=[a])
+    assert counting_db.get_task(a).blocked_by == []
+
+    # Re-saving existing edges is fine; only new edges are walked.
+    assert counting_db.update_task(c, blocked_by=[b, a]).blocked_by == [b, a]
+    assert counting_db.update_task(c, blocked_by=[]).blocked_by == []
+    assert counting_db.update_task(a, blocked_by=[c]).blocked_by == [c]
+
+
+def test_cycle_check_cost_is_independent_of_chain_length(counting_db, project):
+    ids = _chain(counting_db, project.id, 300)
+    other = counting_db.create_task(project_id=project.id, title="tail").id
+
+    counting_db.connects = 0
+    counting_db.update_task(other, blocked_by=[ids[-1]])
+    # Cycle check, then one UPDATE ... RETURNING.
+    assert counting_db.connects == 2
+
+    counting_db.connects = 0
+    with pytest.raises(ValueError):
+        counting_db.update_task(ids[0], blocked_by=[other])
+    assert counting_db.connects == 1
+
+
+def test_graph_blocked_sets_and_critical_chain():
+    graph = TaskGraph([
+        TaskNode(1, "done", 3),
+        TaskNode(2, "todo", 5, blocked_by=(1,)),
+        TaskNode(3, "todo", 1, blocked_by=(2,)),
+        TaskNode(4, "todo", 2),
+        TaskNode(5, "todo", 8, blocked_by=(4, 99)),
+        TaskNode(6, "todo", None, blocked_by=(5, 3)),
+    ])
+
+    assert graph.unblocked_ids() == [2, 4]
+    assert graph.blocked_ids() == [3, 5, 6]
+    assert graph.open_blockers(6) == [5, 3]
+    # 4 -> 5 -> 6 (2 + 8 + 1) beats 2 -> 3 -> 6 (5 + 1 + 1).
+    chain = graph.critical_chain()
+    assert chain == [4, 5, 6] and graph.chain_points(chain) == 11
+    assert graph.critical_chain([2, 3, 6]) == [2, 3, 6]
+
+
+def test_critical_chain_skips_existing_cycles():
+    graph = TaskGraph([
+        TaskNode(1, "todo", 1),
+        TaskNode(2, "todo", 5, blocked_by=(1, 3)),
+        TaskNode(3, "todo", 5, blocked_by=(2,)),
+    ])
+    assert graph.critical_chain() == [1]
+
+
+@pytest.mark.skipif(TestClient is None, reason="fastapi not installed")
+def test_sprint_dependencies_endpoint(counting_db, project):
+    sprint = counting_db.create_sprint(project_id=project.id, name="Sprint 1")
+    first, second = _chain(counting_db, project.id, 2, sprint_id=sprint.id)
+    outside = counting_db.create_task(project_id=project.id, title="outside")
+    counting_db.update_task(first, blocked_by=[outside.id])
+
+    app.dependency_overrides[get_db] = lambda: counting_db
+    try:
+        with TestClient(app) as client:  # type: ignore[arg-type]
+            body = client.get(f"/sprints/{sprint.id}/dependencies").json()
+            assert body["blocked"] == [first, second]
+            assert body["unblocked"] == []
+            assert body["blockers"] == {str(first): [outside.id], str(second): [first]}
+            assert body["critical_chain"] == [first, second]
+
+            counting_db.update_task(outside.id, board_status="done")
+            body = client.get(f"/sprints/{sprint.id}/dependencies").json()
+            assert body["unblocked"] == [first] and body["blocked"] == [second]
+
+            cyclic = client.put(f"/tasks/{first}", json={"blocked_by": [second]})
+            assert cyclic.status_code == 400
+            assert client.get("/sprints/9999/dependencies").status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_db, None)
@@ -0,0 +1,151 @@
+"""
+Tests for the warm Windmill worker runtime and its resident socket server.
+"""
+
+import threading
+
+import pytest
+
+from devgodzilla.windmill import runtime as worker_runtime
+from devgodzilla.windmill.runtime import WorkerRuntime, WorkerServer, dispatch, submit
+
+
+@pytest.fixture
+def server_factory(tmp_path):
+    servers = []
+
+    def start(jobs, **kwargs):
+        server = WorkerServer(tmp_path / "worker.sock", jobs, **kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append((server, thread))
+        return server, thread
+
+    yield start
+    for server, thread in servers:
+        server.shutdown()
+        server.server_close()
+        thread.join(5)
+
+
+def test_runtime_builds_database_and_engines_once(monkeypatch, tmp_path):
+    import devgodzilla.db
+    import devgodzilla.engines.bootstrap as bootstrap
+
+    calls = {"db": 0, "engines": 0}
+
+    def fake_get_database(**kwargs):
+        calls["db"] += 1
+        return object()
+
+    def fake_bootstrap(*, replace):
+        calls["engines"] += 1
+
+    monkeypatch.setattr(devgodzilla.db, "get_database", fake_get_database)
+    monkeypatch.setattr(bootstrap, "bootstrap_default_engines", fake_bootstrap)
+
+    runtime = WorkerRuntime()
+    runtime.warm()
+    db = runtime.db
+    for _ in range(3):
+        runtime.ensure_engines()
+        assert runtime.db is db
+    assert calls == {"db": 1, "engines": 1}
+    # Each job still gets its own context.
+    assert runtime.context() is not runtime.context()
+    assert runtime.context().config is runtime.context().config
+
+
+def test_server_runs_jobs_and_isolates_failures(server_factory):
+    def boom():
+        raise RuntimeError("job exploded")
+
+    server, _ = server_factory({"echo": lambda **kw: {"success": True, **kw}, "boom": boom})
+
+    assert submit(server.socket_path, "echo", {"step_run_id": 7}) == {"success": True, "step_run_id": 7}
+    assert submit(server.socket_path, "boom") == {"success": False, "error": "job exploded"}
+    assert "Unknown worker command" in submit(server.socket_path, "nope")["error"]
+    assert submit(server.socket_path, "echo", {"n": 1})["n"] == 1
+    assert server.jobs_started == 3
+
+
+def test_server_recycles_after_max_jobs(server_factory):
+    server, thread = server_factory({"echo": lambda: {"success": True}}, max_jobs=2)
+    submit(server.socket_path, "echo")
+    submit(server.socket_path, "echo")
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_recycle_drains_in_flight_jobs_and_turns_away_new_ones(server_factory):
+    release = threading.Event()
+    running = threading.Semaphore(0)
+
+    def slow(**kw):
+        running.release()
+        release.wait(5)
+        return {"success": True, **kw}
+
+    server, thread = server_factory({"slow": slow}, max_jobs=2, slots=4)
+    results = {}
+
+    def call(n):
+        results[n] = submit(server.socket_path, "slow", {"n": n})
+
+    callers = [threading.Thread(target=call, args=(n,)) for n in (1, 2)]
+    for caller in callers:
+        caller.start()
+    assert running.acquire(timeout=5) and running.acquire(timeout=5)
+
+    late = submit(server.socket_path, "slow", {"n": 3})
+    assert late["recycling"] is True and late["success"] is False
+    assert thread.is_alive()
+
+    release.set()
+    for caller in callers:
+        caller.join(5)
+    assert results == {1: {"success": True, "n": 1}, 2: {"success": True, "n": 2}}
+    thread.join(5)
+    assert not thread.is_alive()
+    assert server.jobs_started == 2
+
+
+def test_dispatch_uses_resident_worker_or_falls_back(monkeypatch, server_factory, tmp_path):
+    import devgodzilla.windmill.worker as worker
+
+    monkeypatch.setitem(worker.JOBS, "execute_step", lambda **kw: {"where": "local", **kw})
+    monkeypatch.delenv("DEVGODZILLA_WORKER_SOCKET", raising=False)
+    assert dispatch("execute_step", step_run_id=1) == {"where": "local", "step_run_id": 1}
+
+    monkeypatch.setenv("DEVGODZILLA_WORKER_SOCKET", str(tmp_path / "missing.sock"))
+    assert dispatch("execute_step", step_run_id=2)["where"] == "local"
+
+    server, _ = server_factory({"execute_step": lambda **kw: {"where": "resident", **kw}})
+    monkeypatch.setenv("DEVGODZILLA_WORKER_SOCKET", str(server.socket_path))
+    assert dispatch("execute_step", step_run_id=3) == {"where": "resident", "step_run_id": 3}
+
+    monkeypatch.setattr(worker_runtime, "submit", lambda *a, **kw: {"success": False, "recycling": True})
+    assert dispatch("execute_step", step_run_id=4)["where"] == "local"
+
+
+def test_dispatch_reports_a_lost_connection(monkeypatch, tmp_path):
+    import devgodzilla.windmill.worker as worker
+
+    def reset(*args, **kwargs):
+        raise ConnectionResetError("reset by peer")
+
+    monkeypatch.setitem(worker.JOBS, "execute_step", lambda **kw: pytest.fail("job re-run locally"))
+    monkeypatch.setenv("DEVGODZILLA_WORKER_SOCKET", str(tmp_path / "worker.sock"))
+    monkeypatch.setattr(worker_runtime, "submit", reset)
+    result = dispatch("execute_step", step_run_id=1)
+    assert result["success"] is False and "connection lost" in result["error"]
+
+
+def test_worker_entry_points_share_the_process_runtime(monkeypatch):
+    import devgodzilla.windmill.worker as worker
+
+    sentinel = object()
+    monkeypatch.setattr(worker_runtime, "_runtime", WorkerRuntime(db=sentinel))
+    assert worker.get_db() is sentinel
+    assert worker.get_db() is sentinel
+    assert worker.get_context() is not worker.get_context()
@@ -1,9 +1,11 @@
 """Tests for HealthChecker service."""
 
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from devgodzilla.services.health import (
-    HealthChecker, HealthStatus, ComponentHealth, health_status_to_dict
+    HealthChecker, HealthProber, HealthStatus, ComponentHealth, LatencyHistogram, health_status_to_dict
 )
 
 
@@ -108,16 +110,16 @@ class TestHealthChecker:
     @pytest.mark.asyncio
     async def test_check_database_healthy(self, checker, mock_db):
         """Database check returns healthy status."""
-        mock_db.list_projects = MagicMock(return_value=[])
-        
         result = await checker._check_database()
         
         assert result.status == "ok"
+        mock_db.ping.assert_called_once_with()
+        mock_db.list_projects.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_check_database_error(self, checker, mock_db):
         """Database check handles errors."""
-        mock_db.list_projects = MagicMock(side_effect=Exception("DB error"))
+        mock_db.ping = MagicMock(side_effect=Exception("DB error"))
         
         result = await checker._check_database()
         
@@ -224,3 +226,117 @@ class TestHealthStatusToDict:
         assert "database" in result["components"]
         assert "windmill" in result["components"]
         assert result["components"]["windmill"]["status"] == "error"
+
+
+class TestLatencyHistogram:
+    def test_buckets_are_cumulative(self):
+        histogram = LatencyHistogram()
+        for latency in (0.5, 3, 3, 40, 9000):
+            histogram.observe(latency)
+
+        result = histogram.to_dict()
+
+        assert result["count"] == 5
+        assert result["max_ms"] == 9000
+        assert result["buckets"]["le_1"] == 1
+        assert result["buckets"]["le_5"] == 3
+        assert result["buckets"]["le_50"] == 4
+        assert result["buckets"]["le_5000"] == 4
+        assert result["buckets"]["le_inf"] == 5
+
+
+class TestHealthProber:
+    @pytest.fixture
+    def checker(self):
+        windmill = MagicMock()
+        windmill.health_check = MagicMock(return_value=True)
+        registry = MagicMock()
+        registry.list_all = MagicMock(return_value=[])
+        registry.check_all_available = MagicMock(return_value={})
+        return HealthChecker(db=MagicMock(), windmill=windmill, agent_registry=registry)
+
+    def test_snapshot_serves_cached_results(self, checker):
+        prober = HealthProber(checker, intervals={"database": 5, "windmill": 30, "agents": 60})
+
+        pending = prober.snapshot()
+        assert {c.status for c in pending.components.values()} == {"pending"}
+        assert checker.db.ping.call_count == 0
+
+        for name in ("database", "windmill", "agents"):
+            prober.refresh(name)
+        first = prober.snapshot()
+        second = prober.snapshot()
+
+        assert first.status == second.status == "ok"
+        assert checker.db.ping.call_count == 1
+        assert checker.windmill.health_check.call_count == 1
+        assert second.components["database"].details["stale"] is False
+        assert prober.latency()["database"]["count"] == 1
+
+    def test_database_is_resolved_per_probe(self, checker):
+        current = [MagicMock()]
+        checker.db_provider = lambda: current[0]
+        prober = HealthProber(checker, intervals={"database": 5})
+
+        prober.refresh("database")
+        current[0] = MagicMock()
+        current[0].ping.side_effect = Exception("DB down")
+        prober.refresh("database")
+
+        assert prober.snapshot().status == "error"
+        assert checker.db.ping.call_count == 0
+
+    def test_stale_results_degrade(self, checker):
+        prober = HealthProber(checker, intervals={"database": 5})
+        prober.refresh("database")
+
+        with patch("devgodzilla.services.health.time.monotonic", return_value=time.monotonic() + 60):
+            snapshot = prober.snapshot()
+
+        assert snapshot.status == "degraded"
+        assert snapshot.components["database"].message == "stale"
+        assert snapshot.components["database"].details["stale"] is True
+
+    def test_background_refresh_on_cadence(self, checker):
+        prober = HealthProber(checker, intervals={"database": 0.1, "windmill": 30})
+        prober.start()
+        try:
+            deadline = time.monotonic() + 5
+            while checker.db.ping.call_count < 3 and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            prober.stop()
+
+        assert checker.db.ping.call_count >= 3
+        assert checker.windmill.health_check.call_count == 1
+        checker.db.ping.side_effect = Exception("DB down")
+        prober.refresh("database")
+        assert prober.snapshot().status == "error"
+
+
+def test_api_prober_starts_on_demand_and_follows_get_db():
+    pytest.importorskip("fastapi")
+    import threading
+
+    from fastapi.testclient import TestClient
+
+    from devgodzilla.api.app import app
+    from devgodzilla.api.dependencies import get_db
+
+    def probe_threads():
+        return [t for t in threading.enumerate() if t.name.startswith("devgodzilla-health-")]
+
+    db = MagicMock()
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        with TestClient(app) as client:
+            assert probe_threads() == []
+            ready = client.get("/health/ready").json()
+            assert ready["components"]["database"]["status"] in {"pending", "ok"}
+            deadline = time.monotonic() + 5
+            while db.ping.call_count == 0 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert db.ping.call_count >= 1
+    finally:
+        app.dependency_overrides.clear()
+    assert probe_threads() == []
@@ -93,6 +93,20 @@ class TestReconciliationService:
         assert service.db is not None
         assert service.windmill is not None
     
+    @pytest.mark.asyncio
+    async def test_close_releases_only_an_owned_facade(self, mock_context, mock_db):
+        from devgodzilla.db.async_database import AsyncDatabase
+
+        async with ReconciliationService(context=mock_context, db=mock_db) as owned:
+            await owned.adb.run(lambda: None)
+        assert owned.adb._executor._shutdown
+
+        shared = AsyncDatabase(mock_db)
+        async with ReconciliationService(context=mock_context, db=shared):
+            pass
+        assert not shared._executor._shutdown
+        shared.shutdown()
+
     @pytest.mark.asyncio
     async def test_reconcile_runs_empty(self, service, mock_db):
         """Reconciliation with no active runs returns empty report."""
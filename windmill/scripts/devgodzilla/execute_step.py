@@ -14,14 +14,10 @@ Returns:
     output: Agent output
 """
 
-import os
 from datetime import datetime
 
 try:
-    from devgodzilla.config import Config
-    from devgodzilla.services.base import ServiceContext
-    from devgodzilla.db import get_database
-    from devgodzilla.services import ExecutionService
+    from devgodzilla.windmill.runtime import dispatch
     DEVGODZILLA_AVAILABLE = True
 except ImportError:
     DEVGODZILLA_AVAILABLE = False
@@ -41,28 +37,26 @@ def main(
     start_time = datetime.now()
     context = context or {}
     
-    db = get_database()
-    config = Config()
-    service_context = ServiceContext(config=config)
-    execution_service = ExecutionService(service_context, db=db)
-    
     try:
         # Step ID comes as string from Windmill sometimes
         sid = int(step_id)
         
-        result = execution_service.execute_step(
+        # Runs on the resident worker (DEVGODZILLA_WORKER_SOCKET) when one is up.
+        result = dispatch(
+            "execute_step",
             step_run_id=sid,
             agent_id=agent_id,
+            protocol_run_id=protocol_run_id or None,
             job_id=context.get("job_id"),
         )
         
         return {
-            "status": "success" if result.success else "failed",
-            "executed_by": result.engine_id,
-            "output": result.stdout,
-            "error": result.error,
-            "duration_seconds": result.duration_seconds,
-            "artifacts": [str(p) for p in result.outputs_written.values()],
+            "status": "success" if result.get("success") else "failed",
+            "executed_by": result.get("engine_id"),
+            "output": result.get("stdout", ""),
+            "error": result.get("error"),
+            "duration_seconds": result.get("duration_seconds"),
+            "artifacts": result.get("artifacts", []),
         }
         
     except Exception as e: